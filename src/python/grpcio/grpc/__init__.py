@@ -415,6 +415,25 @@ class Call(RpcContext, metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
 
+class PreparedMetadata(_cygrpc.PreparedMetadata):
+    """Metadata encoded once to be sent with many RPCs.
+
+    This is an EXPERIMENTAL API.
+
+    A PreparedMetadata may be passed as the metadata of any RPC in place of
+    the :term:`metadata` it was created from. The keys and values are
+    validated and encoded when it is created, so that each RPC sending it only
+    takes a reference to the encoded data. It otherwise behaves like a tuple of
+    metadata; adding it to a tuple, as interceptors and per-call compression
+    do, yields an ordinary tuple that is encoded again for each RPC.
+
+    Args:
+      metadata: The :term:`metadata` to prepare.
+    """
+
+    __slots__ = ()
+
+
 ##############  Invocation-Side Interceptor Interfaces & Classes  ##############
 
 
@@ -777,6 +796,64 @@ class UnaryUnaryMultiCallable(abc.ABC):
         """
         raise NotImplementedError()
 
+    def batch(
+        self,
+        requests,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        """Synchronously invokes the underlying RPC once for each request.
+
+        This is an EXPERIMENTAL API.
+
+        All of the RPCs are started before any of them is waited on, and every
+        RPC shares the same options.
+
+        Args:
+          requests: An iterable of request values, one per RPC.
+          timeout: An optional duration of time in seconds to allow for
+            each RPC.
+          metadata: Optional :term:`metadata` to be transmitted to the
+            service-side of each RPC.
+          credentials: An optional CallCredentials for the RPCs. Only valid for
+            secure Channel.
+          wait_for_ready: An optional flag to enable :term:`wait_for_ready` mechanism.
+          compression: An element of grpc.Compression, e.g.
+            grpc.Compression.Gzip.
+
+        Returns:
+          A list holding an entry for each request, in the order of the
+          requests. The entry is the response value of the RPC or, should the
+          RPC terminate with non-OK status, the RpcError for the RPC.
+        """
+        calls = []
+        for request in requests:
+            try:
+                calls.append(
+                    self.future(
+                        request,
+                        timeout,
+                        metadata,
+                        credentials,
+                        wait_for_ready,
+                        compression,
+                    )
+                )
+            except RpcError as error:
+                calls.append(error)
+        results = []
+        for call in calls:
+            if isinstance(call, RpcError):
+                results.append(call)
+            elif call.exception() is None:
+                results.append(call.result())
+            else:
+                results.append(call.exception())
+        return results
+
 
 class UnaryStreamMultiCallable(abc.ABC):
     """Affords invoking a unary-stream RPC from client-side."""
@@ -901,6 +978,10 @@ class StreamUnaryMultiCallable(abc.ABC):
 
         Args:
           request_iterator: An iterator that yields request values for the RPC.
+            EXPERIMENTAL: If None, no request iterator is consumed. Instead the
+            returned Call-Future has a write(request) method that sends a
+            request from the calling thread, blocking until it is sent, and a
+            done_writing() method that ends the stream of requests.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If None, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -938,6 +1019,10 @@ class StreamStreamMultiCallable(abc.ABC):
 
         Args:
           request_iterator: An iterator that yields request values for the RPC.
+            EXPERIMENTAL: If None, no request iterator is consumed. Instead the
+            returned Call-iterator has a write(request) method that sends a
+            request from the calling thread, blocking until it is sent, and a
+            done_writing() method that ends the stream of requests.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If not specified, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -2158,9 +2243,12 @@ def intercept_channel(channel, *interceptors):
       interceptors: Zero or more objects of type
         UnaryUnaryClientInterceptor,
         UnaryStreamClientInterceptor,
-        StreamUnaryClientInterceptor, or
-        StreamStreamClientInterceptor.
+        StreamUnaryClientInterceptor,
+        StreamStreamClientInterceptor, or
+        grpc.experimental.ClientMetadataInterceptor.
         Interceptors are given control in the order they are listed.
+        Intercepting a channel returned by this function adds the new
+        interceptors in front of its existing ones.
 
     Returns:
       A Channel that intercepts each invocation via the provided interceptors.
@@ -2169,8 +2257,9 @@ def intercept_channel(channel, *interceptors):
       TypeError: If interceptor does not derive from any of
         UnaryUnaryClientInterceptor,
         UnaryStreamClientInterceptor,
-        StreamUnaryClientInterceptor, or
-        StreamStreamClientInterceptor.
+        StreamUnaryClientInterceptor,
+        StreamStreamClientInterceptor, or
+        grpc.experimental.ClientMetadataInterceptor.
     """
     from grpc import _interceptor  # pylint: disable=cyclic-import
 
@@ -2185,6 +2274,8 @@ def server(
     maximum_concurrent_rpcs=None,
     compression=None,
     xds=False,
+    polling_threads=None,
+    processes=None,
 ):
     """Creates a Server with which RPCs can be serviced.
 
@@ -2208,20 +2299,52 @@ def server(
         lifetime of the server unless overridden.
       xds: If set to true, retrieves server configuration via xDS. This is an
         EXPERIMENTAL option.
+      polling_threads: The number of completion queues, each with its own
+        polling thread, across which incoming RPCs are spread, or None for
+        one. Raising it helps servers whose single polling thread saturates
+        under many small RPCs. This is an EXPERIMENTAL option.
+      processes: The number of worker processes to serve RPCs from, or None
+        to serve them from the calling process. Each worker is forked when the
+        server starts and runs its own server, configured like this one, on
+        the same ports through SO_REUSEPORT; workers that die are restarted.
+        No gRPC channel or server may be in use in the calling process when
+        the server starts, and maximum_concurrent_rpcs applies per worker.
+        Not supported on Windows. This is an EXPERIMENTAL option.
 
     Returns:
       A Server object.
     """
+    from grpc import _prefork  # pylint: disable=cyclic-import
     from grpc import _server  # pylint: disable=cyclic-import
 
+    handlers = () if handlers is None else handlers
+    interceptors = () if interceptors is None else interceptors
+    options = () if options is None else options
+    _prefork.validate_processes(processes)
+    if processes is not None:
+        return _prefork.create_server(
+            processes,
+            handlers,
+            lambda: _server.create_server(
+                thread_pool,
+                (),
+                interceptors,
+                _prefork.reuse_port_options(options),
+                maximum_concurrent_rpcs,
+                compression,
+                xds,
+                polling_threads,
+            ),
+        )
     return _server.create_server(
         thread_pool,
-        () if handlers is None else handlers,
-        () if interceptors is None else interceptors,
-        () if options is None else options,
+        handlers,
+        interceptors,
+        options,
         maximum_concurrent_rpcs,
         compression,
         xds,
+        polling_threads,
     )
 
 
@@ -2268,6 +2391,7 @@ __all__ = (
     "GenericRpcHandler",
     "HandlerCallDetails",
     "LocalConnectionType",
+    "PreparedMetadata",
     "RpcContext",
     "RpcError",
     "RpcMethodHandler",
@@ -25,11 +25,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Sequence,
-    Set,
     Tuple,
     Union,
 )
@@ -62,7 +62,27 @@ _DEFAULT_SINGLE_THREADED_UNARY_STREAM = (
     os.getenv("GRPC_SINGLE_THREADED_UNARY_STREAM") is not None
 )
 
-_UNARY_UNARY_INITIAL_DUE = (
+_CALL_DISPATCH_THREADS_KEY = "GRPC_PYTHON_CALL_DISPATCH_THREADS"
+if _CALL_DISPATCH_THREADS_KEY in os.environ:
+    _CALL_DISPATCH_THREADS = int(os.environ[_CALL_DISPATCH_THREADS_KEY])
+    _LOGGER.debug("Setting call dispatch threads to %d", _CALL_DISPATCH_THREADS)
+else:
+    _CALL_DISPATCH_THREADS = 4
+
+
+def _due(*operation_types: int) -> int:
+    """Returns the bitmask in which the given operations are due."""
+    due = 0
+    for operation_type in operation_types:
+        due |= 1 << operation_type
+    return due
+
+
+_SEND_MESSAGE_DUE = _due(cygrpc.OperationType.send_message)
+_SEND_CLOSE_FROM_CLIENT_DUE = _due(cygrpc.OperationType.send_close_from_client)
+_RECEIVE_MESSAGE_DUE = _due(cygrpc.OperationType.receive_message)
+
+_UNARY_UNARY_INITIAL_DUE = _due(
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.send_message,
     cygrpc.OperationType.send_close_from_client,
@@ -70,20 +90,20 @@ _UNARY_UNARY_INITIAL_DUE = (
     cygrpc.OperationType.receive_message,
     cygrpc.OperationType.receive_status_on_client,
 )
-_UNARY_STREAM_INITIAL_DUE = (
+_UNARY_STREAM_INITIAL_DUE = _due(
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.send_message,
     cygrpc.OperationType.send_close_from_client,
     cygrpc.OperationType.receive_initial_metadata,
     cygrpc.OperationType.receive_status_on_client,
 )
-_STREAM_UNARY_INITIAL_DUE = (
+_STREAM_UNARY_INITIAL_DUE = _due(
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.receive_initial_metadata,
     cygrpc.OperationType.receive_message,
     cygrpc.OperationType.receive_status_on_client,
 )
-_STREAM_STREAM_INITIAL_DUE = (
+_STREAM_STREAM_INITIAL_DUE = _due(
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.receive_initial_metadata,
     cygrpc.OperationType.receive_status_on_client,
@@ -118,9 +138,8 @@ def _unknown_code_details(
     )
 
 
-class _RPCState(object):
-    condition: threading.Condition
-    due: Set[cygrpc.OperationType]
+class _RPCState(_common.LazyConditionState):
+    due: int
     initial_metadata: Optional[MetadataType]
     response: Any
     trailing_metadata: Optional[MetadataType]
@@ -134,38 +153,61 @@ class _RPCState(object):
     rpc_end_time: Optional[float]  # In relative seconds
     method: Optional[str]
     target: Optional[str]
+    traced: bool
+
+    # One _RPCState is allocated per RPC, so it carries no instance dict.
+    __slots__ = (
+        "due",
+        "initial_metadata",
+        "response",
+        "trailing_metadata",
+        "code",
+        "details",
+        "debug_error_string",
+        "cancelled",
+        "callbacks",
+        "fork_epoch",
+        "rpc_start_time",
+        "rpc_end_time",
+        "method",
+        "target",
+        "traced",
+    )
 
     def __init__(
         self,
-        due: Sequence[cygrpc.OperationType],
+        due: int,
         initial_metadata: Optional[MetadataType],
         trailing_metadata: Optional[MetadataType],
         code: Optional[grpc.StatusCode],
         details: Optional[str],
     ):
-        # `condition` guards all members of _RPCState. `notify_all` is called on
-        # `condition` when the state of the RPC has changed.
-        self.condition = threading.Condition()
+        # `lock` guards all members of _RPCState. `notify_all` is called when
+        # the state of the RPC has changed.
+        super(_RPCState, self).__init__()
 
-        # The cygrpc.OperationType objects representing events due from the RPC's
+        # The bitmask, by cygrpc.OperationType, of events due from the RPC's
         # completion queue. If an operation is in `due`, it is guaranteed that
         # `operate()` has been called on a corresponding operation. But the
         # converse is not true. That is, in the case of failed `operate()`
         # calls, there may briefly be events in `due` that do not correspond to
         # operations submitted to Core.
-        self.due = set(due)
+        self.due = due
         self.initial_metadata = initial_metadata
         self.response = None
         self.trailing_metadata = trailing_metadata
         self.code = code
         self.details = details
         self.debug_error_string = None
-        # The following three fields are used for observability.
-        # Updates to those fields do not trigger self.condition.
+        # The following fields are used for observability.
+        # Updates to those fields do not trigger notify_all.
         self.rpc_start_time = None
         self.rpc_end_time = None
         self.method = None
         self.target = None
+        # Whether the observability plugin attached a tracer to the call,
+        # which is how it tells which calls it samples.
+        self.traced = False
 
         # The semantics of grpc.Future.cancel and grpc.Future.cancelled are
         # slightly wonky, so they have to be tracked separately from the rest of the
@@ -176,7 +218,7 @@ class _RPCState(object):
         self.fork_epoch = cygrpc.get_fork_epoch()
 
     def reset_postfork_child(self):
-        self.condition = threading.Condition()
+        super(_RPCState, self).__init__()
 
 
 def _abort(state: _RPCState, code: grpc.StatusCode, details: str) -> None:
@@ -196,7 +238,7 @@ def _handle_event(
     callbacks = []
     for batch_operation in event.batch_operations:
         operation_type = batch_operation.type()
-        state.due.remove(operation_type)
+        state.due &= ~(1 << operation_type)
         if operation_type == cygrpc.OperationType.receive_initial_metadata:
             state.initial_metadata = batch_operation.initial_metadata()
         elif operation_type == cygrpc.OperationType.receive_message:
@@ -236,9 +278,9 @@ def _event_handler(
     state: _RPCState, response_deserializer: Optional[DeserializingFunction]
 ) -> UserTag:
     def handle_event(event):
-        with state.condition:
+        with state.lock:
             callbacks = _handle_event(event, state, response_deserializer)
-            state.condition.notify_all()
+            state.notify_all()
             done = not state.due
         for callback in callbacks:
             try:
@@ -254,6 +296,65 @@ def _event_handler(
     return handle_event
 
 
+def _message_flags(
+    compression_policy: Optional[_compression.CompressionPolicy],
+    method: bytes,
+    compression: Optional[grpc.Compression],
+    serialized_request: bytes,
+) -> int:
+    if compression_policy is None:
+        return _EMPTY_FLAGS
+    return compression_policy.write_flags(
+        method, len(serialized_request), compression
+    )
+
+
+def _send_serialized_request(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    serialized_request: bytes,
+    flags: int,
+    event_handler: Optional[UserTag],
+) -> bool:
+    """Sends a request message and waits for the send to complete.
+
+    Must be called with state.lock held while the RPC is active.
+
+    Returns:
+      Whether the RPC is still active.
+    """
+    state.due |= _SEND_MESSAGE_DUE
+    operations = (cygrpc.SendMessageOperation(serialized_request, flags),)
+    operating = call.operate(operations, event_handler)
+    if not operating:
+        state.due &= ~_SEND_MESSAGE_DUE
+        return False
+
+    def _done():
+        return state.code is not None or not state.due & _SEND_MESSAGE_DUE
+
+    _common.wait(
+        state.condition.wait,
+        _done,
+        spin_cb=functools.partial(cygrpc.block_if_fork_in_progress, state),
+    )
+    return state.code is None
+
+
+def _send_close_from_client(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    event_handler: Optional[UserTag],
+) -> None:
+    """Half-closes the RPC. Must be called with state.lock held."""
+    if state.code is None:
+        state.due |= _SEND_CLOSE_FROM_CLIENT_DUE
+        operations = (cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
+        operating = call.operate(operations, event_handler)
+        if not operating:
+            state.due &= ~_SEND_CLOSE_FROM_CLIENT_DUE
+
+
 # TODO(xuanwn): Create a base class for IntegratedCall and SegregatedCall.
 # pylint: disable=too-many-statements
 def _consume_request_iterator(
@@ -262,6 +363,7 @@ def _consume_request_iterator(
     call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
     request_serializer: SerializingFunction,
     event_handler: Optional[UserTag],
+    message_flags: Callable[[bytes], int],
 ) -> None:
     """Consume a request supplied by the user."""
 
@@ -291,7 +393,7 @@ def _consume_request_iterator(
                 if not return_from_user_request_generator_invoked:
                     cygrpc.return_from_user_request_generator()
             serialized_request = _common.serialize(request, request_serializer)
-            with state.condition:
+            with state.lock:
                 if state.code is None and not state.cancelled:
                     if serialized_request is None:
                         code = grpc.StatusCode.INTERNAL
@@ -302,46 +404,18 @@ def _consume_request_iterator(
                         )
                         _abort(state, code, details)
                         return
-                    state.due.add(cygrpc.OperationType.send_message)
-                    operations = (
-                        cygrpc.SendMessageOperation(
-                            serialized_request, _EMPTY_FLAGS
-                        ),
-                    )
-                    operating = call.operate(operations, event_handler)
-                    if not operating:
-                        state.due.remove(cygrpc.OperationType.send_message)
-                        return
-
-                    def _done():
-                        return (
-                            state.code is not None
-                            or cygrpc.OperationType.send_message
-                            not in state.due
-                        )
-
-                    _common.wait(
-                        state.condition.wait,
-                        _done,
-                        spin_cb=functools.partial(
-                            cygrpc.block_if_fork_in_progress, state
-                        ),
-                    )
-                    if state.code is not None:
+                    if not _send_serialized_request(
+                        state,
+                        call,
+                        serialized_request,
+                        message_flags(serialized_request),
+                        event_handler,
+                    ):
                         return
                 else:
                     return
-        with state.condition:
-            if state.code is None:
-                state.due.add(cygrpc.OperationType.send_close_from_client)
-                operations = (
-                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-                )
-                operating = call.operate(operations, event_handler)
-                if not operating:
-                    state.due.remove(
-                        cygrpc.OperationType.send_close_from_client
-                    )
+        with state.lock:
+            _send_close_from_client(state, call, event_handler)
 
     consumption_thread = cygrpc.ForkManagedThread(
         target=consume_request_iterator
@@ -352,7 +426,7 @@ def _consume_request_iterator(
 
 def _rpc_state_string(class_name: str, rpc_state: _RPCState) -> str:
     """Calculates error string for RPC."""
-    with rpc_state.condition:
+    with rpc_state.lock:
         if rpc_state.code is None:
             return "<{} object>".format(class_name)
         if rpc_state.code is grpc.StatusCode.OK:
@@ -380,9 +454,9 @@ class _InactiveRpcError(grpc.RpcError, grpc.Call, grpc.Future):
     _state: _RPCState
 
     def __init__(self, state: _RPCState):
-        with state.condition:
+        with state.lock:
             self._state = _RPCState(
-                (),
+                0,
                 copy.deepcopy(state.initial_metadata),
                 copy.deepcopy(state.trailing_metadata),
                 state.code,
@@ -495,19 +569,19 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
 
     def is_active(self) -> bool:
         """See grpc.RpcContext.is_active"""
-        with self._state.condition:
+        with self._state.lock:
             return self._state.code is None
 
     def time_remaining(self) -> Optional[float]:
         """See grpc.RpcContext.time_remaining"""
-        with self._state.condition:
+        with self._state.lock:
             if self._deadline is None:
                 return None
             return max(self._deadline - time.time(), 0)
 
     def cancel(self) -> bool:
         """See grpc.RpcContext.cancel"""
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 code = grpc.StatusCode.CANCELLED
                 details = "Locally cancelled by application!"
@@ -516,13 +590,13 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
                 )
                 self._state.cancelled = True
                 _abort(self._state, code, details)
-                self._state.condition.notify_all()
+                self._state.notify_all()
                 return True
             return False
 
     def add_callback(self, callback: NullaryCallbackType) -> bool:
         """See grpc.RpcContext.add_callback"""
-        with self._state.condition:
+        with self._state.lock:
             if self._state.callbacks is None:
                 return False
             self._state.callbacks.append(callback)
@@ -553,7 +627,7 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
         return self._repr()
 
     def __del__(self) -> None:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 self._state.code = grpc.StatusCode.CANCELLED
                 self._state.details = "Cancelled upon garbage collection!"
@@ -562,7 +636,7 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
                     _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[self._state.code],
                     self._state.details,
                 )
-                self._state.condition.notify_all()
+                self._state.notify_all()
 
 
 class _SingleThreadedRendezvous(
@@ -587,15 +661,15 @@ class _SingleThreadedRendezvous(
         return self._state.code is not None
 
     def cancelled(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return self._state.cancelled
 
     def running(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return self._state.code is None
 
     def done(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return self._state.code is not None
 
     def result(self, timeout: Optional[float] = None) -> Any:
@@ -608,7 +682,7 @@ class _SingleThreadedRendezvous(
         be ignored.
         """
         del timeout
-        with self._state.condition:
+        with self._state.lock:
             if not self._is_complete():
                 error_msg = (
                     "_SingleThreadedRendezvous only supports "
@@ -631,7 +705,7 @@ class _SingleThreadedRendezvous(
         be ignored.
         """
         del timeout
-        with self._state.condition:
+        with self._state.lock:
             if not self._is_complete():
                 error_msg = (
                     "_SingleThreadedRendezvous only supports "
@@ -656,7 +730,7 @@ class _SingleThreadedRendezvous(
         be ignored.
         """
         del timeout
-        with self._state.condition:
+        with self._state.lock:
             if not self._is_complete():
                 msg = (
                     "_SingleThreadedRendezvous only supports "
@@ -673,7 +747,7 @@ class _SingleThreadedRendezvous(
                 return sys.exc_info()[2]
 
     def add_done_callback(self, fn: Callable[[grpc.Future], None]) -> None:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 self._state.callbacks.append(functools.partial(fn, self))
                 return
@@ -682,7 +756,7 @@ class _SingleThreadedRendezvous(
 
     def initial_metadata(self) -> Optional[MetadataType]:
         """See grpc.Call.initial_metadata"""
-        with self._state.condition:
+        with self._state.lock:
             # NOTE(gnossen): Based on our initial call batch, we are guaranteed
             # to receive initial metadata before any messages.
             while self._state.initial_metadata is None:
@@ -691,7 +765,7 @@ class _SingleThreadedRendezvous(
 
     def trailing_metadata(self) -> Optional[MetadataType]:
         """See grpc.Call.trailing_metadata"""
-        with self._state.condition:
+        with self._state.lock:
             if self._state.trailing_metadata is None:
                 error_msg = (
                     "Cannot get trailing metadata until RPC is completed."
@@ -701,7 +775,7 @@ class _SingleThreadedRendezvous(
 
     def code(self) -> Optional[grpc.StatusCode]:
         """See grpc.Call.code"""
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 error_msg = "Cannot get code until RPC is completed."
                 raise grpc.experimental.UsageError(error_msg)
@@ -709,7 +783,7 @@ class _SingleThreadedRendezvous(
 
     def details(self) -> Optional[str]:
         """See grpc.Call.details"""
-        with self._state.condition:
+        with self._state.lock:
             if self._state.details is None:
                 error_msg = "Cannot get details until RPC is completed."
                 raise grpc.experimental.UsageError(error_msg)
@@ -717,7 +791,7 @@ class _SingleThreadedRendezvous(
 
     def _consume_next_event(self) -> Optional[cygrpc.BaseEvent]:
         event = self._call.next_event()
-        with self._state.condition:
+        with self._state.lock:
             callbacks = _handle_event(
                 event, self._state, self._response_deserializer
             )
@@ -730,19 +804,19 @@ class _SingleThreadedRendezvous(
     def _next_response(self) -> Any:
         while True:
             self._consume_next_event()
-            with self._state.condition:
+            with self._state.lock:
                 if self._state.response is not None:
                     response = self._state.response
                     self._state.response = None
                     return response
-                if cygrpc.OperationType.receive_message not in self._state.due:
+                if not self._state.due & _RECEIVE_MESSAGE_DUE:
                     if self._state.code is grpc.StatusCode.OK:
                         raise StopIteration()
                     if self._state.code is not None:
                         raise self
 
     def _next(self) -> Any:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 # We tentatively add the operation as expected and remove
                 # it if the enqueue operation fails. This allows us to guarantee that
@@ -753,14 +827,22 @@ class _SingleThreadedRendezvous(
                 # operation to `due`. This would cause an exception on the
                 # channel spin thread when the operation completes and no
                 # corresponding operation would be present in state.due.
-                # Note that, since `condition` is held through this block, there is
+                # Note that, since `lock` is held through this block, there is
                 # no data race on `due`.
-                self._state.due.add(cygrpc.OperationType.receive_message)
+                self._state.due |= _RECEIVE_MESSAGE_DUE
                 operating = self._call.operate(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),), None
+                    (
+                        cygrpc.ReceiveMessageOperation(
+                            _EMPTY_FLAGS,
+                            _common.zero_copy_receive(
+                                self._response_deserializer
+                            ),
+                        ),
+                    ),
+                    None,
                 )
                 if not operating:
-                    self._state.due.remove(cygrpc.OperationType.receive_message)
+                    self._state.due &= ~_RECEIVE_MESSAGE_DUE
             elif self._state.code is grpc.StatusCode.OK:
                 raise StopIteration()
             else:
@@ -768,7 +850,7 @@ class _SingleThreadedRendezvous(
         return self._next_response()
 
     def debug_error_string(self) -> Optional[str]:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.debug_error_string is None:
                 error_msg = (
                     "Cannot get debug error string until RPC is completed."
@@ -794,7 +876,7 @@ class _MultiThreadedRendezvous(
 
     def initial_metadata(self) -> Optional[MetadataType]:
         """See grpc.Call.initial_metadata"""
-        with self._state.condition:
+        with self._state.lock:
 
             def _done():
                 return self._state.initial_metadata is not None
@@ -804,7 +886,7 @@ class _MultiThreadedRendezvous(
 
     def trailing_metadata(self) -> Optional[MetadataType]:
         """See grpc.Call.trailing_metadata"""
-        with self._state.condition:
+        with self._state.lock:
 
             def _done():
                 return self._state.trailing_metadata is not None
@@ -814,7 +896,7 @@ class _MultiThreadedRendezvous(
 
     def code(self) -> Optional[grpc.StatusCode]:
         """See grpc.Call.code"""
-        with self._state.condition:
+        with self._state.lock:
 
             def _done():
                 return self._state.code is not None
@@ -824,7 +906,7 @@ class _MultiThreadedRendezvous(
 
     def details(self) -> Optional[str]:
         """See grpc.Call.details"""
-        with self._state.condition:
+        with self._state.lock:
 
             def _done():
                 return self._state.details is not None
@@ -833,7 +915,7 @@ class _MultiThreadedRendezvous(
             return _common.decode(self._state.details)
 
     def debug_error_string(self) -> Optional[str]:
-        with self._state.condition:
+        with self._state.lock:
 
             def _done():
                 return self._state.debug_error_string is not None
@@ -842,15 +924,15 @@ class _MultiThreadedRendezvous(
             return _common.decode(self._state.debug_error_string)
 
     def cancelled(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return self._state.cancelled
 
     def running(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return self._state.code is None
 
     def done(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return self._state.code is not None
 
     def _is_complete(self) -> bool:
@@ -861,7 +943,7 @@ class _MultiThreadedRendezvous(
 
         See grpc.Future.result for the full API contract.
         """
-        with self._state.condition:
+        with self._state.lock:
             timed_out = _common.wait(
                 self._state.condition.wait, self._is_complete, timeout=timeout
             )
@@ -878,7 +960,7 @@ class _MultiThreadedRendezvous(
 
         See grpc.Future.exception for the full API contract.
         """
-        with self._state.condition:
+        with self._state.lock:
             timed_out = _common.wait(
                 self._state.condition.wait, self._is_complete, timeout=timeout
             )
@@ -897,7 +979,7 @@ class _MultiThreadedRendezvous(
 
         See grpc.future.traceback for the full API contract.
         """
-        with self._state.condition:
+        with self._state.lock:
             timed_out = _common.wait(
                 self._state.condition.wait, self._is_complete, timeout=timeout
             )
@@ -913,7 +995,7 @@ class _MultiThreadedRendezvous(
                 return sys.exc_info()[2]
 
     def add_done_callback(self, fn: Callable[[grpc.Future], None]) -> None:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 self._state.callbacks.append(functools.partial(fn, self))
                 return
@@ -921,18 +1003,25 @@ class _MultiThreadedRendezvous(
         fn(self)
 
     def _next(self) -> Any:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.code is None:
                 event_handler = _event_handler(
                     self._state, self._response_deserializer
                 )
-                self._state.due.add(cygrpc.OperationType.receive_message)
+                self._state.due |= _RECEIVE_MESSAGE_DUE
                 operating = self._call.operate(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                    (
+                        cygrpc.ReceiveMessageOperation(
+                            _EMPTY_FLAGS,
+                            _common.zero_copy_receive(
+                                self._response_deserializer
+                            ),
+                        ),
+                    ),
                     event_handler,
                 )
                 if not operating:
-                    self._state.due.remove(cygrpc.OperationType.receive_message)
+                    self._state.due &= ~_RECEIVE_MESSAGE_DUE
             elif self._state.code is grpc.StatusCode.OK:
                 raise StopIteration()
             else:
@@ -940,7 +1029,7 @@ class _MultiThreadedRendezvous(
 
             def _response_ready():
                 return self._state.response is not None or (
-                    cygrpc.OperationType.receive_message not in self._state.due
+                    not self._state.due & _RECEIVE_MESSAGE_DUE
                     and self._state.code is not None
                 )
 
@@ -949,13 +1038,117 @@ class _MultiThreadedRendezvous(
                 response = self._state.response
                 self._state.response = None
                 return response
-            if cygrpc.OperationType.receive_message not in self._state.due:
+            if not self._state.due & _RECEIVE_MESSAGE_DUE:
                 if self._state.code is grpc.StatusCode.OK:
                     raise StopIteration()
                 if self._state.code is not None:
                     raise self
 
 
+class _RequestWritingRendezvous(
+    _MultiThreadedRendezvous
+):  # pylint: disable=too-many-ancestors
+    """A _MultiThreadedRendezvous whose requests are written by the application.
+
+    Each write issues its send operation from the calling thread and returns
+    once that operation completes, so the RPC needs no thread to consume a
+    request iterator and is flow controlled by its send completions.
+    """
+
+    _request_serializer: Optional[SerializingFunction]
+    _event_handler: Optional[UserTag]
+    _message_flags: Callable[[bytes], int]
+    _writing_done: bool
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        state: _RPCState,
+        call: cygrpc.IntegratedCall,
+        response_deserializer: Optional[DeserializingFunction],
+        deadline: Optional[float],
+        request_serializer: Optional[SerializingFunction],
+        event_handler: Optional[UserTag],
+        message_flags: Callable[[bytes], int],
+    ):
+        super(_RequestWritingRendezvous, self).__init__(
+            state, call, response_deserializer, deadline
+        )
+        self._request_serializer = request_serializer
+        self._event_handler = event_handler
+        self._message_flags = message_flags
+        self._writing_done = False
+
+    def _await_send_completion(self) -> None:
+        def _done():
+            return (
+                self._state.code is not None
+                or not self._state.due & _SEND_MESSAGE_DUE
+            )
+
+        _common.wait(
+            self._state.condition.wait,
+            _done,
+            spin_cb=functools.partial(
+                cygrpc.block_if_fork_in_progress, self._state
+            ),
+        )
+
+    def _raise_if_not_writable(self) -> None:
+        if self._state.code is grpc.StatusCode.OK:
+            raise ValueError("Cannot write to a finished RPC!")
+        if self._state.code is not None:
+            raise self
+        if self._writing_done:
+            raise ValueError("Cannot write after done_writing()!")
+
+    def write(self, request: Any) -> None:
+        """Sends a request message, blocking until it has been sent.
+
+        Raises:
+          ValueError: If done_writing() was called or the RPC already
+            completed successfully.
+          RpcError: If the RPC terminated with non-OK status.
+        """
+        serialized_request = _common.serialize(
+            request, self._request_serializer
+        )
+        with self._state.lock:
+            # Only one send may be in flight, so concurrent writers take turns.
+            self._await_send_completion()
+            self._raise_if_not_writable()
+            if serialized_request is None:
+                code = grpc.StatusCode.INTERNAL
+                details = "Exception serializing request!"
+                self._call.cancel(
+                    _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code], details
+                )
+                _abort(self._state, code, details)
+                self._state.notify_all()
+                raise self
+            if not _send_serialized_request(
+                self._state,
+                self._call,
+                serialized_request,
+                self._message_flags(serialized_request),
+                self._event_handler,
+            ) and self._state.code not in (None, grpc.StatusCode.OK):
+                raise self
+
+    def done_writing(self) -> None:
+        """Signals that no more requests will be written.
+
+        Calling it again, or after the RPC terminated, has no effect.
+        """
+        with self._state.lock:
+            self._await_send_completion()
+            if not self._writing_done:
+                self._writing_done = True
+                _send_close_from_client(
+                    self._state, self._call, self._event_handler
+                )
+
+
 def _start_unary_request(
     request: Any,
     timeout: Optional[float],
@@ -965,7 +1158,7 @@ def _start_unary_request(
     serialized_request = _common.serialize(request, request_serializer)
     if serialized_request is None:
         state = _RPCState(
-            (),
+            0,
             (),
             (),
             grpc.StatusCode.INTERNAL,
@@ -991,14 +1184,18 @@ def _end_unary_response_blocking(
 
 
 def _stream_unary_invocation_operations(
-    metadata: Optional[MetadataType], initial_metadata_flags: int
+    metadata: Optional[MetadataType],
+    initial_metadata_flags: int,
+    response_deserializer: Optional[DeserializingFunction],
 ) -> Sequence[Sequence[cygrpc.Operation]]:
     return (
         (
             cygrpc.SendInitialMetadataOperation(
                 metadata, initial_metadata_flags
             ),
-            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+            cygrpc.ReceiveMessageOperation(
+                _EMPTY_FLAGS, _common.zero_copy_receive(response_deserializer)
+            ),
             cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
         ),
         (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
@@ -1006,7 +1203,9 @@ def _stream_unary_invocation_operations(
 
 
 def _stream_unary_invocation_operations_and_tags(
-    metadata: Optional[MetadataType], initial_metadata_flags: int
+    metadata: Optional[MetadataType],
+    initial_metadata_flags: int,
+    response_deserializer: Optional[DeserializingFunction],
 ) -> Sequence[Tuple[Sequence[cygrpc.Operation], Optional[UserTag]]]:
     return tuple(
         (
@@ -1014,7 +1213,7 @@ def _stream_unary_invocation_operations_and_tags(
             None,
         )
         for operations in _stream_unary_invocation_operations(
-            metadata, initial_metadata_flags
+            metadata, initial_metadata_flags, response_deserializer
         )
     )
 
@@ -1039,10 +1238,14 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _compression_policy: Optional[_compression.CompressionPolicy]
+    _default_compression: Optional[grpc.Compression]
 
     __slots__ = [
         "_channel",
+        "_compression_policy",
         "_context",
+        "_default_compression",
         "_managed_call",
         "_method",
         "_request_serializer",
@@ -1060,6 +1263,8 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        compression_policy: Optional[_compression.CompressionPolicy] = None,
+        default_compression: Optional[grpc.Compression] = None,
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1069,6 +1274,8 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._compression_policy = compression_policy
+        self._default_compression = default_compression
 
     def _prepare(
         self,
@@ -1099,10 +1306,21 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             cygrpc.SendInitialMetadataOperation(
                 augmented_metadata, initial_metadata_flags
             ),
-            cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+            cygrpc.SendMessageOperation(
+                serialized_request,
+                _message_flags(
+                    self._compression_policy,
+                    self._method,
+                    compression or self._default_compression,
+                    serialized_request,
+                ),
+            ),
             cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
             cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
-            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+            cygrpc.ReceiveMessageOperation(
+                _EMPTY_FLAGS,
+                _common.zero_copy_receive(self._response_deserializer),
+            ),
             cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
         )
         return state, operations, deadline, None
@@ -1140,6 +1358,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             self._context,
             self._registered_call_handle,
         )
+        state.traced = call.traced()
         event = call.next_event()
         _handle_event(event, state, self._response_deserializer)
         return state, call
@@ -1172,6 +1391,108 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         )
         return _end_unary_response_blocking(state, call, True, None)
 
+    # pylint: disable=too-many-locals
+    def batch(
+        self,
+        requests: Iterable[Any],
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> List[Any]:
+        deadline = _deadline(timeout)
+        initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
+            wait_for_ready
+        )
+        augmented_metadata = _compression.augment_metadata(
+            metadata, compression
+        )
+        zero_copy = _common.zero_copy_receive(self._response_deserializer)
+        method = _common.decode(self._method)
+        target = _common.decode(self._target)
+        states = []
+        started_states = []
+        operationses = []
+        for request in requests:
+            serialized_request = _common.serialize(
+                request, self._request_serializer
+            )
+            if serialized_request is None:
+                states.append(
+                    _RPCState(
+                        0,
+                        (),
+                        (),
+                        grpc.StatusCode.INTERNAL,
+                        "Exception serializing request!",
+                    )
+                )
+                continue
+            state = _RPCState(_UNARY_UNARY_INITIAL_DUE, None, None, None, None)
+            state.method = method
+            state.target = target
+            states.append(state)
+            started_states.append(state)
+            # Operations hold Core resources while in flight, so each call
+            # needs its own.
+            operationses.append(
+                (
+                    cygrpc.SendInitialMetadataOperation(
+                        augmented_metadata, initial_metadata_flags
+                    ),
+                    cygrpc.SendMessageOperation(
+                        serialized_request,
+                        _message_flags(
+                            self._compression_policy,
+                            self._method,
+                            compression or self._default_compression,
+                            serialized_request,
+                        ),
+                    ),
+                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
+                    cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
+                    cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS, zero_copy),
+                    cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+                )
+            )
+        if started_states:
+            rpc_start_time = time.perf_counter()
+            for state in started_states:
+                state.rpc_start_time = rpc_start_time
+            call_batch = self._channel.segregated_call_batch(
+                cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+                self._method,
+                None,
+                _determine_deadline(deadline),
+                metadata,
+                None if credentials is None else credentials._credentials,
+                operationses,
+                self._context,
+                self._registered_call_handle,
+            )
+            for index, state in enumerate(started_states):
+                state.traced = call_batch.traced(index)
+            # Each call runs a single batch and so completes with one event,
+            # tagged with the call's index.
+            for _ in range(len(started_states)):
+                event = call_batch.next_event()
+                _handle_event(
+                    event,
+                    started_states[event.tag],
+                    self._response_deserializer,
+                )
+        return [
+            (
+                state.response
+                if state.code is grpc.StatusCode.OK
+                else _InactiveRpcError(
+                    state
+                )  # pytype: disable=not-instantiable
+            )
+            for state in states
+        ]
+
     def future(
         self,
         request: Any,
@@ -1190,18 +1511,22 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         state.rpc_start_time = time.perf_counter()
         state.method = _common.decode(self._method)
         state.target = _common.decode(self._target)
-        call = self._managed_call(
-            cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
-            self._method,
-            None,
-            deadline,
-            metadata,
-            None if credentials is None else credentials._credentials,
-            (operations,),
-            event_handler,
-            self._context,
-            self._registered_call_handle,
-        )
+        # Holding the lock keeps the call from completing before it is
+        # known whether it is traced.
+        with state.lock:
+            call = self._managed_call(
+                cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+                self._method,
+                None,
+                deadline,
+                metadata,
+                None if credentials is None else credentials._credentials,
+                (operations,),
+                event_handler,
+                self._context,
+                self._registered_call_handle,
+            )
+            state.traced = call.traced()
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
         )
@@ -1215,10 +1540,14 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _compression_policy: Optional[_compression.CompressionPolicy]
+    _default_compression: Optional[grpc.Compression]
 
     __slots__ = [
         "_channel",
+        "_compression_policy",
         "_context",
+        "_default_compression",
         "_method",
         "_request_serializer",
         "_response_deserializer",
@@ -1234,6 +1563,8 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         request_serializer: SerializingFunction,
         response_deserializer: DeserializingFunction,
         _registered_call_handle: Optional[int],
+        compression_policy: Optional[_compression.CompressionPolicy] = None,
+        default_compression: Optional[grpc.Compression] = None,
     ):
         self._channel = channel
         self._method = method
@@ -1242,6 +1573,8 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._compression_policy = compression_policy
+        self._default_compression = default_compression
 
     def __call__(  # pylint: disable=too-many-locals
         self,
@@ -1258,7 +1591,7 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         )
         if serialized_request is None:
             state = _RPCState(
-                (),
+                0,
                 (),
                 (),
                 grpc.StatusCode.INTERNAL,
@@ -1281,7 +1614,15 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
                 cygrpc.SendInitialMetadataOperation(
                     augmented_metadata, initial_metadata_flags
                 ),
-                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+                cygrpc.SendMessageOperation(
+                    serialized_request,
+                    _message_flags(
+                        self._compression_policy,
+                        self._method,
+                        compression or self._default_compression,
+                        serialized_request,
+                    ),
+                ),
                 cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
             ),
             (cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),),
@@ -1302,6 +1643,7 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             self._context,
             self._registered_call_handle,
         )
+        state.traced = call.traced()
         return _SingleThreadedRendezvous(
             state, call, self._response_deserializer, deadline
         )
@@ -1316,10 +1658,14 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _compression_policy: Optional[_compression.CompressionPolicy]
+    _default_compression: Optional[grpc.Compression]
 
     __slots__ = [
         "_channel",
+        "_compression_policy",
         "_context",
+        "_default_compression",
         "_managed_call",
         "_method",
         "_request_serializer",
@@ -1337,6 +1683,8 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         request_serializer: SerializingFunction,
         response_deserializer: DeserializingFunction,
         _registered_call_handle: Optional[int],
+        compression_policy: Optional[_compression.CompressionPolicy] = None,
+        default_compression: Optional[grpc.Compression] = None,
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1346,6 +1694,8 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._compression_policy = compression_policy
+        self._default_compression = default_compression
 
     def __call__(  # pylint: disable=too-many-locals
         self,
@@ -1373,7 +1723,15 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
                 cygrpc.SendInitialMetadataOperation(
                     augmented_metadata, initial_metadata_flags
                 ),
-                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+                cygrpc.SendMessageOperation(
+                    serialized_request,
+                    _message_flags(
+                        self._compression_policy,
+                        self._method,
+                        compression or self._default_compression,
+                        serialized_request,
+                    ),
+                ),
                 cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
                 cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
             ),
@@ -1382,18 +1740,22 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         state.rpc_start_time = time.perf_counter()
         state.method = _common.decode(self._method)
         state.target = _common.decode(self._target)
-        call = self._managed_call(
-            cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
-            self._method,
-            None,
-            _determine_deadline(deadline),
-            metadata,
-            None if credentials is None else credentials._credentials,
-            operations,
-            _event_handler(state, self._response_deserializer),
-            self._context,
-            self._registered_call_handle,
-        )
+        # Holding the lock keeps the call from completing before it is
+        # known whether it is traced.
+        with state.lock:
+            call = self._managed_call(
+                cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+                self._method,
+                None,
+                _determine_deadline(deadline),
+                metadata,
+                None if credentials is None else credentials._credentials,
+                operations,
+                _event_handler(state, self._response_deserializer),
+                self._context,
+                self._registered_call_handle,
+            )
+            state.traced = call.traced()
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
         )
@@ -1408,10 +1770,14 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _compression_policy: Optional[_compression.CompressionPolicy]
+    _default_compression: Optional[grpc.Compression]
 
     __slots__ = [
         "_channel",
+        "_compression_policy",
         "_context",
+        "_default_compression",
         "_managed_call",
         "_method",
         "_request_serializer",
@@ -1429,6 +1795,8 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        compression_policy: Optional[_compression.CompressionPolicy] = None,
+        default_compression: Optional[grpc.Compression] = None,
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1438,6 +1806,8 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._compression_policy = compression_policy
+        self._default_compression = default_compression
 
     def _blocking(
         self,
@@ -1467,19 +1837,32 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             augmented_metadata,
             None if credentials is None else credentials._credentials,
             _stream_unary_invocation_operations_and_tags(
-                augmented_metadata, initial_metadata_flags
+                augmented_metadata,
+                initial_metadata_flags,
+                self._response_deserializer,
             ),
             self._context,
             self._registered_call_handle,
         )
+        state.traced = call.traced()
         _consume_request_iterator(
-            request_iterator, state, call, self._request_serializer, None
+            request_iterator,
+            state,
+            call,
+            self._request_serializer,
+            None,
+            functools.partial(
+                _message_flags,
+                self._compression_policy,
+                self._method,
+                compression or self._default_compression,
+            ),
         )
         while True:
             event = call.next_event()
-            with state.condition:
+            with state.lock:
                 _handle_event(event, state, self._response_deserializer)
-                state.condition.notify_all()
+                state.notify_all()
                 if not state.due:
                     break
         return state, call
@@ -1524,7 +1907,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
 
     def future(
         self,
-        request_iterator: Iterator,
+        request_iterator: Optional[Iterator],
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -1543,26 +1926,53 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         state.rpc_start_time = time.perf_counter()
         state.method = _common.decode(self._method)
         state.target = _common.decode(self._target)
-        call = self._managed_call(
-            cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
-            self._method,
-            None,
-            deadline,
-            augmented_metadata,
-            None if credentials is None else credentials._credentials,
-            _stream_unary_invocation_operations(
-                metadata, initial_metadata_flags
-            ),
-            event_handler,
-            self._context,
-            self._registered_call_handle,
-        )
+        # Holding the lock keeps the call from completing before it is
+        # known whether it is traced.
+        with state.lock:
+            call = self._managed_call(
+                cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+                self._method,
+                None,
+                deadline,
+                augmented_metadata,
+                None if credentials is None else credentials._credentials,
+                _stream_unary_invocation_operations(
+                    metadata,
+                    initial_metadata_flags,
+                    self._response_deserializer,
+                ),
+                event_handler,
+                self._context,
+                self._registered_call_handle,
+            )
+            state.traced = call.traced()
+        if request_iterator is None:
+            return _RequestWritingRendezvous(
+                state,
+                call,
+                self._response_deserializer,
+                deadline,
+                self._request_serializer,
+                event_handler,
+                functools.partial(
+                    _message_flags,
+                    self._compression_policy,
+                    self._method,
+                    compression or self._default_compression,
+                ),
+            )
         _consume_request_iterator(
             request_iterator,
             state,
             call,
             self._request_serializer,
             event_handler,
+            functools.partial(
+                _message_flags,
+                self._compression_policy,
+                self._method,
+                compression or self._default_compression,
+            ),
         )
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
@@ -1578,10 +1988,14 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _compression_policy: Optional[_compression.CompressionPolicy]
+    _default_compression: Optional[grpc.Compression]
 
     __slots__ = [
         "_channel",
+        "_compression_policy",
         "_context",
+        "_default_compression",
         "_managed_call",
         "_method",
         "_request_serializer",
@@ -1599,6 +2013,8 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        compression_policy: Optional[_compression.CompressionPolicy] = None,
+        default_compression: Optional[grpc.Compression] = None,
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1608,10 +2024,12 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._compression_policy = compression_policy
+        self._default_compression = default_compression
 
     def __call__(
         self,
-        request_iterator: Iterator,
+        request_iterator: Optional[Iterator],
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -1639,24 +2057,49 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         state.rpc_start_time = time.perf_counter()
         state.method = _common.decode(self._method)
         state.target = _common.decode(self._target)
-        call = self._managed_call(
-            cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
-            self._method,
-            None,
-            _determine_deadline(deadline),
-            augmented_metadata,
-            None if credentials is None else credentials._credentials,
-            operations,
-            event_handler,
-            self._context,
-            self._registered_call_handle,
-        )
+        # Holding the lock keeps the call from completing before it is
+        # known whether it is traced.
+        with state.lock:
+            call = self._managed_call(
+                cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+                self._method,
+                None,
+                _determine_deadline(deadline),
+                augmented_metadata,
+                None if credentials is None else credentials._credentials,
+                operations,
+                event_handler,
+                self._context,
+                self._registered_call_handle,
+            )
+            state.traced = call.traced()
+        if request_iterator is None:
+            return _RequestWritingRendezvous(
+                state,
+                call,
+                self._response_deserializer,
+                deadline,
+                self._request_serializer,
+                event_handler,
+                functools.partial(
+                    _message_flags,
+                    self._compression_policy,
+                    self._method,
+                    compression or self._default_compression,
+                ),
+            )
         _consume_request_iterator(
             request_iterator,
             state,
             call,
             self._request_serializer,
             event_handler,
+            functools.partial(
+                _message_flags,
+                self._compression_policy,
+                self._method,
+                compression or self._default_compression,
+            ),
         )
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
@@ -1690,12 +2133,14 @@ class _ChannelCallState(object):
     channel: cygrpc.Channel
     managed_calls: int
     threading: bool
+    shared_dispatch: bool
 
-    def __init__(self, channel: cygrpc.Channel):
+    def __init__(self, channel: cygrpc.Channel, shared_dispatch: bool = False):
         self.lock = threading.Lock()
         self.channel = channel
         self.managed_calls = 0
         self.threading = False
+        self.shared_dispatch = shared_dispatch
 
     def reset_postfork_child(self) -> None:
         self.managed_calls = 0
@@ -1728,6 +2173,60 @@ def _run_channel_spin_thread(state: _ChannelCallState) -> None:
     channel_spin_thread.start()
 
 
+class _CallDispatchPool(object):
+    """A process-wide pool of threads dispatching the events of RPCs.
+
+    Channels created with the SharedCallDispatch option make their calls on a
+    single cygrpc.CallDispatchQueue, which a fixed number of threads poll on
+    behalf of all of them instead of each channel spinning a thread of its own.
+    """
+
+    lock: threading.Lock
+    size: int
+    queue: Optional[cygrpc.CallDispatchQueue]
+
+    def __init__(self, size: int):
+        self.lock = threading.Lock()
+        self.size = size
+        self.queue = None
+
+    def reset_postfork_child(self) -> None:
+        # The dispatching threads do not survive a fork, and the queue is
+        # destroyed once the channels of the child have released it too.
+        self.lock = threading.Lock()
+        if self.queue is not None:
+            self.queue.release()
+            self.queue = None
+
+    def dispatch_queue(self) -> cygrpc.CallDispatchQueue:
+        with self.lock:
+            if self.queue is None:
+                self.queue = cygrpc.CallDispatchQueue()
+                self.queue.acquire()
+                for _ in range(self.size):
+                    _run_call_dispatch_thread(self, self.queue)
+            return self.queue
+
+
+def _run_call_dispatch_thread(
+    pool: _CallDispatchPool, queue: cygrpc.CallDispatchQueue
+) -> None:
+    def dispatch():
+        while True:
+            cygrpc.block_if_fork_in_progress(pool)
+            event = queue.next_call_event()
+            if event.completion_type == cygrpc.CompletionType.queue_timeout:
+                continue
+            event.tag(event)
+
+    dispatch_thread = cygrpc.ForkManagedThread(target=dispatch)
+    dispatch_thread.setDaemon(True)
+    dispatch_thread.start()
+
+
+_call_dispatch_pool = _CallDispatchPool(_CALL_DISPATCH_THREADS)
+
+
 def _channel_managed_call_management(state: _ChannelCallState):
     # pylint: disable=too-many-arguments
     def create(
@@ -1782,6 +2281,8 @@ def _channel_managed_call_management(state: _ChannelCallState):
                 context,
                 _registered_call_handle,
             )
+            if state.shared_dispatch:
+                return call
             if state.managed_calls == 0:
                 state.managed_calls = 1
                 _run_channel_spin_thread(state)
@@ -1993,9 +2494,10 @@ def _separate_channel_options(
     core_options = []
     python_options = []
     for pair in options:
-        if (
-            pair[0]
-            == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream
+        if pair[0] in (
+            grpc.experimental.ChannelOptions.SingleThreadedUnaryStream,
+            grpc.experimental.ChannelOptions.SharedCallDispatch,
+            grpc.experimental.ChannelOptions.CompressionPolicy,
         ):
             python_options.append(pair)
         else:
@@ -2007,6 +2509,9 @@ class Channel(grpc.Channel):
     """A cygrpc.Channel-backed implementation of grpc.Channel."""
 
     _single_threaded_unary_stream: bool
+    _shared_call_dispatch: bool
+    _compression_policy: Optional[_compression.CompressionPolicy]
+    _default_compression: Optional[grpc.Compression]
     _channel: cygrpc.Channel
     _call_state: _ChannelCallState
     _connectivity_state: _ChannelConnectivityState
@@ -2033,14 +2538,26 @@ class Channel(grpc.Channel):
         self._single_threaded_unary_stream = (
             _DEFAULT_SINGLE_THREADED_UNARY_STREAM
         )
+        self._shared_call_dispatch = False
+        self._compression_policy = None
         self._process_python_options(python_options)
+        self._default_compression = _compression.default_compression(
+            core_options, compression
+        )
         self._channel = cygrpc.Channel(
             _common.encode(target),
             _augment_options(core_options, compression),
             credentials,
+            (
+                _call_dispatch_pool.dispatch_queue()
+                if self._shared_call_dispatch
+                else None
+            ),
         )
         self._target = target
-        self._call_state = _ChannelCallState(self._channel)
+        self._call_state = _ChannelCallState(
+            self._channel, self._shared_call_dispatch
+        )
         self._connectivity_state = _ChannelConnectivityState(self._channel)
         cygrpc.fork_register_channel(self)
         if cygrpc.g_gevent_activated:
@@ -2052,7 +2569,8 @@ class Channel(grpc.Channel):
 
         This is a semi-private method. It is intended for use only by gRPC generated code.
 
-        This method is not thread-safe.
+        This method is thread-safe, and lookups of methods that are already
+        registered do not take a lock.
 
         Args:
           method: Required, the method name for the RPC.
@@ -2072,6 +2590,10 @@ class Channel(grpc.Channel):
                 == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream
             ):
                 self._single_threaded_unary_stream = True
+            elif pair[0] == grpc.experimental.ChannelOptions.SharedCallDispatch:
+                self._shared_call_dispatch = bool(pair[1])
+            elif pair[0] == grpc.experimental.ChannelOptions.CompressionPolicy:
+                self._compression_policy = pair[1]
 
     def subscribe(
         self,
@@ -2104,6 +2626,8 @@ class Channel(grpc.Channel):
             request_serializer,
             response_deserializer,
             _registered_call_handle,
+            self._compression_policy,
+            self._default_compression,
         )
 
     # pylint: disable=arguments-differ
@@ -2129,6 +2653,8 @@ class Channel(grpc.Channel):
                 request_serializer,
                 response_deserializer,
                 _registered_call_handle,
+                self._compression_policy,
+                self._default_compression,
             )
         return _UnaryStreamMultiCallable(
             self._channel,
@@ -2138,6 +2664,8 @@ class Channel(grpc.Channel):
             request_serializer,
             response_deserializer,
             _registered_call_handle,
+            self._compression_policy,
+            self._default_compression,
         )
 
     # pylint: disable=arguments-differ
@@ -2159,6 +2687,8 @@ class Channel(grpc.Channel):
             request_serializer,
             response_deserializer,
             _registered_call_handle,
+            self._compression_policy,
+            self._default_compression,
         )
 
     # pylint: disable=arguments-differ
@@ -2180,6 +2710,8 @@ class Channel(grpc.Channel):
             request_serializer,
             response_deserializer,
             _registered_call_handle,
+            self._compression_policy,
+            self._default_compression,
         )
 
     def _unsubscribe_all(self) -> None:
@@ -14,6 +14,7 @@
 """Shared implementation."""
 
 import logging
+import threading
 import time
 from typing import Any, AnyStr, Callable, Optional, Union
 
@@ -90,7 +91,13 @@ def _transform(
         return None
 
 
-def serialize(message: Any, serializer: Optional[SerializingFunction]) -> bytes:
+def serialize(message: Any, serializer: Optional[SerializingFunction]) -> Any:
+    """Serializes a message for sending.
+
+    The result is either bytes or any other object exporting a contiguous
+    buffer (e.g. bytearray, memoryview or mmap), which cygrpc sends without
+    copying when it is large. None indicates a serialization failure.
+    """
     return _transform(message, serializer, "Exception serializing message!")
 
 
@@ -102,6 +109,44 @@ def deserialize(
     )
 
 
+def zero_copy_receive(deserializer: Optional[DeserializingFunction]) -> bool:
+    """Whether messages for a deserializer may be received without copying.
+
+    See grpc.experimental.zero_copy_deserializer.
+    """
+    return getattr(deserializer, "experimental_zero_copy", False)
+
+
+class LazyConditionState(object):
+    """The state of an RPC, guarded by `lock`.
+
+    Threads wait for changes of the state on `condition` and are woken up by
+    `notify_all`. Most RPCs are never waited on, so the condition is only
+    created once a thread has to wait.
+    """
+
+    lock: threading.RLock
+    _condition: Optional[threading.Condition]
+
+    __slots__ = ("lock", "_condition")
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._condition = None
+
+    @property
+    def condition(self) -> threading.Condition:
+        """The condition on `lock`. Must be accessed with `lock` held."""
+        if self._condition is None:
+            self._condition = threading.Condition(self.lock)
+        return self._condition
+
+    def notify_all(self) -> None:
+        """Wakes up waiting threads. Must be called with `lock` held."""
+        if self._condition is not None:
+            self._condition.notify_all()
+
+
 def fully_qualified_method(group: str, method: str) -> str:
     return "/{}/{}".format(group, method)
 
@@ -14,10 +14,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import collections
+from typing import Mapping, Optional, Sequence, Union
 
 import grpc
+from grpc import _common
 from grpc._cython import cygrpc
+from grpc._typing import ChannelArgumentType
 from grpc._typing import MetadataType
 
 NoCompression = cygrpc.CompressionAlgorithm.none
@@ -52,11 +55,29 @@ def create_channel_option(compression: Optional[grpc.Compression]):
     )
 
 
+def default_compression(
+    options: Sequence[ChannelArgumentType],
+    compression: Optional[grpc.Compression],
+) -> Optional[grpc.Compression]:
+    """Returns the algorithm with which RPCs are compressed by default."""
+    if compression:
+        return compression
+    for key, value in options:
+        if (
+            _common.encode(key)
+            == cygrpc.GRPC_COMPRESSION_CHANNEL_DEFAULT_ALGORITHM
+        ):
+            return value
+    return None
+
+
 def augment_metadata(
     metadata: Optional[MetadataType], compression: Optional[grpc.Compression]
 ):
     if not metadata and not compression:
         return None
+    if not compression and isinstance(metadata, cygrpc.PreparedMetadata):
+        return metadata
     base_metadata = tuple(metadata) if metadata else ()
     compression_metadata = (
         (compression_algorithm_to_metadata(compression),) if compression else ()
@@ -64,7 +85,117 @@ def augment_metadata(
     return base_metadata + compression_metadata
 
 
+_EMPTY_FLAGS = 0
+
+CompressionStats = collections.namedtuple(
+    "CompressionStats",
+    (
+        "compressed_messages",
+        "compressed_bytes",
+        "uncompressed_messages",
+        "uncompressed_bytes",
+    ),
+)
+
+
+class CompressionPolicy(object):
+    """Decides per message whether messages are sent compressed.
+
+    Compression costs CPU and framing for every message, which small messages
+    do not recoup. A policy leaves compression enabled only for messages of at
+    least a minimum size, optionally chosen per method, and sends all other
+    messages uncompressed. A policy only applies to RPCs for which a
+    compression algorithm is in effect; it never enables compression itself.
+
+    This is an EXPERIMENTAL API.
+    """
+
+    def __init__(
+        self,
+        minimum_size: int = 0,
+        method_minimum_sizes: Optional[
+            Mapping[Union[str, bytes], Optional[int]]
+        ] = None,
+    ):
+        """Constructor.
+
+        Args:
+          minimum_size: The size in bytes below which serialized messages are
+            sent uncompressed.
+          method_minimum_sizes: An optional mapping from fully-qualified method
+            names to the minimum size applying to messages of that method
+            instead, or to None to send none of them compressed.
+        """
+        self._minimum_size = minimum_size
+        self._method_minimum_sizes = {
+            method.encode("utf8") if isinstance(method, str) else method: size
+            for method, size in (method_minimum_sizes or {}).items()
+        }
+        self._compressed_messages = 0
+        self._compressed_bytes = 0
+        self._uncompressed_messages = 0
+        self._uncompressed_bytes = 0
+
+    def write_flags(
+        self,
+        method: bytes,
+        message_size: int,
+        compression: Optional[grpc.Compression],
+    ) -> int:
+        """Returns the write flags with which to send a message.
+
+        Args:
+          method: The fully-qualified method name of the RPC, as bytes.
+          message_size: The size in bytes of the serialized message.
+          compression: The compression algorithm in effect for the RPC, if
+            any. Messages of RPCs without one are sent uncompressed anyway.
+
+        Returns:
+          Either no flags, or cygrpc.WriteFlag.no_compress to send the message
+          uncompressed.
+        """
+        if not compression:
+            self._uncompressed_messages += 1
+            self._uncompressed_bytes += message_size
+            return _EMPTY_FLAGS
+        minimum_size = self._method_minimum_sizes.get(
+            method, self._minimum_size
+        )
+        # The counters are updated without a lock, so as not to contend on
+        # every message of every RPC sharing the policy. Concurrent updates
+        # may occasionally be lost, which the stats tolerate.
+        if minimum_size is not None and minimum_size <= message_size:
+            self._compressed_messages += 1
+            self._compressed_bytes += message_size
+            return _EMPTY_FLAGS
+        self._uncompressed_messages += 1
+        self._uncompressed_bytes += message_size
+        return cygrpc.WriteFlag.no_compress
+
+    def stats(self) -> CompressionStats:
+        """Returns the numbers of messages and bytes sent so far.
+
+        Messages and bytes counted as compressed were left to be compressed by
+        gRPC Core, while those counted as uncompressed were spared compression
+        by the policy or sent by RPCs without a compression algorithm. The
+        size of the compressed messages is not observable from Python. The
+        numbers are approximate while messages are being sent concurrently.
+
+        Returns:
+          A CompressionStats with the fields compressed_messages,
+          compressed_bytes, uncompressed_messages and uncompressed_bytes.
+        """
+        return CompressionStats(
+            self._compressed_messages,
+            self._compressed_bytes,
+            self._uncompressed_messages,
+            self._uncompressed_bytes,
+        )
+
+
 __all__ = (
+    "CompressionPolicy",
+    "CompressionStats",
     "Deflate",
     "Gzip",
     "NoCompression",
@@ -16,6 +16,7 @@
 cdef class _AioCall(GrpcCallWrapper):
     cdef:
         readonly AioChannel _channel
+        bytes _method
         list _references
         object _deadline
         list _done_callbacks
@@ -42,6 +43,11 @@ cdef class _AioCall(GrpcCallWrapper):
 
         int _send_initial_metadata_flags
 
+        # Whether received messages are delivered as read-only memoryviews
+        # over Core's slices instead of being copied into bytes.
+        bint _zero_copy_receive
+
+    cdef int _get_write_flag(self, object message) except? -1
     cdef void _create_grpc_call(self, object timeout, bytes method, CallCredentials credentials) except *
     cdef void _set_status(self, AioRpcStatus status) except *
     cdef void _set_initial_metadata(self, tuple initial_metadata) except *
@@ -49,6 +49,7 @@ cdef class _AioCall(GrpcCallWrapper):
         init_grpc_aio()
         self.call = NULL
         self._channel = channel
+        self._method = method
         self._loop = channel.loop
         self._references = []
         self._status = None
@@ -59,6 +60,7 @@ cdef class _AioCall(GrpcCallWrapper):
         self._is_locally_cancelled = False
         self._deadline = deadline
         self._send_initial_metadata_flags = _get_send_initial_metadata_flags(wait_for_ready)
+        self._zero_copy_receive = False
         self._create_grpc_call(deadline, method, call_credentials)
 
     def __dealloc__(self):
@@ -66,6 +68,12 @@ cdef class _AioCall(GrpcCallWrapper):
             grpc_call_unref(self.call)
         shutdown_grpc_aio()
 
+    cdef int _get_write_flag(self, object message) except? -1:
+        if self._channel._compression_policy is None:
+            return _EMPTY_FLAGS
+        return self._channel._compression_policy.write_flags(
+            self._method, len(message))
+
     def _repr(self) -> str:
         """Assembles the RPC representation string."""
         # This needs to be loaded at run time once everything
@@ -285,6 +293,13 @@ cdef class _AioCall(GrpcCallWrapper):
 
         return False
 
+    def enable_zero_copy_receive(self):
+        """Delivers received messages as read-only memoryviews.
+
+        Must be called before any message is received on this call.
+        """
+        self._zero_copy_receive = True
+
     def set_internal_error(self, str error_str):
         self._set_status(AioRpcStatus(
             StatusCode.internal,
@@ -294,13 +309,13 @@ cdef class _AioCall(GrpcCallWrapper):
         ))
 
     async def unary_unary(self,
-                          bytes request,
-                          tuple outbound_initial_metadata,
+                          object request,
+                          object outbound_initial_metadata,
                           object context = None):
         """Performs a unary unary RPC.
 
         Args:
-          request: the serialized requests in bytes.
+          request: the serialized request, as bytes or any contiguous buffer.
           outbound_initial_metadata: optional outbound metadata.
           context: instrumentation context.
         """
@@ -309,10 +324,12 @@ cdef class _AioCall(GrpcCallWrapper):
         cdef SendInitialMetadataOperation initial_metadata_op = SendInitialMetadataOperation(
             outbound_initial_metadata,
             self._send_initial_metadata_flags)
-        cdef SendMessageOperation send_message_op = SendMessageOperation(request, _EMPTY_FLAGS)
+        cdef SendMessageOperation send_message_op = SendMessageOperation(
+            request, self._get_write_flag(request))
         cdef SendCloseFromClientOperation send_close_op = SendCloseFromClientOperation(_EMPTY_FLAGS)
         cdef ReceiveInitialMetadataOperation receive_initial_metadata_op = ReceiveInitialMetadataOperation(_EMPTY_FLAGS)
-        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(_EMPTY_FLAGS)
+        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(
+            _EMPTY_FLAGS, self._zero_copy_receive)
         cdef ReceiveStatusOnClientOperation receive_status_on_client_op = ReceiveStatusOnClientOperation(_EMPTY_FLAGS)
 
         if context is not None:
@@ -363,7 +380,7 @@ cdef class _AioCall(GrpcCallWrapper):
 
     async def receive_serialized_message(self):
         """Receives one single raw message in bytes."""
-        cdef bytes received_message
+        cdef object received_message
 
         # Receives a message. Returns None when failed:
         # * EOF, no more messages to read;
@@ -371,19 +388,20 @@ cdef class _AioCall(GrpcCallWrapper):
         # * The server sends final status.
         received_message = await _receive_message(
             self,
-            self._loop
+            self._loop,
+            self._zero_copy_receive
         )
         if received_message is not None:
             return received_message
         else:
             return EOF
 
-    async def send_serialized_message(self, bytes message):
-        """Sends one single raw message in bytes."""
+    async def send_serialized_message(self, object message):
+        """Sends one single raw message as bytes or a contiguous buffer."""
         await _send_message(self,
                             message,
                             None,
-                            False,
+                            self._get_write_flag(message),
                             self._loop)
 
     async def send_receive_close(self):
@@ -393,8 +411,8 @@ cdef class _AioCall(GrpcCallWrapper):
         await execute_batch(self, ops, self._loop)
 
     async def initiate_unary_stream(self,
-                           bytes request,
-                           tuple outbound_initial_metadata,
+                           object request,
+                           object outbound_initial_metadata,
                            object context = None):
         """Implementation of the start of a unary-stream call."""
         # Peer may prematurely end this RPC at any point. We need a coroutine
@@ -407,7 +425,7 @@ cdef class _AioCall(GrpcCallWrapper):
             self._send_initial_metadata_flags)
         cdef Operation send_message_op = SendMessageOperation(
             request,
-            _EMPTY_FLAGS)
+            self._get_write_flag(request))
         cdef Operation send_close_op = SendCloseFromClientOperation(
             _EMPTY_FLAGS)
 
@@ -435,7 +453,7 @@ cdef class _AioCall(GrpcCallWrapper):
             await status_task
 
     async def stream_unary(self,
-                           tuple outbound_initial_metadata,
+                           object outbound_initial_metadata,
                            object metadata_sent_observer,
                            object context = None):
         """Actual implementation of the complete unary-stream call.
@@ -466,7 +484,8 @@ cdef class _AioCall(GrpcCallWrapper):
             return None
 
         cdef tuple inbound_ops
-        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(_EMPTY_FLAGS)
+        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(
+            _EMPTY_FLAGS, self._zero_copy_receive)
         cdef ReceiveStatusOnClientOperation receive_status_on_client_op = ReceiveStatusOnClientOperation(_EMPTY_FLAGS)
 
         if context is not None:
@@ -494,7 +513,7 @@ cdef class _AioCall(GrpcCallWrapper):
             return None
 
     async def initiate_stream_stream(self,
-                           tuple outbound_initial_metadata,
+                           object outbound_initial_metadata,
                            object metadata_sent_observer,
                            object context = None):
         """Actual implementation of the complete stream-stream call.
@@ -33,7 +33,9 @@ cdef class CallbackFailureHandler:
 cdef class CallbackWrapper:
 
     def __cinit__(self, object future, object loop, CallbackFailureHandler failure_handler):
-        self.context.functor.functor_run = self.functor_run
+        # Only invoked by Core for callback completion queues. Completion
+        # queues polled with `next` run `functor_run` on the event loop.
+        self.context.functor.functor_run = _enqueue_callback_completion
         self.context.waiter = <cpython.PyObject*>future
         self.context.loop = <cpython.PyObject*>loop
         self.context.failure_handler = <cpython.PyObject*>failure_handler
@@ -113,14 +115,19 @@ cdef prepend_send_initial_metadata_op(tuple ops, tuple metadata):
 
 
 async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
-                           object loop):
+                           object loop,
+                           bint zero_copy=False):
     """Retrieves parsed messages from Core.
 
     The messages maybe already in Core's buffer, so there isn't a 1-to-1
     mapping between this and the underlying "socket.read()". Also, eventually,
     this function will end with an EOF, which reads empty message.
+
+    If zero_copy is set, the message is returned as a read-only memoryview
+    over the received slices instead of bytes.
     """
-    cdef ReceiveMessageOperation receive_op = ReceiveMessageOperation(_EMPTY_FLAG)
+    cdef ReceiveMessageOperation receive_op = ReceiveMessageOperation(
+        _EMPTY_FLAG, zero_copy)
     cdef tuple ops = (receive_op,)
     try:
         await execute_batch(grpc_call_wrapper, ops, loop)
@@ -137,7 +144,7 @@ async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
 
 
 async def _send_message(GrpcCallWrapper grpc_call_wrapper,
-                        bytes message,
+                        object message,
                         Operation send_initial_metadata_op,
                         int write_flag,
                         object loop):
@@ -149,7 +156,7 @@ async def _send_message(GrpcCallWrapper grpc_call_wrapper,
 
 
 async def _send_initial_metadata(GrpcCallWrapper grpc_call_wrapper,
-                                 tuple metadata,
+                                 object metadata,
                                  int flags,
                                  object loop):
     cdef SendInitialMetadataOperation op = SendInitialMetadataOperation(
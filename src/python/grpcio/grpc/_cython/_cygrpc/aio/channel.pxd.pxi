@@ -25,3 +25,4 @@ cdef class AioChannel:
         bytes _target
         AioChannelStatus _status
         bint _is_secure
+        object _compression_policy
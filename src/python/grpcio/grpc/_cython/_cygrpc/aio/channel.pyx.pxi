@@ -26,13 +26,15 @@ cdef CallbackFailureHandler _WATCH_CONNECTIVITY_FAILURE_HANDLER = CallbackFailur
 
 
 cdef class AioChannel:
-    def __cinit__(self, bytes target, tuple options, ChannelCredentials credentials, object loop):
+    def __cinit__(self, bytes target, tuple options, ChannelCredentials credentials, object loop,
+                  object compression_policy=None):
         init_grpc_aio()
         if options is None:
             options = ()
         cdef _ChannelArgs channel_args = _ChannelArgs(options)
         self._target = target
         self.loop = loop
+        self._compression_policy = compression_policy
         self._status = AIO_CHANNEL_STATUS_READY
 
         if credentials is None:
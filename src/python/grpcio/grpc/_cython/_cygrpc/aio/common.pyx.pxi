@@ -33,8 +33,8 @@ cdef grpc_status_code get_status_code(object code) except *:
             return StatusCode.unknown
 
 
-cdef object deserialize(object deserializer, bytes raw_message):
-    """Perform deserialization on raw bytes.
+cdef object deserialize(object deserializer, object raw_message):
+    """Perform deserialization on raw bytes or a zero-copy message buffer.
 
     Failure to deserialize is a fatal error.
     """
@@ -44,7 +44,12 @@ cdef object deserialize(object deserializer, bytes raw_message):
         return raw_message
 
 
-cdef bytes serialize(object serializer, object message):
+cdef bint zero_copy_requested(object deserializer):
+    """Whether received messages may be delivered as read-only buffers."""
+    return getattr(deserializer, 'experimental_zero_copy', False)
+
+
+cdef object serialize(object serializer, object message):
     """Perform serialization on a message.
 
     Failure to serialize is a fatal error.
@@ -35,8 +35,36 @@ cdef extern from *:
     inline void _unified_socket_write_impl(int fd) nogil
 
 
+cdef extern from *:
+    """
+    #ifdef __linux__
+    #include <sys/eventfd.h>
+
+    static int _eventfd_create_impl(void) {
+        return eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    }
+
+    static void _eventfd_signal_impl(int fd) {
+        eventfd_write(fd, 1);
+    }
+    #else
+    static int _eventfd_create_impl(void) {
+        return -1;
+    }
+
+    static void _eventfd_signal_impl(int fd) {}
+    #endif
+    """
+    int _eventfd_create_impl() nogil
+    void _eventfd_signal_impl(int fd) nogil
+
+
 cdef void _unified_socket_write(int fd) noexcept nogil
 
+cdef void _enqueue_callback_completion(
+        grpc_completion_queue_functor* functor,
+        int success) noexcept nogil
+
 
 cdef class BaseCompletionQueue:
     cdef grpc_completion_queue *_cq
@@ -62,3 +90,13 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
 
     cdef int _poll(self) except -1 nogil
     cdef shutdown(self)
+
+
+cdef class CallbackCompletionQueue(BaseCompletionQueue):
+    cdef grpc_completion_queue_functor _shutdown_functor
+    cdef object _wakeup_reader       # int (eventfd) or socket.socket
+    cdef object _wakeup_writer       # socket.socket, None with an eventfd
+    cdef dict _loops                 # Mapping[asyncio.AbstractLoop, _BoundEventLoop]
+    cdef object _shutdown_event      # threading.Event
+
+    cdef shutdown(self)
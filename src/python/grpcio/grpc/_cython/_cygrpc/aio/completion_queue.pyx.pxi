@@ -29,6 +29,23 @@ def _handle_callback_wrapper(CallbackWrapper callback_wrapper, int success):
     CallbackWrapper.functor_run(callback_wrapper.c_functor(), success)
 
 
+cdef _run_event(grpc_event event, object context_loop):
+    cdef CallbackContext *context = <CallbackContext *>event.tag
+    loop = <object>context.loop
+    if loop is context_loop:
+        # Executes callbacks: complete the future
+        CallbackWrapper.functor_run(
+            <grpc_completion_queue_functor *>event.tag,
+            event.success
+        )
+    else:
+        loop.call_soon_threadsafe(
+            _handle_callback_wrapper,
+            <CallbackWrapper>context.callback_wrapper,
+            event.success
+        )
+
+
 cdef class BaseCompletionQueue:
 
     cdef grpc_completion_queue* c_ptr(self):
@@ -153,7 +170,6 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
             except BlockingIOError:
                 pass
         cdef grpc_event event
-        cdef CallbackContext *context
 
         while True:
             self._queue_mutex.lock()
@@ -165,17 +181,129 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
                 self._queue.pop()
                 self._queue_mutex.unlock()
 
-            context = <CallbackContext *>event.tag
-            loop = <object>context.loop
-            if loop is context_loop:
-                # Executes callbacks: complete the future
-                CallbackWrapper.functor_run(
-                    <grpc_completion_queue_functor *>event.tag,
-                    event.success
-                )
+            _run_event(event, context_loop)
+
+
+# There is at most one CallbackCompletionQueue, the process-wide one. Core
+# invokes its functors without a reference to it, so the state they share
+# with the event loops is global.
+cdef cpp_event_queue _callback_queue
+cdef mutex _callback_queue_mutex
+cdef int _callback_wakeup_fd = -1
+cdef bint _callback_wakeup_is_eventfd = False
+cdef object _callback_queue_shutdown_event = None
+
+
+cdef void _enqueue_callback_completion(
+        grpc_completion_queue_functor* functor,
+        int success) noexcept nogil:
+    """Hands a completion from a Core thread over to the event loops.
+
+    Only the completion that finds the queue empty wakes the loops up; the
+    woken loop drains every completion queued up until it looks again.
+    """
+    cdef grpc_event event
+    cdef bint was_empty
+    event.type = GRPC_OP_COMPLETE
+    event.success = success
+    event.tag = <void *>functor
+
+    _callback_queue_mutex.lock()
+    was_empty = _callback_queue.empty()
+    _callback_queue.push(event)
+    _callback_queue_mutex.unlock()
+
+    if not _has_fd_monitoring:
+        with gil:
+            _drain_callback_queue(None)
+    elif was_empty and _callback_wakeup_fd >= 0:
+        if _callback_wakeup_is_eventfd:
+            _eventfd_signal_impl(_callback_wakeup_fd)
+        else:
+            _unified_socket_write(_callback_wakeup_fd)
+
+
+cdef void _on_callback_queue_shutdown(
+        grpc_completion_queue_functor* functor,
+        int success) noexcept with gil:
+    _callback_queue_shutdown_event.set()
+
+
+cdef _drain_callback_queue(object context_loop):
+    cdef grpc_event event
+    while True:
+        _callback_queue_mutex.lock()
+        if _callback_queue.empty():
+            _callback_queue_mutex.unlock()
+            return
+        event = _callback_queue.front()
+        _callback_queue.pop()
+        _callback_queue_mutex.unlock()
+        _run_event(event, context_loop)
+
+
+cdef class CallbackCompletionQueue(BaseCompletionQueue):
+    """A callback completion queue that needs no polling thread.
+
+    Core runs the functor of each completed tag on its own threads, which
+    queue the completion and wake the event loops through an eventfd, or a
+    socket pair where eventfd is unavailable. Loops that cannot monitor file
+    descriptors are handed their completions with call_soon_threadsafe.
+    """
+
+    def __cinit__(self):
+        global _callback_wakeup_fd
+        global _callback_wakeup_is_eventfd
+        global _callback_queue_shutdown_event
+        cdef int eventfd = _eventfd_create_impl()
+        if eventfd >= 0:
+            self._wakeup_reader = eventfd
+            self._wakeup_writer = None
+            _callback_wakeup_fd = eventfd
+            _callback_wakeup_is_eventfd = True
+        else:
+            self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+            # Every bound loop reads the socket, see PollerCompletionQueue.
+            self._wakeup_reader.setblocking(False)
+            _callback_wakeup_fd = self._wakeup_writer.fileno()
+            _callback_wakeup_is_eventfd = False
+        self._loops = {}
+        self._shutdown_event = threading.Event()
+        _callback_queue_shutdown_event = self._shutdown_event
+        self._shutdown_functor.functor_run = _on_callback_queue_shutdown
+        self._cq = grpc_completion_queue_create_for_callback(
+            &self._shutdown_functor, NULL)
+
+    def bind_loop(self, object loop):
+        if loop in self._loops:
+            return
+        else:
+            self._loops[loop] = _BoundEventLoop(loop, self._wakeup_reader, self._handle_events)
+
+    cdef shutdown(self):
+        global _callback_wakeup_fd
+        for loop in self._loops:
+            self._loops.get(loop).close()
+
+        grpc_completion_queue_shutdown(self._cq)
+        self._shutdown_event.wait()
+        grpc_completion_queue_destroy(self._cq)
+
+        _callback_wakeup_fd = -1
+        if self._wakeup_writer is None:
+            os.close(self._wakeup_reader)
+        else:
+            self._wakeup_reader.close()
+            self._wakeup_writer.close()
+
+    def _handle_events(self, object context_loop):
+        # Resets the wakeup before draining, so that completions queued from
+        # now on wake the loops up again.
+        try:
+            if self._wakeup_writer is None:
+                os.read(self._wakeup_reader, 8)
             else:
-                loop.call_soon_threadsafe(
-                    _handle_callback_wrapper,
-                    <CallbackWrapper>context.callback_wrapper,
-                    event.success
-                )
+                self._wakeup_reader.recv(4096)
+        except BlockingIOError:
+            pass
+        _drain_callback_queue(context_loop)
@@ -24,6 +24,9 @@ class AsyncIOEngine(enum.Enum):
     # EventEngine project, which will be the only IO platform in Core.
     CUSTOM_IO_MANAGER = 'custom_io_manager'
     POLLER = 'poller'
+    # Core's threads deliver completions straight to the event loops, without
+    # a dedicated polling thread.
+    CALLBACK = 'callback'
 
 
 cdef _default_asyncio_engine():
@@ -51,6 +54,14 @@ cdef _initialize_poller():
     _global_aio_state.cq = PollerCompletionQueue()
 
 
+cdef _initialize_callback():
+    # Initializes gRPC Core, must be called before other Core API
+    grpc_init()
+
+    # Creates the only completion queue
+    _global_aio_state.cq = CallbackCompletionQueue()
+
+
 cdef _actual_aio_initialization():
     # Picks the engine for gRPC AsyncIO Stack
     _global_aio_state.engine = AsyncIOEngine.__members__.get(
@@ -62,6 +73,8 @@ cdef _actual_aio_initialization():
     # Initializes the process-level state accordingly
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         _initialize_poller()
+    elif _global_aio_state.engine is AsyncIOEngine.CALLBACK:
+        _initialize_callback()
     else:
         raise ValueError('Unsupported engine type [%s]' % _global_aio_state.engine)
 
@@ -79,13 +92,17 @@ cdef _actual_aio_shutdown():
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         (<PollerCompletionQueue>_global_aio_state.cq).shutdown()
         grpc_shutdown()
+    elif _global_aio_state.engine is AsyncIOEngine.CALLBACK:
+        (<CallbackCompletionQueue>_global_aio_state.cq).shutdown()
+        grpc_shutdown()
     else:
         raise ValueError('Unsupported engine type [%s]' % _global_aio_state.engine)
 
 
 cdef _initialize_per_loop():
     cdef object loop = get_working_loop()
-    if _global_aio_state.engine is AsyncIOEngine.POLLER:
+    if _global_aio_state.engine in (AsyncIOEngine.POLLER,
+                                    AsyncIOEngine.CALLBACK):
         _global_aio_state.cq.bind_loop(loop)
 
 
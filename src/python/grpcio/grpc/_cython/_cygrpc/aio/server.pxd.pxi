@@ -14,12 +14,13 @@
 
 cdef class _HandlerCallDetails:
     cdef readonly str method
-    cdef readonly tuple invocation_metadata
+    cdef readonly object invocation_metadata
 
 
 cdef class RPCState(GrpcCallWrapper):
     cdef grpc_call_details details
     cdef grpc_metadata_array request_metadata
+    cdef MetadataView _invocation_metadata
     cdef AioServer server
     # NOTE(lidiz) Under certain corner case, receiving the client close
     # operation won't immediately fail ongoing RECV_MESSAGE operations. Here I
@@ -37,9 +38,9 @@ cdef class RPCState(GrpcCallWrapper):
     cdef object callbacks
 
     cdef bytes method(self)
-    cdef tuple invocation_metadata(self)
+    cdef MetadataView invocation_metadata(self)
     cdef void raise_for_termination(self) except *
-    cdef int get_write_flag(self)
+    cdef int get_write_flag(self, object message) except? -1
     cdef Operation create_send_initial_metadata_op_if_not_sent(self)
 
 
@@ -75,6 +76,24 @@ cdef class _ConcurrentRpcLimiter:
     cdef bint limiter_concurrency_exceeded
 
 
+cdef class _SerializationBufferPool:
+    cdef list _free_lists  # List[List[bytearray]], one per size class
+    cdef unsigned long long _hits
+    cdef unsigned long long _misses
+    cdef unsigned long long _recycled
+    cdef unsigned long long _discarded
+
+    cdef object serialize(self, object serializer, object size_of, object message)
+    cdef void recycle(self, int size_class, bytearray storage)
+
+
+cdef class _PooledBuffer:
+    cdef _SerializationBufferPool _pool
+    cdef int _size_class
+    cdef bytearray _storage
+    cdef Py_ssize_t _length
+
+
 cdef class AioServer:
     cdef Server _server
     cdef list _generic_handlers
@@ -86,7 +105,10 @@ cdef class AioServer:
     cdef CallbackWrapper _shutdown_callback_wrapper
     cdef object _crash_exception  # Exception
     cdef tuple _interceptors
+    cdef object _method_handler_cache  # grpc._interceptor._MethodHandlerCache
+    cdef object _compression_policy  # grpc._compression.CompressionPolicy
     cdef object _thread_pool  # concurrent.futures.ThreadPoolExecutor
     cdef _ConcurrentRpcLimiter _limiter
+    cdef _SerializationBufferPool _buffer_pool
 
     cdef thread_pool(self)
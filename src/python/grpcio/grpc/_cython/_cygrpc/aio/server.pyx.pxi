@@ -17,8 +17,14 @@ import inspect
 import traceback
 import functools
 
+from cpython.bytearray cimport PyByteArray_AS_STRING
+
 
 cdef int _EMPTY_FLAG = 0
+# Pooled buffers come in power-of-two size classes, from 512B to 4MiB.
+cdef int _POOL_MIN_SIZE_SHIFT = 9
+cdef int _POOL_MAX_SIZE_SHIFT = 22
+cdef int _POOL_MAX_FREE_BUFFERS_PER_SIZE_CLASS = 32
 cdef str _RPC_FINISHED_DETAILS = 'RPC already finished.'
 cdef str _SERVER_STOPPED_DETAILS = 'Server already stopped.'
 
@@ -33,7 +39,7 @@ cdef _augment_metadata(tuple metadata, object compression):
 
 
 cdef class _HandlerCallDetails:
-    def __cinit__(self, str method, tuple invocation_metadata):
+    def __cinit__(self, str method, MetadataView invocation_metadata):
         self.method = method
         self.invocation_metadata = invocation_metadata
 
@@ -61,12 +67,15 @@ cdef class RPCState:
         self.compression_algorithm = None
         self.disable_next_compression = False
         self.callbacks = []
+        self._invocation_metadata = None
 
     cdef bytes method(self):
         return _slice_bytes(self.details.method)
 
-    cdef tuple invocation_metadata(self):
-        return _metadata(&self.request_metadata)
+    cdef MetadataView invocation_metadata(self):
+        if self._invocation_metadata is None:
+            self._invocation_metadata = _metadata_view(&self.request_metadata)
+        return self._invocation_metadata
 
     cdef void raise_for_termination(self) except *:
         """Raise exceptions if RPC is not running.
@@ -85,10 +94,13 @@ cdef class RPCState:
         if self.server._status == AIO_SERVER_STATUS_STOPPED:
             raise _ServerStoppedError(_SERVER_STOPPED_DETAILS)
 
-    cdef int get_write_flag(self):
+    cdef int get_write_flag(self, object message) except? -1:
         if self.disable_next_compression:
             self.disable_next_compression = False
             return WriteFlag.no_compress
+        elif self.server._compression_policy is not None:
+            return self.server._compression_policy.write_flags(
+                self.method(), len(message))
         else:
             return _EMPTY_FLAG
 
@@ -112,6 +124,111 @@ cdef class RPCState:
         shutdown_grpc_aio()
 
 
+cdef class _PooledBuffer:
+    """A serialized message written into storage borrowed from a pool.
+
+    The storage goes back to the pool once the last reference to this buffer
+    is dropped, which for sent messages happens when Core releases the slice
+    over it.
+    """
+
+    def __cinit__(self,
+                  _SerializationBufferPool pool,
+                  int size_class,
+                  bytearray storage,
+                  Py_ssize_t length):
+        self._pool = pool
+        self._size_class = size_class
+        self._storage = storage
+        self._length = length
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cpython.PyBuffer_FillInfo(
+            buffer,
+            self,
+            PyByteArray_AS_STRING(self._storage),
+            self._length,
+            0,
+            flags)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+    def __len__(self):
+        return self._length
+
+    def __dealloc__(self):
+        if self._pool is not None:
+            self._pool.recycle(self._size_class, self._storage)
+
+
+cdef class _SerializationBufferPool:
+    """Recycles serialization buffers across responses, per size class.
+
+    Only serializers created with grpc.experimental.buffer_serializer can
+    write into pooled buffers.
+    """
+
+    def __cinit__(self):
+        self._free_lists = [
+            [] for _ in range(_POOL_MAX_SIZE_SHIFT - _POOL_MIN_SIZE_SHIFT + 1)
+        ]
+        self._hits = 0
+        self._misses = 0
+        self._recycled = 0
+        self._discarded = 0
+
+    cdef object serialize(self, object serializer, object size_of, object message):
+        cdef Py_ssize_t length = size_of(message)
+        cdef int size_class = 0
+        cdef list free_list
+        cdef bytearray storage
+        while (<Py_ssize_t>1 << (size_class + _POOL_MIN_SIZE_SHIFT)) < length:
+            size_class += 1
+        if size_class + _POOL_MIN_SIZE_SHIFT > _POOL_MAX_SIZE_SHIFT:
+            # Too large to be worth keeping around.
+            self._misses += 1
+            return serializer(message)
+        free_list = self._free_lists[size_class]
+        if free_list:
+            self._hits += 1
+            storage = free_list.pop()
+        else:
+            self._misses += 1
+            storage = bytearray(1 << (size_class + _POOL_MIN_SIZE_SHIFT))
+        cdef _PooledBuffer buffer = _PooledBuffer(self, size_class, storage, length)
+        serializer.experimental_serialize_into(message, memoryview(buffer))
+        return buffer
+
+    cdef void recycle(self, int size_class, bytearray storage):
+        cdef list free_list = self._free_lists[size_class]
+        if len(free_list) < _POOL_MAX_FREE_BUFFERS_PER_SIZE_CLASS:
+            self._recycled += 1
+            free_list.append(storage)
+        else:
+            self._discarded += 1
+
+    def stats(self):
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'recycled': self._recycled,
+            'discarded': self._discarded,
+        }
+
+
+cdef object _serialize_response(RPCState rpc_state,
+                                object serializer,
+                                object message):
+    cdef _SerializationBufferPool pool = rpc_state.server._buffer_pool
+    cdef object size_of
+    if pool is not None:
+        size_of = getattr(serializer, 'experimental_size_of', None)
+        if size_of is not None:
+            return pool.serialize(serializer, size_of, message)
+    return serialize(serializer, message)
+
+
 cdef class _ServicerContext:
 
     def __cinit__(self,
@@ -125,10 +242,14 @@ cdef class _ServicerContext:
         self._loop = loop
 
     async def read(self):
-        cdef bytes raw_message
+        cdef object raw_message
         self._rpc_state.raise_for_termination()
 
-        raw_message = await _receive_message(self._rpc_state, self._loop)
+        raw_message = await _receive_message(
+            self._rpc_state,
+            self._loop,
+            zero_copy_requested(self._request_deserializer),
+        )
         self._rpc_state.raise_for_termination()
 
         if raw_message is None:
@@ -140,10 +261,14 @@ cdef class _ServicerContext:
     async def write(self, object message):
         self._rpc_state.raise_for_termination()
 
+        cdef object response_raw = _serialize_response(
+            self._rpc_state,
+            self._response_serializer,
+            message)
         await _send_message(self._rpc_state,
-                            serialize(self._response_serializer, message),
+                            response_raw,
                             self._rpc_state.create_send_initial_metadata_op_if_not_sent(),
-                            self._rpc_state.get_write_flag(),
+                            self._rpc_state.get_write_flag(response_raw),
                             self._loop)
         self._rpc_state.metadata_sent = True
 
@@ -367,8 +492,9 @@ def _is_async_handler(object handler):
     return inspect.isawaitable(handler) or inspect.iscoroutinefunction(handler) or inspect.isasyncgenfunction(handler)
 
 
-async def _find_method_handler(str method, tuple metadata, list generic_handlers,
-                          tuple interceptors):
+async def _find_method_handler(str method, MetadataView metadata,
+                               list generic_handlers, tuple interceptors,
+                               object method_handler_cache=None):
     def query_handlers(handler_call_details):
         for generic_handler in generic_handlers:
             method_handler = generic_handler.service(handler_call_details)
@@ -378,12 +504,25 @@ async def _find_method_handler(str method, tuple metadata, list generic_handlers
 
     cdef _HandlerCallDetails handler_call_details = _HandlerCallDetails(method,
                                                                         metadata)
+    cdef object cache_key
+    cdef object method_handler
     # interceptor
-    if interceptors:
+    if not interceptors:
+        return query_handlers(handler_call_details)
+    if method_handler_cache is None:
         return await _run_interceptor(iter(interceptors), query_handlers,
                                       handler_call_details)
-    else:
-        return query_handlers(handler_call_details)
+
+    # Interceptors that only decide by method run once per cache key.
+    cache_key = method_handler_cache.key(handler_call_details)
+    method_handler = method_handler_cache.get(cache_key)
+    if method_handler is None:
+        method_handler = await _run_interceptor(iter(interceptors),
+                                                query_handlers,
+                                                handler_call_details)
+        if method_handler is not None:
+            method_handler_cache.put(cache_key, method_handler)
+    return method_handler
 
 
 async def _finish_handler_with_unary_response(RPCState rpc_state,
@@ -426,9 +565,10 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     rpc_state.raise_for_termination()
 
     # Serializes the response message
-    cdef bytes response_raw
+    cdef object response_raw
     if rpc_state.status_code == StatusCode.ok:
-        response_raw = serialize(
+        response_raw = _serialize_response(
+            rpc_state,
             response_serializer,
             response_message,
         )
@@ -439,7 +579,7 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     # Assembles the batch operations
     cdef tuple finish_ops
     finish_ops = (
-        SendMessageOperation(response_raw, rpc_state.get_write_flag()),
+        SendMessageOperation(response_raw, rpc_state.get_write_flag(response_raw)),
         SendStatusFromServerOperation(
             rpc_state.trailing_metadata,
             rpc_state.status_code,
@@ -531,7 +671,11 @@ async def _handle_unary_unary_rpc(object method_handler,
                                   RPCState rpc_state,
                                   object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef object request_raw = await _receive_message(
+        rpc_state,
+        loop,
+        zero_copy_requested(method_handler.request_deserializer),
+    )
     if request_raw is None:
         # The RPC was cancelled immediately after start on client side.
         return
@@ -565,7 +709,11 @@ async def _handle_unary_stream_rpc(object method_handler,
                                    RPCState rpc_state,
                                    object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef object request_raw = await _receive_message(
+        rpc_state,
+        loop,
+        zero_copy_requested(method_handler.request_deserializer),
+    )
     if request_raw is None:
         return
 
@@ -801,6 +949,7 @@ async def _handle_rpc(list generic_handlers, tuple interceptors,
         rpc_state.invocation_metadata(),
         generic_handlers,
         interceptors,
+        rpc_state.server._method_handler_cache,
     )
     if method_handler is None:
         rpc_state.status_sent = True
@@ -894,7 +1043,9 @@ cdef class _ConcurrentRpcLimiter:
 cdef class AioServer:
 
     def __init__(self, loop, thread_pool, generic_handlers, interceptors,
-                 options, maximum_concurrent_rpcs):
+                 options, maximum_concurrent_rpcs,
+                 serialization_buffer_pool=False, method_handler_cache=None,
+                 compression_policy=None):
         init_grpc_aio()
         # NOTE(lidiz) Core objects won't be deallocated automatically.
         # If AioServer.shutdown is not called, those objects will leak.
@@ -924,10 +1075,14 @@ cdef class AioServer:
             self._interceptors = tuple(interceptors)
         else:
             self._interceptors = ()
+        self._method_handler_cache = method_handler_cache
+        self._compression_policy = compression_policy
 
         self._thread_pool = thread_pool
         if maximum_concurrent_rpcs is not None:
             self._limiter = _ConcurrentRpcLimiter(maximum_concurrent_rpcs)
+        if serialization_buffer_pool:
+            self._buffer_pool = _SerializationBufferPool()
 
     def add_generic_rpc_handlers(self, object generic_rpc_handlers):
         self._generic_handlers.extend(generic_rpc_handlers)
@@ -1123,5 +1278,10 @@ cdef class AioServer:
         """Access the thread pool instance."""
         return self._thread_pool
 
+    def serialization_buffer_pool_stats(self):
+        if self._buffer_pool is None:
+            return None
+        return self._buffer_pool.stats()
+
     def is_running(self):
         return self._status == AIO_SERVER_STATUS_RUNNING
@@ -30,9 +30,20 @@ cdef class _CallState:
   cdef object call_tracer_capsule
   cdef void maybe_save_registered_method(self, bytes method_name) except *
   cdef void maybe_set_client_call_tracer_on_call(self, bytes method_name, bytes target) except *
+  cdef bint traced(self)
   cdef void delete_call(self) except *
 
 
+cdef class CallDispatchQueue:
+
+  cdef grpc_completion_queue *c_completion_queue
+  # The number of channels and dispatching pools sharing the queue.
+  cdef int _holders
+
+  cdef void _acquire(self) except *
+  cdef void _release(self) except *
+
+
 cdef class _ChannelState:
 
   cdef bytes target
@@ -51,6 +62,9 @@ cdef class _ChannelState:
   # A dict from _BatchOperationTag to _CallState
   cdef dict integrated_call_states
   cdef grpc_completion_queue *c_call_completion_queue
+  # The queue shared with other channels on which integrated calls complete,
+  # or None if they complete on c_call_completion_queue.
+  cdef CallDispatchQueue dispatch_queue
 
   # A set of _CallState
   cdef set segregated_call_states
@@ -72,6 +86,14 @@ cdef class SegregatedCall:
   cdef grpc_completion_queue *_c_completion_queue
 
 
+cdef class SegregatedCallBatch:
+
+  cdef _ChannelState _channel_state
+  cdef list _call_states
+  cdef int _pending_count
+  cdef grpc_completion_queue *_c_completion_queue
+
+
 cdef class Channel:
 
   cdef _ChannelState _state
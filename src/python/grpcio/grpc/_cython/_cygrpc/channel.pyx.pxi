@@ -90,10 +90,15 @@ cdef class _CallState:
     with _observability.get_plugin() as plugin:
       if plugin and plugin.observability_enabled:
         capsule = plugin.create_client_call_tracer(method_name, target)
+        if capsule is None:
+          return
         capsule_ptr = cpython.PyCapsule_GetPointer(capsule, CLIENT_CALL_TRACER)
         _set_call_tracer(self.c_call, capsule_ptr)
         self.call_tracer_capsule = capsule
 
+  cdef bint traced(self):
+    return self.call_tracer_capsule is not None
+
 cdef class _ChannelState:
 
   def __cinit__(self, target):
@@ -125,9 +130,14 @@ cdef class CallHandle:
 
 
 
-cdef tuple _operate(grpc_call *c_call, object operations, object user_tag):
+cdef tuple _operate(
+    grpc_call *c_call, object operations, object user_tag,
+    _ChannelState channel_state=None):
   cdef grpc_call_error c_call_error
-  cdef _BatchOperationTag tag = _BatchOperationTag(user_tag, operations, None)
+  # The tag retains the state of the channel on which the call was made, which
+  # routes its event when the channel shares a CallDispatchQueue.
+  cdef _BatchOperationTag tag = _BatchOperationTag(
+      user_tag, operations, channel_state)
   tag.prepare()
   cpython.Py_INCREF(tag)
   with nogil:
@@ -143,7 +153,8 @@ cdef object _operate_from_integrated_call(
   cdef _BatchOperationTag tag
   with channel_state.condition:
     if call_state.due:
-      c_call_error, tag = _operate(call_state.c_call, operations, user_tag)
+      c_call_error, tag = _operate(
+          call_state.c_call, operations, user_tag, channel_state)
       if c_call_error == GRPC_CALL_OK:
         call_state.due.add(tag)
         channel_state.integrated_call_states[tag] = call_state
@@ -295,7 +306,8 @@ cdef void _call(
           _raise_call_error_no_metadata(c_call_error)
       started_tags = set()
       for operations, user_tag in operationses_and_user_tags:
-        c_call_error, tag = _operate(call_state.c_call, operations, user_tag)
+        c_call_error, tag = _operate(
+            call_state.c_call, operations, user_tag, channel_state)
         if c_call_error == GRPC_CALL_OK:
           started_tags.add(tag)
         else:
@@ -317,6 +329,54 @@ cdef void _process_integrated_call_tag(
   if not call_state.due:
     call_state.delete_call()
 
+
+cdef class CallDispatchQueue:
+  """A completion queue on which integrated calls of many channels complete.
+
+  Any number of threads may poll the queue. Each event is routed to the state
+  of the channel its call was made on before being returned. The underlying
+  completion queue is destroyed once every channel and pool that acquired it
+  has released it.
+  """
+
+  def __cinit__(self):
+    fork_handlers_and_grpc_init()
+    self.c_completion_queue = grpc_completion_queue_create_for_next(NULL)
+    self._holders = 0
+
+  cdef void _acquire(self) except *:
+    if self.c_completion_queue == NULL:
+      raise ValueError('Cannot acquire a destroyed CallDispatchQueue!')
+    self._holders += 1
+
+  cdef void _release(self) except *:
+    self._holders -= 1
+    if self._holders == 0:
+      _destroy_c_completion_queue(self.c_completion_queue)
+      self.c_completion_queue = NULL
+      grpc_shutdown()
+
+  def acquire(self):
+    self._acquire()
+
+  def release(self):
+    self._release()
+
+  def next_call_event(self):
+    cdef _ChannelState state
+    if is_fork_support_enabled():
+      queue_deadline = time.time() + 1.0
+    else:
+      queue_deadline = None
+    tag, event = _latent_event(self.c_completion_queue, queue_deadline)
+    if tag is not None:
+      state = tag._retained_call
+      with state.condition:
+        _process_integrated_call_tag(state, tag)
+        state.condition.notify_all()
+    return event
+
+
 cdef class IntegratedCall:
 
   def __cinit__(self, _ChannelState channel_state, _CallState call_state):
@@ -330,6 +390,10 @@ cdef class IntegratedCall:
   def cancel(self, code, details):
     _cancel(self._channel_state, self._call_state, code, details)
 
+  def traced(self):
+    """Returns whether the observability plugin attached a tracer to the call."""
+    return self._call_state.traced()
+
 
 cdef IntegratedCall _integrated_call(
     _ChannelState state, int flags, method, host, object deadline,
@@ -376,6 +440,10 @@ cdef class SegregatedCall:
   def cancel(self, code, details):
     _cancel(self._channel_state, self._call_state, code, details)
 
+  def traced(self):
+    """Returns whether the observability plugin attached a tracer to the call."""
+    return self._call_state.traced()
+
   def next_event(self):
     def on_success(tag):
       _process_segregated_call_tag(
@@ -420,6 +488,102 @@ cdef SegregatedCall _segregated_call(
   return segregated_call
 
 
+cdef object _process_segregated_call_batch_tag(
+    SegregatedCallBatch batch, _BatchOperationTag tag):
+  cdef _CallState call_state = batch._call_states[tag._user_tag]
+  call_state.due.remove(tag)
+  if not call_state.due:
+    call_state.delete_call()
+    batch._channel_state.segregated_call_states.remove(call_state)
+    batch._pending_count -= 1
+    if not batch._pending_count:
+      _destroy_c_completion_queue(batch._c_completion_queue)
+
+
+cdef class SegregatedCallBatch:
+  """Calls started together on a single, shared completion queue.
+
+  Each call runs exactly one batch of operations, and the events taken from
+  the completion queue carry the index of their call as their tag.
+  """
+
+  def __cinit__(self, _ChannelState channel_state):
+    self._channel_state = channel_state
+    self._call_states = []
+    self._pending_count = 0
+
+  def cancel(self, code, details):
+    cdef _CallState call_state
+    for call_state in self._call_states:
+      _cancel(self._channel_state, call_state, code, details)
+
+  def traced(self, index):
+    """Returns whether the observability plugin attached a tracer to a call."""
+    return (<_CallState>self._call_states[index]).traced()
+
+  def next_event(self):
+    def on_success(tag):
+      _process_segregated_call_batch_tag(self, tag)
+    def on_failure():
+      cdef _CallState call_state
+      for call_state in self._call_states:
+        if call_state.due:
+          call_state.due.clear()
+          call_state.delete_call()
+          self._channel_state.segregated_call_states.remove(call_state)
+      self._pending_count = 0
+      _destroy_c_completion_queue(self._c_completion_queue)
+    return _next_call_event(
+        self._channel_state, self._c_completion_queue, on_success, on_failure,
+        None)
+
+
+cdef SegregatedCallBatch _segregated_call_batch(
+    _ChannelState state, int flags, method, host, object deadline,
+    object metadata, CallCredentials credentials, operationses,
+    object context, object registered_call_handle):
+  cdef SegregatedCallBatch batch = SegregatedCallBatch(state)
+  cdef _CallState call_state
+
+  def on_success(started_tags):
+    state.segregated_call_states.add(call_state)
+
+  with state.condition:
+    if state.open:
+      batch._c_completion_queue = grpc_completion_queue_create_for_next(NULL)
+    else:
+      raise ValueError('Cannot invoke RPC on closed channel!')
+
+  try:
+    # The condition is reentrant. Holding it across the loop lets all of the
+    # calls start without contending with other threads once per call.
+    with state.condition:
+      for operations in operationses:
+        call_state = _CallState()
+        _call(
+            state, call_state, batch._c_completion_queue, on_success, flags,
+            method, host, deadline, credentials,
+            ((operations, len(batch._call_states)),), metadata, context,
+            registered_call_handle)
+        batch._call_states.append(call_state)
+        batch._pending_count += 1
+  except:
+    if batch._pending_count:
+      # Calls that did start hold tags on the completion queue, which must be
+      # drained before it can be destroyed.
+      batch.cancel(
+          GRPC_STATUS_CANCELLED, 'Cancelled after a batched call failed!')
+      while batch._pending_count:
+        batch.next_event()
+    else:
+      _destroy_c_completion_queue(batch._c_completion_queue)
+    raise
+
+  if not batch._pending_count:
+    _destroy_c_completion_queue(batch._c_completion_queue)
+  return batch
+
+
 cdef object _watch_connectivity_state(
     _ChannelState state, grpc_connectivity_state last_observed_state,
     object deadline):
@@ -471,7 +635,12 @@ cdef _close(Channel channel, grpc_status_code code, object details,
         while state.connectivity_due:
           state.condition.wait()
 
-      _destroy_c_completion_queue(state.c_call_completion_queue)
+      if state.dispatch_queue is None:
+        _destroy_c_completion_queue(state.c_call_completion_queue)
+      else:
+        state.dispatch_queue._release()
+        state.dispatch_queue = None
+      state.c_call_completion_queue = NULL
       _destroy_c_completion_queue(state.c_connectivity_completion_queue)
       grpc_channel_destroy(state.c_channel)
       state.c_channel = NULL
@@ -492,12 +661,18 @@ cdef class Channel:
 
   def __cinit__(
       self, bytes target, object arguments,
-      ChannelCredentials channel_credentials):
+      ChannelCredentials channel_credentials,
+      CallDispatchQueue dispatch_queue=None):
     arguments = () if arguments is None else tuple(arguments)
     fork_handlers_and_grpc_init()
     self._state = _ChannelState(target)
-    self._state.c_call_completion_queue = (
-        grpc_completion_queue_create_for_next(NULL))
+    if dispatch_queue is None:
+      self._state.c_call_completion_queue = (
+          grpc_completion_queue_create_for_next(NULL))
+    else:
+      dispatch_queue._acquire()
+      self._state.dispatch_queue = dispatch_queue
+      self._state.c_call_completion_queue = dispatch_queue.c_completion_queue
     self._state.c_connectivity_completion_queue = (
         grpc_completion_queue_create_for_next(NULL))
     self._arguments = arguments
@@ -527,6 +702,10 @@ cdef class Channel:
         operationses_and_tags, context, registered_call_handle)
 
   def next_call_event(self):
+    if self._state.dispatch_queue is not None:
+      # Events of other channels sharing the queue are routed to their
+      # channels' states as well.
+      return self._state.dispatch_queue.next_call_event()
     def on_success(tag):
       if tag is not None:
         _process_integrated_call_tag(self._state, tag)
@@ -548,6 +727,14 @@ cdef class Channel:
         self._state, flags, method, host, deadline, metadata, credentials,
         operationses_and_tags, context, registered_call_handle)
 
+  def segregated_call_batch(
+      self, int flags, method, host, object deadline, object metadata,
+      CallCredentials credentials, operationses, object context = None,
+      object registered_call_handle = None):
+    return _segregated_call_batch(
+        self._state, flags, method, host, deadline, metadata, credentials,
+        operationses, context, registered_call_handle)
+
   def check_connectivity_state(self, bint try_to_connect):
     with self._state.condition:
       if self._state.open:
@@ -570,7 +757,9 @@ cdef class Channel:
     """
     Get or registers a call handler for a method.
 
-    This method is not thread-safe.
+    Lookups of already registered methods cost a single dictionary access.
+    Registration happens without releasing the GIL, so concurrent callers
+    never register the same method twice.
 
     Args:
       method: Required, the method name for the RPC.
@@ -578,6 +767,8 @@ cdef class Channel:
     Returns:
       The registered call handle pointer in the form of a Python Long. 
     """
-    if method not in self._registered_call_handles.keys():
-      self._registered_call_handles[method] = CallHandle(self._state, method)
-    return self._registered_call_handles[method].call_handle
+    cdef CallHandle handle = self._registered_call_handles.get(method)
+    if handle is None:
+      handle = CallHandle(self._state, method)
+      self._registered_call_handles[method] = handle
+    return handle.call_handle
@@ -29,7 +29,7 @@ cdef class RequestCallEvent(BaseEvent):
   cdef readonly object tag
   cdef readonly Call call
   cdef readonly CallDetails call_details
-  cdef readonly tuple invocation_metadata
+  cdef readonly object invocation_metadata
 
 
 cdef class BatchOperationEvent(BaseEvent):
@@ -25,7 +25,7 @@ cdef class RequestCallEvent(BaseEvent):
 
   def __cinit__(
       self, grpc_completion_type completion_type, bint success, object tag,
-      Call call, CallDetails call_details, tuple invocation_metadata):
+      Call call, CallDetails call_details, MetadataView invocation_metadata):
     self.completion_type = completion_type
     self.success = success
     self.tag = tag
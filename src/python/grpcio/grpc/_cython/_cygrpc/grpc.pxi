@@ -89,10 +89,9 @@ cdef extern from "grpc/support/alloc.h":
 
 
 cdef extern from "grpc/byte_buffer_reader.h":
-
-  struct grpc_byte_buffer_reader:
-    # We don't care about the internals
-    pass
+  # grpc_byte_buffer_reader is declared next to grpc_byte_buffer below, since
+  # the one member we access refers to it.
+  pass
 
 
 cdef extern from "grpc/impl/codegen/grpc_types.h":
@@ -111,6 +110,8 @@ cdef extern from "grpc/grpc.h":
   void grpc_slice_unref(grpc_slice s) nogil
   grpc_slice grpc_empty_slice() nogil
   grpc_slice grpc_slice_new(void *p, size_t len, void (*destroy)(void *)) nogil
+  grpc_slice grpc_slice_new_with_user_data(
+      void *p, size_t len, void (*destroy)(void *), void *user_data) nogil
   grpc_slice grpc_slice_new_with_len(
       void *p, size_t len, void (*destroy)(void *, size_t)) nogil
   grpc_slice grpc_slice_malloc(size_t length) nogil
@@ -158,6 +159,10 @@ cdef extern from "grpc/grpc.h":
     # We don't care about the internals.
     pass
 
+  struct grpc_byte_buffer_reader:
+    # The (possibly decompressed) buffer the reader iterates over.
+    grpc_byte_buffer *buffer_out
+
   grpc_byte_buffer *grpc_raw_byte_buffer_create(grpc_slice *slices,
                                                 size_t nslices) nogil
   size_t grpc_byte_buffer_length(grpc_byte_buffer *bb) nogil
@@ -24,3 +24,28 @@ cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice)
 
 
 cdef tuple _metadata(grpc_metadata_array *c_metadata_array)
+
+
+cdef class PreparedMetadata:
+
+  cdef tuple _metadata
+  cdef grpc_metadata *c_metadata
+  cdef size_t c_count
+
+
+cdef class MetadataView:
+
+  cdef bytes _buffer
+  # Offsets of the keys and values in _buffer, with keys at even indices and
+  # the end of the buffer last.
+  cdef size_t *_offsets
+  cdef Py_ssize_t _count
+  # Maps decoded keys to the index of their first metadatum once needed.
+  cdef dict _first_indices
+
+  cdef bytes _raw(self, Py_ssize_t position)
+
+  cdef tuple _metadatum_at(self, Py_ssize_t index)
+
+
+cdef MetadataView _metadata_view(grpc_metadata_array *c_metadata_array)
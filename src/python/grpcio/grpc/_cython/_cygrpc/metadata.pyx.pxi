@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libc.string cimport memcpy
+
 import collections
+import collections.abc
 
 
 class InitialMetadataFlags:
@@ -26,7 +29,22 @@ _Metadatum = collections.namedtuple('_Metadatum', ('key', 'value',))
 
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count) except *:
-  if metadata is None:
+  cdef PreparedMetadata prepared_metadata
+  cdef size_t index
+  if isinstance(metadata, PreparedMetadata):
+    prepared_metadata = <PreparedMetadata>metadata
+    c_count[0] = prepared_metadata.c_count
+    if prepared_metadata.c_count == 0:
+      c_metadata[0] = NULL
+      return
+    c_metadata[0] = <grpc_metadata *>gpr_malloc(
+        prepared_metadata.c_count * sizeof(grpc_metadata))
+    for index in range(prepared_metadata.c_count):
+      c_metadata[0][index].key = grpc_slice_ref(
+          prepared_metadata.c_metadata[index].key)
+      c_metadata[0][index].value = grpc_slice_ref(
+          prepared_metadata.c_metadata[index].value)
+  elif metadata is None:
     c_count[0] = 0
     c_metadata[0] = NULL
   else:
@@ -58,6 +76,79 @@ cdef void _release_c_metadata(grpc_metadata *c_metadata, int count) except *:
     gpr_free(c_metadata)
 
 
+cdef class PreparedMetadata:
+  """Metadata encoded once so that it can be sent with many RPCs.
+
+  The keys and values are encoded into slices when the object is created. Each
+  RPC sending it then only takes another reference to those slices.
+  """
+
+  def __cinit__(self, metadata):
+    cdef grpc_metadata *c_metadata
+    cdef size_t c_count
+    self.c_metadata = NULL
+    self.c_count = 0
+    self._metadata = tuple(
+        _Metadatum(key, value) for key, value in metadata)
+    _store_c_metadata(self._metadata, &c_metadata, &c_count)
+    self.c_metadata = c_metadata
+    self.c_count = c_count
+
+  def __dealloc__(self):
+    _release_c_metadata(self.c_metadata, self.c_count)
+
+  def __len__(self):
+    return self.c_count
+
+  def __getitem__(self, index):
+    return self._metadata[index]
+
+  def __iter__(self):
+    return iter(self._metadata)
+
+  def index(self, value, start=0, stop=None):
+    """Returns the index of the first metadatum equal to the given value."""
+    return self._metadata.index(
+        value, *slice(start, stop).indices(len(self._metadata))[:2])
+
+  def count(self, value):
+    """Returns the number of metadata equal to the given value."""
+    return self._metadata.count(value)
+
+  def __eq__(self, other):
+    if isinstance(other, PreparedMetadata):
+      return self._metadata == (<PreparedMetadata>other)._metadata
+    if isinstance(other, tuple):
+      return self._metadata == other
+    return NotImplemented
+
+  def __ne__(self, other):
+    result = self.__eq__(other)
+    return result if result is NotImplemented else not result
+
+  def __hash__(self):
+    return hash(self._metadata)
+
+  def __add__(self, other):
+    if isinstance(other, (PreparedMetadata, tuple)):
+      return tuple(self) + tuple(other)
+    return NotImplemented
+
+  def __radd__(self, other):
+    if isinstance(other, tuple):
+      return other + tuple(self)
+    return NotImplemented
+
+  def __repr__(self):
+    return '{}({!r})'.format(type(self).__name__, self._metadata)
+
+  def __reduce__(self):
+    return type(self), (self._metadata,)
+
+
+collections.abc.Sequence.register(PreparedMetadata)
+
+
 cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice):
   cdef bytes key = _slice_bytes(key_slice)
   cdef bytes value = _slice_bytes(value_slice)
@@ -71,3 +162,148 @@ cdef tuple _metadata(grpc_metadata_array *c_metadata_array):
           c_metadata_array.metadata[index].key,
           c_metadata_array.metadata[index].value)
       for index in range(c_metadata_array.count))
+
+
+cdef class MetadataView:
+  """An immutable sequence of metadata decoded as it is accessed.
+
+  The keys and values are copied out of core into a single buffer and only
+  turned into _Metadatum when accessed, so that handlers reading a few
+  metadata out of many do not pay for the others. It compares equal to the
+  tuple of its metadatum and is otherwise used like one.
+  """
+
+  def __cinit__(self):
+    self._buffer = b''
+    self._offsets = NULL
+    self._count = 0
+    self._first_indices = None
+
+  def __dealloc__(self):
+    if self._offsets != NULL:
+      gpr_free(self._offsets)
+
+  cdef bytes _raw(self, Py_ssize_t position):
+    return self._buffer[self._offsets[position]:self._offsets[position + 1]]
+
+  cdef tuple _metadatum_at(self, Py_ssize_t index):
+    cdef bytes key = self._raw(2 * index)
+    cdef bytes value = self._raw(2 * index + 1)
+    return <tuple>_Metadatum(
+        _decode(key), value if key[-4:] == b'-bin' else _decode(value))
+
+  def __len__(self):
+    return self._count
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return tuple(
+          self._metadatum_at(position)
+          for position in range(*index.indices(self._count)))
+    if index < 0:
+      index += self._count
+    if not 0 <= index < self._count:
+      raise IndexError('metadata index out of range')
+    return self._metadatum_at(index)
+
+  def __iter__(self):
+    cdef Py_ssize_t index
+    for index in range(self._count):
+      yield self._metadatum_at(index)
+
+  def get(self, key, default=None):
+    """Returns the value of the first metadatum with the given key."""
+    cdef Py_ssize_t index
+    if self._first_indices is None:
+      self._first_indices = {}
+      for index in range(self._count - 1, -1, -1):
+        self._first_indices[_decode(self._raw(2 * index))] = index
+    index = self._first_indices.get(key, -1)
+    if index < 0:
+      return default
+    return self._metadatum_at(index)[1]
+
+  def get_all(self, key):
+    """Returns the values of all the metadata with the given key."""
+    cdef bytes encoded_key = _encode(key)
+    cdef Py_ssize_t index
+    return [
+        self._metadatum_at(index)[1] for index in range(self._count)
+        if self._raw(2 * index) == encoded_key]
+
+  def index(self, value, start=0, stop=None):
+    """Returns the index of the first metadatum equal to the given value."""
+    cdef Py_ssize_t index
+    for index in range(*slice(start, stop).indices(self._count)):
+      if self._metadatum_at(index) == value:
+        return index
+    raise ValueError('metadatum not in metadata')
+
+  def count(self, value):
+    """Returns the number of metadata equal to the given value."""
+    cdef Py_ssize_t index
+    cdef Py_ssize_t count = 0
+    for index in range(self._count):
+      if self._metadatum_at(index) == value:
+        count += 1
+    return count
+
+  def __eq__(self, other):
+    if isinstance(other, (MetadataView, tuple)):
+      return tuple(self) == tuple(other)
+    return NotImplemented
+
+  def __ne__(self, other):
+    if isinstance(other, (MetadataView, tuple)):
+      return tuple(self) != tuple(other)
+    return NotImplemented
+
+  def __hash__(self):
+    return hash(tuple(self))
+
+  def __add__(self, other):
+    if isinstance(other, (MetadataView, tuple)):
+      return tuple(self) + tuple(other)
+    return NotImplemented
+
+  def __radd__(self, other):
+    if isinstance(other, tuple):
+      return other + tuple(self)
+    return NotImplemented
+
+  def __repr__(self):
+    return repr(tuple(self))
+
+  def __reduce__(self):
+    return tuple, (tuple(self),)
+
+
+collections.abc.Sequence.register(MetadataView)
+
+
+cdef MetadataView _metadata_view(grpc_metadata_array *c_metadata_array):
+  cdef MetadataView view = MetadataView()
+  cdef size_t count = c_metadata_array.count
+  cdef size_t length = 0
+  cdef size_t index
+  cdef grpc_slice c_slice
+  if count == 0:
+    return view
+  for index in range(count):
+    length += grpc_slice_length(c_metadata_array.metadata[index].key)
+    length += grpc_slice_length(c_metadata_array.metadata[index].value)
+  view._buffer = cpython.PyBytes_FromStringAndSize(NULL, length)
+  cdef char *destination = cpython.PyBytes_AS_STRING(view._buffer)
+  view._offsets = <size_t *>gpr_malloc((2 * count + 1) * sizeof(size_t))
+  view._offsets[0] = 0
+  for index in range(2 * count):
+    if index % 2 == 0:
+      c_slice = c_metadata_array.metadata[index // 2].key
+    else:
+      c_slice = c_metadata_array.metadata[index // 2].value
+    length = grpc_slice_length(c_slice)
+    memcpy(destination + view._offsets[index], grpc_slice_start_ptr(c_slice),
+           length)
+    view._offsets[index + 1] = view._offsets[index] + length
+  view._count = count
+  return view
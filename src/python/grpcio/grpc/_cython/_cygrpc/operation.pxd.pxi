@@ -35,7 +35,7 @@ cdef class SendInitialMetadataOperation(Operation):
 
 cdef class SendMessageOperation(Operation):
 
-  cdef readonly bytes _message
+  cdef readonly object _message
   cdef readonly int _flags
   cdef grpc_byte_buffer *_c_message_byte_buffer
 
@@ -75,11 +75,17 @@ cdef class ReceiveInitialMetadataOperation(Operation):
   cdef void un_c(self) except *
 
 
+cdef class _SliceBuffer:
+
+  cdef grpc_slice _c_slice
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   cdef readonly int _flags
+  cdef bint _zero_copy
   cdef grpc_byte_buffer *_c_message_byte_buffer
-  cdef bytes _message
+  cdef object _message
 
   cdef void c(self) except *
   cdef void un_c(self) except *
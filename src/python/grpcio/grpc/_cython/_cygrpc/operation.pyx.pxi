@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libc.string cimport memcpy
+
 
 cdef class Operation:
 
@@ -46,12 +48,80 @@ cdef class SendInitialMetadataOperation(Operation):
         self._c_initial_metadata, self._c_initial_metadata_count)
 
 
+# Messages at least this large are sent by referencing the application's
+# buffer instead of copying it. Below this size, a copy is cheaper than queueing
+# the buffer to be released once Core is done with it.
+cdef size_t _ZERO_COPY_SEND_MIN_SIZE = 16 * 1024
+
+# The buffers of the message slices that Core has dropped. Core drops slices on
+# whichever thread holds their last reference, including its own threads, which
+# must not take the GIL; the buffers are released later by the threads of
+# channels and servers, which hold it. Buffers of slices dropped once the
+# interpreter is gone are never released, nor freed.
+cdef queue[Py_buffer *] _released_message_buffers
+cdef mutex _released_message_buffers_mu
+
+
+cdef void _release_message_buffer(void *user_data) noexcept nogil:
+  _released_message_buffers_mu.lock()
+  _released_message_buffers.push(<Py_buffer *>user_data)
+  _released_message_buffers_mu.unlock()
+
+
+cdef void _drain_released_message_buffers() noexcept:
+  cdef Py_buffer *view
+  while True:
+    _released_message_buffers_mu.lock()
+    if _released_message_buffers.empty():
+      _released_message_buffers_mu.unlock()
+      return
+    view = _released_message_buffers.front()
+    _released_message_buffers.pop()
+    _released_message_buffers_mu.unlock()
+    cpython.PyBuffer_Release(view)
+    gpr_free(view)
+
+
+cdef grpc_slice _slice_from_message(object message) except *:
+  """Creates a slice over a serialized message.
+
+  The message may be any object exporting a contiguous buffer. Large buffers
+  are referenced in place; the slice keeps the exporter alive and its buffer
+  acquired until Core releases the slice.
+  """
+  cdef Py_buffer *view
+  cdef grpc_slice message_slice
+  _drain_released_message_buffers()
+  if isinstance(message, bytes) and (
+      <size_t>len(<bytes>message) < _ZERO_COPY_SEND_MIN_SIZE):
+    return grpc_slice_from_copied_buffer(message, len(<bytes>message))
+  view = <Py_buffer *>gpr_malloc(sizeof(Py_buffer))
+  try:
+    cpython.PyObject_GetBuffer(message, view, cpython.PyBUF_SIMPLE)
+  except:
+    gpr_free(view)
+    raise
+  if <size_t>view.len < _ZERO_COPY_SEND_MIN_SIZE:
+    message_slice = grpc_slice_from_copied_buffer(
+        <const char *>view.buf, view.len)
+    cpython.PyBuffer_Release(view)
+    gpr_free(view)
+    return message_slice
+  return grpc_slice_new_with_user_data(
+      view.buf, view.len, _release_message_buffer, view)
+
+
 cdef class SendMessageOperation(Operation):
 
-  def __cinit__(self, bytes message, int flags):
+  def __cinit__(self, object message, int flags):
     if message is None:
       self._message = b''
+    elif isinstance(message, bytes):
+      self._message = message
     else:
+      # Fails early, on the calling thread, for objects that are not
+      # contiguous buffers.
+      memoryview(message).cast('B')
       self._message = message
     self._flags = flags
 
@@ -61,8 +131,7 @@ cdef class SendMessageOperation(Operation):
   cdef void c(self) except *:
     self.c_op.type = GRPC_OP_SEND_MESSAGE
     self.c_op.flags = self._flags
-    cdef grpc_slice message_slice = grpc_slice_from_copied_buffer(
-        self._message, len(self._message))
+    cdef grpc_slice message_slice = _slice_from_message(self._message)
     self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
         &message_slice, 1)
     grpc_slice_unref(message_slice)
@@ -142,10 +211,68 @@ cdef class ReceiveInitialMetadataOperation(Operation):
     return self._initial_metadata
 
 
+cdef class _SliceBuffer:
+  """A read-only buffer-protocol object over a grpc_slice.
+
+  The slice reference is owned by this object and dropped when it is
+  collected, so views handed out through memoryview keep the underlying
+  message memory alive for exactly as long as they are in use.
+  """
+
+  def __cinit__(self):
+    self._c_slice = grpc_empty_slice()
+
+  def __getbuffer__(self, Py_buffer *buffer, int flags):
+    cpython.PyBuffer_FillInfo(
+        buffer, self, grpc_slice_start_ptr(self._c_slice),
+        grpc_slice_length(self._c_slice), 1, flags)
+
+  def __releasebuffer__(self, Py_buffer *buffer):
+    pass
+
+  def __len__(self):
+    return grpc_slice_length(self._c_slice)
+
+  def __dealloc__(self):
+    grpc_slice_unref(self._c_slice)
+
+
+cdef size_t _append_slice(char *destination, size_t offset, grpc_slice source):
+  cdef size_t length = grpc_slice_length(source)
+  memcpy(destination + offset, grpc_slice_start_ptr(source), length)
+  grpc_slice_unref(source)
+  return offset + length
+
+
+cdef memoryview _read_message_buffer(grpc_byte_buffer_reader *reader):
+  # A message that arrived in a single slice is exposed as-is. A message spread
+  # over several slices is merged into one contiguous slice, which is still a
+  # single copy rather than the two made by the bytes path.
+  cdef _SliceBuffer message_buffer = _SliceBuffer()
+  cdef grpc_slice first_slice
+  cdef grpc_slice next_slice
+  cdef char *message_pointer
+  cdef size_t offset
+  if not grpc_byte_buffer_reader_next(reader, &first_slice):
+    return memoryview(message_buffer)
+  if not grpc_byte_buffer_reader_next(reader, &next_slice):
+    message_buffer._c_slice = first_slice
+    return memoryview(message_buffer)
+  message_buffer._c_slice = grpc_slice_malloc(
+      grpc_byte_buffer_length(reader.buffer_out))
+  message_pointer = <char *>grpc_slice_start_ptr(message_buffer._c_slice)
+  offset = _append_slice(message_pointer, 0, first_slice)
+  offset = _append_slice(message_pointer, offset, next_slice)
+  while grpc_byte_buffer_reader_next(reader, &next_slice):
+    offset = _append_slice(message_pointer, offset, next_slice)
+  return memoryview(message_buffer)
+
+
 cdef class ReceiveMessageOperation(Operation):
 
-  def __cinit__(self, flags):
+  def __cinit__(self, flags, bint zero_copy=False):
     self._flags = flags
+    self._zero_copy = zero_copy
 
   def type(self):
     return GRPC_OP_RECV_MESSAGE
@@ -165,7 +292,10 @@ cdef class ReceiveMessageOperation(Operation):
     if self._c_message_byte_buffer != NULL:
       message_reader_status = grpc_byte_buffer_reader_init(
           &message_reader, self._c_message_byte_buffer)
-      if message_reader_status:
+      if message_reader_status and self._zero_copy:
+        self._message = _read_message_buffer(&message_reader)
+        grpc_byte_buffer_reader_destroy(&message_reader)
+      elif message_reader_status:
         message = bytearray()
         while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
           message_slice_pointer = grpc_slice_start_ptr(message_slice)
@@ -14,11 +14,23 @@
 """Implementation of gRPC Python interceptors."""
 
 import collections
+import functools
 import sys
+import threading
 import types
-from typing import Any, Callable, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import grpc
+import grpc.experimental
 
 from ._typing import DeserializingFunction
 from ._typing import DoneCallbackType
@@ -26,12 +38,80 @@ from ._typing import MetadataType
 from ._typing import RequestIterableType
 from ._typing import SerializingFunction
 
+_MAXIMUM_CACHED_METHOD_HANDLERS = 1024
+
+
+def _first_metadata_value(metadata: Any, key: str) -> Any:
+    get = getattr(metadata, "get", None)
+    if get is not None:
+        return get(key)
+    for metadatum_key, value in metadata:
+        if metadatum_key == key:
+            return value
+    return None
+
+
+class _MethodHandlerCache(object):
+    """Caches the method handlers resolved through per-method interceptors.
+
+    Handlers are keyed by method name and by the first value of each metadata
+    key that an interceptor declared it decides by. Lookups take no lock, and
+    once full the cache evicts its oldest entries.
+    """
+
+    _metadata_keys: Tuple[str, ...]
+    _handlers: Dict[Hashable, grpc.RpcMethodHandler]
+    _lock: threading.Lock
+
+    def __init__(self, metadata_keys: Tuple[str, ...]):
+        self._metadata_keys = metadata_keys
+        self._handlers = {}
+        self._lock = threading.Lock()
+
+    def key(self, handler_call_details: grpc.HandlerCallDetails) -> Hashable:
+        if not self._metadata_keys:
+            return handler_call_details.method
+        metadata = handler_call_details.invocation_metadata or ()
+        return (handler_call_details.method,) + tuple(
+            _first_metadata_value(metadata, key) for key in self._metadata_keys
+        )
+
+    def get(self, key: Hashable) -> Optional[grpc.RpcMethodHandler]:
+        return self._handlers.get(key)
+
+    def put(self, key: Hashable, handler: grpc.RpcMethodHandler) -> None:
+        with self._lock:
+            while len(self._handlers) >= _MAXIMUM_CACHED_METHOD_HANDLERS:
+                del self._handlers[next(iter(self._handlers))]
+            self._handlers[key] = handler
+
+
+def method_handler_cache(
+    interceptors: Optional[Sequence[Any]],
+) -> Optional[_MethodHandlerCache]:
+    """Returns a cache if every interceptor only decides per method."""
+    if not interceptors:
+        return None
+    metadata_keys = []
+    for interceptor in interceptors:
+        interceptor_keys = getattr(
+            interceptor, "experimental_per_method_metadata_keys", None
+        )
+        if interceptor_keys is None:
+            return None
+        for key in interceptor_keys:
+            if key not in metadata_keys:
+                metadata_keys.append(key)
+    return _MethodHandlerCache(tuple(metadata_keys))
+
 
 class _ServicePipeline(object):
     interceptors: Tuple[grpc.ServerInterceptor]
+    _handler_cache: Optional[_MethodHandlerCache]
 
     def __init__(self, interceptors: Sequence[grpc.ServerInterceptor]):
         self.interceptors = tuple(interceptors)
+        self._handler_cache = method_handler_cache(self.interceptors)
 
     def _continuation(self, thunk: Callable, index: int) -> Callable:
         return lambda context: self._intercept_at(thunk, index, context)
@@ -48,7 +128,15 @@ class _ServicePipeline(object):
     def execute(
         self, thunk: Callable, context: grpc.HandlerCallDetails
     ) -> grpc.RpcMethodHandler:
-        return self._intercept_at(thunk, 0, context)
+        if self._handler_cache is None:
+            return self._intercept_at(thunk, 0, context)
+        key = self._handler_cache.key(context)
+        handler = self._handler_cache.get(key)
+        if handler is None:
+            handler = self._intercept_at(thunk, 0, context)
+            if handler is not None:
+                self._handler_cache.put(key, handler)
+        return handler
 
 
 def service_pipeline(
@@ -249,49 +337,207 @@ class _UnaryOutcome(grpc.Call, grpc.Future):
         fn(self)
 
 
-class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+_ClientInterceptor = Union[
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.experimental.ClientMetadataInterceptor,
+]
+
+
+def _observes_calls(interceptor: Any) -> bool:
+    return (
+        type(interceptor).observe_call
+        is not grpc.experimental.ClientMetadataInterceptor.observe_call
+    )
+
+
+class _InterceptedMultiCallable(object):
+    """Runs the RPCs of one method through a chain of client interceptors.
+
+    The chain is resolved once, when the multi-callable is created. While it
+    only holds ClientMetadataInterceptors, RPCs are invoked directly on the
+    underlying multi-callable once their metadata has been intercepted, with
+    no continuation, call details or outcome created per interceptor.
+    """
+
+    _INTERCEPTOR_TYPE: type
+
     _thunk: Callable
     _method: str
-    _interceptor: grpc.UnaryUnaryClientInterceptor
+    _interceptors: Tuple[_ClientInterceptor, ...]
+    _metadata_only: bool
+    _observers: Tuple[grpc.experimental.ClientMetadataInterceptor, ...]
 
     def __init__(
         self,
         thunk: Callable,
         method: str,
-        interceptor: grpc.UnaryUnaryClientInterceptor,
+        interceptors: Tuple[_ClientInterceptor, ...],
     ):
         self._thunk = thunk
         self._method = method
-        self._interceptor = interceptor
+        self._interceptors = interceptors
+        self._metadata_only = not any(
+            isinstance(interceptor, self._INTERCEPTOR_TYPE)
+            for interceptor in interceptors
+        )
+        # Calls are observed from the innermost interceptor outwards.
+        self._observers = tuple(
+            interceptor
+            for interceptor in reversed(interceptors)
+            if not isinstance(interceptor, self._INTERCEPTOR_TYPE)
+            and _observes_calls(interceptor)
+        )
 
-    def __call__(
+    def _intercept(
         self,
+        interceptor: Any,
+        continuation: Callable,
+        client_call_details: _ClientCallDetails,
         request: Any,
-        timeout: Optional[float] = None,
-        metadata: Optional[MetadataType] = None,
-        credentials: Optional[grpc.CallCredentials] = None,
-        wait_for_ready: Optional[bool] = None,
-        compression: Optional[grpc.Compression] = None,
     ) -> Any:
-        response, ignored_call = self._with_call(
+        raise NotImplementedError()
+
+    def _intercept_metadata(
+        self, metadata: Optional[MetadataType]
+    ) -> Optional[MetadataType]:
+        for interceptor in self._interceptors:
+            metadata = interceptor.intercept_metadata(self._method, metadata)
+        return metadata
+
+    def _observe(self, call: Any) -> None:
+        for observer in self._observers:
+            call.add_done_callback(
+                functools.partial(observer.observe_call, self._method)
+            )
+
+    def _continuation(
+        self,
+        index: int,
+        invoke: Callable,
+        client_call_details: _ClientCallDetails,
+    ) -> Callable:
+        def continuation(new_details, request):
+            if not isinstance(new_details, _ClientCallDetails):
+                new_details = _ClientCallDetails(
+                    *_unwrap_client_call_details(
+                        new_details, client_call_details
+                    )
+                )
+            if index == len(self._interceptors):
+                return invoke(new_details, request)
+            try:
+                return self._intercept_at(index, invoke, new_details, request)
+            except grpc.RpcError as rpc_error:
+                return rpc_error
+            except Exception as exception:  # pylint:disable=broad-except
+                return _FailureOutcome(exception, sys.exc_info()[2])
+
+        return continuation
+
+    def _intercept_at(
+        self,
+        index: int,
+        invoke: Callable,
+        client_call_details: _ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        interceptor = self._interceptors[index]
+        continuation = self._continuation(
+            index + 1, invoke, client_call_details
+        )
+        if isinstance(interceptor, self._INTERCEPTOR_TYPE):
+            return self._intercept(
+                interceptor, continuation, client_call_details, request
+            )
+        outcome = continuation(
+            client_call_details._replace(
+                metadata=interceptor.intercept_metadata(
+                    client_call_details.method, client_call_details.metadata
+                )
+            ),
+            request,
+        )
+        if _observes_calls(interceptor):
+            observe = functools.partial(
+                interceptor.observe_call, client_call_details.method
+            )
+            # Interceptors further down the chain may return outcomes of
+            # their own, which need not be Futures.
+            if isinstance(outcome, grpc.Future):
+                outcome.add_done_callback(observe)
+            elif isinstance(outcome, grpc.RpcError):
+                observe(outcome)
+        return outcome
+
+    def _invoke_with_call(
+        self, client_call_details: _ClientCallDetails, request: Any
+    ) -> Any:
+        try:
+            response, call = self._thunk(client_call_details.method).with_call(
+                request,
+                timeout=client_call_details.timeout,
+                metadata=client_call_details.metadata,
+                credentials=client_call_details.credentials,
+                wait_for_ready=client_call_details.wait_for_ready,
+                compression=client_call_details.compression,
+            )
+            return _UnaryOutcome(response, call)
+        except grpc.RpcError as rpc_error:
+            return rpc_error
+        except Exception as exception:  # pylint:disable=broad-except
+            return _FailureOutcome(exception, sys.exc_info()[2])
+
+    def _invoke_future(
+        self, client_call_details: _ClientCallDetails, request: Any
+    ) -> Any:
+        return self._thunk(client_call_details.method).future(
             request,
-            timeout=timeout,
-            metadata=metadata,
-            credentials=credentials,
-            wait_for_ready=wait_for_ready,
-            compression=compression,
+            timeout=client_call_details.timeout,
+            metadata=client_call_details.metadata,
+            credentials=client_call_details.credentials,
+            wait_for_ready=client_call_details.wait_for_ready,
+            compression=client_call_details.compression,
+        )
+
+    def _invoke_stream(
+        self, client_call_details: _ClientCallDetails, request: Any
+    ) -> Any:
+        return self._thunk(client_call_details.method)(
+            request,
+            timeout=client_call_details.timeout,
+            metadata=client_call_details.metadata,
+            credentials=client_call_details.credentials,
+            wait_for_ready=client_call_details.wait_for_ready,
+            compression=client_call_details.compression,
         )
-        return response
 
-    def _with_call(
+    def _blocking_with_call(
         self,
         request: Any,
-        timeout: Optional[float] = None,
-        metadata: Optional[MetadataType] = None,
-        credentials: Optional[grpc.CallCredentials] = None,
-        wait_for_ready: Optional[bool] = None,
-        compression: Optional[grpc.Compression] = None,
+        timeout: Optional[float],
+        metadata: Optional[MetadataType],
+        credentials: Optional[grpc.CallCredentials],
+        wait_for_ready: Optional[bool],
+        compression: Optional[grpc.Compression],
     ) -> Tuple[Any, grpc.Call]:
+        if self._metadata_only:
+            try:
+                response, call = self._thunk(self._method).with_call(
+                    request,
+                    timeout=timeout,
+                    metadata=self._intercept_metadata(metadata),
+                    credentials=credentials,
+                    wait_for_ready=wait_for_ready,
+                    compression=compression,
+                )
+            except grpc.RpcError as rpc_error:
+                self._observe(rpc_error)
+                raise
+            self._observe(call)
+            return response, call
         client_call_details = _ClientCallDetails(
             self._method,
             timeout,
@@ -300,35 +546,83 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             wait_for_ready,
             compression,
         )
+        call = self._intercept_at(
+            0, self._invoke_with_call, client_call_details, request
+        )
+        return call.result(), call
 
-        def continuation(new_details, request):
-            (
-                new_method,
-                new_timeout,
-                new_metadata,
-                new_credentials,
-                new_wait_for_ready,
-                new_compression,
-            ) = _unwrap_client_call_details(new_details, client_call_details)
-            try:
-                response, call = self._thunk(new_method).with_call(
+    def _non_blocking(
+        self,
+        invoke: Callable,
+        request: Any,
+        timeout: Optional[float],
+        metadata: Optional[MetadataType],
+        credentials: Optional[grpc.CallCredentials],
+        wait_for_ready: Optional[bool],
+        compression: Optional[grpc.Compression],
+    ) -> Any:
+        try:
+            if self._metadata_only:
+                call = invoke(
+                    _ClientCallDetails(
+                        self._method,
+                        timeout,
+                        self._intercept_metadata(metadata),
+                        credentials,
+                        wait_for_ready,
+                        compression,
+                    ),
                     request,
-                    timeout=new_timeout,
-                    metadata=new_metadata,
-                    credentials=new_credentials,
-                    wait_for_ready=new_wait_for_ready,
-                    compression=new_compression,
                 )
-                return _UnaryOutcome(response, call)
-            except grpc.RpcError as rpc_error:
-                return rpc_error
-            except Exception as exception:  # pylint:disable=broad-except
-                return _FailureOutcome(exception, sys.exc_info()[2])
+                self._observe(call)
+                return call
+            client_call_details = _ClientCallDetails(
+                self._method,
+                timeout,
+                metadata,
+                credentials,
+                wait_for_ready,
+                compression,
+            )
+            return self._intercept_at(0, invoke, client_call_details, request)
+        except Exception as exception:  # pylint:disable=broad-except
+            return _FailureOutcome(exception, sys.exc_info()[2])
 
-        call = self._interceptor.intercept_unary_unary(
+
+class _UnaryUnaryMultiCallable(
+    _InterceptedMultiCallable, grpc.UnaryUnaryMultiCallable
+):
+    _INTERCEPTOR_TYPE = grpc.UnaryUnaryClientInterceptor
+
+    def _intercept(
+        self,
+        interceptor: grpc.UnaryUnaryClientInterceptor,
+        continuation: Callable,
+        client_call_details: _ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return interceptor.intercept_unary_unary(
             continuation, client_call_details, request
         )
-        return call.result(), call
+
+    def __call__(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        response, ignored_call = self._blocking_with_call(
+            request,
+            timeout,
+            metadata,
+            credentials,
+            wait_for_ready,
+            compression,
+        )
+        return response
 
     def with_call(
         self,
@@ -339,13 +633,13 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ) -> Tuple[Any, grpc.Call]:
-        return self._with_call(
+        return self._blocking_with_call(
             request,
-            timeout=timeout,
-            metadata=metadata,
-            credentials=credentials,
-            wait_for_ready=wait_for_ready,
-            compression=compression,
+            timeout,
+            metadata,
+            credentials,
+            wait_for_ready,
+            compression,
         )
 
     def future(
@@ -357,8 +651,9 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ) -> Any:
-        client_call_details = _ClientCallDetails(
-            self._method,
+        return self._non_blocking(
+            self._invoke_future,
+            request,
             timeout,
             metadata,
             credentials,
@@ -366,46 +661,22 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             compression,
         )
 
-        def continuation(new_details, request):
-            (
-                new_method,
-                new_timeout,
-                new_metadata,
-                new_credentials,
-                new_wait_for_ready,
-                new_compression,
-            ) = _unwrap_client_call_details(new_details, client_call_details)
-            return self._thunk(new_method).future(
-                request,
-                timeout=new_timeout,
-                metadata=new_metadata,
-                credentials=new_credentials,
-                wait_for_ready=new_wait_for_ready,
-                compression=new_compression,
-            )
-
-        try:
-            return self._interceptor.intercept_unary_unary(
-                continuation, client_call_details, request
-            )
-        except Exception as exception:  # pylint:disable=broad-except
-            return _FailureOutcome(exception, sys.exc_info()[2])
 
+class _UnaryStreamMultiCallable(
+    _InterceptedMultiCallable, grpc.UnaryStreamMultiCallable
+):
+    _INTERCEPTOR_TYPE = grpc.UnaryStreamClientInterceptor
 
-class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
-    _thunk: Callable
-    _method: str
-    _interceptor: grpc.UnaryStreamClientInterceptor
-
-    def __init__(
+    def _intercept(
         self,
-        thunk: Callable,
-        method: str,
         interceptor: grpc.UnaryStreamClientInterceptor,
-    ):
-        self._thunk = thunk
-        self._method = method
-        self._interceptor = interceptor
+        continuation: Callable,
+        client_call_details: _ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return interceptor.intercept_unary_stream(
+            continuation, client_call_details, request
+        )
 
     def __call__(
         self,
@@ -416,8 +687,9 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ):
-        client_call_details = _ClientCallDetails(
-            self._method,
+        return self._non_blocking(
+            self._invoke_stream,
+            request,
             timeout,
             metadata,
             credentials,
@@ -425,67 +697,24 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             compression,
         )
 
-        def continuation(new_details, request):
-            (
-                new_method,
-                new_timeout,
-                new_metadata,
-                new_credentials,
-                new_wait_for_ready,
-                new_compression,
-            ) = _unwrap_client_call_details(new_details, client_call_details)
-            return self._thunk(new_method)(
-                request,
-                timeout=new_timeout,
-                metadata=new_metadata,
-                credentials=new_credentials,
-                wait_for_ready=new_wait_for_ready,
-                compression=new_compression,
-            )
-
-        try:
-            return self._interceptor.intercept_unary_stream(
-                continuation, client_call_details, request
-            )
-        except Exception as exception:  # pylint:disable=broad-except
-            return _FailureOutcome(exception, sys.exc_info()[2])
 
+class _StreamUnaryMultiCallable(
+    _InterceptedMultiCallable, grpc.StreamUnaryMultiCallable
+):
+    _INTERCEPTOR_TYPE = grpc.StreamUnaryClientInterceptor
 
-class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
-    _thunk: Callable
-    _method: str
-    _interceptor: grpc.StreamUnaryClientInterceptor
-
-    def __init__(
+    def _intercept(
         self,
-        thunk: Callable,
-        method: str,
         interceptor: grpc.StreamUnaryClientInterceptor,
-    ):
-        self._thunk = thunk
-        self._method = method
-        self._interceptor = interceptor
-
-    def __call__(
-        self,
+        continuation: Callable,
+        client_call_details: _ClientCallDetails,
         request_iterator: RequestIterableType,
-        timeout: Optional[float] = None,
-        metadata: Optional[MetadataType] = None,
-        credentials: Optional[grpc.CallCredentials] = None,
-        wait_for_ready: Optional[bool] = None,
-        compression: Optional[grpc.Compression] = None,
     ) -> Any:
-        response, ignored_call = self._with_call(
-            request_iterator,
-            timeout=timeout,
-            metadata=metadata,
-            credentials=credentials,
-            wait_for_ready=wait_for_ready,
-            compression=compression,
+        return interceptor.intercept_stream_unary(
+            continuation, client_call_details, request_iterator
         )
-        return response
 
-    def _with_call(
+    def __call__(
         self,
         request_iterator: RequestIterableType,
         timeout: Optional[float] = None,
@@ -493,44 +722,16 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         credentials: Optional[grpc.CallCredentials] = None,
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
-    ) -> Tuple[Any, grpc.Call]:
-        client_call_details = _ClientCallDetails(
-            self._method,
+    ) -> Any:
+        response, ignored_call = self._blocking_with_call(
+            request_iterator,
             timeout,
             metadata,
             credentials,
             wait_for_ready,
             compression,
         )
-
-        def continuation(new_details, request_iterator):
-            (
-                new_method,
-                new_timeout,
-                new_metadata,
-                new_credentials,
-                new_wait_for_ready,
-                new_compression,
-            ) = _unwrap_client_call_details(new_details, client_call_details)
-            try:
-                response, call = self._thunk(new_method).with_call(
-                    request_iterator,
-                    timeout=new_timeout,
-                    metadata=new_metadata,
-                    credentials=new_credentials,
-                    wait_for_ready=new_wait_for_ready,
-                    compression=new_compression,
-                )
-                return _UnaryOutcome(response, call)
-            except grpc.RpcError as rpc_error:
-                return rpc_error
-            except Exception as exception:  # pylint:disable=broad-except
-                return _FailureOutcome(exception, sys.exc_info()[2])
-
-        call = self._interceptor.intercept_stream_unary(
-            continuation, client_call_details, request_iterator
-        )
-        return call.result(), call
+        return response
 
     def with_call(
         self,
@@ -541,13 +742,13 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ) -> Tuple[Any, grpc.Call]:
-        return self._with_call(
+        return self._blocking_with_call(
             request_iterator,
-            timeout=timeout,
-            metadata=metadata,
-            credentials=credentials,
-            wait_for_ready=wait_for_ready,
-            compression=compression,
+            timeout,
+            metadata,
+            credentials,
+            wait_for_ready,
+            compression,
         )
 
     def future(
@@ -559,8 +760,9 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ) -> Any:
-        client_call_details = _ClientCallDetails(
-            self._method,
+        return self._non_blocking(
+            self._invoke_future,
+            request_iterator,
             timeout,
             metadata,
             credentials,
@@ -568,46 +770,22 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             compression,
         )
 
-        def continuation(new_details, request_iterator):
-            (
-                new_method,
-                new_timeout,
-                new_metadata,
-                new_credentials,
-                new_wait_for_ready,
-                new_compression,
-            ) = _unwrap_client_call_details(new_details, client_call_details)
-            return self._thunk(new_method).future(
-                request_iterator,
-                timeout=new_timeout,
-                metadata=new_metadata,
-                credentials=new_credentials,
-                wait_for_ready=new_wait_for_ready,
-                compression=new_compression,
-            )
 
-        try:
-            return self._interceptor.intercept_stream_unary(
-                continuation, client_call_details, request_iterator
-            )
-        except Exception as exception:  # pylint:disable=broad-except
-            return _FailureOutcome(exception, sys.exc_info()[2])
-
-
-class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
-    _thunk: Callable
-    _method: str
-    _interceptor: grpc.StreamStreamClientInterceptor
+class _StreamStreamMultiCallable(
+    _InterceptedMultiCallable, grpc.StreamStreamMultiCallable
+):
+    _INTERCEPTOR_TYPE = grpc.StreamStreamClientInterceptor
 
-    def __init__(
+    def _intercept(
         self,
-        thunk: Callable,
-        method: str,
         interceptor: grpc.StreamStreamClientInterceptor,
-    ):
-        self._thunk = thunk
-        self._method = method
-        self._interceptor = interceptor
+        continuation: Callable,
+        client_call_details: _ClientCallDetails,
+        request_iterator: RequestIterableType,
+    ) -> Any:
+        return interceptor.intercept_stream_stream(
+            continuation, client_call_details, request_iterator
+        )
 
     def __call__(
         self,
@@ -618,8 +796,9 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ):
-        client_call_details = _ClientCallDetails(
-            self._method,
+        return self._non_blocking(
+            self._invoke_stream,
+            request_iterator,
             timeout,
             metadata,
             credentials,
@@ -627,53 +806,76 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             compression,
         )
 
-        def continuation(new_details, request_iterator):
-            (
-                new_method,
-                new_timeout,
-                new_metadata,
-                new_credentials,
-                new_wait_for_ready,
-                new_compression,
-            ) = _unwrap_client_call_details(new_details, client_call_details)
-            return self._thunk(new_method)(
-                request_iterator,
-                timeout=new_timeout,
-                metadata=new_metadata,
-                credentials=new_credentials,
-                wait_for_ready=new_wait_for_ready,
-                compression=new_compression,
-            )
 
-        try:
-            return self._interceptor.intercept_stream_stream(
-                continuation, client_call_details, request_iterator
-            )
-        except Exception as exception:  # pylint:disable=broad-except
-            return _FailureOutcome(exception, sys.exc_info()[2])
+def _interceptors_of_type(
+    interceptors: Tuple[_ClientInterceptor, ...], interceptor_type: type
+) -> Tuple[_ClientInterceptor, ...]:
+    return tuple(
+        interceptor
+        for interceptor in interceptors
+        if isinstance(interceptor, interceptor_type)
+        or isinstance(interceptor, grpc.experimental.ClientMetadataInterceptor)
+    )
 
 
 class _Channel(grpc.Channel):
     _channel: grpc.Channel
-    _interceptor: Union[
-        grpc.UnaryUnaryClientInterceptor,
-        grpc.UnaryStreamClientInterceptor,
-        grpc.StreamStreamClientInterceptor,
-        grpc.StreamUnaryClientInterceptor,
-    ]
+    _interceptors: Tuple[_ClientInterceptor, ...]
+    _unary_unary_interceptors: Tuple[_ClientInterceptor, ...]
+    _unary_stream_interceptors: Tuple[_ClientInterceptor, ...]
+    _stream_unary_interceptors: Tuple[_ClientInterceptor, ...]
+    _stream_stream_interceptors: Tuple[_ClientInterceptor, ...]
 
     def __init__(
         self,
         channel: grpc.Channel,
-        interceptor: Union[
-            grpc.UnaryUnaryClientInterceptor,
-            grpc.UnaryStreamClientInterceptor,
-            grpc.StreamStreamClientInterceptor,
-            grpc.StreamUnaryClientInterceptor,
-        ],
+        interceptors: Tuple[_ClientInterceptor, ...],
     ):
         self._channel = channel
-        self._interceptor = interceptor
+        self._interceptors = interceptors
+        self._unary_unary_interceptors = _interceptors_of_type(
+            interceptors, grpc.UnaryUnaryClientInterceptor
+        )
+        self._unary_stream_interceptors = _interceptors_of_type(
+            interceptors, grpc.UnaryStreamClientInterceptor
+        )
+        self._stream_unary_interceptors = _interceptors_of_type(
+            interceptors, grpc.StreamUnaryClientInterceptor
+        )
+        self._stream_stream_interceptors = _interceptors_of_type(
+            interceptors, grpc.StreamStreamClientInterceptor
+        )
+
+    @staticmethod
+    def _thunk(
+        create_multi_callable: Callable,
+        method: str,
+        request_serializer: Optional[SerializingFunction],
+        response_deserializer: Optional[DeserializingFunction],
+        _registered_method: Optional[bool],
+    ) -> Callable:
+        # pytype: disable=wrong-arg-count
+        multi_callable = create_multi_callable(
+            method,
+            request_serializer,
+            response_deserializer,
+            _registered_method,
+        )
+
+        # Interceptors rarely change the method, so the underlying
+        # multi-callable is only created anew when one does.
+        def thunk(new_method):
+            if new_method == method:
+                return multi_callable
+            return create_multi_callable(
+                new_method,
+                request_serializer,
+                response_deserializer,
+                _registered_method,
+            )
+
+        # pytype: enable=wrong-arg-count
+        return thunk
 
     def subscribe(
         self, callback: Callable, try_to_connect: Optional[bool] = False
@@ -691,16 +893,17 @@ class _Channel(grpc.Channel):
         response_deserializer: Optional[DeserializingFunction] = None,
         _registered_method: Optional[bool] = False,
     ) -> grpc.UnaryUnaryMultiCallable:
-        # pytype: disable=wrong-arg-count
-        thunk = lambda m: self._channel.unary_unary(
-            m,
+        thunk = self._thunk(
+            self._channel.unary_unary,
+            method,
             request_serializer,
             response_deserializer,
             _registered_method,
         )
-        # pytype: enable=wrong-arg-count
-        if isinstance(self._interceptor, grpc.UnaryUnaryClientInterceptor):
-            return _UnaryUnaryMultiCallable(thunk, method, self._interceptor)
+        if self._unary_unary_interceptors:
+            return _UnaryUnaryMultiCallable(
+                thunk, method, self._unary_unary_interceptors
+            )
         return thunk(method)
 
     # pylint: disable=arguments-differ
@@ -711,16 +914,17 @@ class _Channel(grpc.Channel):
         response_deserializer: Optional[DeserializingFunction] = None,
         _registered_method: Optional[bool] = False,
     ) -> grpc.UnaryStreamMultiCallable:
-        # pytype: disable=wrong-arg-count
-        thunk = lambda m: self._channel.unary_stream(
-            m,
+        thunk = self._thunk(
+            self._channel.unary_stream,
+            method,
             request_serializer,
             response_deserializer,
             _registered_method,
         )
-        # pytype: enable=wrong-arg-count
-        if isinstance(self._interceptor, grpc.UnaryStreamClientInterceptor):
-            return _UnaryStreamMultiCallable(thunk, method, self._interceptor)
+        if self._unary_stream_interceptors:
+            return _UnaryStreamMultiCallable(
+                thunk, method, self._unary_stream_interceptors
+            )
         return thunk(method)
 
     # pylint: disable=arguments-differ
@@ -731,16 +935,17 @@ class _Channel(grpc.Channel):
         response_deserializer: Optional[DeserializingFunction] = None,
         _registered_method: Optional[bool] = False,
     ) -> grpc.StreamUnaryMultiCallable:
-        # pytype: disable=wrong-arg-count
-        thunk = lambda m: self._channel.stream_unary(
-            m,
+        thunk = self._thunk(
+            self._channel.stream_unary,
+            method,
             request_serializer,
             response_deserializer,
             _registered_method,
         )
-        # pytype: enable=wrong-arg-count
-        if isinstance(self._interceptor, grpc.StreamUnaryClientInterceptor):
-            return _StreamUnaryMultiCallable(thunk, method, self._interceptor)
+        if self._stream_unary_interceptors:
+            return _StreamUnaryMultiCallable(
+                thunk, method, self._stream_unary_interceptors
+            )
         return thunk(method)
 
     # pylint: disable=arguments-differ
@@ -751,16 +956,17 @@ class _Channel(grpc.Channel):
         response_deserializer: Optional[DeserializingFunction] = None,
         _registered_method: Optional[bool] = False,
     ) -> grpc.StreamStreamMultiCallable:
-        # pytype: disable=wrong-arg-count
-        thunk = lambda m: self._channel.stream_stream(
-            m,
+        thunk = self._thunk(
+            self._channel.stream_stream,
+            method,
             request_serializer,
             response_deserializer,
             _registered_method,
         )
-        # pytype: enable=wrong-arg-count
-        if isinstance(self._interceptor, grpc.StreamStreamClientInterceptor):
-            return _StreamStreamMultiCallable(thunk, method, self._interceptor)
+        if self._stream_stream_interceptors:
+            return _StreamStreamMultiCallable(
+                thunk, method, self._stream_stream_interceptors
+            )
         return thunk(method)
 
     def _close(self):
@@ -779,31 +985,35 @@ class _Channel(grpc.Channel):
 
 def intercept_channel(
     channel: grpc.Channel,
-    *interceptors: Optional[
-        Sequence[
-            Union[
-                grpc.UnaryUnaryClientInterceptor,
-                grpc.UnaryStreamClientInterceptor,
-                grpc.StreamStreamClientInterceptor,
-                grpc.StreamUnaryClientInterceptor,
-            ]
-        ]
-    ],
+    *interceptors: Optional[Sequence[_ClientInterceptor]],
 ) -> grpc.Channel:
-    for interceptor in reversed(list(interceptors)):
+    for interceptor in interceptors:
         if (
             not isinstance(interceptor, grpc.UnaryUnaryClientInterceptor)
             and not isinstance(interceptor, grpc.UnaryStreamClientInterceptor)
             and not isinstance(interceptor, grpc.StreamUnaryClientInterceptor)
             and not isinstance(interceptor, grpc.StreamStreamClientInterceptor)
+            and not isinstance(
+                interceptor, grpc.experimental.ClientMetadataInterceptor
+            )
         ):
             error_msg = (
                 "interceptor must be "
                 "grpc.UnaryUnaryClientInterceptor or "
                 "grpc.UnaryStreamClientInterceptor or "
                 "grpc.StreamUnaryClientInterceptor or "
-                "grpc.StreamStreamClientInterceptor"
+                "grpc.StreamStreamClientInterceptor or "
+                "grpc.experimental.ClientMetadataInterceptor"
             )
             raise TypeError(error_msg)
-        channel = _Channel(channel, interceptor)
-    return channel
+    if not interceptors:
+        return channel
+    # Intercepting an intercepted channel extends its chain rather than
+    # nesting another one around it, so that every RPC runs a single chain.
+    if isinstance(channel, _Channel):
+        return _Channel(
+            channel._channel,  # pylint: disable=protected-access
+            tuple(interceptors)
+            + channel._interceptors,  # pylint: disable=protected-access
+        )
+    return _Channel(channel, tuple(interceptors))
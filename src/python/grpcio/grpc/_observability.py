@@ -89,7 +89,7 @@ class ObservabilityPlugin(
     @abc.abstractmethod
     def create_client_call_tracer(
         self, method_name: bytes, target: bytes
-    ) -> ClientCallTracerCapsule:
+    ) -> Optional[ClientCallTracerCapsule]:
         """Creates a ClientCallTracerCapsule.
 
         After register the plugin, if tracing or stats is enabled, this method
@@ -105,7 +105,8 @@ class ObservabilityPlugin(
           registered_method: Whether this method is pre-registered.
 
         Returns:
-          A PyCapsule which stores a ClientCallTracer object.
+          A PyCapsule which stores a ClientCallTracer object, or None if the
+          call should not be traced.
         """
         raise NotImplementedError()
 
@@ -161,7 +162,8 @@ class ObservabilityPlugin(
         """Record the latency of the RPC.
 
         After register the plugin, if stats is enabled, this method will be
-        called at the end of each RPC.
+        called at the end of each RPC for which create_client_call_tracer
+        returned a tracer.
 
         Args:
           method: The fully-qualified name of the RPC method being invoked.
@@ -173,6 +175,19 @@ class ObservabilityPlugin(
         """
         raise NotImplementedError()
 
+    def record_response_cache_lookup(self, method: str, hit: bool) -> None:
+        """Record a lookup in a client-side response cache.
+
+        After register the plugin, if stats is enabled, this method will be
+        called for each RPC of a method cached by a
+        grpc.experimental.ResponseCache. Lookups are not recorded unless
+        this method is overridden.
+
+        Args:
+          method: The fully-qualified name of the RPC method being invoked.
+          hit: Whether the RPC was answered from the cache.
+        """
+
     def set_tracing(self, enable: bool) -> None:
         """Enable or disable tracing.
 
@@ -279,10 +294,9 @@ def maybe_record_rpc_latency(state: "_channel._RPCState") -> None:
       state: a grpc._channel._RPCState object which contains the stats related to the
     RPC.
     """
-    # TODO(xuanwn): use channel args to exclude those metrics.
-    for exclude_prefix in _SERVICES_TO_EXCLUDE:
-        if exclude_prefix in state.method.encode("utf8"):
-            return
+    # Calls without a tracer were either excluded or not sampled.
+    if not state.traced:
+        return
     with get_plugin() as plugin:
         if plugin and plugin.stats_enabled:
             rpc_latency_s = state.rpc_end_time - state.rpc_start_time
@@ -292,6 +306,18 @@ def maybe_record_rpc_latency(state: "_channel._RPCState") -> None:
             )
 
 
+def maybe_record_response_cache_lookup(method: str, hit: bool) -> None:
+    """Record a response cache lookup, if the plugin is registered and stats is enabled.
+
+    Args:
+      method: The fully-qualified name of the RPC method being invoked.
+      hit: Whether the RPC was answered from the cache.
+    """
+    with get_plugin() as plugin:
+        if plugin and plugin.stats_enabled:
+            plugin.record_response_cache_lookup(method, hit)
+
+
 def create_server_call_tracer_factory_option(
     xds: bool,
 ) -> Union[Tuple[ChannelArgumentType], Tuple[()]]:
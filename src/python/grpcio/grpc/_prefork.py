@@ -0,0 +1,595 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Serving RPCs from a supervised pool of pre-forked worker processes.
+
+The parent process never creates any gRPC Core object of its own: it only
+records the handlers and ports of the server, reserves the ports with
+SO_REUSEPORT sockets and forks the workers, each of which then builds and runs
+an ordinary server bound to the same ports. This is the only way to keep all
+of gRPC's fork-safety requirements without GRPC_ENABLE_FORK_SUPPORT.
+"""
+
+import logging
+import multiprocessing
+from multiprocessing import connection
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import grpc
+from grpc import _common
+from grpc._typing import ChannelArgumentType
+
+_LOGGER = logging.getLogger(__name__)
+
+_REUSE_PORT_OPTION = "grpc.so_reuseport"
+
+_READY = "ready"
+_FAILED = "failed"
+_STOP = "stop"
+NO_STOP_REQUEST = object()
+
+_POLL_PERIOD_S = 0.1
+_SUPERVISION_PERIOD_S = 1.0
+# A worker which dies sooner than this after being forked is not restarted
+# before this much time has passed, to keep crashing workers from spinning.
+_RESTART_BACKOFF_S = 1.0
+# How long workers get to exit on top of the grace period before they are
+# terminated.
+_STOP_TIMEOUT_S = 5.0
+
+
+def validate_processes(processes: Optional[int]) -> None:
+    if processes is None:
+        return
+    if processes < 1:
+        raise ValueError(
+            "processes must be a positive integer, got {}".format(processes)
+        )
+    if sys.platform == "win32" or not hasattr(socket, "SO_REUSEPORT"):
+        raise ValueError(
+            "Pre-forked servers are not supported on this platform."
+        )
+
+
+def reuse_port_options(
+    options: Sequence[ChannelArgumentType],
+) -> Sequence[ChannelArgumentType]:
+    return tuple(
+        option for option in options if option[0] != _REUSE_PORT_OPTION
+    ) + ((_REUSE_PORT_OPTION, 1),)
+
+
+def _split_address(address: str) -> Tuple[str, int]:
+    if address.endswith("]") or ":" not in address:
+        return address, 0
+    host, _, port = address.rpartition(":")
+    try:
+        return host, int(port)
+    except ValueError:
+        raise ValueError(
+            "Pre-forked servers can only listen on TCP ports, got {}".format(
+                address
+            )
+        ) from None
+
+
+def _reservation_addresses(
+    host: str, port: int
+) -> List[Tuple[int, Tuple[Any, ...]]]:
+    """Returns the address families and addresses to bind, in order."""
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1]
+    if host in ("", "::"):
+        # Like the workers, listens on every interface, of both families
+        # where IPv6 is available.
+        return [(socket.AF_INET6, ("::", port)), (socket.AF_INET, ("", port))]
+    return [
+        (family, address)
+        for family, _, _, _, address in socket.getaddrinfo(
+            host, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+        )
+    ]
+
+
+def _reserve_port(host: str, port: int) -> Optional[socket.socket]:
+    """Binds a SO_REUSEPORT socket holding a port for the workers.
+
+    The socket is bound to the host on which the workers listen, in the
+    address family of that host. It never listens, so it receives no
+    connections; it only keeps other processes from taking the port while
+    workers are being restarted.
+    """
+    try:
+        addresses = _reservation_addresses(host, port)
+    except OSError:
+        _LOGGER.debug("Failed to resolve host %s.", host, exc_info=True)
+        return None
+    for family, address in addresses:
+        try:
+            reservation = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            # The address family is not supported.
+            continue
+        try:
+            reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            if (
+                reservation.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+                == 0
+            ):
+                raise RuntimeError("Failed to set SO_REUSEPORT.")
+            reservation.bind(address)
+        except OSError:
+            _LOGGER.debug(
+                "Failed to reserve port %d on %s.",
+                port,
+                address[0],
+                exc_info=True,
+            )
+            reservation.close()
+            continue
+        except:
+            reservation.close()
+            raise
+        return reservation
+    return None
+
+
+class ServerConfiguration(object):
+    """The handlers and ports applied to the server of every worker."""
+
+    _lock: threading.Lock
+    _started: bool
+    _generic_handlers: List[grpc.GenericRpcHandler]
+    _registered_method_handlers: List[
+        Tuple[str, Dict[str, grpc.RpcMethodHandler]]
+    ]
+    _ports: List[Tuple[str, Optional[grpc.ServerCredentials]]]
+    reservations: List[socket.socket]
+
+    def __init__(self, generic_handlers: Sequence[grpc.GenericRpcHandler]):
+        self._lock = threading.Lock()
+        self._started = False
+        self._generic_handlers = list(generic_handlers)
+        self._registered_method_handlers = []
+        self._ports = []
+        self.reservations = []
+
+    def _check_not_started(self) -> None:
+        if self._started:
+            raise ValueError(
+                "Pre-forked servers cannot be changed once started."
+            )
+
+    def add_generic_rpc_handlers(
+        self, generic_rpc_handlers: Sequence[grpc.GenericRpcHandler]
+    ) -> None:
+        with self._lock:
+            self._check_not_started()
+            self._generic_handlers.extend(generic_rpc_handlers)
+
+    def add_registered_method_handlers(
+        self,
+        service_name: str,
+        method_handlers: Dict[str, grpc.RpcMethodHandler],
+    ) -> None:
+        with self._lock:
+            # Mirrors servers ignoring registrations once started.
+            if not self._started:
+                self._registered_method_handlers.append(
+                    (service_name, method_handlers)
+                )
+
+    def add_port(
+        self,
+        address: str,
+        server_credentials: Optional[grpc.ServerCredentials],
+    ) -> int:
+        host, port = _split_address(address)
+        with self._lock:
+            self._check_not_started()
+            reservation = _reserve_port(host, port)
+            if reservation is None:
+                return _common.validate_port_binding_result(address, 0)
+            self.reservations.append(reservation)
+            port = reservation.getsockname()[1]
+            self._ports.append(("{}:{}".format(host, port), server_credentials))
+            return port
+
+    def freeze(self) -> None:
+        with self._lock:
+            self._started = True
+
+    def apply(self, server: Any) -> None:
+        """Applies the configuration to a grpc.Server or grpc.aio.Server."""
+        if self._generic_handlers:
+            server.add_generic_rpc_handlers(self._generic_handlers)
+        for service_name, method_handlers in self._registered_method_handlers:
+            server.add_registered_method_handlers(service_name, method_handlers)
+        for address, server_credentials in self._ports:
+            if server_credentials is None:
+                server.add_insecure_port(address)
+            else:
+                server.add_secure_port(address, server_credentials)
+
+    def release_ports(self) -> None:
+        for reservation in self.reservations:
+            reservation.close()
+
+
+def poll_stop_request(worker_connection: connection.Connection) -> Any:
+    """Returns the grace of a pending stop request, or NO_STOP_REQUEST.
+
+    A worker whose parent has died is told to stop immediately.
+    """
+    if not worker_connection.poll(_POLL_PERIOD_S):
+        return NO_STOP_REQUEST
+    try:
+        _, grace = worker_connection.recv()
+    except (EOFError, OSError):
+        return None
+    return grace
+
+
+def notify_ready(worker_connection: connection.Connection) -> None:
+    worker_connection.send((_READY, None))
+
+
+class _Worker(object):
+    process: multiprocessing.process.BaseProcess
+    connection: connection.Connection
+    started_at: float
+    reported: bool
+    serving: bool
+
+    def __init__(
+        self,
+        process: multiprocessing.process.BaseProcess,
+        parent_connection: connection.Connection,
+    ):
+        self.process = process
+        self.connection = parent_connection
+        self.started_at = time.monotonic()
+        self.reported = False
+        self.serving = False
+
+    def receive_status(self) -> Optional[str]:
+        """Records the worker's readiness; returns why it failed, if it did."""
+        self.reported = True
+        try:
+            status, details = self.connection.recv()
+        except (EOFError, OSError):
+            return "Worker process exited with code {}.".format(
+                self.process.exitcode
+            )
+        if status == _READY:
+            self.serving = True
+            return None
+        return details
+
+
+class WorkerPool(object):
+    """Forks, supervises and stops the worker processes of a server.
+
+    Workers that die while the pool is serving are forked again, and stop
+    requests are relayed to every worker so that they all drain their RPCs
+    within the same grace period.
+    """
+
+    _context: Any
+    _processes: int
+    _target: Callable[[connection.Connection], None]
+    _configuration: ServerConfiguration
+    _lock: threading.Lock
+    _workers: List[_Worker]
+    _started: bool
+    _stopping: bool
+    _wakeup_reader: connection.Connection
+    _wakeup_writer: connection.Connection
+    termination_event: threading.Event
+
+    def __init__(
+        self,
+        processes: int,
+        target: Callable[[connection.Connection], None],
+        configuration: ServerConfiguration,
+    ):
+        self._context = multiprocessing.get_context("fork")
+        self._processes = processes
+        self._target = target
+        self._configuration = configuration
+        self._lock = threading.Lock()
+        self._workers = []
+        self._started = False
+        self._stopping = False
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(
+            duplex=False
+        )
+        self.termination_event = threading.Event()
+
+    def _run_worker(
+        self,
+        parent_connection: connection.Connection,
+        worker_connection: connection.Connection,
+    ) -> None:
+        # Only the connection to the parent may stay open in the worker;
+        # otherwise workers would not see EOF when the parent dies.
+        parent_connection.close()
+        for worker in self._workers:
+            worker.connection.close()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+        self._configuration.release_ports()
+        # Interrupts are handled by the parent, which stops every worker.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            self._target(worker_connection)
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Exception serving in worker process!")
+            try:
+                worker_connection.send((_FAILED, repr(exception)))
+            except OSError:
+                pass
+            sys.exit(1)
+
+    def _fork_worker(self) -> _Worker:
+        parent_connection, worker_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=self._run_worker,
+            args=(parent_connection, worker_connection),
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+        return _Worker(process, parent_connection)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                raise ValueError("Cannot start already-started server!")
+            self._started = True
+            for _ in range(self._processes):
+                self._workers.append(self._fork_worker())
+            failures = [
+                failure
+                for failure in (
+                    worker.receive_status() for worker in self._workers
+                )
+                if failure is not None
+            ]
+        if failures:
+            self.stop(None).wait()
+            raise RuntimeError(
+                "Failed to start worker processes: {}".format(
+                    "; ".join(failures)
+                )
+            )
+        thread = threading.Thread(target=self._supervise)
+        thread.daemon = True
+        thread.start()
+
+    def _supervise(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                waitables = [self._wakeup_reader]
+                timeout = _SUPERVISION_PERIOD_S
+                for worker in self._workers:
+                    if worker.process.exitcode is None:
+                        waitables.append(worker.process.sentinel)
+                        if not worker.reported:
+                            waitables.append(worker.connection)
+                    else:
+                        # Dead, but waiting out its restart backoff.
+                        timeout = min(
+                            timeout,
+                            worker.started_at
+                            + _RESTART_BACKOFF_S
+                            - time.monotonic(),
+                        )
+            ready = connection.wait(waitables, timeout=max(0, timeout))
+            dead_workers = []
+            with self._lock:
+                if self._stopping:
+                    return
+                for index, worker in enumerate(self._workers):
+                    if worker.process.is_alive():
+                        if not worker.reported and worker.connection in ready:
+                            failure = worker.receive_status()
+                            if failure is not None:
+                                _LOGGER.error(
+                                    "Restarted worker failed to serve: %s",
+                                    failure,
+                                )
+                        continue
+                    worker.serving = False
+                    if (
+                        time.monotonic() - worker.started_at
+                        >= _RESTART_BACKOFF_S
+                    ):
+                        dead_workers.append((index, worker))
+            if dead_workers:
+                self._restart(dead_workers)
+
+    def _restart(self, dead_workers: Sequence[Tuple[int, _Worker]]) -> None:
+        # The lock is not held while forking, so that the other threads of
+        # the parent neither wait on the fork nor leave the lock held in the
+        # workers. Each replacement is installed before the next one is
+        # forked, which thus inherits and closes its connection.
+        for index, worker in dead_workers:
+            _LOGGER.warning(
+                "Worker process %d exited with code %s; restarting.",
+                worker.process.pid,
+                worker.process.exitcode,
+            )
+            worker.connection.close()
+            worker.process.join()
+            replacement = self._fork_worker()
+            with self._lock:
+                if not self._stopping:
+                    self._workers[index] = replacement
+                    continue
+            # The pool stopped while the replacement was being forked,
+            # without knowing of it.
+            replacement.process.terminate()
+            replacement.process.join()
+            replacement.connection.close()
+            return
+
+    def serving_worker_count(self) -> int:
+        with self._lock:
+            return sum(
+                1
+                for worker in self._workers
+                if worker.serving and worker.process.is_alive()
+            )
+
+    def _await_workers(
+        self, workers: Sequence[_Worker], grace: Optional[float]
+    ) -> None:
+        deadline = time.monotonic() + (grace or 0) + _STOP_TIMEOUT_S
+        for worker in workers:
+            worker.process.join(max(0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                _LOGGER.warning(
+                    "Terminating worker process %d, which did not stop.",
+                    worker.process.pid,
+                )
+                worker.process.terminate()
+                worker.process.join()
+            worker.connection.close()
+        self._configuration.release_ports()
+        self.termination_event.set()
+
+    def stop(self, grace: Optional[float]) -> threading.Event:
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self._configuration.release_ports()
+                self.termination_event.set()
+                return self.termination_event
+            if self.termination_event.is_set():
+                return self.termination_event
+            workers = list(self._workers)
+            for worker in workers:
+                try:
+                    worker.connection.send((_STOP, grace))
+                except OSError:
+                    # The worker already exited.
+                    pass
+            if not self._stopping:
+                self._stopping = True
+                self._wakeup_writer.send(None)
+                self._wakeup_writer.close()
+                thread = threading.Thread(
+                    target=self._await_workers, args=(workers, grace)
+                )
+                thread.daemon = True
+                thread.start()
+        return self.termination_event
+
+
+class _Server(grpc.Server):
+    """A grpc.Server whose RPCs are served by pre-forked worker processes."""
+
+    _configuration: ServerConfiguration
+    _pool: WorkerPool
+
+    def __init__(
+        self,
+        processes: int,
+        generic_handlers: Sequence[grpc.GenericRpcHandler],
+        server_factory: Callable[[], grpc.Server],
+    ):
+        self._configuration = ServerConfiguration(generic_handlers)
+        self._server_factory = server_factory
+        self._pool = WorkerPool(
+            processes, self._serve_in_worker, self._configuration
+        )
+
+    def _serve_in_worker(self, worker_connection: connection.Connection):
+        server = self._server_factory()
+        self._configuration.apply(server)
+        server.start()
+        notify_ready(worker_connection)
+        grace = poll_stop_request(worker_connection)
+        while grace is NO_STOP_REQUEST:
+            grace = poll_stop_request(worker_connection)
+        # Once the parent has died, every poll returns at once, so only the
+        # first stop request is acted upon.
+        server.stop(grace).wait()
+
+    def add_generic_rpc_handlers(
+        self, generic_rpc_handlers: Sequence[grpc.GenericRpcHandler]
+    ) -> None:
+        from grpc import _server  # pylint: disable=cyclic-import
+
+        _server._validate_generic_rpc_handlers(generic_rpc_handlers)
+        self._configuration.add_generic_rpc_handlers(generic_rpc_handlers)
+
+    def add_registered_method_handlers(
+        self,
+        service_name: str,
+        method_handlers: Dict[str, grpc.RpcMethodHandler],
+    ) -> None:
+        self._configuration.add_registered_method_handlers(
+            service_name, method_handlers
+        )
+
+    def add_insecure_port(self, address: str) -> int:
+        return self._configuration.add_port(address, None)
+
+    def add_secure_port(
+        self, address: str, server_credentials: grpc.ServerCredentials
+    ) -> int:
+        return self._configuration.add_port(address, server_credentials)
+
+    def start(self) -> None:
+        self._configuration.freeze()
+        self._pool.start()
+
+    def stop(self, grace: Optional[float]) -> threading.Event:
+        shutdown_event = self._pool.stop(grace)
+        if grace is None:
+            shutdown_event.wait()
+        return shutdown_event
+
+    def wait_for_termination(self, timeout: Optional[float] = None) -> bool:
+        return _common.wait(
+            self._pool.termination_event.wait,
+            self._pool.termination_event.is_set,
+            timeout=timeout,
+        )
+
+    def serving_worker_count(self) -> int:
+        """Returns how many worker processes are currently serving.
+
+        This is an EXPERIMENTAL API.
+        """
+        return self._pool.serving_worker_count()
+
+
+def create_server(
+    processes: int,
+    generic_handlers: Sequence[grpc.GenericRpcHandler],
+    server_factory: Callable[[], grpc.Server],
+) -> _Server:
+    from grpc import _server  # pylint: disable=cyclic-import
+
+    _server._validate_generic_rpc_handlers(generic_handlers)
+    return _Server(processes, generic_handlers, server_factory)
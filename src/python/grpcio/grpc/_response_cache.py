@@ -0,0 +1,381 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A client-side cache of the responses of unary-unary RPCs."""
+
+from __future__ import annotations
+
+import collections
+import functools
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+import grpc
+from grpc import _observability
+from grpc._typing import DoneCallbackType
+from grpc._typing import MetadataType
+
+CacheKey = Tuple[str, bytes]
+
+_FAILURE_REPR_FORMAT = (
+    "<{} of cached RPC that terminated with:\n"
+    "\tstatus = {}\n"
+    '\tdetails = "{}"\n'
+    ">"
+)
+
+_CacheEntry = collections.namedtuple(
+    "_CacheEntry",
+    (
+        "code",
+        "details",
+        "response",
+        "initial_metadata",
+        "trailing_metadata",
+        "size",
+        "expiry",
+    ),
+)
+
+ResponseCacheStats = collections.namedtuple(
+    "ResponseCacheStats",
+    ("hits", "misses", "evictions", "entries", "size"),
+)
+
+
+def _serialize_request(request: Any) -> bytes:
+    if isinstance(request, bytes):
+        return request
+    if isinstance(request, (bytearray, memoryview)):
+        return bytes(request)
+    return request.SerializeToString(deterministic=True)
+
+
+def _response_size(response: Any) -> int:
+    if isinstance(response, (bytes, bytearray, memoryview)):
+        return len(response)
+    return response.ByteSize()
+
+
+class ResponseCache(object):
+    """Caches the responses of unary-unary RPCs on the client.
+
+    Responses of the cached methods are kept per method and serialized
+    request, in least-recently-used order and for a bounded time. An RPC
+    whose response is cached is answered without touching the network or
+    the response deserializer, with the very response object received
+    earlier, which therefore must not be mutated. Failed RPCs may be cached
+    as well, so that e.g. lookups of missing resources fail fast. Metadata
+    and credentials of RPCs are not part of the key, so only methods whose
+    responses depend on the request alone may be cached.
+
+    The cache applies to the channels it intercepts, which may be sync
+    channels, through the interceptor returned by interceptor(), or AsyncIO
+    channels, through the interceptor returned by aio_interceptor(). Lookups
+    are reported to the registered observability plugin, if any, through
+    its record_response_cache_lookup method.
+
+    This is an EXPERIMENTAL API.
+    """
+
+    def __init__(
+        self,
+        methods: Iterable[str],
+        maximum_entries: int = 1024,
+        maximum_size: Optional[int] = None,
+        ttl: float = 60.0,
+        negative_ttl: Optional[float] = None,
+        negative_codes: Iterable[grpc.StatusCode] = (
+            grpc.StatusCode.NOT_FOUND,
+        ),
+        request_serializer: Optional[Callable[[Any], bytes]] = None,
+        response_size: Optional[Callable[[Any], int]] = None,
+    ):
+        """Constructor.
+
+        Args:
+          methods: The fully-qualified names of the unary-unary methods whose
+            responses are cached, e.g. "/package.Service/Method".
+          maximum_entries: The maximum number of entries kept.
+          maximum_size: The optional maximum total size in bytes of the
+            serialized requests and responses kept.
+          ttl: The number of seconds for which a response is kept.
+          negative_ttl: The optional number of seconds for which failures
+            with one of negative_codes are kept. Failures are not cached
+            unless given.
+          negative_codes: The status codes of the failures to cache.
+          request_serializer: An optional callable serializing requests into
+            the bytes keying the cache. Defaults to the deterministic
+            serialization of protobuf messages, while bytes requests key the
+            cache as they are.
+          response_size: An optional callable returning the size in bytes of
+            a response. Defaults to the ByteSize of protobuf messages, or the
+            length of bytes responses.
+        """
+        self._methods = frozenset(methods)
+        self._maximum_entries = maximum_entries
+        self._maximum_size = maximum_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._negative_codes = frozenset(negative_codes)
+        self._request_serializer = request_serializer or _serialize_request
+        self._response_size = response_size or _response_size
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _caches(self, method: str) -> bool:
+        return method in self._methods
+
+    def _key(self, method: str, request: Any) -> CacheKey:
+        return method, self._request_serializer(request)
+
+    def _lookup(self, key: CacheKey) -> Optional[_CacheEntry]:
+        """Returns the live entry for a key, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expiry <= now:
+                del self._entries[key]
+                self._size -= entry.size
+                entry = None
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        _observability.maybe_record_response_cache_lookup(
+            key[0], entry is not None
+        )
+        return entry
+
+    def _store_response(
+        self,
+        key: CacheKey,
+        response: Any,
+        details: Optional[str],
+        initial_metadata: Optional[MetadataType],
+        trailing_metadata: Optional[MetadataType],
+    ) -> None:
+        self._insert(
+            key,
+            _CacheEntry(
+                grpc.StatusCode.OK,
+                details,
+                response,
+                initial_metadata,
+                trailing_metadata,
+                len(key[1]) + self._response_size(response),
+                time.monotonic() + self._ttl,
+            ),
+        )
+
+    def _store_failure(
+        self,
+        key: CacheKey,
+        code: grpc.StatusCode,
+        details: Optional[str],
+        initial_metadata: Optional[MetadataType],
+        trailing_metadata: Optional[MetadataType],
+    ) -> None:
+        if self._negative_ttl is None or code not in self._negative_codes:
+            return
+        self._insert(
+            key,
+            _CacheEntry(
+                code,
+                details,
+                None,
+                initial_metadata,
+                trailing_metadata,
+                len(key[1]),
+                time.monotonic() + self._negative_ttl,
+            ),
+        )
+
+    def _insert(self, key: CacheKey, entry: _CacheEntry) -> None:
+        if self._maximum_size is not None and self._maximum_size < entry.size:
+            return
+        with self._lock:
+            previous_entry = self._entries.pop(key, None)
+            if previous_entry is not None:
+                self._size -= previous_entry.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while len(self._entries) > self._maximum_entries or (
+                self._maximum_size is not None
+                and self._size > self._maximum_size
+            ):
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._size -= evicted_entry.size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drops all entries of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> ResponseCacheStats:
+        """Returns the counters of the cache.
+
+        Returns:
+          A ResponseCacheStats with the fields hits, misses, evictions,
+          entries and size, the latter being the total size in bytes of the
+          entries kept.
+        """
+        with self._lock:
+            return ResponseCacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+            )
+
+    def interceptor(self) -> grpc.UnaryUnaryClientInterceptor:
+        """Returns an interceptor applying the cache to sync channels.
+
+        Returns:
+          A grpc.UnaryUnaryClientInterceptor to be passed to
+          grpc.intercept_channel.
+        """
+        return _ResponseCacheInterceptor(self)
+
+    def aio_interceptor(self) -> Any:
+        """Returns an interceptor applying the cache to AsyncIO channels.
+
+        Returns:
+          A grpc.aio.UnaryUnaryClientInterceptor to be passed to the
+          interceptors of a grpc.aio channel.
+        """
+        from grpc.aio import _response_cache  # pylint: disable=cyclic-import
+
+        return _response_cache.ResponseCacheInterceptor(self)
+
+
+class _CachedCall(grpc.Call):
+    _entry: _CacheEntry
+
+    def __init__(self, entry: _CacheEntry):
+        self._entry = entry
+
+    def initial_metadata(self) -> Optional[MetadataType]:
+        return self._entry.initial_metadata
+
+    def trailing_metadata(self) -> Optional[MetadataType]:
+        return self._entry.trailing_metadata
+
+    def code(self) -> Optional[grpc.StatusCode]:
+        return self._entry.code
+
+    def details(self) -> Optional[str]:
+        return self._entry.details
+
+    def is_active(self) -> bool:
+        return False
+
+    def time_remaining(self) -> Optional[float]:
+        return None
+
+    def cancel(self) -> bool:
+        return False
+
+    def add_callback(self, unused_callback) -> bool:
+        return False
+
+
+class _CachedFailure(
+    _CachedCall, grpc.RpcError, grpc.Future
+):  # pylint: disable=too-many-ancestors
+    def cancelled(self) -> bool:
+        return False
+
+    def running(self) -> bool:
+        return False
+
+    def done(self) -> bool:
+        return True
+
+    def result(self, ignored_timeout: Optional[float] = None):
+        raise self
+
+    def exception(self, ignored_timeout: Optional[float] = None):
+        return self
+
+    def traceback(self, ignored_timeout: Optional[float] = None):
+        return None
+
+    def add_done_callback(self, fn: DoneCallbackType) -> None:
+        fn(self)
+
+    def __str__(self) -> str:
+        return _FAILURE_REPR_FORMAT.format(
+            self.__class__.__name__, self._entry.code, self._entry.details
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _store_outcome(cache: ResponseCache, key: CacheKey, call: Any) -> None:
+    code = call.code()
+    if code is grpc.StatusCode.OK:
+        cache._store_response(
+            key,
+            call.result(),
+            call.details(),
+            call.initial_metadata(),
+            call.trailing_metadata(),
+        )
+    elif code is not None:
+        cache._store_failure(
+            key,
+            code,
+            call.details(),
+            call.initial_metadata(),
+            call.trailing_metadata(),
+        )
+
+
+class _ResponseCacheInterceptor(grpc.UnaryUnaryClientInterceptor):
+    _cache: ResponseCache
+
+    def __init__(self, cache: ResponseCache):
+        self._cache = cache
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not self._cache._caches(client_call_details.method):
+            return continuation(client_call_details, request)
+        key = self._cache._key(client_call_details.method, request)
+        entry = self._cache._lookup(key)
+        if entry is None:
+            outcome = continuation(client_call_details, request)
+            # Interceptors further down the chain may return outcomes of
+            # their own, which need not be Futures. Those are not cached.
+            if isinstance(outcome, grpc.Future):
+                outcome.add_done_callback(
+                    functools.partial(_store_outcome, self._cache, key)
+                )
+            return outcome
+        if entry.code is grpc.StatusCode.OK:
+            from grpc import _interceptor  # pylint: disable=cyclic-import
+
+            return _interceptor._UnaryOutcome(
+                entry.response, _CachedCall(entry)
+            )
+        return _CachedFailure(entry)
@@ -18,6 +18,7 @@ from __future__ import annotations
 import abc
 import collections
 from concurrent import futures
+import contextlib
 import contextvars
 import enum
 import logging
@@ -54,6 +55,7 @@ from grpc._typing import ResponseType
 from grpc._typing import SerializingFunction
 from grpc._typing import ServerCallbackTag
 from grpc._typing import ServerTagCallbackType
+import grpc.experimental
 from typing_extensions import override
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,17 +63,14 @@ _LOGGER = logging.getLogger(__name__)
 _SHUTDOWN_TAG = "shutdown"
 _REQUEST_CALL_TAG = "request_call"
 
-_RECEIVE_CLOSE_ON_SERVER_TOKEN = "receive_close_on_server"
-_SEND_INITIAL_METADATA_TOKEN = "send_initial_metadata"
-_RECEIVE_MESSAGE_TOKEN = "receive_message"
-_SEND_MESSAGE_TOKEN = "send_message"
-_SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN = (
-    "send_initial_metadata * send_message"
-)
-_SEND_STATUS_FROM_SERVER_TOKEN = "send_status_from_server"
-_SEND_INITIAL_METADATA_AND_SEND_STATUS_FROM_SERVER_TOKEN = (
-    "send_initial_metadata * send_status_from_server"
-)
+# Each token is a bit of the due bitmask of an _RPCState.
+_RECEIVE_CLOSE_ON_SERVER_TOKEN = 1 << 0
+_SEND_INITIAL_METADATA_TOKEN = 1 << 1
+_RECEIVE_MESSAGE_TOKEN = 1 << 2
+_SEND_MESSAGE_TOKEN = 1 << 3
+_SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN = 1 << 4
+_SEND_STATUS_FROM_SERVER_TOKEN = 1 << 5
+_SEND_INITIAL_METADATA_AND_SEND_STATUS_FROM_SERVER_TOKEN = 1 << 6
 
 _OPEN = "open"
 _CLOSED = "closed"
@@ -83,7 +82,9 @@ _DEALLOCATED_SERVER_CHECK_PERIOD_S = 1.0
 _INF_TIMEOUT = 1e9
 
 
-def _serialized_request(request_event: cygrpc.BaseEvent) -> bytes:
+def _serialized_request(
+    request_event: cygrpc.BaseEvent,
+) -> Optional[Union[bytes, memoryview]]:
     return request_event.batch_operations[0].message()
 
 
@@ -179,10 +180,9 @@ class _GenericMethod(_Method):
         return None
 
 
-class _RPCState(object):
+class _RPCState(_common.LazyConditionState):
     context: contextvars.Context
-    condition: threading.Condition
-    due = Set[str]
+    due: int
     request: Any
     client: str
     initial_metadata_allowed: bool
@@ -195,11 +195,34 @@ class _RPCState(object):
     rpc_errors: List[Exception]
     callbacks: Optional[List[NullaryCallbackType]]
     aborted: bool
+    compression_policy: Optional[_compression.CompressionPolicy]
+    default_compression: Optional[grpc.Compression]
+    method: Optional[bytes]
+
+    __slots__ = (
+        "context",
+        "due",
+        "request",
+        "client",
+        "initial_metadata_allowed",
+        "compression_algorithm",
+        "disable_next_compression",
+        "trailing_metadata",
+        "code",
+        "details",
+        "statused",
+        "rpc_errors",
+        "callbacks",
+        "aborted",
+        "compression_policy",
+        "default_compression",
+        "method",
+    )
 
     def __init__(self):
+        super(_RPCState, self).__init__()
         self.context = contextvars.Context()
-        self.condition = threading.Condition()
-        self.due = set()
+        self.due = 0
         self.request = None
         self.client = _OPEN
         self.initial_metadata_allowed = True
@@ -212,6 +235,11 @@ class _RPCState(object):
         self.rpc_errors = []
         self.callbacks = []
         self.aborted = False
+        # The default compression algorithm and the method are only recorded
+        # for the compression policy, if any.
+        self.compression_policy = None
+        self.default_compression = None
+        self.method = None
 
 
 def _raise_rpc_error(state: _RPCState) -> None:
@@ -221,9 +249,9 @@ def _raise_rpc_error(state: _RPCState) -> None:
 
 
 def _possibly_finish_call(
-    state: _RPCState, token: str
+    state: _RPCState, token: int
 ) -> ServerTagCallbackType:
-    state.due.remove(token)
+    state.due &= ~token
     if not _is_rpc_state_active(state) and not state.due:
         callbacks = state.callbacks
         state.callbacks = None
@@ -231,9 +259,9 @@ def _possibly_finish_call(
     return None, ()
 
 
-def _send_status_from_server(state: _RPCState, token: str) -> ServerCallbackTag:
+def _send_status_from_server(state: _RPCState, token: int) -> ServerCallbackTag:
     def send_status_from_server(unused_send_status_from_server_event):
-        with state.condition:
+        with state.lock:
             return _possibly_finish_call(state, token)
 
     return send_status_from_server
@@ -242,7 +270,7 @@ def _send_status_from_server(state: _RPCState, token: str) -> ServerCallbackTag:
 def _get_initial_metadata(
     state: _RPCState, metadata: Optional[MetadataType]
 ) -> Optional[MetadataType]:
-    with state.condition:
+    with state.lock:
         if state.compression_algorithm:
             compression_metadata = (
                 _compression.compression_algorithm_to_metadata(
@@ -295,17 +323,17 @@ def _abort(
             operations, _send_status_from_server(state, token)
         )
         state.statused = True
-        state.due.add(token)
+        state.due |= token
 
 
 def _receive_close_on_server(state: _RPCState) -> ServerCallbackTag:
     def receive_close_on_server(receive_close_on_server_event):
-        with state.condition:
+        with state.lock:
             if receive_close_on_server_event.batch_operations[0].cancelled():
                 state.client = _CANCELLED
             elif state.client is _OPEN:
                 state.client = _CLOSED
-            state.condition.notify_all()
+            state.notify_all()
             return _possibly_finish_call(state, _RECEIVE_CLOSE_ON_SERVER_TOKEN)
 
     return receive_close_on_server
@@ -319,16 +347,16 @@ def _receive_message(
     def receive_message(receive_message_event):
         serialized_request = _serialized_request(receive_message_event)
         if serialized_request is None:
-            with state.condition:
+            with state.lock:
                 if state.client is _OPEN:
                     state.client = _CLOSED
-                state.condition.notify_all()
+                state.notify_all()
                 return _possibly_finish_call(state, _RECEIVE_MESSAGE_TOKEN)
         else:
             request = _common.deserialize(
                 serialized_request, request_deserializer
             )
-            with state.condition:
+            with state.lock:
                 if request is None:
                     _abort(
                         state,
@@ -338,7 +366,7 @@ def _receive_message(
                     )
                 else:
                     state.request = request
-                state.condition.notify_all()
+                state.notify_all()
                 return _possibly_finish_call(state, _RECEIVE_MESSAGE_TOKEN)
 
     return receive_message
@@ -346,16 +374,16 @@ def _receive_message(
 
 def _send_initial_metadata(state: _RPCState) -> ServerCallbackTag:
     def send_initial_metadata(unused_send_initial_metadata_event):
-        with state.condition:
+        with state.lock:
             return _possibly_finish_call(state, _SEND_INITIAL_METADATA_TOKEN)
 
     return send_initial_metadata
 
 
-def _send_message(state: _RPCState, token: str) -> ServerCallbackTag:
+def _send_message(state: _RPCState, token: int) -> ServerCallbackTag:
     def send_message(unused_send_message_event):
-        with state.condition:
-            state.condition.notify_all()
+        with state.lock:
+            state.notify_all()
             return _possibly_finish_call(state, token)
 
     return send_message
@@ -377,7 +405,7 @@ class _Context(grpc.ServicerContext):
         self._request_deserializer = request_deserializer
 
     def is_active(self) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             return _is_rpc_state_active(self._state)
 
     def time_remaining(self) -> float:
@@ -387,14 +415,14 @@ class _Context(grpc.ServicerContext):
         self._rpc_event.call.cancel()
 
     def add_callback(self, callback: NullaryCallbackType) -> bool:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.callbacks is None:
                 return False
             self._state.callbacks.append(callback)
             return True
 
     def disable_next_message_compression(self) -> None:
-        with self._state.condition:
+        with self._state.lock:
             self._state.disable_next_compression = True
 
     def invocation_metadata(self) -> Optional[MetadataType]:
@@ -419,11 +447,11 @@ class _Context(grpc.ServicerContext):
         }
 
     def set_compression(self, compression: grpc.Compression) -> None:
-        with self._state.condition:
+        with self._state.lock:
             self._state.compression_algorithm = compression
 
     def send_initial_metadata(self, initial_metadata: MetadataType) -> None:
-        with self._state.condition:
+        with self._state.lock:
             if self._state.client is _CANCELLED:
                 _raise_rpc_error(self._state)
             if self._state.initial_metadata_allowed:
@@ -434,13 +462,13 @@ class _Context(grpc.ServicerContext):
                     (operation,), _send_initial_metadata(self._state)
                 )
                 self._state.initial_metadata_allowed = False
-                self._state.due.add(_SEND_INITIAL_METADATA_TOKEN)
+                self._state.due |= _SEND_INITIAL_METADATA_TOKEN
             else:
                 error_msg = "Initial metadata no longer allowed!"
                 raise ValueError(error_msg)
 
     def set_trailing_metadata(self, trailing_metadata: MetadataType) -> None:
-        with self._state.condition:
+        with self._state.lock:
             self._state.trailing_metadata = trailing_metadata
 
     def trailing_metadata(self) -> Optional[MetadataType]:
@@ -454,7 +482,7 @@ class _Context(grpc.ServicerContext):
             )
             code = grpc.StatusCode.UNKNOWN
             details = ""
-        with self._state.condition:
+        with self._state.lock:
             self._state.code = code
             self._state.details = _common.encode(details)
             self._state.aborted = True
@@ -465,14 +493,14 @@ class _Context(grpc.ServicerContext):
         self.abort(status.code, status.details)
 
     def set_code(self, code: grpc.StatusCode) -> None:
-        with self._state.condition:
+        with self._state.lock:
             self._state.code = code
 
     def code(self) -> grpc.StatusCode:
         return self._state.code
 
     def set_details(self, details: str) -> None:
-        with self._state.condition:
+        with self._state.lock:
             self._state.details = _common.encode(details)
 
     def details(self) -> bytes:
@@ -504,19 +532,24 @@ class _RequestIterator(object):
             raise StopIteration()
         else:
             self._call.start_server_batch(
-                (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                (
+                    cygrpc.ReceiveMessageOperation(
+                        _EMPTY_FLAGS,
+                        _common.zero_copy_receive(self._request_deserializer),
+                    ),
+                ),
                 _receive_message(
                     self._state, self._call, self._request_deserializer
                 ),
             )
-            self._state.due.add(_RECEIVE_MESSAGE_TOKEN)
+            self._state.due |= _RECEIVE_MESSAGE_TOKEN
 
     def _look_for_request(self) -> Any:
         if self._state.client is _CANCELLED:
             _raise_rpc_error(self._state)
         elif (
             self._state.request is None
-            and _RECEIVE_MESSAGE_TOKEN not in self._state.due
+            and not self._state.due & _RECEIVE_MESSAGE_TOKEN
         ):
             raise StopIteration()
         else:
@@ -527,7 +560,7 @@ class _RequestIterator(object):
         raise AssertionError()  # should never run
 
     def _next(self) -> Any:
-        with self._state.condition:
+        with self._state.lock:
             self._raise_or_start_receive_message()
             while True:
                 self._state.condition.wait()
@@ -551,14 +584,19 @@ def _unary_request(
     request_deserializer: Optional[DeserializingFunction],
 ) -> Callable[[], Any]:
     def unary_request():
-        with state.condition:
+        with state.lock:
             if not _is_rpc_state_active(state):
                 return None
             rpc_event.call.start_server_batch(
-                (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                (
+                    cygrpc.ReceiveMessageOperation(
+                        _EMPTY_FLAGS,
+                        _common.zero_copy_receive(request_deserializer),
+                    ),
+                ),
                 _receive_message(state, rpc_event.call, request_deserializer),
             )
-            state.due.add(_RECEIVE_MESSAGE_TOKEN)
+            state.due |= _RECEIVE_MESSAGE_TOKEN
             while True:
                 state.condition.wait()
                 if state.request is None:
@@ -608,7 +646,7 @@ def _call_behavior(
                 response_or_iterator = behavior(argument, context)
             return response_or_iterator, True
         except Exception as exception:  # pylint: disable=broad-except
-            with state.condition:
+            with state.lock:
                 if state.aborted:
                     _abort(
                         state,
@@ -653,7 +691,7 @@ def _take_response_from_response_iterator(
     except StopIteration:
         return None, True
     except Exception as exception:  # pylint: disable=broad-except
-        with state.condition:
+        with state.lock:
             if state.aborted:
                 _abort(
                     state,
@@ -681,7 +719,7 @@ def _serialize_response(
 ) -> Optional[bytes]:
     serialized_response = _common.serialize(response, response_serializer)
     if serialized_response is None:
-        with state.condition:
+        with state.lock:
             _abort(
                 state,
                 rpc_event.call,
@@ -693,22 +731,28 @@ def _serialize_response(
 
 
 def _get_send_message_op_flags_from_state(
-    state: _RPCState,
+    state: _RPCState, serialized_response: bytes
 ) -> Union[int, cygrpc.WriteFlag]:
     if state.disable_next_compression:
         return cygrpc.WriteFlag.no_compress
+    if state.compression_policy is not None:
+        return state.compression_policy.write_flags(
+            state.method,
+            len(serialized_response),
+            state.compression_algorithm or state.default_compression,
+        )
     return _EMPTY_FLAGS
 
 
 def _reset_per_message_state(state: _RPCState) -> None:
-    with state.condition:
+    with state.lock:
         state.disable_next_compression = False
 
 
 def _send_response(
     rpc_event: cygrpc.BaseEvent, state: _RPCState, serialized_response: bytes
 ) -> bool:
-    with state.condition:
+    with state.lock:
         if not _is_rpc_state_active(state):
             return False
         if state.initial_metadata_allowed:
@@ -716,7 +760,9 @@ def _send_response(
                 _get_initial_metadata_operation(state, None),
                 cygrpc.SendMessageOperation(
                     serialized_response,
-                    _get_send_message_op_flags_from_state(state),
+                    _get_send_message_op_flags_from_state(
+                        state, serialized_response
+                    ),
                 ),
             )
             state.initial_metadata_allowed = False
@@ -725,18 +771,20 @@ def _send_response(
             operations = (
                 cygrpc.SendMessageOperation(
                     serialized_response,
-                    _get_send_message_op_flags_from_state(state),
+                    _get_send_message_op_flags_from_state(
+                        state, serialized_response
+                    ),
                 ),
             )
             token = _SEND_MESSAGE_TOKEN
         rpc_event.call.start_server_batch(
             operations, _send_message(state, token)
         )
-        state.due.add(token)
+        state.due |= token
         _reset_per_message_state(state)
         while True:
             state.condition.wait()
-            if token not in state.due:
+            if not state.due & token:
                 return _is_rpc_state_active(state)
 
 
@@ -745,7 +793,7 @@ def _status(
     state: _RPCState,
     serialized_response: Optional[bytes],
 ) -> None:
-    with state.condition:
+    with state.lock:
         if state.client is not _CANCELLED:
             code = _completion_code(state)
             details = _details(state)
@@ -760,7 +808,9 @@ def _status(
                 operations.append(
                     cygrpc.SendMessageOperation(
                         serialized_response,
-                        _get_send_message_op_flags_from_state(state),
+                        _get_send_message_op_flags_from_state(
+                            state, serialized_response
+                        ),
                     )
                 )
             rpc_event.call.start_server_batch(
@@ -769,7 +819,7 @@ def _status(
             )
             state.statused = True
             _reset_per_message_state(state)
-            state.due.add(_SEND_STATUS_FROM_SERVER_TOKEN)
+            state.due |= _SEND_STATUS_FROM_SERVER_TOKEN
 
 
 def _unary_response_in_pool(
@@ -800,6 +850,52 @@ def _unary_response_in_pool(
         cygrpc.uninstall_context()
 
 
+def _unary_response_inline(
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    behavior: ArityAgnosticMethodHandler,
+    request_deserializer: Optional[DeserializingFunction],
+    response_serializer: Optional[SerializingFunction],
+) -> ServerCallbackTag:
+    receive_message = _receive_message(
+        state, rpc_event.call, request_deserializer
+    )
+
+    def receive_message_and_respond(receive_message_event):
+        rpc_state, callbacks = receive_message(receive_message_event)
+        with state.lock:
+            request = state.request
+            state.request = None
+            if request is None:
+                if state.client is _CLOSED and _is_rpc_state_active(state):
+                    details = (
+                        '"{}" requires exactly one request message.'.format(
+                            rpc_event.call_details.method
+                        )
+                    )
+                    _abort(
+                        state,
+                        rpc_event.call,
+                        cygrpc.StatusCode.unimplemented,
+                        _common.encode(details),
+                    )
+                return rpc_state, callbacks
+            if not _is_rpc_state_active(state):
+                return rpc_state, callbacks
+        state.context.run(
+            _unary_response_in_pool,
+            rpc_event,
+            state,
+            behavior,
+            lambda: request,
+            request_deserializer,
+            response_serializer,
+        )
+        return rpc_state, callbacks
+
+    return receive_message_and_respond
+
+
 def _stream_response_in_pool(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -882,12 +978,40 @@ def _select_thread_pool_for_behavior(
     return default_thread_pool
 
 
+def _handle_unary_unary_inline(
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    method_handler: grpc.RpcMethodHandler,
+) -> None:
+    # The behavior runs on the polling thread once the request arrives, so
+    # nothing may wait for another completion queue event on its behalf.
+    rpc_event.call.start_server_batch(
+        (
+            cygrpc.ReceiveMessageOperation(
+                _EMPTY_FLAGS,
+                _common.zero_copy_receive(method_handler.request_deserializer),
+            ),
+        ),
+        _unary_response_inline(
+            rpc_event,
+            state,
+            method_handler.unary_unary,
+            method_handler.request_deserializer,
+            method_handler.response_serializer,
+        ),
+    )
+    state.due |= _RECEIVE_MESSAGE_TOKEN
+
+
 def _handle_unary_unary(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
     default_thread_pool: futures.ThreadPoolExecutor,
-) -> futures.Future:
+) -> Optional[futures.Future]:
+    if getattr(method_handler.unary_unary, "experimental_inline", False):
+        _handle_unary_unary_inline(rpc_event, state, method_handler)
+        return None
     unary_request = _unary_request(
         rpc_event, state, method_handler.request_deserializer
     )
@@ -1032,13 +1156,13 @@ def _handle_with_method_handler(
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
     thread_pool: futures.ThreadPoolExecutor,
-) -> futures.Future:
-    with state.condition:
+) -> Optional[futures.Future]:
+    with state.lock:
         rpc_event.call.start_server_batch(
             (cygrpc.ReceiveCloseOnServerOperation(_EMPTY_FLAGS),),
             _receive_close_on_server(state),
         )
-        state.due.add(_RECEIVE_CLOSE_ON_SERVER_TOKEN)
+        state.due |= _RECEIVE_CLOSE_ON_SERVER_TOKEN
         if method_handler.request_streaming:
             if method_handler.response_streaming:
                 return _handle_stream_stream(
@@ -1062,6 +1186,8 @@ def _handle_call(
     interceptor_pipeline: Optional[_interceptor._ServicePipeline],
     thread_pool: futures.ThreadPoolExecutor,
     concurrency_exceeded: bool,
+    compression_policy: Optional[_compression.CompressionPolicy],
+    default_compression: Optional[grpc.Compression],
 ) -> Tuple[Optional[_RPCState], Optional[futures.Future]]:
     """Handles RPC based on provided handlers.
 
@@ -1078,6 +1204,14 @@ def _handle_call(
         return None, None
     if rpc_event.call_details.method or method_with_handler.name():
         rpc_state = _RPCState()
+        if compression_policy is not None:
+            rpc_state.compression_policy = compression_policy
+            rpc_state.default_compression = default_compression
+            rpc_state.method = (
+                _common.encode(method_with_handler.name())
+                if method_with_handler.name()
+                else rpc_event.call_details.method
+            )
         try:
             method_handler = _find_method_handler(
                 rpc_event,
@@ -1127,9 +1261,31 @@ class _ServerStage(enum.Enum):
     GRACE = "grace"
 
 
-class _ServerState(object):
+class _ServerShard(object):
+    """A completion queue of the server and the RPCs accepted on it.
+
+    Calls requested on a shard's completion queue deliver all of their
+    events back to that queue, so a shard's bookkeeping is only ever
+    touched by its own polling thread and by the handlers of its RPCs.
+    """
+
     lock: threading.RLock
     completion_queue: cygrpc.CompletionQueue
+    rpc_states: Set[_RPCState]
+    due: Set[str]
+
+    def __init__(self, completion_queue: cygrpc.CompletionQueue):
+        self.lock = threading.RLock()
+        self.completion_queue = completion_queue
+
+        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
+        self.rpc_states = set()
+        self.due = set()
+
+
+class _ServerState(object):
+    lock: threading.RLock
+    shards: List[_ServerShard]
     server: cygrpc.Server
     generic_handlers: List[grpc.GenericRpcHandler]
     registered_method_handlers: Dict[str, grpc.RpcMethodHandler]
@@ -1139,23 +1295,30 @@ class _ServerState(object):
     termination_event: threading.Event
     shutdown_events: List[threading.Event]
     maximum_concurrent_rpcs: Optional[int]
+    compression_policy: Optional[_compression.CompressionPolicy]
+    default_compression: Optional[grpc.Compression]
+    rpc_count_lock: threading.Lock
     active_rpc_count: int
-    rpc_states: Set[_RPCState]
-    due: Set[str]
+    drained_shard_count: int
     server_deallocated: bool
 
     # pylint: disable=too-many-arguments
     def __init__(
         self,
-        completion_queue: cygrpc.CompletionQueue,
+        completion_queues: Sequence[cygrpc.CompletionQueue],
         server: cygrpc.Server,
         generic_handlers: Sequence[grpc.GenericRpcHandler],
         interceptor_pipeline: Optional[_interceptor._ServicePipeline],
         thread_pool: futures.ThreadPoolExecutor,
         maximum_concurrent_rpcs: Optional[int],
+        compression_policy: Optional[_compression.CompressionPolicy],
+        default_compression: Optional[grpc.Compression],
     ):
         self.lock = threading.RLock()
-        self.completion_queue = completion_queue
+        self.shards = [
+            _ServerShard(completion_queue)
+            for completion_queue in completion_queues
+        ]
         self.server = server
         self.generic_handlers = list(generic_handlers)
         self.interceptor_pipeline = interceptor_pipeline
@@ -1164,13 +1327,14 @@ class _ServerState(object):
         self.termination_event = threading.Event()
         self.shutdown_events = [self.termination_event]
         self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+        self.compression_policy = compression_policy
+        self.default_compression = default_compression
+        # Only maintained when maximum_concurrent_rpcs is set.
+        self.rpc_count_lock = threading.Lock()
         self.active_rpc_count = 0
+        self.drained_shard_count = 0
         self.registered_method_handlers = {}
 
-        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
-        self.rpc_states = set()
-        self.due = set()
-
         # A "volatile" flag to interrupt the daemon serving thread
         self.server_deallocated = False
 
@@ -1205,49 +1369,65 @@ def _add_secure_port(
         )
 
 
-def _request_call(state: _ServerState) -> None:
+def _request_call(state: _ServerState, shard: _ServerShard) -> None:
     state.server.request_call(
-        state.completion_queue, state.completion_queue, _REQUEST_CALL_TAG
+        shard.completion_queue, shard.completion_queue, _REQUEST_CALL_TAG
     )
-    state.due.add(_REQUEST_CALL_TAG)
+    shard.due.add(_REQUEST_CALL_TAG)
 
 
-def _request_registered_call(state: _ServerState, method: str) -> None:
+def _request_registered_call(
+    state: _ServerState, shard: _ServerShard, method: str
+) -> None:
     registered_call_tag = method
     state.server.request_registered_call(
-        state.completion_queue,
-        state.completion_queue,
+        shard.completion_queue,
+        shard.completion_queue,
         method,
         registered_call_tag,
     )
-    state.due.add(registered_call_tag)
+    shard.due.add(registered_call_tag)
 
 
 # TODO(https://github.com/grpc/grpc/issues/6597): delete this function.
-def _stop_serving(state: _ServerState) -> bool:
-    if not state.rpc_states and not state.due:
-        state.server.destroy()
-        for shutdown_event in state.shutdown_events:
-            shutdown_event.set()
-        state.stage = _ServerStage.STOPPED
+def _stop_serving(shard: _ServerShard) -> bool:
+    return not shard.rpc_states and not shard.due
+
+
+def _on_shard_drained(state: _ServerState) -> None:
+    with state.lock:
+        state.drained_shard_count += 1
+        if state.drained_shard_count == len(state.shards):
+            state.server.destroy()
+            for shutdown_event in state.shutdown_events:
+                shutdown_event.set()
+            state.stage = _ServerStage.STOPPED
+
+
+def _acquire_rpc_slot(state: _ServerState) -> bool:
+    if state.maximum_concurrent_rpcs is None:
+        return True
+    with state.rpc_count_lock:
+        if state.active_rpc_count >= state.maximum_concurrent_rpcs:
+            return False
+        state.active_rpc_count += 1
         return True
-    return False
 
 
 def _on_call_completed(state: _ServerState) -> None:
-    with state.lock:
+    with state.rpc_count_lock:
         state.active_rpc_count -= 1
 
 
 # pylint: disable=too-many-branches
 def _process_event_and_continue(
-    state: _ServerState, event: cygrpc.BaseEvent
+    state: _ServerState, shard: _ServerShard, event: cygrpc.BaseEvent
 ) -> bool:
     should_continue = True
     if event.tag is _SHUTDOWN_TAG:
-        with state.lock:
-            state.due.remove(_SHUTDOWN_TAG)
-            if _stop_serving(state):
+        with shard.lock:
+            shard.due.remove(_SHUTDOWN_TAG)
+            if _stop_serving(shard):
                 should_continue = False
     elif (
         event.tag is _REQUEST_CALL_TAG
@@ -1266,32 +1446,36 @@ def _process_event_and_continue(
             method_with_handler = _GenericMethod(
                 state.generic_handlers,
             )
-        with state.lock:
-            state.due.remove(event.tag)
-            concurrency_exceeded = (
-                state.maximum_concurrent_rpcs is not None
-                and state.active_rpc_count >= state.maximum_concurrent_rpcs
-            )
+        with shard.lock:
+            shard.due.remove(event.tag)
+            slot_acquired = _acquire_rpc_slot(state)
             rpc_state, rpc_future = _handle_call(
                 event,
                 method_with_handler,
                 state.interceptor_pipeline,
                 state.thread_pool,
-                concurrency_exceeded,
+                not slot_acquired,
+                state.compression_policy,
+                state.default_compression,
             )
             if rpc_state is not None:
-                state.rpc_states.add(rpc_state)
-            if rpc_future is not None:
-                state.active_rpc_count += 1
-                rpc_future.add_done_callback(
-                    lambda _unused_future: _on_call_completed(state)
-                )
+                shard.rpc_states.add(rpc_state)
+            if state.maximum_concurrent_rpcs is not None and slot_acquired:
+                if rpc_future is None:
+                    _on_call_completed(state)
+                else:
+                    rpc_future.add_done_callback(
+                        lambda _unused_future: _on_call_completed(state)
+                    )
+            # The stage only leaves STARTED while all shard locks are held.
             if state.stage is _ServerStage.STARTED:
                 if registered_method_name in state.registered_method_handlers:
-                    _request_registered_call(state, registered_method_name)
+                    _request_registered_call(
+                        state, shard, registered_method_name
+                    )
                 else:
-                    _request_call(state)
-            elif _stop_serving(state):
+                    _request_call(state, shard)
+            elif _stop_serving(shard):
                 should_continue = False
     else:
         rpc_state, callbacks = event.tag(event)
@@ -1301,23 +1485,27 @@ def _process_event_and_continue(
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Exception calling callback!")
         if rpc_state is not None:
-            with state.lock:
-                state.rpc_states.remove(rpc_state)
-                if _stop_serving(state):
+            with shard.lock:
+                shard.rpc_states.remove(rpc_state)
+                if _stop_serving(shard):
                     should_continue = False
+    if not should_continue:
+        _on_shard_drained(state)
     return should_continue
 
 
-def _serve(state: _ServerState) -> None:
+def _serve(state: _ServerState, shard: _ServerShard) -> None:
     while True:
         timeout = time.time() + _DEALLOCATED_SERVER_CHECK_PERIOD_S
-        event = state.completion_queue.poll(timeout)
+        event = shard.completion_queue.poll(timeout)
         if state.server_deallocated:
             _begin_shutdown_once(state)
         is_timeout = (
             event.completion_type == cygrpc.CompletionType.queue_timeout
         )
-        if not is_timeout and not _process_event_and_continue(state, event):
+        if not is_timeout and not _process_event_and_continue(
+            state, shard, event
+        ):
             return
         # We want to force the deletion of the previous event
         # ~before~ we poll again; if the event has a reference
@@ -1328,9 +1516,17 @@ def _serve(state: _ServerState) -> None:
 def _begin_shutdown_once(state: _ServerState) -> None:
     with state.lock:
         if state.stage is _ServerStage.STARTED:
-            state.server.shutdown(state.completion_queue, _SHUTDOWN_TAG)
-            state.stage = _ServerStage.GRACE
-            state.due.add(_SHUTDOWN_TAG)
+            # Polling threads request new calls while holding only their
+            # shard's lock, so all of them are taken to change the stage.
+            with contextlib.ExitStack() as stack:
+                for shard in state.shards:
+                    stack.enter_context(shard.lock)
+                shutdown_shard = state.shards[0]
+                state.server.shutdown(
+                    shutdown_shard.completion_queue, _SHUTDOWN_TAG
+                )
+                state.stage = _ServerStage.GRACE
+                shutdown_shard.due.add(_SHUTDOWN_TAG)
 
 
 def _stop(state: _ServerState, grace: Optional[float]) -> threading.Event:
@@ -1365,14 +1561,18 @@ def _start(state: _ServerState) -> None:
             raise ValueError(error_msg)
         state.server.start()
         state.stage = _ServerStage.STARTED
-        # Request a call for each registered method so we can handle any of them.
-        for method in state.registered_method_handlers:
-            _request_registered_call(state, method)
-        # Also request a call for non-registered method.
-        _request_call(state)
-        thread = threading.Thread(target=_serve, args=(state,))
-        thread.daemon = True
-        thread.start()
+        for shard in state.shards:
+            with shard.lock:
+                # Request a call for each registered method so we can handle
+                # any of them.
+                for method in state.registered_method_handlers:
+                    _request_registered_call(state, shard, method)
+                # Also request a call for non-registered method.
+                _request_call(state, shard)
+        for shard in state.shards:
+            thread = threading.Thread(target=_serve, args=(state, shard))
+            thread.daemon = True
+            thread.start()
 
 
 def _validate_generic_rpc_handlers(
@@ -1404,6 +1604,20 @@ def _augment_options(
     )
 
 
+def _separate_server_options(
+    options: Sequence[ChannelArgumentType],
+) -> Tuple[Sequence[ChannelArgumentType], Sequence[ChannelArgumentType]]:
+    """Separates core server options from Python server options."""
+    core_options = []
+    python_options = []
+    for pair in options:
+        if pair[0] == grpc.experimental.ServerOptions.CompressionPolicy:
+            python_options.append(pair)
+        else:
+            core_options.append(pair)
+    return python_options, core_options
+
+
 class _Server(grpc.Server):
     _state: _ServerState
 
@@ -1417,17 +1631,28 @@ class _Server(grpc.Server):
         maximum_concurrent_rpcs: Optional[int],
         compression: Optional[grpc.Compression],
         xds: bool,
+        polling_threads: int,
     ):
-        completion_queue = cygrpc.CompletionQueue()
-        server = cygrpc.Server(_augment_options(options, compression, xds), xds)
-        server.register_completion_queue(completion_queue)
+        completion_queues = [
+            cygrpc.CompletionQueue() for _ in range(polling_threads)
+        ]
+        python_options, core_options = _separate_server_options(options)
+        server = cygrpc.Server(
+            _augment_options(core_options, compression, xds), xds
+        )
+        for completion_queue in completion_queues:
+            server.register_completion_queue(completion_queue)
         self._state = _ServerState(
-            completion_queue,
+            completion_queues,
             server,
             generic_handlers,
             _interceptor.service_pipeline(interceptors),
             thread_pool,
             maximum_concurrent_rpcs,
+            dict(python_options).get(
+                grpc.experimental.ServerOptions.CompressionPolicy
+            ),
+            _compression.default_compression(core_options, compression),
         )
         self._cy_server = server
 
@@ -1502,8 +1727,17 @@ def create_server(
     maximum_concurrent_rpcs: Optional[int],
     compression: Optional[grpc.Compression],
     xds: bool,
+    polling_threads: Optional[int] = None,
 ) -> _Server:
     _validate_generic_rpc_handlers(generic_rpc_handlers)
+    if polling_threads is None:
+        polling_threads = 1
+    elif polling_threads < 1:
+        raise ValueError(
+            "polling_threads must be a positive integer, got {}".format(
+                polling_threads
+            )
+        )
     return _Server(
         thread_pool,
         generic_rpc_handlers,
@@ -1512,4 +1746,5 @@ def create_server(
         maximum_concurrent_rpcs,
         compression,
         xds,
+        polling_threads,
     )
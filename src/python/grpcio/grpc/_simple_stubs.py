@@ -13,17 +13,17 @@
 # limitations under the License.
 """Functions that obviate explicit stubs and explicit channels."""
 
-import collections
-import datetime
 import logging
 import os
 import threading
+import time
 from typing import (
     Any,
     AnyStr,
     Callable,
     Dict,
     Iterator,
+    List,
     Optional,
     Sequence,
     Tuple,
@@ -49,14 +49,18 @@ _LOGGER = logging.getLogger(__name__)
 
 _EVICTION_PERIOD_KEY = "GRPC_PYTHON_MANAGED_CHANNEL_EVICTION_SECONDS"
 if _EVICTION_PERIOD_KEY in os.environ:
-    _EVICTION_PERIOD = datetime.timedelta(
-        seconds=float(os.environ[_EVICTION_PERIOD_KEY])
-    )
+    _EVICTION_PERIOD_S = float(os.environ[_EVICTION_PERIOD_KEY])
     _LOGGER.debug(
-        "Setting managed channel eviction period to %s", _EVICTION_PERIOD
+        "Setting managed channel eviction period to %f seconds",
+        _EVICTION_PERIOD_S,
     )
 else:
-    _EVICTION_PERIOD = datetime.timedelta(minutes=10)
+    _EVICTION_PERIOD_S = 10 * 60.0
+
+# Idle channels are found by periodic sweeps rather than by timestamping every
+# hit, so a channel is evicted after being unused for between one and
+# (1 + 1 / _SWEEPS_PER_EVICTION_PERIOD) eviction periods.
+_SWEEPS_PER_EVICTION_PERIOD = 4
 
 _MAXIMUM_CHANNELS_KEY = "GRPC_PYTHON_MANAGED_CHANNEL_MAXIMUM"
 if _MAXIMUM_CHANNELS_KEY in os.environ:
@@ -92,6 +96,26 @@ def _create_channel(
     )
 
 
+class _CacheEntry:
+    """A cached channel and the bookkeeping used to approximate LRU order.
+
+    Hits only ever set `referenced`, without holding the cache lock. The
+    eviction thread clears it on each sweep and counts the sweeps for which
+    the entry went unused, following the clock algorithm.
+    """
+
+    __slots__ = ("channel", "referenced", "idle_sweeps")
+
+    channel: grpc.Channel
+    referenced: bool
+    idle_sweeps: int
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.referenced = True
+        self.idle_sweeps = 0
+
+
 class ChannelCache:
     # NOTE(rbellevi): Untyped due to reference cycle.
     _singleton = None
@@ -99,11 +123,17 @@ class ChannelCache:
     _condition: threading.Condition = threading.Condition(lock=_lock)
     _eviction_ready: threading.Event = threading.Event()
 
-    _mapping: Dict[CacheKey, Tuple[grpc.Channel, datetime.datetime]]
+    # Read without holding _lock on cache hits. Only mutated under _lock.
+    _mapping: Dict[CacheKey, _CacheEntry]
+    # Entries removed from _mapping but not yet closed. A caller may have
+    # looked an entry up just before it was removed, so closing is deferred
+    # by one sweep and the entry is reinstated if it turns out to be in use.
+    _retired: List[Tuple[CacheKey, _CacheEntry]]
     _eviction_thread: threading.Thread
 
     def __init__(self):
-        self._mapping = collections.OrderedDict()
+        self._mapping = {}
+        self._retired = []
         self._eviction_thread = threading.Thread(
             target=ChannelCache._perform_evictions, daemon=True
         )
@@ -111,46 +141,92 @@ class ChannelCache:
 
     @staticmethod
     def get():
-        with ChannelCache._lock:
-            if ChannelCache._singleton is None:
-                ChannelCache._singleton = ChannelCache()
-        ChannelCache._eviction_ready.wait()
-        return ChannelCache._singleton
-
-    def _evict_locked(self, key: CacheKey):
-        channel, _ = self._mapping.pop(key)
-        _LOGGER.debug(
-            "Evicting channel %s with configuration %s.", channel, key
-        )
-        channel.close()
-        del channel
+        singleton = ChannelCache._singleton
+        if singleton is None or not ChannelCache._eviction_ready.is_set():
+            with ChannelCache._lock:
+                if ChannelCache._singleton is None:
+                    ChannelCache._singleton = ChannelCache()
+            ChannelCache._eviction_ready.wait()
+            singleton = ChannelCache._singleton
+        return singleton
+
+    def _retire_locked(self, key: CacheKey, entry: _CacheEntry):
+        del self._mapping[key]
+        entry.referenced = False
+        self._retired.append((key, entry))
+
+    def _evict_over_capacity_locked(self):
+        # Every entry gets at most one second chance per batch, so the clock
+        # hand terminates even while hits keep setting reference bits.
+        second_chances = len(self._mapping)
+        while len(self._mapping) > _MAXIMUM_CHANNELS:
+            key = next(iter(self._mapping))
+            entry = self._mapping[key]
+            if entry.referenced and second_chances:
+                second_chances -= 1
+                entry.referenced = False
+                # Move the entry behind the clock hand.
+                del self._mapping[key]
+                self._mapping[key] = entry
+            else:
+                self._retire_locked(key, entry)
+
+    def _sweep_locked(self) -> List[grpc.Channel]:
+        to_close = []
+        retired, self._retired = self._retired, []
+        for key, entry in retired:
+            if not entry.referenced:
+                _LOGGER.debug(
+                    "Evicting channel %s with configuration %s.",
+                    entry.channel,
+                    key,
+                )
+                to_close.append(entry.channel)
+            elif key not in self._mapping:
+                entry.idle_sweeps = 0
+                self._mapping[key] = entry
+            else:
+                # Superseded while still in use. Close it once it goes idle.
+                entry.referenced = False
+                self._retired.append((key, entry))
+        for key, entry in tuple(self._mapping.items()):
+            if entry.referenced:
+                entry.referenced = False
+                entry.idle_sweeps = 0
+            else:
+                entry.idle_sweeps += 1
+                if entry.idle_sweeps >= _SWEEPS_PER_EVICTION_PERIOD:
+                    self._retire_locked(key, entry)
+        return to_close
 
     @staticmethod
     def _perform_evictions():
+        sweep_period = _EVICTION_PERIOD_S / _SWEEPS_PER_EVICTION_PERIOD
+        next_sweep = time.monotonic() + sweep_period
         while True:
+            to_close = ()
             with ChannelCache._lock:
                 ChannelCache._eviction_ready.set()
-                if not ChannelCache._singleton._mapping:
+                cache = ChannelCache._singleton
+                if len(cache._mapping) > _MAXIMUM_CHANNELS:
+                    cache._evict_over_capacity_locked()
+                now = time.monotonic()
+                if not cache._mapping and not cache._retired:
                     ChannelCache._condition.wait()
-                elif len(ChannelCache._singleton._mapping) > _MAXIMUM_CHANNELS:
-                    key = next(iter(ChannelCache._singleton._mapping.keys()))
-                    ChannelCache._singleton._evict_locked(key)
-                    # And immediately reevaluate.
-                else:
-                    key, (_, eviction_time) = next(
-                        iter(ChannelCache._singleton._mapping.items())
-                    )
-                    now = datetime.datetime.now()
-                    if eviction_time <= now:
-                        ChannelCache._singleton._evict_locked(key)
-                        continue
-                    time_to_eviction = (eviction_time - now).total_seconds()
+                    next_sweep = time.monotonic() + sweep_period
+                elif now < next_sweep:
                     # NOTE: We aim to *eventually* coalesce to a state in
-                    # which no overdue channels are in the cache and the
-                    # length of the cache is longer than _MAXIMUM_CHANNELS.
+                    # which no idle channels are in the cache and the
+                    # length of the cache is no longer than _MAXIMUM_CHANNELS.
                     # We tolerate momentary states in which these two
                     # criteria are not met.
-                    ChannelCache._condition.wait(timeout=time_to_eviction)
+                    ChannelCache._condition.wait(timeout=next_sweep - now)
+                else:
+                    to_close = cache._sweep_locked()
+                    next_sweep = now + sweep_period
+            # Closing a channel may block, so it happens outside of the lock.
+            for channel in to_close:
+                channel.close()
 
     def get_channel(
         self,
@@ -186,36 +262,32 @@ class ChannelCache:
             _LOGGER.debug("Defaulting to SSL channel credentials.")
             channel_credentials = grpc.ssl_channel_credentials()
         key = (target, options, channel_credentials, compression)
-        with self._lock:
-            channel_data = self._mapping.get(key, None)
-            call_handle = None
-            if channel_data is not None:
-                channel = channel_data[0]
-                # Register a new call handle if we're calling a registered method for an
-                # existing channel and this method is not registered.
-                if _registered_method:
-                    call_handle = channel._get_registered_call_handle(method)
-                self._mapping.pop(key)
-                self._mapping[key] = (
-                    channel,
-                    datetime.datetime.now() + _EVICTION_PERIOD,
-                )
-                return channel, call_handle
-            channel = _create_channel(
-                target, options, channel_credentials, compression
-            )
-            if _registered_method:
-                call_handle = channel._get_registered_call_handle(method)
-            self._mapping[key] = (
-                channel,
-                datetime.datetime.now() + _EVICTION_PERIOD,
-            )
-            if (
-                len(self._mapping) == 1
-                or len(self._mapping) >= _MAXIMUM_CHANNELS
-            ):
-                self._condition.notify()
-            return channel, call_handle
+        # Hits are served without taking the lock. They only mark the entry
+        # as recently used and leave reordering to the eviction thread.
+        entry = self._mapping.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._mapping.get(key)
+                if entry is None:
+                    entry = _CacheEntry(
+                        _create_channel(
+                            target, options, channel_credentials, compression
+                        )
+                    )
+                    self._mapping[key] = entry
+                    if (
+                        len(self._mapping) == 1
+                        or len(self._mapping) > _MAXIMUM_CHANNELS
+                    ):
+                        self._condition.notify()
+        elif not entry.referenced:
+            entry.referenced = True
+        call_handle = None
+        # Register a new call handle if we're calling a registered method for an
+        # existing channel and this method is not registered.
+        if _registered_method:
+            call_handle = entry.channel._get_registered_call_handle(method)
+        return entry.channel, call_handle
 
     def _test_only_channel_count(self) -> int:
         with self._lock:
@@ -14,11 +14,13 @@
 """Abstract base classes for Channel objects and Multicallable objects."""
 
 import abc
-from typing import Generic, Optional
+import functools
+from typing import Generic, Iterable, List, Optional, Union
 
 import grpc
 
 from . import _base_call
+from . import _utils
 from ._typing import DeserializingFunction
 from ._typing import MetadataType
 from ._typing import RequestIterableType
@@ -64,6 +66,49 @@ class UnaryUnaryMultiCallable(Generic[RequestType, ResponseType], abc.ABC):
             metadata, status code, and details.
         """
 
+    async def batch(
+        self,
+        requests: Iterable[RequestType],
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> List[Union[ResponseType, grpc.RpcError]]:
+        """Invokes the underlying RPC once for each request, concurrently.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          requests: An iterable of request values, one per RPC.
+          timeout: An optional duration of time in seconds to allow
+            for each RPC.
+          metadata: Optional :term:`metadata` to be transmitted to the
+            service-side of each RPC.
+          credentials: An optional CallCredentials for the RPCs. Only valid for
+            secure Channel.
+          wait_for_ready: An optional flag to enable :term:`wait_for_ready` mechanism.
+          compression: An element of grpc.Compression, e.g.
+            grpc.Compression.Gzip.
+
+        Returns:
+          A list holding an entry for each request, in the order of the
+          requests. The entry is the response value of the RPC or, should the
+          RPC terminate with non-OK status, the RpcError for the RPC.
+        """
+        return await _utils.gather_responses(
+            functools.partial(
+                self,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            ),
+            requests,
+        )
+
 
 class UnaryStreamMultiCallable(Generic[RequestType, ResponseType], abc.ABC):
     """Enables asynchronous invocation of a server-streaming RPC."""
@@ -198,23 +198,28 @@ class Call:
     _loop: asyncio.AbstractEventLoop
     _code: grpc.StatusCode
     _cython_call: cygrpc._AioCall
-    _metadata: Tuple[MetadatumType, ...]
+    _metadata: Union[Tuple[MetadatumType, ...], cygrpc.PreparedMetadata]
     _request_serializer: Optional[SerializingFunction]
     _response_deserializer: Optional[DeserializingFunction]
 
     def __init__(
         self,
         cython_call: cygrpc._AioCall,
-        metadata: Metadata,
+        metadata: Union[Metadata, cygrpc.PreparedMetadata],
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         loop: asyncio.AbstractEventLoop,
     ) -> None:
         self._loop = loop
         self._cython_call = cython_call
-        self._metadata = tuple(metadata)
+        if isinstance(metadata, cygrpc.PreparedMetadata):
+            self._metadata = metadata
+        else:
+            self._metadata = tuple(metadata)
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        if _common.zero_copy_receive(response_deserializer):
+            cython_call.enable_zero_copy_receive()
 
     def __del__(self) -> None:
         # The '_cython_call' object might be destructed before Call object
@@ -550,7 +555,7 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
         self,
         request: RequestType,
         deadline: Optional[float],
-        metadata: Metadata,
+        metadata: Union[Metadata, cygrpc.PreparedMetadata],
         credentials: Optional[grpc.CallCredentials],
         wait_for_ready: Optional[bool],
         channel: cygrpc.AioChannel,
@@ -613,7 +618,7 @@ class UnaryStreamCall(_StreamResponseMixin, Call, _base_call.UnaryStreamCall):
         self,
         request: RequestType,
         deadline: Optional[float],
-        metadata: Metadata,
+        metadata: Union[Metadata, cygrpc.PreparedMetadata],
         credentials: Optional[grpc.CallCredentials],
         wait_for_ready: Optional[bool],
         channel: cygrpc.AioChannel,
@@ -669,7 +674,7 @@ class StreamUnaryCall(
         self,
         request_iterator: Optional[RequestIterableType],
         deadline: Optional[float],
-        metadata: Metadata,
+        metadata: Union[Metadata, cygrpc.PreparedMetadata],
         credentials: Optional[grpc.CallCredentials],
         wait_for_ready: Optional[bool],
         channel: cygrpc.AioChannel,
@@ -722,7 +727,7 @@ class StreamStreamCall(
         self,
         request_iterator: Optional[RequestIterableType],
         deadline: Optional[float],
-        metadata: Metadata,
+        metadata: Union[Metadata, cygrpc.PreparedMetadata],
         credentials: Optional[grpc.CallCredentials],
         wait_for_ready: Optional[bool],
         channel: cygrpc.AioChannel,
@@ -15,13 +15,14 @@
 
 import asyncio
 import sys
-from typing import Any, Iterable, List, Optional, Sequence
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
 
 import grpc
 from grpc import _common
 from grpc import _compression
 from grpc import _grpcio_metadata
 from grpc._cython import cygrpc
+import grpc.experimental
 
 from . import _base_call
 from . import _base_channel
@@ -47,6 +48,7 @@ from ._typing import RequestType
 from ._typing import ResponseType
 from ._typing import SerializingFunction
 from ._utils import _timeout_to_deadline
+from ._utils import gather_responses
 
 _USER_AGENT = "grpc-python-asyncio/{}".format(_grpcio_metadata.__version__)
 
@@ -61,6 +63,20 @@ else:
         return asyncio.all_tasks()
 
 
+def _separate_channel_options(
+    options: ChannelArgumentType,
+) -> Tuple[ChannelArgumentType, ChannelArgumentType]:
+    """Separates core channel options from Python channel options."""
+    core_options = []
+    python_options = []
+    for pair in options:
+        if pair[0] == grpc.experimental.ChannelOptions.CompressionPolicy:
+            python_options.append(pair)
+        else:
+            core_options.append(pair)
+    return python_options, core_options
+
+
 def _augment_channel_arguments(
     base_options: ChannelArgumentType, compression: Optional[grpc.Compression]
 ):
@@ -114,14 +130,23 @@ class _BaseMultiCallable:
         self._interceptors = interceptors
         self._references = references
 
-    @staticmethod
     def _init_metadata(
+        self,
         metadata: Optional[MetadataType] = None,
         compression: Optional[grpc.Compression] = None,
-    ) -> Metadata:
+    ) -> Union[Metadata, cygrpc.PreparedMetadata]:
         """Based on the provided values for <metadata> or <compression> initialise the final
         metadata, as it should be used for the current call.
+
+        A grpc.PreparedMetadata is passed through untouched unless compression
+        or interceptors need it as a mutable Metadata.
         """
+        if (
+            isinstance(metadata, cygrpc.PreparedMetadata)
+            and not compression
+            and not self._interceptors
+        ):
+            return metadata
         metadata = metadata or Metadata()
         if not isinstance(metadata, Metadata) and isinstance(
             metadata, Sequence
@@ -178,6 +203,44 @@ class UnaryUnaryMultiCallable(
 
         return call
 
+    async def batch(
+        self,
+        requests: Iterable[RequestType],
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> List[Any]:
+        if self._interceptors:
+            return await super().batch(
+                requests,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        # The options are shared, so they are only processed once.
+        metadata = self._init_metadata(metadata, compression)
+        deadline = _timeout_to_deadline(timeout)
+        return await gather_responses(
+            lambda request: UnaryUnaryCall(
+                request,
+                deadline,
+                metadata,
+                credentials,
+                wait_for_ready,
+                self._channel,
+                self._method,
+                self._request_serializer,
+                self._response_deserializer,
+                self._loop,
+            ),
+            requests,
+        )
+
 
 class UnaryStreamMultiCallable(
     _BaseMultiCallable, _base_channel.UnaryStreamMultiCallable
@@ -366,12 +429,16 @@ class Channel(_base_channel.Channel):
                         + "{}. ".format(StreamStreamClientInterceptor.__name__)
                     )
 
+        python_options, core_options = _separate_channel_options(options)
         self._loop = cygrpc.get_working_loop()
         self._channel = cygrpc.AioChannel(
             _common.encode(target),
-            _augment_channel_arguments(options, compression),
+            _augment_channel_arguments(core_options, compression),
             credentials,
             self._loop,
+            compression_policy=dict(python_options).get(
+                grpc.experimental.ChannelOptions.CompressionPolicy
+            ),
         )
 
     async def __aenter__(self):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Implementation of the metadata abstraction for gRPC Asyncio Python."""
+
 from collections import OrderedDict
 from collections import abc
 from typing import Any, Iterator, List, Optional, Tuple, Union
@@ -37,6 +38,7 @@ class Metadata(abc.Collection):  # noqa: PLW1641
 
     def __init__(self, *args: Tuple[MetadataKey, MetadataValue]) -> None:
         self._metadata = OrderedDict()
+        self._length = 0
         for md_key, md_value in args:
             self.add(md_key, md_value)
 
@@ -51,12 +53,13 @@ class Metadata(abc.Collection):  # noqa: PLW1641
     def add(self, key: MetadataKey, value: MetadataValue) -> None:
         self._metadata.setdefault(key, [])
         self._metadata[key].append(value)
+        self._length += 1
 
     def __len__(self) -> int:
         """Return the total number of elements that there are in the metadata,
         including multiple values for the same key.
         """
-        return sum(map(len, self._metadata.values()))
+        return self._length
 
     def __getitem__(self, key: MetadataKey) -> MetadataValue:
         """When calling <metadata>[<key>], the first element of all those
@@ -72,8 +75,9 @@ class Metadata(abc.Collection):  # noqa: PLW1641
         """Calling metadata[<key>] = <value>
         Maps <value> to the first instance of <key>.
         """
-        if key not in self:
+        if not self._metadata.get(key):
             self._metadata[key] = [value]
+            self._length += 1
         else:
             current_values = self.get_all(key)
             self._metadata[key] = [value, *current_values[1:]]
@@ -84,10 +88,11 @@ class Metadata(abc.Collection):  # noqa: PLW1641
         if not current_values:
             raise KeyError(repr(key))
         self._metadata[key] = current_values[1:]
+        self._length -= 1
 
     def delete_all(self, key: MetadataKey) -> None:
         """Delete all mappings for <key>."""
-        del self._metadata[key]
+        self._length -= len(self._metadata.pop(key))
 
     def __iter__(self) -> Iterator[Tuple[MetadataKey, MetadataValue]]:
         for key, values in self._metadata.items():
@@ -115,10 +120,11 @@ class Metadata(abc.Collection):  # noqa: PLW1641
         """For compatibility with other Metadata abstraction objects (like in Java),
         this would return all items under the desired <key>.
         """
-        return self._metadata.get(key, [])
+        return list(self._metadata.get(key, ()))
 
     def set_all(self, key: MetadataKey, values: List[MetadataValue]) -> None:
-        self._metadata[key] = values
+        self._length += len(values) - len(self._metadata.get(key, ()))
+        self._metadata[key] = list(values)
 
     def __contains__(self, key: MetadataKey) -> bool:
         return key in self._metadata
@@ -0,0 +1,85 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Applies a grpc.experimental.ResponseCache to AsyncIO channels."""
+
+from typing import Callable, Optional, Union
+
+import grpc
+from grpc import _common
+from grpc import _response_cache
+
+from ._call import AioRpcError
+from ._call import UnaryUnaryCall
+from ._interceptor import ClientCallDetails
+from ._interceptor import UnaryUnaryCallResponse
+from ._interceptor import UnaryUnaryClientInterceptor
+from ._metadata import Metadata
+from ._typing import RequestType
+from ._typing import ResponseType
+
+
+def _metadata_tuple(metadata: Optional[Metadata]) -> Optional[tuple]:
+    return None if metadata is None else tuple(metadata)
+
+
+class ResponseCacheInterceptor(UnaryUnaryClientInterceptor):
+    """Answers the RPCs of cached methods from a ResponseCache."""
+
+    _cache: _response_cache.ResponseCache
+
+    def __init__(self, cache: _response_cache.ResponseCache):
+        self._cache = cache
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[
+            [ClientCallDetails, RequestType], UnaryUnaryCall
+        ],
+        client_call_details: ClientCallDetails,
+        request: RequestType,
+    ) -> Union[UnaryUnaryCall, ResponseType]:
+        method = _common.decode(client_call_details.method)
+        if not self._cache._caches(method):
+            return await continuation(client_call_details, request)
+        key = self._cache._key(method, request)
+        entry = self._cache._lookup(key)
+        if entry is None:
+            call = await continuation(client_call_details, request)
+            try:
+                response = await call
+            except AioRpcError as rpc_error:
+                self._cache._store_failure(
+                    key,
+                    rpc_error.code(),
+                    rpc_error.details(),
+                    _metadata_tuple(rpc_error.initial_metadata()),
+                    _metadata_tuple(rpc_error.trailing_metadata()),
+                )
+                raise
+            self._cache._store_response(
+                key,
+                response,
+                await call.details(),
+                _metadata_tuple(await call.initial_metadata()),
+                _metadata_tuple(await call.trailing_metadata()),
+            )
+            return call
+        if entry.code is grpc.StatusCode.OK:
+            return UnaryUnaryCallResponse(entry.response)
+        raise AioRpcError(
+            entry.code,
+            Metadata.from_tuple(entry.initial_metadata),
+            Metadata.from_tuple(entry.trailing_metadata),
+            entry.details,
+        )
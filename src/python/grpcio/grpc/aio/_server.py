@@ -13,13 +13,18 @@
 # limitations under the License.
 """Server-side implementation of gRPC Asyncio Python."""
 
+import asyncio
 from concurrent.futures import Executor
-from typing import Any, Dict, Optional, Sequence
+from multiprocessing import connection
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import grpc
 from grpc import _common
 from grpc import _compression
+from grpc import _interceptor
+from grpc import _prefork
 from grpc._cython import cygrpc
+import grpc.experimental
 
 from . import _base_server
 from ._interceptor import ServerInterceptor
@@ -33,6 +38,23 @@ def _augment_channel_arguments(
     return tuple(base_options) + compression_option
 
 
+def _separate_server_options(
+    options: ChannelArgumentType,
+) -> Tuple[ChannelArgumentType, ChannelArgumentType]:
+    """Separates core server options from Python server options."""
+    core_options = []
+    python_options = []
+    for pair in options:
+        if pair[0] in (
+            grpc.experimental.ServerOptions.SerializationBufferPool,
+            grpc.experimental.ServerOptions.CompressionPolicy,
+        ):
+            python_options.append(pair)
+        else:
+            core_options.append(pair)
+    return python_options, core_options
+
+
 class Server(_base_server.Server):
     """Serves RPCs."""
 
@@ -60,13 +82,26 @@ class Server(_base_server.Server):
                 # TODO(asheshvidyut): fix the value error below
                 # not caught by ruff.
                 raise ValueError(error_msg)
+        python_options, core_options = _separate_server_options(options)
+        python_options = dict(python_options)
         self._server = cygrpc.AioServer(
             self._loop,
             thread_pool,
             generic_handlers,
             interceptors,
-            _augment_channel_arguments(options, compression),
+            _augment_channel_arguments(core_options, compression),
             maximum_concurrent_rpcs,
+            serialization_buffer_pool=bool(
+                python_options.get(
+                    grpc.experimental.ServerOptions.SerializationBufferPool
+                )
+            ),
+            method_handler_cache=_interceptor.method_handler_cache(
+                interceptors
+            ),
+            compression_policy=python_options.get(
+                grpc.experimental.ServerOptions.CompressionPolicy
+            ),
         )
 
     def add_generic_rpc_handlers(
@@ -186,6 +221,21 @@ class Server(_base_server.Server):
         """
         return await self._server.wait_for_termination(timeout)
 
+    def serialization_buffer_pool_stats(self) -> Optional[Dict[str, int]]:
+        """Reports how the pool of serialization buffers has been used.
+
+        This is an EXPERIMENTAL API.
+
+        Returns:
+          None if the server was created without the
+          grpc.experimental.ServerOptions.SerializationBufferPool option.
+          Otherwise, a dict counting the "hits" and "misses" of responses
+          looking for a pooled buffer, and the released buffers either
+          "recycled" into the pool or "discarded" because their size class
+          was full.
+        """
+        return self._server.serialization_buffer_pool_stats()
+
     def __del__(self):
         """Schedules a graceful shutdown in current event loop.
 
@@ -199,6 +249,99 @@ class Server(_base_server.Server):
             )
 
 
+class _PreforkServer(_base_server.Server):
+    """Serves RPCs from pre-forked worker processes.
+
+    Each worker runs its own event loop and Server, configured like this one.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        generic_handlers: Sequence[grpc.GenericRpcHandler],
+        server_arguments: Dict[str, Any],
+    ):
+        self._configuration = _prefork.ServerConfiguration(generic_handlers)
+        self._server_arguments = server_arguments
+        self._pool = _prefork.WorkerPool(
+            processes, self._serve_in_worker, self._configuration
+        )
+
+    def _serve_in_worker(
+        self, worker_connection: connection.Connection
+    ) -> None:
+        asyncio.run(self._serve(worker_connection))
+
+    async def _serve(self, worker_connection: connection.Connection) -> None:
+        loop = asyncio.get_running_loop()
+        server = Server(**self._server_arguments)
+        self._configuration.apply(server)
+        await server.start()
+        _prefork.notify_ready(worker_connection)
+        termination = loop.create_task(server.wait_for_termination())
+        stop = None
+        while not termination.done():
+            grace = await loop.run_in_executor(
+                None, _prefork.poll_stop_request, worker_connection
+            )
+            if grace is not _prefork.NO_STOP_REQUEST:
+                # Once the parent has died, every poll returns at once, so
+                # only the first stop request is acted upon.
+                stop = loop.create_task(server.stop(grace))
+                break
+        if stop is not None:
+            await stop
+        await termination
+
+    def add_generic_rpc_handlers(
+        self, generic_rpc_handlers: Sequence[grpc.GenericRpcHandler]
+    ) -> None:
+        self._configuration.add_generic_rpc_handlers(generic_rpc_handlers)
+
+    def add_registered_method_handlers(
+        self,
+        service_name: str,
+        method_handlers: Dict[str, grpc.RpcMethodHandler],
+    ) -> None:
+        self._configuration.add_registered_method_handlers(
+            service_name, method_handlers
+        )
+
+    def add_insecure_port(self, address: str) -> int:
+        return self._configuration.add_port(address, None)
+
+    def add_secure_port(
+        self, address: str, server_credentials: grpc.ServerCredentials
+    ) -> int:
+        return self._configuration.add_port(address, server_credentials)
+
+    async def start(self) -> None:
+        self._configuration.freeze()
+        # Workers are forked from an executor thread, which unlike this one
+        # has no running event loop to leak into them.
+        await asyncio.get_running_loop().run_in_executor(None, self._pool.start)
+
+    async def stop(self, grace: Optional[float]) -> None:
+        shutdown_event = self._pool.stop(grace)
+        await asyncio.get_running_loop().run_in_executor(
+            None, shutdown_event.wait
+        )
+
+    async def wait_for_termination(
+        self, timeout: Optional[float] = None
+    ) -> bool:
+        return not await asyncio.get_running_loop().run_in_executor(
+            None, self._pool.termination_event.wait, timeout
+        )
+
+    def serving_worker_count(self) -> int:
+        """Returns how many worker processes are currently serving.
+
+        This is an EXPERIMENTAL API.
+        """
+        return self._pool.serving_worker_count()
+
+
 def server(
     migration_thread_pool: Optional[Executor] = None,
     handlers: Optional[Sequence[grpc.GenericRpcHandler]] = None,
@@ -206,6 +349,7 @@ def server(
     options: Optional[ChannelArgumentType] = None,
     maximum_concurrent_rpcs: Optional[int] = None,
     compression: Optional[grpc.Compression] = None,
+    processes: Optional[int] = None,
 ):
     """Creates a Server with which RPCs can be serviced.
 
@@ -227,10 +371,33 @@ def server(
       compression: An element of grpc.Compression, e.g.
         grpc.Compression.Gzip. This compression algorithm will be used for the
         lifetime of the server unless overridden by set_compression.
+      processes: The number of worker processes to serve RPCs from, or None
+        to serve them from the calling process. Each worker is forked when the
+        server starts and runs its own event loop and server, configured like
+        this one, on the same ports through SO_REUSEPORT; workers that die are
+        restarted. No gRPC channel or server may be in use in the calling
+        process when the server starts, and maximum_concurrent_rpcs applies
+        per worker. Not supported on Windows. This is an EXPERIMENTAL option.
 
     Returns:
       A Server object.
     """
+    _prefork.validate_processes(processes)
+    if processes is not None:
+        return _PreforkServer(
+            processes,
+            () if handlers is None else handlers,
+            {
+                "thread_pool": migration_thread_pool,
+                "generic_handlers": (),
+                "interceptors": () if interceptors is None else interceptors,
+                "options": _prefork.reuse_port_options(
+                    () if options is None else options
+                ),
+                "maximum_concurrent_rpcs": maximum_concurrent_rpcs,
+                "compression": compression,
+            },
+        )
     return Server(
         migration_thread_pool,
         () if handlers is None else handlers,
@@ -12,11 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Internal utilities used by the gRPC Aio module."""
+
+import asyncio
 import time
-from typing import Optional
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+import grpc
+
+from . import _base_call
+from ._typing import RequestType
+from ._typing import ResponseType
 
 
 def _timeout_to_deadline(timeout: Optional[float]) -> Optional[float]:
     if timeout is None:
         return None
     return time.time() + timeout
+
+
+async def _response_or_rpc_error(
+    call: _base_call.UnaryUnaryCall,
+) -> Union[ResponseType, grpc.RpcError]:
+    try:
+        return await call
+    except grpc.RpcError as rpc_error:
+        return rpc_error
+
+
+async def gather_responses(
+    invoke: Callable[[RequestType], _base_call.UnaryUnaryCall],
+    requests: Iterable[RequestType],
+) -> List[Any]:
+    """Invokes an RPC for each request and awaits them concurrently.
+
+    RpcErrors the RPCs terminate with are returned in place of their
+    responses. Any other exception, e.g. the cancellation of the awaiting
+    task or a failure to serialize a request, cancels every RPC invoked so
+    far before it is raised.
+    """
+    calls = []
+    try:
+        for request in requests:
+            calls.append(invoke(request))
+        return await asyncio.gather(
+            *(_response_or_rpc_error(call) for call in calls)
+        )
+    except BaseException:
+        for call in calls:
+            call.cancel()
+        raise
@@ -22,7 +22,9 @@ import sys
 import warnings
 
 import grpc
+from grpc._compression import CompressionPolicy
 from grpc._cython import cygrpc as _cygrpc
+from grpc._response_cache import ResponseCache
 
 _EXPERIMENTAL_APIS_USED = set()
 
@@ -34,9 +36,69 @@ class ChannelOptions(object):
 
     Attributes:
       SingleThreadedUnaryStream: Perform unary-stream RPCs on a single thread.
+      SharedCallDispatch: Handle the events of the channel's RPCs on a
+        process-wide pool of threads shared with other channels given this
+        option, rather than on a thread of the channel's own. The pool size
+        defaults to 4 and may be configured with the environment variable
+        "GRPC_PYTHON_CALL_DISPATCH_THREADS".
+      CompressionPolicy: A CompressionPolicy deciding which request messages
+        of the channel's RPCs are sent compressed.
     """
 
     SingleThreadedUnaryStream = "SingleThreadedUnaryStream"
+    SharedCallDispatch = "SharedCallDispatch"
+    CompressionPolicy = "CompressionPolicy"
+
+
+class ServerOptions(object):
+    """Indicates a server option unique to gRPC Python.
+
+    This enumeration is part of an EXPERIMENTAL API.
+
+    Attributes:
+      SerializationBufferPool: Serialize responses of AsyncIO servers into
+        recycled buffers, for serializers created by buffer_serializer.
+      CompressionPolicy: A CompressionPolicy deciding which response messages
+        of the server's RPCs are sent compressed.
+    """
+
+    SerializationBufferPool = "SerializationBufferPool"
+    CompressionPolicy = "CompressionPolicy"
+
+
+class ClientMetadataInterceptor(object):
+    """Affords intercepting only the metadata and the outcome of RPCs.
+
+    Unlike the general client interceptors, a ClientMetadataInterceptor is
+    handed no continuation and applies to RPCs of every arity. An RPC whose
+    interceptors are all ClientMetadataInterceptors is invoked directly on the
+    underlying channel, without the call details, continuations and outcome
+    objects that general interceptors require. Subclasses override either or
+    both methods.
+
+    This is an EXPERIMENTAL API.
+    """
+
+    def intercept_metadata(self, method, metadata):
+        """Intercepts the metadata of an RPC before it is invoked.
+
+        Args:
+          method: The method name of the RPC.
+          metadata: The metadata to be sent with the RPC, or None.
+
+        Returns:
+          The metadata to send with the RPC instead, which may be the given
+          metadata itself.
+        """
+        return metadata
+
+    def observe_call(self, method, call):
+        """Observes an RPC once it has terminated.
+
+        Args:
+          method: The method name of the RPC.
+          call: An object that is both a Call and a Future for the RPC.
+        """
 
 
 class UsageError(Exception):
@@ -112,12 +174,150 @@ def wrap_server_method_handler(wrapper, handler):
     return handler._replace(stream_stream=wrapper(handler.stream_stream))
 
 
+def zero_copy_deserializer(deserializer=None):
+    """Marks a deserializer as able to consume read-only buffers.
+
+    Messages received for an RPC whose request or response deserializer was
+    created by this function are not assembled into bytes. Instead, the
+    deserializer is handed a read-only memoryview backed directly by the slices
+    received from the wire, and the memory is released once the view and every
+    object derived from it have been collected. This avoids copying large
+    messages on both the sync and asyncio stacks, on clients and servers.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      deserializer: A callable accepting any bytes-like object, such as the
+        FromString method of a protobuf message class, or None to pass the
+        memoryview itself to the application.
+
+    Returns:
+      A deserializer to be used wherever a request_deserializer or
+      response_deserializer is accepted.
+    """
+
+    def _deserialize(message):
+        if deserializer is None:
+            return message
+        return deserializer(message)
+
+    _deserialize.experimental_zero_copy = True
+    return _deserialize
+
+
+def buffer_serializer(size_of, serialize_into):
+    """Creates a serializer able to write messages into supplied buffers.
+
+    AsyncIO servers created with the ServerOptions.SerializationBufferPool
+    option serialize responses with such serializers into buffers taken from
+    a pool, in power-of-two size classes. Each buffer returns to the pool once
+    Core is done sending it, so streams of similarly sized messages stop
+    allocating a new buffer per message. Everywhere else, the serializer
+    writes into a newly allocated bytearray.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      size_of: A callable returning the size in bytes of the serialized form
+        of a message, such as the ByteSize method of a protobuf message.
+      serialize_into: A callable accepting a message and a writable buffer of
+        exactly the size returned by size_of, and writing the serialized
+        message into the buffer.
+
+    Returns:
+      A serializer to be used wherever a request_serializer or
+      response_serializer is accepted.
+    """
+
+    def _serialize(message):
+        buffer = bytearray(size_of(message))
+        serialize_into(message, memoryview(buffer))
+        return buffer
+
+    _serialize.experimental_size_of = size_of
+    _serialize.experimental_serialize_into = serialize_into
+    return _serialize
+
+
+def inline_method_handler(handler):
+    """Runs a unary-unary server method handler on the polling thread.
+
+    The behavior of the returned handler is called directly by the thread
+    polling the server's completion queue as soon as the request arrives,
+    rather than being submitted to the server's thread pool. This removes a
+    thread handoff from every RPC, at the price of stalling all other RPCs on
+    that completion queue until the behavior returns, so it only suits
+    behaviors that return promptly without blocking, e.g. cache lookups.
+    Inline RPCs are not counted against the server's maximum_concurrent_rpcs.
+
+    A servicer method registered through generated code can be marked the
+    same way by setting its experimental_inline attribute to True.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      handler: A unary-unary RpcMethodHandler.
+
+    Returns:
+      A newly created RpcMethodHandler.
+    """
+    if handler.request_streaming or handler.response_streaming:
+        raise ValueError("Only unary-unary method handlers can run inline.")
+
+    behavior = handler.unary_unary
+
+    def _inline_behavior(request, context):
+        return behavior(request, context)
+
+    _inline_behavior.experimental_inline = True
+    return handler._replace(unary_unary=_inline_behavior)
+
+
+def per_method_server_interceptor(interceptor, metadata_keys=()):
+    """Marks a server interceptor as deciding only by method name.
+
+    The handler an interceptor returns usually depends on nothing but the
+    method being called. When every interceptor of a server is marked this
+    way, the server runs its interceptors once per method and reuses the
+    resulting RpcMethodHandler for later RPCs, so that steady-state
+    interception costs a single dictionary lookup. An interceptor that also
+    decides by some invocation metadata lists those keys, and handlers are
+    then cached per method and first value of each key. The cache is bounded,
+    and RPCs for which the interceptors return None are not cached.
+    Side effects of a marked interceptor, e.g. setting context variables,
+    therefore only happen for the RPCs that populate the cache.
+
+    An interceptor class can be marked the same way by setting its
+    experimental_per_method_metadata_keys attribute to a tuple of keys.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      interceptor: A grpc.ServerInterceptor or grpc.aio.ServerInterceptor.
+      metadata_keys: An optional iterable of invocation metadata keys the
+        interceptor decides by.
+
+    Returns:
+      The given interceptor.
+    """
+    interceptor.experimental_per_method_metadata_keys = tuple(metadata_keys)
+    return interceptor
+
+
 __all__ = (
     "ChannelOptions",
+    "ClientMetadataInterceptor",
+    "CompressionPolicy",
     "ExperimentalApiWarning",
+    "ResponseCache",
+    "ServerOptions",
     "UsageError",
+    "buffer_serializer",
+    "inline_method_handler",
     "insecure_channel_credentials",
+    "per_method_server_interceptor",
     "wrap_server_method_handler",
+    "zero_copy_deserializer",
 )
 
 if sys.version_info > (3, 6):
@@ -22,47 +22,54 @@ import grpc_channelz.v1.channelz_pb2_grpc as _channelz_pb2_grpc
 class ChannelzServicer(_channelz_pb2_grpc.ChannelzServicer):
     """AsyncIO servicer for handling RPCs for service statuses."""
 
-    @staticmethod
+    def __init__(self, experimental_cache_ttl=None):
+        self._servicer = _SyncChannelzServicer(experimental_cache_ttl)
+
     async def GetTopChannels(
+        self,
         request: _channelz_pb2.GetTopChannelsRequest,
         context: aio.ServicerContext,
     ) -> _channelz_pb2.GetTopChannelsResponse:
-        return _SyncChannelzServicer.GetTopChannels(request, context)
+        return self._servicer.GetTopChannels(request, context)
 
-    @staticmethod
     async def GetServers(
-        request: _channelz_pb2.GetServersRequest, context: aio.ServicerContext
+        self,
+        request: _channelz_pb2.GetServersRequest,
+        context: aio.ServicerContext,
     ) -> _channelz_pb2.GetServersResponse:
-        return _SyncChannelzServicer.GetServers(request, context)
+        return self._servicer.GetServers(request, context)
 
-    @staticmethod
     async def GetServer(
-        request: _channelz_pb2.GetServerRequest, context: aio.ServicerContext
+        self,
+        request: _channelz_pb2.GetServerRequest,
+        context: aio.ServicerContext,
     ) -> _channelz_pb2.GetServerResponse:
-        return _SyncChannelzServicer.GetServer(request, context)
+        return self._servicer.GetServer(request, context)
 
-    @staticmethod
     async def GetServerSockets(
+        self,
         request: _channelz_pb2.GetServerSocketsRequest,
         context: aio.ServicerContext,
     ) -> _channelz_pb2.GetServerSocketsResponse:
-        return _SyncChannelzServicer.GetServerSockets(request, context)
+        return self._servicer.GetServerSockets(request, context)
 
-    @staticmethod
     async def GetChannel(
-        request: _channelz_pb2.GetChannelRequest, context: aio.ServicerContext
+        self,
+        request: _channelz_pb2.GetChannelRequest,
+        context: aio.ServicerContext,
     ) -> _channelz_pb2.GetChannelResponse:
-        return _SyncChannelzServicer.GetChannel(request, context)
+        return self._servicer.GetChannel(request, context)
 
-    @staticmethod
     async def GetSubchannel(
+        self,
         request: _channelz_pb2.GetSubchannelRequest,
         context: aio.ServicerContext,
     ) -> _channelz_pb2.GetSubchannelResponse:
-        return _SyncChannelzServicer.GetSubchannel(request, context)
+        return self._servicer.GetSubchannel(request, context)
 
-    @staticmethod
     async def GetSocket(
-        request: _channelz_pb2.GetSocketRequest, context: aio.ServicerContext
+        self,
+        request: _channelz_pb2.GetSocketRequest,
+        context: aio.ServicerContext,
     ) -> _channelz_pb2.GetSocketResponse:
-        return _SyncChannelzServicer.GetSocket(request, context)
+        return self._servicer.GetSocket(request, context)
@@ -17,6 +17,10 @@ import sys
 
 import grpc
 from grpc_channelz.v1._servicer import ChannelzServicer
+from grpc_channelz.v1._servicer import iter_server_sockets
+from grpc_channelz.v1._servicer import iter_servers
+from grpc_channelz.v1._servicer import iter_top_channels
+from grpc_channelz.v1._servicer import summary
 import grpc_channelz.v1.channelz_pb2_grpc as _channelz_pb2_grpc
 
 _add_channelz_servicer_doc = """Add Channelz servicer to a server.
@@ -37,19 +41,23 @@ This is an EXPERIMENTAL API.
 
 Args:
     server: A gRPC server to which Channelz service will be added.
+    experimental_cache_ttl: An optional number of seconds for which a parsed
+      response is reused for identical queries, so that frequent scrapes of
+      processes with many channels or sockets share the parsing cost.
+      Responses are not cached by default.
 """
 
 if sys.version_info[0] >= 3 and sys.version_info[1] >= 6:
     from grpc_channelz.v1 import _async as aio
 
-    def add_channelz_servicer(server):
+    def add_channelz_servicer(server, experimental_cache_ttl=None):
         if isinstance(server, grpc.experimental.aio.Server):
             _channelz_pb2_grpc.add_ChannelzServicer_to_server(
-                aio.ChannelzServicer(), server
+                aio.ChannelzServicer(experimental_cache_ttl), server
             )
         else:
             _channelz_pb2_grpc.add_ChannelzServicer_to_server(
-                ChannelzServicer(), server
+                ChannelzServicer(experimental_cache_ttl), server
             )
 
     add_channelz_servicer.__doc__ = _add_channelz_servicer_doc
@@ -58,13 +66,17 @@ if sys.version_info[0] >= 3 and sys.version_info[1] >= 6:
         "ChannelzServicer",
         "add_channelz_servicer",
         "aio",
+        "iter_server_sockets",
+        "iter_servers",
+        "iter_top_channels",
+        "summary",
     ]
 
 else:
 
-    def add_channelz_servicer(server):
+    def add_channelz_servicer(server, experimental_cache_ttl=None):
         _channelz_pb2_grpc.add_ChannelzServicer_to_server(
-            ChannelzServicer(), server
+            ChannelzServicer(experimental_cache_ttl), server
         )
 
     add_channelz_servicer.__doc__ = _add_channelz_servicer_doc
@@ -72,4 +84,8 @@ else:
     __all__ = [
         "ChannelzServicer",
         "add_channelz_servicer",
+        "iter_server_sockets",
+        "iter_servers",
+        "iter_top_channels",
+        "summary",
     ]
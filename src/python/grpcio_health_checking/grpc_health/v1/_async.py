@@ -14,13 +14,46 @@
 """Reference implementation for health checking in gRPC Python."""
 
 import asyncio
-import collections
 from typing import MutableMapping
 
 import grpc
 from grpc_health.v1 import health_pb2 as _health_pb2
 from grpc_health.v1 import health_pb2_grpc as _health_pb2_grpc
 
+from . import _common
+
+
+class _Broadcaster:
+    """Fans the status of a single service out to all of its watchers.
+
+    Publishing swaps in the latest shared response and wakes every watcher
+    through one event. A watcher that wakes up late sends only the latest
+    response, so rapid flaps coalesce into the eventual status.
+    """
+
+    response: _health_pb2.HealthCheckResponse
+    watchers: int
+    _changed: asyncio.Event
+
+    def __init__(self, response: _health_pb2.HealthCheckResponse) -> None:
+        self.response = response
+        self.watchers = 0
+        self._changed = asyncio.Event()
+
+    def publish(self, response: _health_pb2.HealthCheckResponse) -> None:
+        if response is self.response:
+            return
+        self.response = response
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def next_response(
+        self, last_response: _health_pb2.HealthCheckResponse
+    ) -> _health_pb2.HealthCheckResponse:
+        while self.response is last_response:
+            await self._changed.wait()
+        return self.response
+
 
 class HealthServicer(_health_pb2_grpc.HealthServicer):
     """An AsyncIO implementation of health checking servicer."""
@@ -28,12 +61,12 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
     _server_status: MutableMapping[
         str, "_health_pb2.HealthCheckResponse.ServingStatus"
     ]
-    _server_watchers: MutableMapping[str, asyncio.Condition]
+    _broadcasters: MutableMapping[str, _Broadcaster]
     _gracefully_shutting_down: bool
 
     def __init__(self) -> None:
         self._server_status = {"": _health_pb2.HealthCheckResponse.SERVING}
-        self._server_watchers = collections.defaultdict(asyncio.Condition)
+        self._broadcasters = {}
         self._gracefully_shutting_down = False
 
     async def Check(
@@ -49,46 +82,37 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
     async def Watch(
         self, request: _health_pb2.HealthCheckRequest, context
     ) -> None:
-        condition = self._server_watchers[request.service]
-        last_status = None
+        broadcaster = self._broadcasters.get(request.service)
+        if broadcaster is None:
+            status = self._server_status.get(
+                request.service,
+                _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN,
+            )
+            broadcaster = _Broadcaster(_common.shared_response(status))
+            self._broadcasters[request.service] = broadcaster
+        broadcaster.watchers += 1
         try:
-            async with condition:
-                while True:
-                    status = self._server_status.get(
-                        request.service,
-                        _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN,
-                    )
-
-                    # NOTE(lidiz) If the observed status is the same, it means
-                    # there are missing intermediate statuses. It's considered
-                    # acceptable since peer only interested in eventual status.
-                    if status != last_status:
-                        # Responds with current health state
-                        await context.write(
-                            _health_pb2.HealthCheckResponse(status=status)
-                        )
-
-                    # Records the last sent status
-                    last_status = status
-
-                    # Polling on health state changes
-                    await condition.wait()
+            response = broadcaster.response
+            while True:
+                # NOTE(lidiz) If the observed status is the same, it means
+                # there are missing intermediate statuses. It's considered
+                # acceptable since peer only interested in eventual status.
+                await context.write(response)
+                response = await broadcaster.next_response(response)
         finally:
-            if request.service in self._server_watchers:
-                del self._server_watchers[request.service]
+            broadcaster.watchers -= 1
+            if not broadcaster.watchers:
+                del self._broadcasters[request.service]
 
     async def _set(
         self,
         service: str,
         status: _health_pb2.HealthCheckResponse.ServingStatus,
     ) -> None:
-        if service in self._server_watchers:
-            condition = self._server_watchers.get(service)
-            async with condition:
-                self._server_status[service] = status
-                condition.notify_all()
-        else:
-            self._server_status[service] = status
+        self._server_status[service] = status
+        broadcaster = self._broadcasters.get(service)
+        if broadcaster is not None:
+            broadcaster.publish(_common.shared_response(status))
 
     async def set(
         self,
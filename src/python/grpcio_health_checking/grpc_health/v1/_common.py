@@ -0,0 +1,32 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Code shared by the health checking servicers."""
+
+from grpc_health.v1 import health_pb2 as _health_pb2
+
+_RESPONSES = {}
+
+
+def shared_response(status):
+    """Returns the response shared by every watcher for a status.
+
+    Watchers of all services send the same response object for a status, so
+    it must never be mutated.
+    """
+    response = _RESPONSES.get(status)
+    if response is None:
+        response = _RESPONSES.setdefault(
+            status, _health_pb2.HealthCheckResponse(status=status)
+        )
+    return response
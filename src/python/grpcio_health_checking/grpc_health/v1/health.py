@@ -13,7 +13,6 @@
 # limitations under the License.
 """Reference implementation for health checking in gRPC Python."""
 
-import collections
 import sys
 import threading
 
@@ -21,6 +20,8 @@ import grpc
 from grpc_health.v1 import health_pb2 as _health_pb2
 from grpc_health.v1 import health_pb2_grpc as _health_pb2_grpc
 
+from . import _common
+
 if sys.version_info[0] >= 3 and sys.version_info[1] >= 6:
     # Exposes AsyncHealthServicer as public API.
     from . import _async as aio  # pylint: disable=unused-import
@@ -34,7 +35,7 @@ OVERALL_HEALTH = ""
 class _Watcher:
     def __init__(self):
         self._condition = threading.Condition()
-        self._responses = collections.deque()
+        self._response = None
         self._open = True
 
     def __iter__(self):
@@ -42,10 +43,12 @@ class _Watcher:
 
     def _next(self):
         with self._condition:
-            while not self._responses and self._open:
+            while self._response is None and self._open:
                 self._condition.wait()
-            if self._responses:
-                return self._responses.popleft()
+            if self._response is not None:
+                response = self._response
+                self._response = None
+                return response
             raise StopIteration()
 
     def next(self):
@@ -56,7 +59,8 @@ class _Watcher:
 
     def add(self, response):
         with self._condition:
-            self._responses.append(response)
+            # A status the consumer has not picked up yet is superseded.
+            self._response = response
             self._condition.notify()
 
     def close(self):
@@ -75,6 +79,60 @@ def _watcher_to_send_response_callback_adapter(watcher):
     return send_response_callback
 
 
+class _Broadcaster:
+    """Fans the status of a single service out to all of its watchers.
+
+    Responses are delivered outside of any lock by the thread that published
+    them. A status published while a delivery is in progress is picked up by
+    that delivery once it finishes, so rapid flaps coalesce into the latest
+    status instead of queueing one delivery per change.
+    """
+
+    def __init__(self, response):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._published = response
+        self._broadcast = response
+        self._delivering = False
+
+    def __bool__(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, send_response_callback):
+        with self._lock:
+            send_response_callback(self._broadcast)
+            self._subscribers.add(send_response_callback)
+
+    def unsubscribe(self, send_response_callback):
+        with self._lock:
+            self._subscribers.discard(send_response_callback)
+
+    def publish(self, response):
+        """Records a response, returning whether the caller must deliver it."""
+        with self._lock:
+            self._published = response
+            if self._delivering or response is self._broadcast:
+                return False
+            self._delivering = True
+            return True
+
+    def deliver(self):
+        try:
+            while True:
+                with self._lock:
+                    if self._published is self._broadcast:
+                        self._delivering = False
+                        return
+                    response = self._broadcast = self._published
+                    subscribers = tuple(self._subscribers)
+                for send_response_callback in subscribers:
+                    send_response_callback(response)
+        except BaseException:
+            with self._lock:
+                self._delivering = False
+            raise
+
+
 class HealthServicer(_health_pb2_grpc.HealthServicer):
     """Servicer handling RPCs for service statuses."""
 
@@ -83,7 +141,7 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
     ):
         self._lock = threading.RLock()
         self._server_status = {"": _health_pb2.HealthCheckResponse.SERVING}
-        self._send_response_callbacks = {}
+        self._broadcasters = {}
         self.Watch.__func__.experimental_non_blocking = (
             experimental_non_blocking
         )
@@ -93,9 +151,10 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
     def _on_close_callback(self, send_response_callback, service):
         def callback():
             with self._lock:
-                self._send_response_callbacks[service].remove(
-                    send_response_callback
-                )
+                broadcaster = self._broadcasters[service]
+                broadcaster.unsubscribe(send_response_callback)
+                if not broadcaster:
+                    del self._broadcasters[service]
             send_response_callback(None)
 
         return callback
@@ -121,17 +180,14 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
             )
         service = request.service
         with self._lock:
-            status = self._server_status.get(service)
-            if status is None:
-                status = (
-                    _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN
+            broadcaster = self._broadcasters.get(service)
+            if broadcaster is None:
+                status = self._server_status.get(
+                    service, _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN
                 )  # pylint: disable=no-member
-            send_response_callback(
-                _health_pb2.HealthCheckResponse(status=status)
-            )
-            if service not in self._send_response_callbacks:
-                self._send_response_callbacks[service] = set()
-            self._send_response_callbacks[service].add(send_response_callback)
+                broadcaster = _Broadcaster(_common.shared_response(status))
+                self._broadcasters[service] = broadcaster
+            broadcaster.subscribe(send_response_callback)
             context.add_callback(
                 self._on_close_callback(send_response_callback, service)
             )
@@ -149,13 +205,12 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
             if self._gracefully_shutting_down:
                 return
             self._server_status[service] = status
-            if service in self._send_response_callbacks:
-                for send_response_callback in self._send_response_callbacks[
-                    service
-                ]:
-                    send_response_callback(
-                        _health_pb2.HealthCheckResponse(status=status)
-                    )
+            broadcaster = self._broadcasters.get(service)
+            if broadcaster is None or not broadcaster.publish(
+                _common.shared_response(status)
+            ):
+                return
+        broadcaster.deliver()
 
     def enter_graceful_shutdown(self):
         """Permanently sets the status of all services to NOT_SERVING.
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libcpp.map cimport map
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
@@ -88,6 +89,8 @@ cdef extern from "observability_util.h" namespace "grpc_observability":
   cdef void* CreateServerCallTracerFactory(const vector[Label] exchange_labels, const char* identifier) except +
   cdef queue[NativeCensusData]* g_census_data_buffer
   cdef void AwaitNextBatchLocked(unique_lock[mutex]&, int) nogil
+  cdef bint CensusDataBufferEmptyLocked() nogil
+  cdef vector[NativeAggregatedMetric] TakeAggregatedMetricsLocked() nogil
   cdef bint PythonCensusStatsEnabled() nogil
   cdef bint PythonCensusTracingEnabled() nogil
   cdef mutex g_census_data_buffer_mutex
@@ -100,6 +103,14 @@ cdef extern from "observability_util.h" namespace "grpc_observability":
     SpanCensusData span_data
     vector[Label] labels
 
+  cppclass NativeAggregatedMetric "::grpc_observability::AggregatedMetric":
+    Measurement measurement_data
+    vector[Label] labels
+    string identifier
+    int64_t count
+    vector[double] double_values
+    vector[int64_t] int_values
+
   ctypedef struct CloudMonitoring:
     pass
 
@@ -162,3 +173,10 @@ cdef extern from "sampler.h" namespace "grpc_observability":
     ProbabilitySampler& Get()
 
     void SetThreshold(double sampling_rate)
+
+  cdef cppclass MetricsSampler:
+    @staticmethod
+    MetricsSampler& Get()
+
+    void Configure(double sampling_rate, const map[string, double]& method_sampling_rates,
+                   double tail_latency_threshold_s)
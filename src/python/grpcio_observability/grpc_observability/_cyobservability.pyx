@@ -116,6 +116,27 @@ def activate_config(object py_config) -> None:
 def activate_stats() -> None:
   EnablePythonCensusStats(True);
 
+def configure_metrics_sampling(double sampling_rate, dict method_sampling_rates,
+                               object tail_latency_threshold) -> None:
+  """Configures which calls record metrics in call tracers.
+
+  Args:
+  sampling_rate: The probability that a call records metrics.
+  method_sampling_rates: A dict mapping method names, without leading slash, to
+    the probability that calls to them record metrics instead of sampling_rate.
+  tail_latency_threshold: The number of seconds above which sampled calls record
+    their end of call metrics other than counters even though they ended with
+    OK, or None to always record them.
+  """
+  cdef map[string, double] c_method_sampling_rates
+  for method, rate in method_sampling_rates.items():
+    c_method_sampling_rates[_encode(method)] = rate
+  cdef double c_tail_latency_threshold = -1
+  if tail_latency_threshold is not None:
+    c_tail_latency_threshold = tail_latency_threshold
+  MetricsSampler.Get().Configure(sampling_rate, c_method_sampling_rates,
+                                 c_tail_latency_threshold)
+
 def create_client_call_tracer(bytes method_name, bytes target, bytes trace_id, str identifier,
                               dict exchange_labels, object enabled_optional_labels,
                               bint registered_method, bytes parent_span_id=b'') -> cpython.PyObject:
@@ -226,7 +247,8 @@ def _cy_metric_name_to_py_metric_name(cMetricsName metric_name) -> MetricsName:
     raise ValueError('Invalid metric name %s' % metric_name)
 
 
-def _get_stats_data(object measurement, object labels, object identifier) -> _observability.StatsData:
+def _get_stats_data(object measurement, object labels, object identifier,
+                    int64_t count=1, object values=None) -> _observability.StatsData:
   """Convert a Python measurement to StatsData.
 
   Args:
@@ -239,6 +261,8 @@ def _get_stats_data(object measurement, object labels, object identifier) -> _ob
       value -> {value_double: float | value_int: int}
   labels: Labels assciociated with stats data with type of Mapping[str, AnyStr].
   identifier: Specifies the plugins associated with this stats data.
+  count: The number of measurements aggregated into this one.
+  values: The individual aggregated measurements if they were kept.
   """
   measurement: Measurement
   labels: Mapping[str, AnyStr]
@@ -251,14 +275,18 @@ def _get_stats_data(object measurement, object labels, object identifier) -> _ob
                                        labels=labels,
                                        identifiers=identifiers,
                                        registered_method=measurement['registered_method'],
-                                       include_exchange_labels=measurement['include_exchange_labels'],)
+                                       include_exchange_labels=measurement['include_exchange_labels'],
+                                       count=count,
+                                       values=values or [],)
   else:
     py_stat = _observability.StatsData(name=metric_name, measure_double=False,
                                        value_int=measurement['value']['value_int'],
                                        labels=labels,
                                        identifiers=identifiers,
                                        registered_method=measurement['registered_method'],
-                                       include_exchange_labels=measurement['include_exchange_labels'],)
+                                       include_exchange_labels=measurement['include_exchange_labels'],
+                                       count=count,
+                                       values=values or [],)
   return py_stat
 
 
@@ -312,7 +340,7 @@ cdef void _export_census_data(object exporter):
         AwaitNextBatchLocked(dereference(lk), export_interval_ms)
 
         # Break only when buffer have data
-        if not g_census_data_buffer.empty():
+        if not CensusDataBufferEmptyLocked():
           del lk
           break
         else:
@@ -330,27 +358,35 @@ cdef void _export_census_data(object exporter):
 cdef void _flush_census_data(object exporter):
   exporter: _observability.Exporter
 
+  cdef vector[NativeAggregatedMetric] c_metrics
   lk = new unique_lock[mutex](g_census_data_buffer_mutex)
-  if g_census_data_buffer.empty():
+  if CensusDataBufferEmptyLocked():
     del lk
     return
-  py_metrics_batch = []
+  c_metrics = TakeAggregatedMetricsLocked()
   py_spans_batch = []
   while not g_census_data_buffer.empty():
     c_census_data = g_census_data_buffer.front()
-    if c_census_data.type == kMetricData:
-      py_labels = _c_label_to_labels(c_census_data.labels)
-      py_identifier = _decode(c_census_data.identifier)
-      py_measurement = _c_measurement_to_measurement(c_census_data.measurement_data)
-      py_metric = _get_stats_data(py_measurement, py_labels, py_identifier)
-      py_metrics_batch.append(py_metric)
-    else:
-      py_span = _get_tracing_data(c_census_data.span_data, c_census_data.span_data.span_labels,
-                                  c_census_data.span_data.span_annotations)
-      py_spans_batch.append(py_span)
+    py_span = _get_tracing_data(c_census_data.span_data, c_census_data.span_data.span_labels,
+                                c_census_data.span_data.span_annotations)
+    py_spans_batch.append(py_span)
     g_census_data_buffer.pop()
 
   del lk
+  # Metrics were aggregated by label set, so labels are only converted once
+  # for all the measurements sharing them.
+  py_metrics_batch = []
+  for c_metric in c_metrics:
+    py_labels = _c_label_to_labels(c_metric.labels)
+    py_identifier = _decode(c_metric.identifier)
+    py_measurement = _c_measurement_to_measurement(c_metric.measurement_data)
+    if c_metric.measurement_data.type == kMeasurementDouble:
+      py_values = c_metric.double_values
+    else:
+      py_values = c_metric.int_values
+    py_metric = _get_stats_data(py_measurement, py_labels, py_identifier,
+                                c_metric.count, py_values)
+    py_metrics_batch.append(py_metric)
   exporter.export_stats_data(py_metrics_batch)
   exporter.export_tracing_data(py_spans_batch)
 
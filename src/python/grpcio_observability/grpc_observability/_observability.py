@@ -51,8 +51,10 @@ class StatsData:
         MetricsName.CLIENT_STARTED_RPCS.
       measure_double: A bool indicate whether the metric is a floating-point
         value.
-      value_int: The actual metric value if measure_double is False.
-      value_float: The actual metric value if measure_double is True.
+      value_int: The actual metric value if measure_double is False. For
+        aggregated data, the sum of the aggregated measurements.
+      value_float: The actual metric value if measure_double is True. For
+        aggregated data, the sum of the aggregated measurements.
       include_exchange_labels: Whether this data should include exchanged labels.
       labels: A dictionary that maps label tags associated with this metric to
        corresponding label value.
@@ -60,6 +62,9 @@ class StatsData:
         belongs to.
       registered_method: Whether the method in this data is a registered method
         in stubs.
+      count: The number of measurements aggregated into this data.
+      values: The individual aggregated measurements. Empty for counters, of
+        which only the sum is kept, and for data that was not aggregated.
     """
 
     # type disabled reason: forward reference, circular import.
@@ -71,6 +76,8 @@ class StatsData:
     labels: Dict[str, Union[str, bytes]] = field(default_factory=dict)
     identifiers: Set[str] = field(default_factory=set)
     registered_method: bool = False
+    count: int = 1
+    values: List[Union[int, float]] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
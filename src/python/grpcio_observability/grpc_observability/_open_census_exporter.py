@@ -122,9 +122,6 @@ class OpenCensusExporter(_observability.Exporter):
             measure = _views.METRICS_NAME_TO_MEASURE.get(data.name, None)
             if not measure:
                 continue
-            # Create a measurement map for each metric, otherwise metrics will
-            # be overridden instead of accumulate.
-            measurement_map = self.stats_recorder.new_measurement_map()
             # Add data label to default labels.
             labels = data.labels
             labels.update(self.default_labels)
@@ -132,11 +129,24 @@ class OpenCensusExporter(_observability.Exporter):
             for key, value in labels.items():
                 tag_map.insert(TagKey(key), TagValue(value))
 
-            if data.measure_double:
-                measurement_map.measure_float_put(measure, data.value_float)
+            if data.values:
+                values = data.values
+            elif data.count == 1:
+                values = (
+                    data.value_float if data.measure_double else data.value_int,
+                )
             else:
-                measurement_map.measure_int_put(measure, data.value_int)
-            measurement_map.record(tag_map)
+                # Only the sum of counters is kept, each counted RPC being 1.
+                values = (1,) * data.count
+            for value in values:
+                # Create a measurement map for each measurement, otherwise
+                # metrics will be overridden instead of accumulate.
+                measurement_map = self.stats_recorder.new_measurement_map()
+                if data.measure_double:
+                    measurement_map.measure_float_put(measure, value)
+                else:
+                    measurement_map.measure_int_put(measure, value)
+                measurement_map.record(tag_map)
 
     def export_tracing_data(
         self, tracing_data: List[_observability.TracingData]
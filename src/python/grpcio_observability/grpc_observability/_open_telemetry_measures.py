@@ -82,6 +82,14 @@ SERVER_RPC_RECEIVED_BYTES = Metric(
     "Compressed message bytes received per server call",
 )
 
+# Recorded by the plugin itself rather than by the call tracers.
+CLIENT_RESPONSE_CACHE_LOOKUPS = Metric(
+    "grpc.client.response_cache.lookups",
+    None,
+    "{lookup}",
+    "Number of lookups in client-side response caches",
+)
+
 
 def base_metrics() -> List[Metric]:
     return [
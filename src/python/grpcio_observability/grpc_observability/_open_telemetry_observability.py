@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import functools
 import logging
+import random
 import threading
 import time
-from typing import Any, AnyStr, Dict, Iterable, List, Optional, Set, Union
+from typing import (
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 import grpc
 from grpc_observability import _cyobservability
@@ -43,8 +57,10 @@ OpenTelemetryPluginOption = (
 
 GRPC_METHOD_LABEL = "grpc.method"
 GRPC_TARGET_LABEL = "grpc.target"
+GRPC_RESPONSE_CACHE_RESULT_LABEL = "grpc.response_cache.result"
 GRPC_CLIENT_METRIC_PREFIX = "grpc.client"
 GRPC_OTHER_LABEL_VALUE = "other"
+_DEFAULT_LABEL_CACHE_SIZE = 1024
 _observability_lock: threading.RLock = threading.RLock()
 _OPEN_TELEMETRY_OBSERVABILITY: Optional["OpenTelemetryObservability"] = None
 
@@ -69,19 +85,155 @@ GRPC_STATUS_CODE_TO_STRING = {
 }
 
 
+class _LabelCache:
+    """A bounded LRU cache of the attributes recorded for raw label sets."""
+
+    _lock: threading.Lock
+    _maxsize: int
+    _attributes: "collections.OrderedDict[Hashable, Dict[str, str]]"
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, maxsize: int):
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._attributes = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Dict[str, str]]:
+        with self._lock:
+            attributes = self._attributes.get(key)
+            if attributes is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._attributes.move_to_end(key)
+            return attributes
+
+    def put(self, key: Hashable, attributes: Dict[str, str]) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._attributes[key] = attributes
+            if len(self._attributes) > self._maxsize:
+                self._attributes.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._attributes.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._attributes),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+class _MetricsSampling:
+    """Decides which calls record metrics on behalf of all plugins.
+
+    A call is sampled with the highest rate any plugin asks for its method,
+    and only skips end of call metrics if every plugin has a tail latency
+    threshold. Counters are never skipped by the threshold, so weighting them
+    by the sampling rate still estimates all calls.
+    """
+
+    sampling_rate: float
+    method_sampling_rates: Dict[str, float]
+    tail_latency_threshold: Optional[float]
+    sample_all: bool
+
+    def __init__(self, plugins: Iterable[_OpenTelemetryPlugin]):
+        plugins = [plugin.plugin for plugin in plugins]
+        self.sampling_rate = max(
+            (plugin.sampling_rate for plugin in plugins), default=1.0
+        )
+        methods = set()
+        for plugin in plugins:
+            methods.update(plugin.method_sampling_rates)
+        self.method_sampling_rates = {
+            method: max(
+                plugin.method_sampling_rates.get(method, plugin.sampling_rate)
+                for plugin in plugins
+            )
+            for method in methods
+        }
+        thresholds = [plugin.tail_latency_threshold for plugin in plugins]
+        if thresholds and None not in thresholds:
+            self.tail_latency_threshold = min(thresholds)
+        else:
+            self.tail_latency_threshold = None
+        self.sample_all = all(
+            rate >= 1.0
+            for rate in (
+                self.sampling_rate,
+                *self.method_sampling_rates.values(),
+            )
+        )
+
+    def _rate(self, method: str) -> float:
+        return self.method_sampling_rates.get(
+            method.lstrip("/"), self.sampling_rate
+        )
+
+    def should_sample(self, method: str) -> bool:
+        if self.sample_all:
+            return True
+        return random.random() < self._rate(method)
+
+    def should_record_end(
+        self, latency: float, status_code: grpc.StatusCode
+    ) -> bool:
+        return (
+            self.tail_latency_threshold is None
+            or status_code != grpc.StatusCode.OK
+            or latency > self.tail_latency_threshold
+        )
+
+    def weight(self, stats_data: StatsData) -> float:
+        """Returns how many calls each sampled call stands for."""
+        if self.sample_all:
+            return 1.0
+        method = stats_data.labels.get(GRPC_METHOD_LABEL, "")
+        if isinstance(method, bytes):
+            method = method.decode()
+        rate = self._rate(method)
+        return 1.0 / rate if rate > 0.0 else 1.0
+
+
 class _OpenTelemetryPlugin:
     _plugin: OpenTelemetryPlugin
     _metric_to_recorder: Dict[MetricsName, Union[Counter, Histogram]]
+    _response_cache_lookups: Optional[Counter]
     _enabled_client_plugin_options: Optional[List[OpenTelemetryPluginOption]]
     _enabled_server_plugin_options: Optional[List[OpenTelemetryPluginOption]]
+    _label_cache: _LabelCache
+    _target_attribute_filter: Callable[[str], bool]
+    _generic_method_attribute_filter: Callable[[str], bool]
     identifier: str
 
     def __init__(self, plugin: OpenTelemetryPlugin):
         self._plugin = plugin
         self._metric_to_recorder = {}
+        self._response_cache_lookups = None
         self.identifier = str(id(self))
         self._enabled_client_plugin_options = None
         self._enabled_server_plugin_options = None
+        self._label_cache = _LabelCache(plugin.label_cache_size)
+        # The filters only see a handful of distinct methods and targets.
+        self._target_attribute_filter = functools.lru_cache(
+            maxsize=plugin.label_cache_size
+        )(plugin.target_attribute_filter)
+        self._generic_method_attribute_filter = functools.lru_cache(
+            maxsize=plugin.label_cache_size
+        )(plugin.generic_method_attribute_filter)
 
         meter_provider = self._plugin.meter_provider
         if meter_provider:
@@ -90,15 +242,55 @@ class _OpenTelemetryPlugin:
             self._metric_to_recorder = self._register_metrics(
                 meter, enabled_metrics
             )
+            metric = _open_telemetry_measures.CLIENT_RESPONSE_CACHE_LOOKUPS
+            self._response_cache_lookups = meter.create_counter(
+                name=metric.name,
+                unit=metric.unit,
+                description=metric.description,
+            )
 
     def _should_record(self, stats_data: StatsData) -> bool:
         # Decide if this plugin should record the stats_data.
         return stats_data.name in self._metric_to_recorder
 
-    def _record_stats_data(self, stats_data: StatsData) -> None:
+    @property
+    def plugin(self) -> OpenTelemetryPlugin:
+        return self._plugin
+
+    def _record_stats_data(self, stats_data: StatsData, weight: float) -> None:
         recorder = self._metric_to_recorder[stats_data.name]
-        enabled_plugin_options = []
-        if GRPC_CLIENT_METRIC_PREFIX in recorder.name:
+        is_client = GRPC_CLIENT_METRIC_PREFIX in recorder.name
+        label_set = (
+            is_client,
+            stats_data.include_exchange_labels,
+            stats_data.registered_method,
+            tuple(stats_data.labels.items()),
+        )
+        attributes = self._label_cache.get(label_set)
+        if attributes is None:
+            attributes = self._resolve_attributes(stats_data, is_client)
+            self._label_cache.put(label_set, attributes)
+
+        value = 0
+        if stats_data.measure_double:
+            value = stats_data.value_float
+        else:
+            value = stats_data.value_int
+        if isinstance(recorder, Counter):
+            # Scale counters up to all the calls sampled ones stand for.
+            if weight != 1.0:
+                value *= weight
+            recorder.add(value, attributes=attributes)
+        elif isinstance(recorder, Histogram):
+            # Histograms have no way to take pre-bucketed data, so only the
+            # attributes are shared between the aggregated samples.
+            for sample in stats_data.values or (value,):
+                recorder.record(sample, attributes=attributes)
+
+    def _resolve_attributes(
+        self, stats_data: StatsData, is_client: bool
+    ) -> Dict[str, str]:
+        if is_client:
             enabled_plugin_options = self._enabled_client_plugin_options
         else:
             enabled_plugin_options = self._enabled_server_plugin_options
@@ -108,7 +300,7 @@ class _OpenTelemetryPlugin:
                 stats_data.labels, enabled_plugin_options
             )
         else:
-            deserialized_labels = stats_data.labels
+            deserialized_labels = dict(stats_data.labels)
         labels = self._maybe_add_labels(
             stats_data.include_exchange_labels,
             deserialized_labels,
@@ -117,33 +309,47 @@ class _OpenTelemetryPlugin:
         decoded_labels = self.decode_labels(labels)
 
         target = decoded_labels.get(GRPC_TARGET_LABEL, "")
-        if not self._plugin.target_attribute_filter(target):
+        if not self._target_attribute_filter(target):
             # Filter target name.
             decoded_labels[GRPC_TARGET_LABEL] = GRPC_OTHER_LABEL_VALUE
 
         method = decoded_labels.get(GRPC_METHOD_LABEL, "")
         if not (
             stats_data.registered_method
-            or self._plugin.generic_method_attribute_filter(method)
+            or self._generic_method_attribute_filter(method)
         ):
             # Filter method name if it's not registered method and
             # generic_method_attribute_filter returns false.
             decoded_labels[GRPC_METHOD_LABEL] = GRPC_OTHER_LABEL_VALUE
+        return decoded_labels
 
-        value = 0
-        if stats_data.measure_double:
-            value = stats_data.value_float
-        else:
-            value = stats_data.value_int
-        if isinstance(recorder, Counter):
-            recorder.add(value, attributes=decoded_labels)
-        elif isinstance(recorder, Histogram):
-            recorder.record(value, attributes=decoded_labels)
+    def record_response_cache_lookup(
+        self, method: str, registered_method: bool, hit: bool
+    ) -> None:
+        """Counts a lookup in a client-side response cache."""
+        if self._response_cache_lookups is None:
+            return
+        if not (
+            registered_method or self._generic_method_attribute_filter(method)
+        ):
+            method = GRPC_OTHER_LABEL_VALUE
+        self._response_cache_lookups.add(
+            1,
+            attributes={
+                GRPC_METHOD_LABEL: method,
+                GRPC_RESPONSE_CACHE_RESULT_LABEL: "hit" if hit else "miss",
+            },
+        )
+
+    def label_cache_stats(self) -> Dict[str, int]:
+        return self._label_cache.stats()
 
-    def maybe_record_stats_data(self, stats_data: StatsData) -> None:
+    def maybe_record_stats_data(
+        self, stats_data: StatsData, weight: float = 1.0
+    ) -> None:
         # Records stats data to MeterProvider.
         if self._should_record(stats_data):
-            self._record_stats_data(stats_data)
+            self._record_stats_data(stats_data, weight)
 
     def get_client_exchange_labels(self) -> Dict[str, AnyStr]:
         """Get labels used for client side Metadata Exchange."""
@@ -179,6 +385,8 @@ class _OpenTelemetryPlugin:
                     plugin_option, "is_active_on_client_channel"
                 ) and plugin_option.is_active_on_client_channel(target_str):
                     self._enabled_client_plugin_options.append(plugin_option)
+            # Attributes resolved with the previous options are stale.
+            self._label_cache.clear()
 
     def activate_server_plugin_options(self, xds: bool) -> None:
         """Activate server plugin options based on option settings."""
@@ -189,6 +397,7 @@ class _OpenTelemetryPlugin:
                     plugin_option, "is_active_on_server"
                 ) and plugin_option.is_active_on_server(xds):
                     self._enabled_server_plugin_options.append(plugin_option)
+            self._label_cache.clear()
 
     @staticmethod
     def _deserialize_labels(
@@ -303,17 +512,24 @@ def end_open_telemetry_observability() -> None:
 
 class _OpenTelemetryExporterDelegator(_observability.Exporter):
     _plugins: Iterable[_OpenTelemetryPlugin]
+    _sampling: _MetricsSampling
 
-    def __init__(self, plugins: Iterable[_OpenTelemetryPlugin]):
+    def __init__(
+        self,
+        plugins: Iterable[_OpenTelemetryPlugin],
+        sampling: _MetricsSampling,
+    ):
         self._plugins = plugins
+        self._sampling = sampling
 
     def export_stats_data(
         self, stats_data: List[_observability.StatsData]
     ) -> None:
         # Records stats data to MeterProvider.
         for data in stats_data:
+            weight = self._sampling.weight(data)
             for plugin in self._plugins:
-                plugin.maybe_record_stats_data(data)
+                plugin.maybe_record_stats_data(data, weight)
 
     def export_tracing_data(
         self, tracing_data: List[_observability.TracingData]
@@ -333,6 +549,7 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
 
     _exporter: "grpc_observability.Exporter"
     _plugins: List[_OpenTelemetryPlugin]
+    _sampling: _MetricsSampling
     _registered_methods: Set[bytes]
     _client_option_activated: bool
     _server_option_activated: bool
@@ -342,15 +559,23 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
         *,
         plugins: Iterable[_OpenTelemetryPlugin],
     ):
-        self._exporter = _OpenTelemetryExporterDelegator(plugins)
-        self._registered_methods = set()
         self._plugins = list(plugins)
+        self._sampling = _MetricsSampling(self._plugins)
+        self._exporter = _OpenTelemetryExporterDelegator(
+            self._plugins, self._sampling
+        )
+        self._registered_methods = set()
         self._client_option_activated = False
         self._server_option_activated = False
 
     def observability_init(self):
         try:
             _cyobservability.activate_stats()
+            _cyobservability.configure_metrics_sampling(
+                self._sampling.sampling_rate,
+                self._sampling.method_sampling_rates,
+                self._sampling.tail_latency_threshold,
+            )
             self.set_stats(True)
         except Exception as e:  # pylint: disable=broad-except
             error_msg = f"Activate observability metrics failed with: {e}"
@@ -376,12 +601,16 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
         time.sleep(_cyobservability.CENSUS_EXPORT_BATCH_INTERVAL_SECS)
         self.set_tracing(False)
         self.set_stats(False)
+        _cyobservability.configure_metrics_sampling(1.0, {}, None)
         _cyobservability.observability_deinit()
         grpc._observability.observability_deinit()
 
     def create_client_call_tracer(
         self, method_name: bytes, target: bytes
-    ) -> ClientCallTracerCapsule:
+    ) -> Optional[ClientCallTracerCapsule]:
+        # Calls which are not sampled do not get a tracer at all.
+        if not self._sampling.should_sample(method_name.decode("utf8")):
+            return None
         trace_id = b"TRACE_ID"
         self._maybe_activate_client_plugin_options(target)
         exchange_labels = self._get_client_exchange_labels()
@@ -425,6 +654,12 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
         rpc_latency: float,
         status_code: grpc.StatusCode,
     ) -> None:
+        # Only calls given a tracer get here, so they are already sampled.
+        # The latency is in milliseconds, and the threshold in seconds.
+        if not self._sampling.should_record_end(
+            rpc_latency / 1000, status_code
+        ):
+            return
         status_code = GRPC_STATUS_CODE_TO_STRING.get(status_code, "UNKNOWN")
         encoded_method = method.encode("utf8")
         _cyobservability._record_rpc_latency(
@@ -437,6 +672,14 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
             encoded_method in self._registered_methods,
         )
 
+    def record_response_cache_lookup(self, method: str, hit: bool) -> None:
+        # Lookups are cheap to count, so they are not sampled.
+        registered_method = method.encode("utf8") in self._registered_methods
+        for plugin in self._plugins:
+            plugin.record_response_cache_lookup(
+                method.strip("/"), registered_method, hit
+            )
+
     def save_registered_method(self, method_name: bytes) -> None:
         self._registered_methods.add(method_name)
 
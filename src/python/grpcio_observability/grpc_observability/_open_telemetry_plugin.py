@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import AnyStr, Callable, Dict, Iterable, List, Optional
+import collections
+from typing import AnyStr, Callable, Dict, Iterable, List, Mapping, Optional
 
 from grpc_observability import _open_telemetry_observability
 from grpc_observability._observability import OptionalLabelType
@@ -94,6 +95,10 @@ class OpenTelemetryPlugin:
     meter_provider: Optional[MeterProvider]
     target_attribute_filter: Callable[[str], bool]
     generic_method_attribute_filter: Callable[[str], bool]
+    label_cache_size: int
+    sampling_rate: float
+    method_sampling_rates: Mapping[str, float]
+    tail_latency_threshold: Optional[float]
     _plugins: List[_open_telemetry_observability._OpenTelemetryPlugin]
 
     def __init__(
@@ -103,6 +108,10 @@ class OpenTelemetryPlugin:
         meter_provider: Optional[MeterProvider] = None,
         target_attribute_filter: Optional[Callable[[str], bool]] = None,
         generic_method_attribute_filter: Optional[Callable[[str], bool]] = None,
+        label_cache_size: Optional[int] = None,
+        sampling_rate: float = 1.0,
+        method_sampling_rates: Optional[Mapping[str, float]] = None,
+        tail_latency_threshold: Optional[float] = None,
     ):
         """
         Args:
@@ -125,6 +134,19 @@ class OpenTelemetryPlugin:
         this function returns.
         Return True means the original method name will be used, False means method name will
         be replaced with "other".
+          label_cache_size: The maximum number of distinct label sets whose resolved
+        attributes are cached, along with the results of the attribute filters, or None
+        for the default size. 0 disables the cache. This is an EXPERIMENTAL option.
+          sampling_rate: The probability, between 0 and 1, that a call records metrics.
+        Counters are scaled so that they still estimate the number of all calls. This is
+        an EXPERIMENTAL option.
+          method_sampling_rates: A mapping from fully-qualified method names, e.g.
+        "package.Service/Method", to the sampling rate to use for them instead of
+        sampling_rate. This is an EXPERIMENTAL option.
+          tail_latency_threshold: If provided, sampled calls only record their end of
+        call metrics, e.g. durations and message sizes, when they took longer than this
+        many seconds or did not end with an OK status. Counters are not affected, so
+        that they still count all calls. This is an EXPERIMENTAL option.
         """
         self.plugin_options = plugin_options or []
         self.meter_provider = meter_provider
@@ -134,6 +156,22 @@ class OpenTelemetryPlugin:
         self.generic_method_attribute_filter = (
             generic_method_attribute_filter or (lambda _target: False)
         )
+        if label_cache_size is None:
+            label_cache_size = (
+                _open_telemetry_observability._DEFAULT_LABEL_CACHE_SIZE
+            )
+        self.label_cache_size = label_cache_size
+        self.method_sampling_rates = {
+            method.lstrip("/"): rate
+            for method, rate in (method_sampling_rates or {}).items()
+        }
+        for rate in (sampling_rate, *self.method_sampling_rates.values()):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(
+                    f"Sampling rates must be between 0 and 1, got {rate}."
+                )
+        self.sampling_rate = sampling_rate
+        self.tail_latency_threshold = tail_latency_threshold
         self._plugins = [
             _open_telemetry_observability._OpenTelemetryPlugin(self)
         ]
@@ -166,5 +204,21 @@ class OpenTelemetryPlugin:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         _open_telemetry_observability.end_open_telemetry_observability()
 
+    def label_cache_stats(self) -> Dict[str, int]:
+        """
+        Reports how the cache of resolved label sets has been used.
+
+        This is an EXPERIMENTAL API.
+
+        Returns:
+          A dict with the current "size" of the cache, the number of recorded data
+        points whose label set was found in the cache ("hits") or not ("misses"), and
+        the number of label sets evicted from it ("evictions").
+        """
+        stats = collections.Counter()
+        for plugin in self._plugins:
+            stats.update(plugin.label_cache_stats())
+        return dict(stats)
+
     def _get_enabled_optional_labels(self) -> List[OptionalLabelType]:
         return []
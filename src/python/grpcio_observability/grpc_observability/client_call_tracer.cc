@@ -26,6 +26,7 @@
 #include "metadata_exchange.h"
 #include "observability_util.h"
 #include "python_observability_context.h"
+#include "sampler.h"
 #include "src/core/lib/experiments/experiments.h"
 #include "src/core/lib/slice/slice.h"
 #include "src/core/util/grpc_check.h"
@@ -266,11 +267,6 @@ void PythonOpenCensusCallTracer::PythonOpenCensusCallAttemptTracer::
         parent_->labels_injector_.GetExchangeLabels(recv_trailing_metadata);
   }
   auto status_code_ = status.code();
-  uint64_t elapsed_time = 0;
-  if (recv_trailing_metadata != nullptr) {
-    elapsed_time = GetElapsedTimeFromTrailingMetadata(recv_trailing_metadata);
-  }
-
   std::string final_status = absl::StatusCodeToString(status_code_);
   context_.Labels().emplace_back(kClientMethod, parent_->method_);
   context_.Labels().emplace_back(kClientTarget, parent_->target_);
@@ -282,6 +278,20 @@ void PythonOpenCensusCallTracer::PythonOpenCensusCallAttemptTracer::
   for (const auto& label : labels_from_peer_) {
     context_.Labels().emplace_back(label);
   }
+  // Counters are exempt from the tail latency threshold, so that they still
+  // count every sampled call.
+  RecordIntMetric(kRpcClientCompletedRpcMeasureName, 1, context_.Labels(),
+                  parent_->identifier_, parent_->registered_method_,
+                  /*include_exchange_labels=*/true);
+  record_end_ = MetricsSampler::Get().ShouldRecordEnd(
+      absl::ToDoubleSeconds(absl::Now() - start_time_), status.ok());
+  if (!record_end_) {
+    return;
+  }
+  uint64_t elapsed_time = 0;
+  if (recv_trailing_metadata != nullptr) {
+    elapsed_time = GetElapsedTimeFromTrailingMetadata(recv_trailing_metadata);
+  }
   uint64_t incoming_bytes = 0;
   uint64_t outgoing_bytes = 0;
   if (grpc_core::IsCallTracerInTransportEnabled()) {
@@ -309,9 +319,6 @@ void PythonOpenCensusCallTracer::PythonOpenCensusCallAttemptTracer::
                      context_.Labels(), parent_->identifier_,
                      parent_->registered_method_,
                      /*include_exchange_labels=*/true);
-  RecordIntMetric(kRpcClientCompletedRpcMeasureName, 1, context_.Labels(),
-                  parent_->identifier_, parent_->registered_method_,
-                  /*include_exchange_labels=*/true);
 }
 
 void PythonOpenCensusCallTracer::PythonOpenCensusCallAttemptTracer::
@@ -330,17 +337,19 @@ void PythonOpenCensusCallTracer::PythonOpenCensusCallAttemptTracer::
 void PythonOpenCensusCallTracer::PythonOpenCensusCallAttemptTracer::
     RecordEnd() {
   if (PythonCensusStatsEnabled()) {
-    context_.Labels().emplace_back(kClientMethod, parent_->method_);
-    context_.Labels().emplace_back(kClientStatus,
-                                   StatusCodeToString(status_code_));
-    RecordIntMetric(kRpcClientSentMessagesPerRpcMeasureName,
-                    sent_message_count_, context_.Labels(),
-                    parent_->identifier_, parent_->registered_method_,
-                    /*include_exchange_labels=*/true);
-    RecordIntMetric(kRpcClientReceivedMessagesPerRpcMeasureName,
-                    recv_message_count_, context_.Labels(),
-                    parent_->identifier_, parent_->registered_method_,
-                    /*include_exchange_labels=*/true);
+    if (record_end_) {
+      context_.Labels().emplace_back(kClientMethod, parent_->method_);
+      context_.Labels().emplace_back(kClientStatus,
+                                     StatusCodeToString(status_code_));
+      RecordIntMetric(kRpcClientSentMessagesPerRpcMeasureName,
+                      sent_message_count_, context_.Labels(),
+                      parent_->identifier_, parent_->registered_method_,
+                      /*include_exchange_labels=*/true);
+      RecordIntMetric(kRpcClientReceivedMessagesPerRpcMeasureName,
+                      recv_message_count_, context_.Labels(),
+                      parent_->identifier_, parent_->registered_method_,
+                      /*include_exchange_labels=*/true);
+    }
 
     grpc_core::MutexLock lock(&parent_->mu_);
     if (--parent_->num_active_rpcs_ == 0) {
@@ -107,6 +107,8 @@ class PythonOpenCensusCallTracer : public grpc_core::ClientCallTracerInterface {
         optional_labels_array_;
     std::vector<Label> labels_from_peer_;
     bool is_trailers_only_ = false;
+    // Whether MetricsSampler keeps the end of call metrics of this attempt.
+    bool record_end_ = true;
     // TODO(roth, ctiller): Won't need atomic here once chttp2 is migrated
     // to promises, after which we can ensure that the transport invokes
     // the RecordIncomingBytes() and RecordOutgoingBytes() methods inside
@@ -32,6 +32,15 @@ namespace grpc_observability {
 std::queue<CensusData>* g_census_data_buffer;
 std::mutex g_census_data_buffer_mutex;
 std::condition_variable g_census_data_buffer_cv;
+// Measurements are aggregated by label set until the export thread takes them,
+// so that Python resolves the attributes of each label set once per export
+// interval. Only counters collapse into their sum. Histogram samples are kept
+// individually and count towards the buffer size like unaggregated data,
+// because exporters have to record them one at a time.
+std::vector<AggregatedMetric>* g_aggregated_metrics;
+std::map<AggregatedMetricKey, size_t>* g_aggregated_metric_indices;
+// Number of entries held by the aggregates towards the buffer size.
+int g_aggregated_metric_buffered_size = 0;
 // TODO(xuanwn): Change below to a more appropriate number.
 // Assume buffer will store 100 CensusData and start export when buffer is 70%
 // full.
@@ -56,6 +65,30 @@ int GetMaxExportBufferSize() {
   return kMaxExportBufferSize;
 }
 
+// Metrics counting RPCs measure 1 per RPC, so only their sum is kept.
+bool IsCounterMetric(MetricsName name) {
+  switch (name) {
+    case kRpcClientStartedRpcsMeasureName:
+    case kRpcClientCompletedRpcMeasureName:
+    case kRpcServerStartedRpcsMeasureName:
+    case kRpcServerCompletedRpcMeasureName:
+      return true;
+    default:
+      return false;
+  }
+}
+
+int BufferedSizeLocked() {
+  return g_census_data_buffer->size() + g_aggregated_metric_buffered_size;
+}
+
+void MaybeNotifyExportThreadLocked() {
+  if (BufferedSizeLocked() >=
+      (GetExportThreadHold() * GetMaxExportBufferSize())) {
+    g_census_data_buffer_cv.notify_all();
+  }
+}
+
 }  // namespace
 
 void RecordIntMetric(MetricsName name, int64_t value,
@@ -69,8 +102,7 @@ void RecordIntMetric(MetricsName name, int64_t value,
   measurement_data.include_exchange_labels = include_exchange_labels;
   measurement_data.value.value_int = value;
 
-  CensusData data = CensusData(measurement_data, labels, identifier);
-  AddCensusDataToBuffer(data);
+  AddMeasurementToAggregates(measurement_data, labels, identifier);
 }
 
 void RecordDoubleMetric(MetricsName name, double value,
@@ -84,8 +116,7 @@ void RecordDoubleMetric(MetricsName name, double value,
   measurement_data.include_exchange_labels = include_exchange_labels;
   measurement_data.value.value_double = value;
 
-  CensusData data = CensusData(measurement_data, labels, identifier);
-  AddCensusDataToBuffer(data);
+  AddMeasurementToAggregates(measurement_data, labels, identifier);
 }
 
 void RecordSpan(const SpanCensusData& span_census_data) {
@@ -95,6 +126,8 @@ void RecordSpan(const SpanCensusData& span_census_data) {
 
 void NativeObservabilityInit() {
   g_census_data_buffer = new std::queue<CensusData>;
+  g_aggregated_metrics = new std::vector<AggregatedMetric>;
+  g_aggregated_metric_indices = new std::map<AggregatedMetricKey, size_t>;
   // Forces linking of instrument library
   grpc_core::CreateCollectionScope({}, {});
 }
@@ -126,16 +159,80 @@ void AwaitNextBatchLocked(std::unique_lock<std::mutex>& lock, int timeout_ms) {
 
 void AddCensusDataToBuffer(const CensusData& data) {
   std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
-  if (g_census_data_buffer->size() >= GetMaxExportBufferSize()) {
+  if (BufferedSizeLocked() >= GetMaxExportBufferSize()) {
     VLOG(2) << "Reached maximum census data buffer size, discarding this "
                "CensusData entry";
   } else {
     g_census_data_buffer->push(data);
   }
-  if (g_census_data_buffer->size() >=
-      (GetExportThreadHold() * GetMaxExportBufferSize())) {
-    g_census_data_buffer_cv.notify_all();
+  MaybeNotifyExportThreadLocked();
+}
+
+void AddMeasurementToAggregates(const Measurement& measurement,
+                                const std::vector<Label>& labels,
+                                const std::string& identifier) {
+  AggregatedMetricKey key{measurement.name, identifier,
+                          measurement.registered_method,
+                          measurement.include_exchange_labels, labels};
+  const bool is_counter = IsCounterMetric(measurement.name);
+  std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
+  auto it = g_aggregated_metric_indices->find(key);
+  // Counting into an existing counter does not grow the buffer.
+  if ((it == g_aggregated_metric_indices->end() || !is_counter) &&
+      BufferedSizeLocked() >= GetMaxExportBufferSize()) {
+    VLOG(2) << "Reached maximum census data buffer size, discarding this "
+               "measurement";
+    MaybeNotifyExportThreadLocked();
+    return;
+  }
+  AggregatedMetric* metric;
+  if (it == g_aggregated_metric_indices->end()) {
+    g_aggregated_metric_indices->emplace(std::move(key),
+                                         g_aggregated_metrics->size());
+    g_aggregated_metrics->emplace_back();
+    metric = &g_aggregated_metrics->back();
+    metric->measurement_data = measurement;
+    if (measurement.type == kMeasurementDouble) {
+      metric->measurement_data.value.value_double = 0;
+    } else {
+      metric->measurement_data.value.value_int = 0;
+    }
+    metric->labels = labels;
+    metric->identifier = identifier;
+    metric->count = 0;
+    ++g_aggregated_metric_buffered_size;
+  } else {
+    metric = &(*g_aggregated_metrics)[it->second];
+    if (!is_counter) {
+      ++g_aggregated_metric_buffered_size;
+    }
   }
+  ++metric->count;
+  if (measurement.type == kMeasurementDouble) {
+    metric->measurement_data.value.value_double +=
+        measurement.value.value_double;
+    if (!is_counter) {
+      metric->double_values.push_back(measurement.value.value_double);
+    }
+  } else {
+    metric->measurement_data.value.value_int += measurement.value.value_int;
+    if (!is_counter) {
+      metric->int_values.push_back(measurement.value.value_int);
+    }
+  }
+  MaybeNotifyExportThreadLocked();
+}
+
+bool CensusDataBufferEmptyLocked() {
+  return g_census_data_buffer->empty() && g_aggregated_metrics->empty();
+}
+
+std::vector<AggregatedMetric> TakeAggregatedMetricsLocked() {
+  std::vector<AggregatedMetric> aggregated_metrics;
+  aggregated_metrics.swap(*g_aggregated_metrics);
+  g_aggregated_metric_indices->clear();
+  g_aggregated_metric_buffered_size = 0;
+  return aggregated_metrics;
 }
 
 absl::string_view StatusCodeToString(grpc_status_code code) {
@@ -20,9 +20,11 @@
 
 #include <algorithm>
 #include <condition_variable>
+#include <map>
 #include <mutex>
 #include <queue>
 #include <string>
+#include <tuple>
 #include <utility>
 #include <vector>
 
@@ -49,6 +51,35 @@ struct CensusData {
   CensusData(const SpanCensusData& sd) : type(kSpanData), span_data(sd) {}
 };
 
+// All the measurements of one metric sharing the same labels, identifier and
+// flags since the last export. The value of measurement_data holds their sum.
+struct AggregatedMetric {
+  Measurement measurement_data;
+  std::vector<Label> labels;
+  std::string identifier;
+  int64_t count;
+  // The individual measurements, kept for every metric but counters. Neither
+  // OpenTelemetry nor OpenCensus accept pre-bucketed histogram data, so
+  // exporters replay these one at a time.
+  std::vector<double> double_values;
+  std::vector<int64_t> int_values;
+};
+
+struct AggregatedMetricKey {
+  MetricsName name;
+  std::string identifier;
+  bool registered_method;
+  bool include_exchange_labels;
+  std::vector<Label> labels;
+  bool operator<(const AggregatedMetricKey& other) const {
+    return std::tie(name, registered_method, include_exchange_labels,
+                    identifier, labels) <
+           std::tie(other.name, other.registered_method,
+                    other.include_exchange_labels, other.identifier,
+                    other.labels);
+  }
+};
+
 // extern is required for Cython
 extern std::queue<CensusData>* g_census_data_buffer;
 extern std::mutex g_census_data_buffer_mutex;
@@ -70,6 +101,15 @@ void AwaitNextBatchLocked(std::unique_lock<std::mutex>& lock, int timeout_ms);
 
 void AddCensusDataToBuffer(const CensusData& buffer);
 
+void AddMeasurementToAggregates(const Measurement& measurement,
+                                const std::vector<Label>& labels,
+                                const std::string& identifier);
+
+// Both of the following must be called with g_census_data_buffer_mutex held.
+bool CensusDataBufferEmptyLocked();
+
+std::vector<AggregatedMetric> TakeAggregatedMetricsLocked();
+
 void RecordIntMetric(MetricsName name, int64_t value,
                      const std::vector<Label>& labels, std::string identifier,
                      const bool registered_method,
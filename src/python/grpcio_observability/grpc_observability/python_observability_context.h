@@ -22,6 +22,7 @@
 #include <algorithm>
 #include <atomic>
 #include <string>
+#include <tuple>
 #include <vector>
 
 #include "constants.h"
@@ -90,6 +91,9 @@ struct Tag {
 struct Label {
   Label() {}
   Label(std::string k, std::string v) : key(k), value(v) {}
+  bool operator<(const Label& other) const {
+    return std::tie(key, value) < std::tie(other.key, other.value);
+  }
   std::string key;
   std::string value;
 };
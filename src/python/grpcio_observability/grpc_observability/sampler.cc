@@ -16,6 +16,7 @@
 
 #include <cmath>
 #include <cstdint>
+#include <random>
 
 #include "absl/strings/escaping.h"
 
@@ -66,4 +67,45 @@ bool ProbabilitySampler::ShouldSample(const std::string& trace_id) {
   return CalculateThresholdFromBuffer(trace_id) <= threshold_;
 }
 
+MetricsSampler& MetricsSampler::Get() {
+  static MetricsSampler* sampler = new MetricsSampler;
+  return *sampler;
+}
+
+void MetricsSampler::Configure(
+    double sampling_rate,
+    const std::map<std::string, double>& method_sampling_rates,
+    double tail_latency_threshold_s) {
+  std::lock_guard<std::mutex> lock(mu_);
+  sampling_rate_ = sampling_rate;
+  method_sampling_rates_.clear();
+  bool sample_all = sampling_rate >= 1.0;
+  for (const auto& method_sampling_rate : method_sampling_rates) {
+    method_sampling_rates_.emplace(method_sampling_rate);
+    sample_all = sample_all && method_sampling_rate.second >= 1.0;
+  }
+  sample_all_.store(sample_all);
+  tail_latency_threshold_s_.store(tail_latency_threshold_s);
+}
+
+bool MetricsSampler::ShouldSample(absl::string_view method) {
+  if (sample_all_.load(std::memory_order_relaxed)) return true;
+  double rate;
+  {
+    std::lock_guard<std::mutex> lock(mu_);
+    auto it = method_sampling_rates_.find(method);
+    rate = it == method_sampling_rates_.end() ? sampling_rate_ : it->second;
+  }
+  if (rate >= 1.0) return true;
+  if (rate <= 0.0) return false;
+  thread_local std::mt19937_64 generator{std::random_device{}()};
+  return std::uniform_real_distribution<double>(0.0, 1.0)(generator) < rate;
+}
+
+bool MetricsSampler::ShouldRecordEnd(double latency_s, bool ok) {
+  const double threshold_s =
+      tail_latency_threshold_s_.load(std::memory_order_relaxed);
+  return threshold_s < 0 || !ok || latency_s > threshold_s;
+}
+
 }  // namespace grpc_observability
@@ -15,9 +15,15 @@
 #ifndef SAMPLER_MAIN_H
 #define SAMPLER_MAIN_H
 
+#include <atomic>
 #include <cstdint>
+#include <functional>
+#include <map>
+#include <mutex>
 #include <string>
 
+#include "absl/strings/string_view.h"
+
 namespace grpc_observability {
 
 // Returns true or false for sampling based on the given probability. Objects of
@@ -38,6 +44,33 @@ class ProbabilitySampler final {
   uint64_t threshold_;
 };
 
+// Decides which calls record metrics.
+class MetricsSampler final {
+ public:
+  static MetricsSampler& Get();
+
+  // Calls to the methods in method_sampling_rates are sampled with their rate,
+  // others with sampling_rate. Unless tail_latency_threshold_s is negative,
+  // only the sampled calls which took longer than it or did not end with OK
+  // record their end of call metrics other than counters.
+  void Configure(double sampling_rate,
+                 const std::map<std::string, double>& method_sampling_rates,
+                 double tail_latency_threshold_s);
+
+  bool ShouldSample(absl::string_view method);
+
+  bool ShouldRecordEnd(double latency_s, bool ok);
+
+ private:
+  MetricsSampler() = default;
+
+  std::atomic<bool> sample_all_{true};
+  std::atomic<double> tail_latency_threshold_s_{-1};
+  std::mutex mu_;
+  double sampling_rate_ = 1;
+  std::map<std::string, double, std::less<>> method_sampling_rates_;
+};
+
 }  // namespace grpc_observability
 
 #endif  // SAMPLER_MAIN_H
@@ -26,6 +26,7 @@
 #include "constants.h"
 #include "observability_util.h"
 #include "python_observability_context.h"
+#include "sampler.h"
 #include "src/core/call/metadata_batch.h"
 #include "src/core/lib/channel/channel_stack.h"
 #include "src/core/lib/experiments/experiments.h"
@@ -121,7 +122,8 @@ void PythonOpenCensusServerCallTracer::RecordReceivedInitialMetadata(
   registered_method_ =
       recv_initial_metadata->get(grpc_core::GrpcRegisteredMethod())
           .value_or(nullptr) != nullptr;
-  if (PythonCensusStatsEnabled()) {
+  sampled_ = MetricsSampler::Get().ShouldSample(method_);
+  if (PythonCensusStatsEnabled() && sampled_) {
     context_.Labels().emplace_back(kServerMethod, std::string(method_));
     RecordIntMetric(kRpcServerStartedRpcsMeasureName, 1, context_.Labels(),
                     identifier_, registered_method_,
@@ -189,17 +191,8 @@ void PythonOpenCensusServerCallTracer::RecordCancel(
 
 void PythonOpenCensusServerCallTracer::RecordEnd(
     const grpc_call_final_info* final_info) {
-  if (PythonCensusStatsEnabled()) {
-    uint64_t outgoing_bytes;
-    uint64_t incoming_bytes;
-    if (grpc_core::IsCallTracerInTransportEnabled()) {
-      outgoing_bytes = outgoing_bytes_.load();
-      incoming_bytes = incoming_bytes_.load();
-    } else {
-      outgoing_bytes = GetOutgoingDataSize(final_info);
-      incoming_bytes = GetIncomingDataSize(final_info);
-    }
-    double elapsed_time_s = absl::ToDoubleSeconds(elapsed_time_);
+  double elapsed_time_s = absl::ToDoubleSeconds(elapsed_time_);
+  if (PythonCensusStatsEnabled() && sampled_) {
     context_.Labels().emplace_back(kServerMethod, std::string(method_));
     context_.Labels().emplace_back(
         kServerStatus,
@@ -207,26 +200,40 @@ void PythonOpenCensusServerCallTracer::RecordEnd(
     for (const auto& label : labels_from_peer_) {
       context_.Labels().emplace_back(label);
     }
-    RecordDoubleMetric(kRpcServerSentBytesPerRpcMeasureName,
-                       static_cast<double>(outgoing_bytes), context_.Labels(),
-                       identifier_, registered_method_,
-                       /*include_exchange_labels=*/true);
-    RecordDoubleMetric(kRpcServerReceivedBytesPerRpcMeasureName,
-                       static_cast<double>(incoming_bytes), context_.Labels(),
-                       identifier_, registered_method_,
-                       /*include_exchange_labels=*/true);
-    RecordDoubleMetric(kRpcServerServerLatencyMeasureName, elapsed_time_s,
-                       context_.Labels(), identifier_, registered_method_,
-                       /*include_exchange_labels=*/true);
+    // Counters are exempt from the tail latency threshold, so that they still
+    // count every sampled call.
     RecordIntMetric(kRpcServerCompletedRpcMeasureName, 1, context_.Labels(),
                     identifier_, registered_method_,
                     /*include_exchange_labels=*/true);
-    RecordIntMetric(kRpcServerSentMessagesPerRpcMeasureName,
-                    sent_message_count_, context_.Labels(), identifier_,
-                    registered_method_, /*include_exchange_labels=*/true);
-    RecordIntMetric(kRpcServerReceivedMessagesPerRpcMeasureName,
-                    recv_message_count_, context_.Labels(), identifier_,
-                    registered_method_, /*include_exchange_labels=*/true);
+    if (MetricsSampler::Get().ShouldRecordEnd(
+            elapsed_time_s, final_info->final_status == GRPC_STATUS_OK)) {
+      uint64_t outgoing_bytes;
+      uint64_t incoming_bytes;
+      if (grpc_core::IsCallTracerInTransportEnabled()) {
+        outgoing_bytes = outgoing_bytes_.load();
+        incoming_bytes = incoming_bytes_.load();
+      } else {
+        outgoing_bytes = GetOutgoingDataSize(final_info);
+        incoming_bytes = GetIncomingDataSize(final_info);
+      }
+      RecordDoubleMetric(kRpcServerSentBytesPerRpcMeasureName,
+                         static_cast<double>(outgoing_bytes),
+                         context_.Labels(), identifier_, registered_method_,
+                         /*include_exchange_labels=*/true);
+      RecordDoubleMetric(kRpcServerReceivedBytesPerRpcMeasureName,
+                         static_cast<double>(incoming_bytes),
+                         context_.Labels(), identifier_, registered_method_,
+                         /*include_exchange_labels=*/true);
+      RecordDoubleMetric(kRpcServerServerLatencyMeasureName, elapsed_time_s,
+                         context_.Labels(), identifier_, registered_method_,
+                         /*include_exchange_labels=*/true);
+      RecordIntMetric(kRpcServerSentMessagesPerRpcMeasureName,
+                      sent_message_count_, context_.Labels(), identifier_,
+                      registered_method_, /*include_exchange_labels=*/true);
+      RecordIntMetric(kRpcServerReceivedMessagesPerRpcMeasureName,
+                      recv_message_count_, context_.Labels(), identifier_,
+                      registered_method_, /*include_exchange_labels=*/true);
+    }
   }
   if (PythonCensusTracingEnabled()) {
     context_.EndSpan();
@@ -135,6 +135,8 @@ class PythonOpenCensusServerCallTracer
   std::vector<Label> labels_from_peer_;
   std::string identifier_;
   bool registered_method_ = false;
+  // Whether MetricsSampler sampled this call for metrics.
+  bool sampled_ = true;
   // TODO(roth, ctiller): Won't need atomic here once chttp2 is migrated
   // to promises, after which we can ensure that the transport invokes
   // the RecordIncomingBytes() and RecordOutgoingBytes() methods inside
@@ -40,21 +40,10 @@ def _collect_transitive_dependencies(descriptor, seen_files):
             _collect_transitive_dependencies(dependency, seen_files)
 
 
-def _file_descriptor_response(descriptor, original_request):
-    # collect all dependencies
-    descriptors = {}
-    _collect_transitive_dependencies(descriptor, descriptors)
-
-    # serialize all descriptors
-    serialized_proto_list = []
-    for d_value in descriptors.values():
-        proto = descriptor_pb2.FileDescriptorProto()
-        d_value.CopyToProto(proto)
-        serialized_proto_list.append(proto.SerializeToString())
-
+def _file_descriptor_response(serialized_proto_list, original_request):
     return _reflection_pb2.ServerReflectionResponse(
         file_descriptor_response=_reflection_pb2.FileDescriptorResponse(
-            file_descriptor_proto=(serialized_proto_list)
+            file_descriptor_proto=serialized_proto_list
         ),
         original_request=original_request,
     )
@@ -72,24 +61,65 @@ class BaseReflectionServicer(_reflection_pb2_grpc.ServerReflectionServicer):
         """
         self._service_names = tuple(sorted(service_names))
         self._pool = _POOL if pool is None else pool
+        # Files in a descriptor pool never change once added, so serialized
+        # files and dependency closures stay valid for the pool's lifetime.
+        # Lookups that fail are not cached, as the file may be added later.
+        self._serialized_files = {}
+        self._closures_by_filename = {}
+        self._closures_by_symbol = {}
+        for service_name in self._service_names:
+            try:
+                self._symbol_closure(service_name)
+            except KeyError:
+                pass
+
+    def _serialized_file(self, descriptor):
+        serialized_file = self._serialized_files.get(descriptor.name)
+        if serialized_file is None:
+            proto = descriptor_pb2.FileDescriptorProto()
+            descriptor.CopyToProto(proto)
+            serialized_file = proto.SerializeToString()
+            self._serialized_files[descriptor.name] = serialized_file
+        return serialized_file
+
+    def _closure(self, descriptor):
+        closure = self._closures_by_filename.get(descriptor.name)
+        if closure is None:
+            # collect all dependencies
+            descriptors = {}
+            _collect_transitive_dependencies(descriptor, descriptors)
+            closure = tuple(
+                self._serialized_file(d_value)
+                for d_value in descriptors.values()
+            )
+            self._closures_by_filename[descriptor.name] = closure
+        return closure
+
+    def _symbol_closure(self, fully_qualified_name):
+        closure = self._closures_by_symbol.get(fully_qualified_name)
+        if closure is None:
+            closure = self._closure(
+                self._pool.FindFileContainingSymbol(fully_qualified_name)
+            )
+            self._closures_by_symbol[fully_qualified_name] = closure
+        return closure
 
     def _file_by_filename(self, request, filename):
-        try:
-            descriptor = self._pool.FindFileByName(filename)
-        except KeyError:
-            return _not_found_error(request)
-        else:
-            return _file_descriptor_response(descriptor, request)
+        closure = self._closures_by_filename.get(filename)
+        if closure is None:
+            try:
+                closure = self._closure(self._pool.FindFileByName(filename))
+            except KeyError:
+                return _not_found_error(request)
+        return _file_descriptor_response(closure, request)
 
     def _file_containing_symbol(self, request, fully_qualified_name):
         try:
-            descriptor = self._pool.FindFileContainingSymbol(
-                fully_qualified_name
-            )
+            closure = self._symbol_closure(fully_qualified_name)
         except KeyError:
             return _not_found_error(request)
         else:
-            return _file_descriptor_response(descriptor, request)
+            return _file_descriptor_response(closure, request)
 
     def _file_containing_extension(
         self, request, containing_type, extension_number
@@ -101,13 +131,11 @@ class BaseReflectionServicer(_reflection_pb2_grpc.ServerReflectionServicer):
             extension_descriptor = self._pool.FindExtensionByNumber(
                 message_descriptor, extension_number
             )
-            descriptor = self._pool.FindFileContainingSymbol(
-                extension_descriptor.full_name
-            )
+            closure = self._symbol_closure(extension_descriptor.full_name)
         except KeyError:
             return _not_found_error(request)
         else:
-            return _file_descriptor_response(descriptor, request)
+            return _file_descriptor_response(closure, request)
 
     def _all_extension_numbers_of_type(self, request, containing_type):
         try:
@@ -533,6 +533,76 @@ class ChannelzServicerTest(unittest.TestCase):
             ip = ipaddress.IPv6Address(tcpip_address.ip_address)
         return f"{ip}:{tcpip_address.port}"
 
+    def test_iter_top_channels(self):
+        k_channels = 4
+        self._pairs = _generate_channel_server_pairs(k_channels)
+        self._send_successful_unary_unary(1)
+        resp = self._channelz_stub.GetTopChannels(
+            channelz_pb2.GetTopChannelsRequest(start_channel_id=0)
+        )
+        self.assertSequenceEqual(
+            resp.channel, tuple(channelz.iter_top_channels())
+        )
+
+    def test_iter_servers_and_server_sockets(self):
+        self._pairs = _generate_channel_server_pairs(2)
+        self._send_successful_unary_unary(0)
+        servers = tuple(channelz.iter_servers())
+        self.assertEqual(len(servers), 2)
+        for server in servers:
+            resp = self._channelz_stub.GetServerSockets(
+                channelz_pb2.GetServerSocketsRequest(
+                    server_id=server.ref.server_id, start_socket_id=0
+                )
+            )
+            self.assertSequenceEqual(
+                resp.socket_ref,
+                tuple(channelz.iter_server_sockets(server.ref.server_id, 1)),
+            )
+        with self.assertRaises(ValueError):
+            tuple(channelz.iter_server_sockets(10000))
+
+    def test_summary(self):
+        self._pairs = _generate_channel_server_pairs(2)
+        k_success = 3
+        k_failed = 2
+        for i in range(k_success):
+            self._send_successful_unary_unary(0)
+        for i in range(k_failed):
+            self._send_failed_unary_unary(1)
+
+        self.assertEqual(
+            {
+                "top_channels": 2,
+                "channel_calls_started": k_success + k_failed,
+                "channel_calls_succeeded": k_success,
+                "channel_calls_failed": k_failed,
+                "servers": 2,
+                "server_calls_started": k_success + k_failed,
+                "server_calls_succeeded": k_success,
+                "server_calls_failed": k_failed,
+            },
+            channelz.summary(),
+        )
+
+    def test_cached_responses(self):
+        self._pairs = _generate_channel_server_pairs(1)
+        servicer = channelz.ChannelzServicer(experimental_cache_ttl=60)
+        request = channelz_pb2.GetTopChannelsRequest(start_channel_id=0)
+        resp = servicer.GetTopChannels(request, None)
+        self.assertEqual(len(resp.channel), 1)
+
+        self._pairs.extend(_generate_channel_server_pairs(1))
+        self.assertIs(resp, servicer.GetTopChannels(request, None))
+        self.assertEqual(
+            len(
+                channelz.ChannelzServicer()
+                .GetTopChannels(request, None)
+                .channel
+            ),
+            2,
+        )
+
     def test_invalid_query_get_server(self):
         try:
             self._channelz_stub.GetServer(
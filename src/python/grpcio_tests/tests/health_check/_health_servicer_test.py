@@ -200,6 +200,35 @@ class BaseWatchTests:
             self.assertTrue(response_queue1.empty())
             self.assertTrue(response_queue2.empty())
 
+        def test_watch_unchanged_status_not_resent(self):
+            request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
+            response_queue = queue.Queue()
+            rendezvous = self._stub.Watch(request)
+            thread = threading.Thread(
+                target=_consume_responses, args=(rendezvous, response_queue)
+            )
+            thread.start()
+
+            response = response_queue.get(timeout=test_constants.SHORT_TIMEOUT)
+            self.assertEqual(
+                health_pb2.HealthCheckResponse.SERVICE_UNKNOWN, response.status
+            )
+
+            for _ in range(3):
+                self._servicer.set(
+                    _WATCH_SERVICE, health_pb2.HealthCheckResponse.SERVING
+                )
+            response = response_queue.get(timeout=test_constants.SHORT_TIMEOUT)
+            self.assertEqual(
+                health_pb2.HealthCheckResponse.SERVING, response.status
+            )
+            with self.assertRaises(queue.Empty):
+                response_queue.get(timeout=test_constants.SHORT_TIMEOUT)
+
+            rendezvous.cancel()
+            thread.join()
+            self.assertTrue(response_queue.empty())
+
         @unittest.skip("https://github.com/grpc/grpc/issues/18127")
         def test_cancelled_watch_removed_from_watch_list(self):
             request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
@@ -225,11 +254,12 @@ class BaseWatchTests:
             timeout = time.time() + test_constants.TIME_ALLOWANCE
             while (
                 time.time() < timeout
-                and self._servicer._send_response_callbacks[_WATCH_SERVICE]
+                and _WATCH_SERVICE in self._servicer._broadcasters
             ):
                 time.sleep(1)
-            self.assertFalse(
-                self._servicer._send_response_callbacks[_WATCH_SERVICE],
+            self.assertNotIn(
+                _WATCH_SERVICE,
+                self._servicer._broadcasters,
                 "watch set should be empty",
             )
             self.assertTrue(response_queue.empty())
@@ -28,9 +28,13 @@ from grpc_observability._open_telemetry_observability import (
     GRPC_OTHER_LABEL_VALUE,
 )
 from grpc_observability._open_telemetry_observability import GRPC_METHOD_LABEL
+from grpc_observability._open_telemetry_observability import (
+    GRPC_RESPONSE_CACHE_RESULT_LABEL,
+)
 from grpc_observability._open_telemetry_observability import GRPC_TARGET_LABEL
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import AggregationTemporality
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.metrics.export import MetricExportResult
 from opentelemetry.sdk.metrics.export import MetricExporter
 from opentelemetry.sdk.metrics.export import MetricsData
@@ -41,6 +45,8 @@ from tests.observability import _test_server
 logger = logging.getLogger(__name__)
 
 STREAM_LENGTH = 5
+AGGREGATED_CALL_COUNT = 10
+SAMPLED_METHOD_NAME = "test/UnaryUnary"
 OTEL_EXPORT_INTERVAL_S = 0.5
 
 
@@ -360,6 +366,178 @@ class OpenTelemetryObservabilityTest(unittest.TestCase):
         self._validate_metrics_exist(self.all_metrics)
         self._validate_all_metrics_names(self.all_metrics.keys())
 
+    def testRecordAllAggregatedMeasurements(self):
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        with grpc_observability.OpenTelemetryPlugin(meter_provider=provider):
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(AGGREGATED_CALL_COUNT):
+                _test_server.unary_unary_call(port=port)
+
+        data_points = self._collect_data_points(reader)
+        # Calls sharing labels are aggregated before reaching Python, yet
+        # every one of them must be counted.
+        self.assertEqual(
+            AGGREGATED_CALL_COUNT,
+            sum(
+                point.value
+                for point in data_points[
+                    _open_telemetry_measures.CLIENT_ATTEMPT_STARTED.name
+                ]
+            ),
+        )
+        self.assertEqual(
+            AGGREGATED_CALL_COUNT,
+            sum(
+                point.count
+                for point in data_points[
+                    _open_telemetry_measures.CLIENT_ATTEMPT_DURATION.name
+                ]
+            ),
+        )
+
+    def testRecordResponseCacheLookups(self):
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        cache = grpc.experimental.ResponseCache(("/" + SAMPLED_METHOD_NAME,))
+        with grpc_observability.OpenTelemetryPlugin(
+            meter_provider=provider,
+            generic_method_attribute_filter=lambda _method: True,
+        ):
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(AGGREGATED_CALL_COUNT):
+                _test_server.intercepted_unary_unary_call(
+                    port, cache.interceptor()
+                )
+
+        data_points = self._collect_data_points(reader)
+        lookups = {
+            (
+                point.attributes[GRPC_METHOD_LABEL],
+                point.attributes[GRPC_RESPONSE_CACHE_RESULT_LABEL],
+            ): point.value
+            for point in data_points[
+                _open_telemetry_measures.CLIENT_RESPONSE_CACHE_LOOKUPS.name
+            ]
+        }
+        self.assertEqual(
+            {
+                (SAMPLED_METHOD_NAME, "miss"): 1,
+                (SAMPLED_METHOD_NAME, "hit"): AGGREGATED_CALL_COUNT - 1,
+            },
+            lookups,
+        )
+
+    def testLabelCacheStats(self):
+        plugin = grpc_observability.OpenTelemetryPlugin(
+            meter_provider=self._provider
+        )
+        with plugin:
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(AGGREGATED_CALL_COUNT):
+                _test_server.unary_unary_call(port=port)
+
+        self._validate_metrics_exist(self.all_metrics)
+        self._validate_all_metrics_names(self.all_metrics.keys())
+        stats = plugin.label_cache_stats()
+        self.assertGreater(stats["hits"], 0)
+        self.assertGreater(stats["size"], 0)
+        self.assertEqual(0, stats["evictions"])
+
+    def testDisabledLabelCache(self):
+        plugin = grpc_observability.OpenTelemetryPlugin(
+            meter_provider=self._provider, label_cache_size=0
+        )
+        with plugin:
+            server, port = _test_server.start_server()
+            self._server = server
+            _test_server.unary_unary_call(port=port)
+
+        self._validate_metrics_exist(self.all_metrics)
+        self._validate_all_metrics_names(self.all_metrics.keys())
+        stats = plugin.label_cache_stats()
+        self.assertEqual(0, stats["hits"])
+        self.assertEqual(0, stats["size"])
+
+    def testZeroSamplingRate(self):
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        with grpc_observability.OpenTelemetryPlugin(
+            meter_provider=provider, sampling_rate=0.0
+        ):
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(AGGREGATED_CALL_COUNT):
+                _test_server.unary_unary_call(port=port)
+
+        data_points = self._collect_data_points(reader)
+        for base_metric in _open_telemetry_measures.base_metrics():
+            self.assertFalse(data_points[base_metric.name])
+
+    def testMethodSamplingRate(self):
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        with grpc_observability.OpenTelemetryPlugin(
+            meter_provider=provider,
+            sampling_rate=0.0,
+            method_sampling_rates={SAMPLED_METHOD_NAME: 0.5},
+        ):
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(AGGREGATED_CALL_COUNT):
+                _test_server.unary_unary_call(port=port)
+
+        data_points = self._collect_data_points(reader)
+        # Every sampled call counts twice, so the started counter stays even.
+        started = sum(
+            point.value
+            for point in data_points[
+                _open_telemetry_measures.CLIENT_ATTEMPT_STARTED.name
+            ]
+        )
+        self.assertEqual(0, started % 2)
+
+    def testTailLatencyThreshold(self):
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        with grpc_observability.OpenTelemetryPlugin(
+            meter_provider=provider, tail_latency_threshold=3600.0
+        ):
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(AGGREGATED_CALL_COUNT):
+                _test_server.unary_unary_call(port=port)
+
+        data_points = self._collect_data_points(reader)
+        # Started calls are counted, but fast successful calls do not record
+        # their durations.
+        self.assertEqual(
+            AGGREGATED_CALL_COUNT,
+            sum(
+                point.value
+                for point in data_points[
+                    _open_telemetry_measures.CLIENT_ATTEMPT_STARTED.name
+                ]
+            ),
+        )
+        self.assertFalse(
+            data_points[_open_telemetry_measures.CLIENT_ATTEMPT_DURATION.name]
+        )
+        self.assertFalse(
+            data_points[_open_telemetry_measures.SERVER_RPC_DURATION.name]
+        )
+
+    def testInvalidSamplingRate(self):
+        with self.assertRaises(ValueError):
+            grpc_observability.OpenTelemetryPlugin(sampling_rate=1.5)
+        with self.assertRaises(ValueError):
+            grpc_observability.OpenTelemetryPlugin(
+                method_sampling_rates={SAMPLED_METHOD_NAME: -1.0}
+            )
+
     def testTargetAttributeFilter(self):
         main_server, main_port = _test_server.start_server()
         backup_server, backup_port = _test_server.start_server()
@@ -495,6 +673,19 @@ class OpenTelemetryObservabilityTest(unittest.TestCase):
         else:
             self.fail(message() + " after " + str(timeout))
 
+    def _collect_data_points(
+        self, reader: InMemoryMetricReader
+    ) -> Dict[str, List[Any]]:
+        data_points = defaultdict(list)
+        metrics_data = reader.get_metrics_data()
+        if metrics_data is None:
+            return data_points
+        for resource_metric in metrics_data.resource_metrics:
+            for scope_metric in resource_metric.scope_metrics:
+                for metric in scope_metric.metrics:
+                    data_points[metric.name].extend(metric.data.data_points)
+        return data_points
+
     def _validate_metrics_exist(self, all_metrics: Dict[str, Any]) -> None:
         # Sleep here to make sure we have at least one export from OTel MetricExporter.
         self.assert_eventually(
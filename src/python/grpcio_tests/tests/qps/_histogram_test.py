@@ -0,0 +1,143 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the histogram recording the latencies of benchmarks."""
+
+import logging
+import math
+import threading
+import unittest
+
+from tests.qps import histogram
+
+_RESOLUTION = 0.01
+_MAX_POSSIBLE = 60e9
+_THREAD_COUNT = 4
+_SAMPLES_PER_THREAD = 1000
+
+
+def _expected_bucket(val):
+    multiplier = 1.0 + _RESOLUTION
+    return int(math.log(min(val, _MAX_POSSIBLE)) / math.log(multiplier))
+
+
+def _samples(thread_index):
+    return [
+        (thread_index + 1) * 1000 + index
+        for index in range(_SAMPLES_PER_THREAD)
+    ]
+
+
+class HistogramTest(unittest.TestCase):
+    def setUp(self):
+        self._histogram = histogram.Histogram(_RESOLUTION, _MAX_POSSIBLE)
+
+    def _add_from_threads(self, target_histogram):
+        threads = [
+            threading.Thread(
+                target=lambda samples: [
+                    target_histogram.add(val) for val in samples
+                ],
+                args=(_samples(index),),
+            )
+            for index in range(_THREAD_COUNT)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def testEmpty(self):
+        data = self._histogram.get_data()
+        self.assertEqual(0, data.count)
+        self.assertEqual(_MAX_POSSIBLE, data.min_seen)
+        self.assertEqual(0, data.max_seen)
+        self.assertEqual(_expected_bucket(_MAX_POSSIBLE) + 1, len(data.bucket))
+        self.assertEqual(0, sum(data.bucket))
+
+    def testBucketBoundaries(self):
+        multiplier = 1.0 + _RESOLUTION
+        samples = [1, _MAX_POSSIBLE, 2 * _MAX_POSSIBLE]
+        for exponent in range(1, 2500, 7):
+            boundary = multiplier**exponent
+            samples.extend(
+                (
+                    boundary,
+                    math.nextafter(boundary, 0),
+                    math.nextafter(boundary, math.inf),
+                )
+            )
+        for val in samples:
+            self._histogram.add(val)
+        expected_buckets = [0] * (_expected_bucket(_MAX_POSSIBLE) + 1)
+        for val in samples:
+            expected_buckets[_expected_bucket(val)] += 1
+        self.assertEqual(
+            expected_buckets, list(self._histogram.get_data().bucket)
+        )
+
+    def testMergesSamplesAcrossThreads(self):
+        self._add_from_threads(self._histogram)
+        samples = [
+            val for index in range(_THREAD_COUNT) for val in _samples(index)
+        ]
+        data = self._histogram.get_data()
+        self.assertEqual(len(samples), data.count)
+        self.assertEqual(sum(samples), data.sum)
+        self.assertEqual(sum(val * val for val in samples), data.sum_of_squares)
+        self.assertEqual(min(samples), data.min_seen)
+        self.assertEqual(max(samples), data.max_seen)
+        expected_buckets = [0] * len(data.bucket)
+        for val in samples:
+            expected_buckets[_expected_bucket(val)] += 1
+        self.assertEqual(expected_buckets, list(data.bucket))
+
+    def testMergesData(self):
+        other = histogram.Histogram(_RESOLUTION, _MAX_POSSIBLE)
+        self._add_from_threads(other)
+        self._histogram.add(7)
+        self._histogram.merge(other.get_data())
+        data = self._histogram.get_data()
+        other_data = other.get_data()
+        self.assertEqual(other_data.count + 1, data.count)
+        self.assertEqual(other_data.sum + 7, data.sum)
+        self.assertEqual(7, data.min_seen)
+        self.assertEqual(other_data.max_seen, data.max_seen)
+        self.assertEqual(
+            sum(other_data.bucket) + 1,
+            sum(data.bucket),
+        )
+        self.assertEqual(
+            other_data.bucket[_expected_bucket(7)] + 1,
+            data.bucket[_expected_bucket(7)],
+        )
+
+    def testReset(self):
+        self._add_from_threads(self._histogram)
+        self._histogram.add(5)
+        self._histogram.reset()
+        self.assertEqual(0, self._histogram.get_data().count)
+        # A thread that recorded before the reset records afresh after it.
+        self._histogram.add(3)
+        data = self._histogram.get_data()
+        self.assertEqual(1, data.count)
+        self.assertEqual(3, data.sum)
+        self.assertEqual(3, data.min_seen)
+        self.assertEqual(3, data.max_seen)
+        self.assertEqual(1, data.bucket[_expected_bucket(3)])
+        self.assertEqual(1, sum(data.bucket))
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
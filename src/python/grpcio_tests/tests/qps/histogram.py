@@ -12,69 +12,105 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import math
 import threading
 
 from src.proto.grpc.testing import stats_pb2
 
 
+class _Recorder(object):
+    """Accumulates the samples added by a single thread.
+
+    Only its owning thread writes to a recorder, so recording takes no lock.
+    """
+
+    def __init__(self, bucket_count, max_possible):
+        self.sum = 0
+        self.sum_of_squares = 0
+        self.count = 0
+        self.min = max_possible
+        self.max = 0
+        self.buckets = array.array("Q", bytes(8 * bucket_count))
+
+
 class Histogram(object):
     """Histogram class used for recording performance testing data.
 
-    This class is thread safe.
+    This class is thread safe. Each recording thread accumulates into its own
+    preallocated recorder, and the recorders are only combined when the data
+    is read.
     """
 
     def __init__(self, resolution, max_possible):
         self._lock = threading.Lock()
         self._resolution = resolution
         self._max_possible = max_possible
-        self._sum = 0
-        self._sum_of_squares = 0
         self.multiplier = 1.0 + self._resolution
-        self._count = 0
-        self._min = self._max_possible
-        self._max = 0
-        self._buckets = [0] * (self._bucket_for(self._max_possible) + 1)
+        self._log_multiplier = math.log(self.multiplier)
+        self._bucket_count = self._bucket_for(self._max_possible) + 1
+        self._local = threading.local()
+        self._recorders = []
+
+    def _new_recorder(self):
+        recorder = _Recorder(self._bucket_count, self._max_possible)
+        with self._lock:
+            self._local.recorder = recorder
+            self._recorders.append(recorder)
+        return recorder
 
     def reset(self):
         with self._lock:
-            self._sum = 0
-            self._sum_of_squares = 0
-            self._count = 0
-            self._min = self._max_possible
-            self._max = 0
-            self._buckets = [0] * (self._bucket_for(self._max_possible) + 1)
+            # Threads register fresh recorders on their next add.
+            self._local = threading.local()
+            self._recorders = []
 
     def add(self, val):
-        with self._lock:
-            self._sum += val
-            self._sum_of_squares += val * val
-            self._count += 1
-            self._min = min(self._min, val)
-            self._max = max(self._max, val)
-            self._buckets[self._bucket_for(val)] += 1
+        recorder = getattr(self._local, "recorder", None)
+        if recorder is None:
+            recorder = self._new_recorder()
+        recorder.sum += val
+        recorder.sum_of_squares += val * val
+        recorder.count += 1
+        if val < recorder.min:
+            recorder.min = val
+        if val > recorder.max:
+            recorder.max = val
+        recorder.buckets[self._bucket_for(val)] += 1
 
     def get_data(self):
         with self._lock:
-            data = stats_pb2.HistogramData()
-            data.bucket.extend(self._buckets)
-            data.min_seen = self._min
-            data.max_seen = self._max
-            data.sum = self._sum
-            data.sum_of_squares = self._sum_of_squares
-            data.count = self._count
-            return data
+            recorders = tuple(self._recorders)
+        data = stats_pb2.HistogramData()
+        if recorders:
+            data.bucket.extend(
+                map(sum, zip(*(recorder.buckets for recorder in recorders)))
+            )
+        else:
+            data.bucket.extend([0] * self._bucket_count)
+        data.min_seen = min(
+            (recorder.min for recorder in recorders),
+            default=self._max_possible,
+        )
+        data.max_seen = max((recorder.max for recorder in recorders), default=0)
+        data.sum = sum(recorder.sum for recorder in recorders)
+        data.sum_of_squares = sum(
+            recorder.sum_of_squares for recorder in recorders
+        )
+        data.count = sum(recorder.count for recorder in recorders)
+        return data
 
     def merge(self, another_data):
+        recorder = _Recorder(self._bucket_count, self._max_possible)
+        recorder.buckets = array.array("Q", another_data.bucket)
+        recorder.min = another_data.min_seen
+        recorder.max = another_data.max_seen
+        recorder.sum = another_data.sum
+        recorder.sum_of_squares = another_data.sum_of_squares
+        recorder.count = another_data.count
         with self._lock:
-            for i in range(len(self._buckets)):
-                self._buckets[i] += another_data.bucket[i]
-            self._min = min(self._min, another_data.min_seen)
-            self._max = max(self._max, another_data.max_seen)
-            self._sum += another_data.sum
-            self._sum_of_squares += another_data.sum_of_squares
-            self._count += another_data.count
+            self._recorders.append(recorder)
 
     def _bucket_for(self, val):
         val = min(val, self._max_possible)
-        return int(math.log(val, self.multiplier))
+        return int(math.log(val) / self._log_multiplier)
@@ -221,6 +221,61 @@ class ReflectionServicerTest(unittest.TestCase):
         )
         self.assertEqual(expected_responses, responses)
 
+    def testRepeatedFileRequests(self):
+        requests = (
+            reflection_pb2.ServerReflectionRequest(
+                file_containing_symbol=_EMPTY_EXTENSIONS_SYMBOL_NAME
+            ),
+            reflection_pb2.ServerReflectionRequest(
+                file_by_filename=_EMPTY_PROTO_FILE_NAME
+            ),
+        ) * 3
+        responses = tuple(self._stub.ServerReflectionInfo(iter(requests)))
+        self.assertEqual(len(requests), len(responses))
+        self.assertEqual(
+            (
+                _file_descriptor_to_proto(empty2_extensions_pb2.DESCRIPTOR),
+                _file_descriptor_to_proto(empty2_pb2.DESCRIPTOR),
+            ),
+            tuple(responses[0].file_descriptor_response.file_descriptor_proto),
+        )
+        self.assertEqual(responses[:2], responses[2:4])
+        self.assertEqual(responses[:2], responses[4:])
+
+    def testFileAddedToPoolAfterLookup(self):
+        pool = descriptor_pool.DescriptorPool()
+        server = test_common.test_server()
+        reflection.enable_server_reflection(_SERVICE_NAMES, server, pool=pool)
+        port = server.add_insecure_port("[::]:0")
+        server.start()
+        try:
+            with grpc.insecure_channel("localhost:%d" % port) as channel:
+                stub = reflection_pb2_grpc.ServerReflectionStub(channel)
+                request = reflection_pb2.ServerReflectionRequest(
+                    file_by_filename="late.proto"
+                )
+                (response,) = stub.ServerReflectionInfo(iter((request,)))
+                self.assertTrue(response.HasField("error_response"))
+
+                pool.AddSerializedFile(
+                    descriptor_pb2.FileDescriptorProto(
+                        name="late.proto", package="late"
+                    ).SerializeToString()
+                )
+                (response,) = stub.ServerReflectionInfo(iter((request,)))
+                self.assertEqual(
+                    (
+                        _file_descriptor_to_proto(
+                            pool.FindFileByName("late.proto")
+                        ),
+                    ),
+                    tuple(
+                        response.file_descriptor_response.file_descriptor_proto
+                    ),
+                )
+        finally:
+            server.stop(None)
+
     def testReflectionServiceName(self):
         self.assertEqual(
             reflection.SERVICE_NAME, "grpc.reflection.v1alpha.ServerReflection"
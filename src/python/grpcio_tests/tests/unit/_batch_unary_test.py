@@ -0,0 +1,118 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests issuing batches of unary-unary RPCs."""
+
+from concurrent import futures
+import logging
+import unittest
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_REQUEST_COUNT = test_constants.RPC_CONCURRENCY
+_FAILING_REQUEST = b"fail"
+_UNSERIALIZABLE_REQUEST = b"unserializable"
+
+_SERVICE_NAME = "test"
+_ECHO = "Echo"
+
+
+def _echo(request, servicer_context):
+    if request == _FAILING_REQUEST:
+        servicer_context.abort(grpc.StatusCode.INVALID_ARGUMENT, "failed")
+    return request
+
+
+def _serialize_request(request):
+    if request == _UNSERIALIZABLE_REQUEST:
+        raise ValueError("unserializable request")
+    return request
+
+
+class _PassThroughInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def __init__(self):
+        self.intercepted_count = 0
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.intercepted_count += 1
+        return continuation(client_call_details, request)
+
+
+class BatchUnaryTest(unittest.TestCase):
+    def setUp(self):
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, {_ECHO: grpc.unary_unary_rpc_method_handler(_echo)}
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def _multi_callable(self, channel, request_serializer=None):
+        return channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _ECHO),
+            request_serializer=request_serializer,
+            _registered_method=True,
+        )
+
+    def testResponsesInRequestOrder(self):
+        requests = [b"%d" % index for index in range(_REQUEST_COUNT)]
+        responses = self._multi_callable(self._channel).batch(
+            requests, timeout=test_constants.LONG_TIMEOUT
+        )
+        self.assertEqual(requests, responses)
+
+    def testEmptyBatch(self):
+        self.assertEqual([], self._multi_callable(self._channel).batch(()))
+
+    def testFailuresAreReturnedInPlace(self):
+        responses = self._multi_callable(
+            self._channel, request_serializer=_serialize_request
+        ).batch(
+            (b"first", _FAILING_REQUEST, _UNSERIALIZABLE_REQUEST, b"last"),
+            timeout=test_constants.LONG_TIMEOUT,
+        )
+        self.assertEqual(b"first", responses[0])
+        self.assertIsInstance(responses[1], grpc.RpcError)
+        self.assertIs(grpc.StatusCode.INVALID_ARGUMENT, responses[1].code())
+        self.assertEqual("failed", responses[1].details())
+        self.assertIsInstance(responses[2], grpc.RpcError)
+        self.assertIs(grpc.StatusCode.INTERNAL, responses[2].code())
+        self.assertEqual(b"last", responses[3])
+
+    def testInterceptedBatch(self):
+        interceptor = _PassThroughInterceptor()
+        channel = grpc.intercept_channel(self._channel, interceptor)
+        requests = [b"%d" % index for index in range(_REQUEST_COUNT)]
+        responses = self._multi_callable(channel).batch(
+            requests, timeout=test_constants.LONG_TIMEOUT
+        )
+        self.assertEqual(requests, responses)
+        self.assertEqual(_REQUEST_COUNT, interceptor.intercepted_count)
+
+    def testBatchOnClosedChannel(self):
+        multi_callable = self._multi_callable(self._channel)
+        self._channel.close()
+        with self.assertRaises(ValueError):
+            multi_callable.batch((b"request",))
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -398,6 +398,109 @@ class CompressionTest(unittest.TestCase):
             _REQUEST,
         )
 
+    def testServerCompressionPolicy(self):
+        policy = grpc.experimental.CompressionPolicy(
+            minimum_size=len(_REQUEST) + 1,
+            method_minimum_sizes={
+                grpc._common.fully_qualified_method(
+                    _SERVICE_NAME, _UNARY_STREAM
+                ): 0,
+            },
+        )
+        server_kwargs = {
+            "compression": grpc.Compression.Deflate,
+            "options": (
+                (grpc.experimental.ServerOptions.CompressionPolicy, policy),
+            ),
+        }
+        _, unary_received_ratio = _get_compression_ratios(
+            _unary_unary_client,
+            {},
+            {},
+            {},
+            get_method_handlers(None),
+            {},
+            {},
+            server_kwargs,
+            get_method_handlers(None),
+            _REQUEST,
+        )
+        self.assertNotCompressed(unary_received_ratio)
+        _, stream_received_ratio = _get_compression_ratios(
+            _unary_stream_client,
+            {},
+            {},
+            {},
+            get_method_handlers(None),
+            {},
+            {},
+            server_kwargs,
+            get_method_handlers(None),
+            _REQUEST,
+        )
+        self.assertCompressed(stream_received_ratio)
+        self.assertEqual(
+            (
+                _STREAM_LENGTH,
+                _STREAM_LENGTH * len(_REQUEST),
+                1,
+                len(_REQUEST),
+            ),
+            tuple(policy.stats()),
+        )
+
+    def testChannelCompressionPolicy(self):
+        policy = grpc.experimental.CompressionPolicy(
+            minimum_size=len(_REQUEST) + 1
+        )
+        channel_kwargs = {
+            "compression": grpc.Compression.Deflate,
+            "options": (
+                (grpc.experimental.ChannelOptions.CompressionPolicy, policy),
+            ),
+        }
+        sent_ratio, _ = _get_compression_ratios(
+            _stream_unary_client,
+            {},
+            {},
+            {},
+            get_method_handlers(None),
+            channel_kwargs,
+            {},
+            {},
+            get_method_handlers(None),
+            _REQUEST,
+        )
+        self.assertNotCompressed(sent_ratio)
+        self.assertEqual(
+            (0, 0, _STREAM_LENGTH, _STREAM_LENGTH * len(_REQUEST)),
+            tuple(policy.stats()),
+        )
+
+    def testCompressionPolicyWithoutAlgorithm(self):
+        policy = grpc.experimental.CompressionPolicy()
+        channel_kwargs = {
+            "options": (
+                (grpc.experimental.ChannelOptions.CompressionPolicy, policy),
+            ),
+        }
+        _get_compression_ratios(
+            _stream_unary_client,
+            {},
+            {},
+            {},
+            get_method_handlers(None),
+            channel_kwargs,
+            {},
+            {},
+            get_method_handlers(None),
+            _REQUEST,
+        )
+        self.assertEqual(
+            (0, 0, _STREAM_LENGTH, _STREAM_LENGTH * len(_REQUEST)),
+            tuple(policy.stats()),
+        )
+
 
 def _get_compression_str(name, value):
     return "{}{}".format(name, _COMPRESSION_NAMES[value])
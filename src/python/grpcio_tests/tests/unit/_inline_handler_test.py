@@ -0,0 +1,168 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests unary-unary handlers run on the server's polling thread."""
+
+from concurrent import futures
+import logging
+import threading
+import unittest
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b"\x00\x00\x00"
+_RESPONSE = b"\x00\x00\x01"
+
+_POOL_THREAD_NAME_PREFIX = "handler_pool"
+
+_SERVICE_NAME = "test"
+_INLINE = "Inline"
+_INLINE_ATTRIBUTE = "InlineAttribute"
+_INLINE_ABORT = "InlineAbort"
+_INLINE_RAISE = "InlineRaise"
+_POOLED = "Pooled"
+
+
+class _Servicer(object):
+    def __init__(self):
+        self.thread_names = []
+
+    def handle(self, request, servicer_context):
+        self.thread_names.append(threading.current_thread().name)
+        return request + _RESPONSE
+
+    def handle_marked(self, request, servicer_context):
+        return self.handle(request, servicer_context)
+
+    # Marked the way a servicer registered through generated code would be.
+    handle_marked.experimental_inline = True
+
+    def handle_abort(self, request, servicer_context):
+        servicer_context.abort(grpc.StatusCode.NOT_FOUND, "missing")
+
+    def handle_raise(self, request, servicer_context):
+        raise ValueError("inline failure")
+
+
+def _method_handlers(servicer):
+    return {
+        _INLINE: grpc.experimental.inline_method_handler(
+            grpc.unary_unary_rpc_method_handler(servicer.handle)
+        ),
+        _INLINE_ATTRIBUTE: grpc.unary_unary_rpc_method_handler(
+            servicer.handle_marked
+        ),
+        _INLINE_ABORT: grpc.experimental.inline_method_handler(
+            grpc.unary_unary_rpc_method_handler(servicer.handle_abort)
+        ),
+        _INLINE_RAISE: grpc.experimental.inline_method_handler(
+            grpc.unary_unary_rpc_method_handler(servicer.handle_raise)
+        ),
+        _POOLED: grpc.unary_unary_rpc_method_handler(servicer.handle),
+    }
+
+
+class InlineHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self._servicer = _Servicer()
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=_POOL_THREAD_NAME_PREFIX
+            ),
+            options=(("grpc.so_reuseport", 0),),
+            maximum_concurrent_rpcs=1,
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _method_handlers(self._servicer)
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _multi_callable(self, method):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testInlineHandlerBypassesThreadPool(self):
+        self.assertEqual(
+            _REQUEST + _RESPONSE, self._multi_callable(_INLINE)(_REQUEST)
+        )
+        self.assertEqual(
+            _REQUEST + _RESPONSE, self._multi_callable(_POOLED)(_REQUEST)
+        )
+        inline_thread_name, pooled_thread_name = self._servicer.thread_names
+        self.assertFalse(
+            inline_thread_name.startswith(_POOL_THREAD_NAME_PREFIX)
+        )
+        self.assertTrue(pooled_thread_name.startswith(_POOL_THREAD_NAME_PREFIX))
+
+    def testInlineAttribute(self):
+        self.assertEqual(
+            _REQUEST + _RESPONSE,
+            self._multi_callable(_INLINE_ATTRIBUTE)(_REQUEST),
+        )
+        self.assertFalse(
+            self._servicer.thread_names[0].startswith(_POOL_THREAD_NAME_PREFIX)
+        )
+
+    def testInlineRpcsDoNotHoldConcurrencySlots(self):
+        multi_callable = self._multi_callable(_INLINE)
+        with futures.ThreadPoolExecutor(
+            max_workers=test_constants.THREAD_CONCURRENCY
+        ) as executor:
+            response_futures = [
+                executor.submit(multi_callable, _REQUEST)
+                for _ in range(test_constants.RPC_CONCURRENCY)
+            ]
+            for response_future in response_futures:
+                self.assertEqual(_REQUEST + _RESPONSE, response_future.result())
+
+    def testInlineAbort(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._multi_callable(_INLINE_ABORT)(_REQUEST)
+        self.assertIs(
+            grpc.StatusCode.NOT_FOUND, exception_context.exception.code()
+        )
+        self.assertEqual("missing", exception_context.exception.details())
+
+    def testInlineException(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._multi_callable(_INLINE_RAISE)(_REQUEST)
+        self.assertIs(
+            grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+        )
+        # The polling thread keeps serving after the failure.
+        self.assertEqual(
+            _REQUEST + _RESPONSE, self._multi_callable(_INLINE)(_REQUEST)
+        )
+
+    def testStreamingHandlerIsRejected(self):
+        with self.assertRaises(ValueError):
+            grpc.experimental.inline_method_handler(
+                grpc.stream_stream_rpc_method_handler(
+                    lambda request_iterator, context: request_iterator
+                )
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
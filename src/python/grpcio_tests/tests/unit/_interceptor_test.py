@@ -389,6 +389,26 @@ class _LoggingInterceptor(
         return continuation(client_call_details, request_iterator)
 
 
+class _MetadataLoggingInterceptor(grpc.experimental.ClientMetadataInterceptor):
+    def __init__(self, tag, record, header=None):
+        self.tag = tag
+        self.record = record
+        self.header = header
+        self.observed = threading.Event()
+
+    def intercept_metadata(self, method, metadata):
+        self.record.append(self.tag + ":intercept_metadata")
+        if self.header is None:
+            return metadata
+        return tuple(metadata or ()) + (self.header,)
+
+    def observe_call(self, method, call):
+        self.record.append(
+            "{}:observe_call:{}".format(self.tag, call.code().name)
+        )
+        self.observed.set()
+
+
 class _DefectiveClientInterceptor(grpc.UnaryUnaryClientInterceptor):
     def intercept_unary_unary(
         self, ignored_continuation, ignored_client_call_details, ignored_request
@@ -396,6 +416,39 @@ class _DefectiveClientInterceptor(grpc.UnaryUnaryClientInterceptor):
         raise test_control.Defect()
 
 
+class _UnavailableError(grpc.RpcError, grpc.Call):
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return "Short-circuited"
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def add_callback(self, callback):
+        return False
+
+
+class _ShortCircuitingInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def intercept_unary_unary(
+        self, ignored_continuation, ignored_client_call_details, ignored_request
+    ):
+        return _UnavailableError()
+
+
 def _wrap_request_iterator_stream_interceptor(wrapper):
     def intercept_call(
         client_call_details,
@@ -457,6 +510,20 @@ def _filter_server_interceptor(condition, interceptor):
     return _GenericServerInterceptor(intercept_service)
 
 
+def _serve_with_interceptors(pool, handler, interceptors):
+    server = grpc.server(
+        pool,
+        options=(("grpc.so_reuseport", 0),),
+        interceptors=interceptors,
+    )
+    port = server.add_insecure_port("[::]:0")
+    server.add_registered_method_handlers(
+        _SERVICE_NAME, get_method_handlers(handler)
+    )
+    server.start()
+    return server, port
+
+
 class InterceptorTest(unittest.TestCase):
     def setUp(self):
         self._control = test_control.PauseFailControl()
@@ -565,6 +632,118 @@ class InterceptorTest(unittest.TestCase):
         self.assertIsNotNone(call_future.exception())
         self.assertEqual(call_future.code(), grpc.StatusCode.INTERNAL)
 
+    def testClientMetadataInterceptors(self):
+        request = b"\x07\x08"
+
+        channel = grpc.intercept_channel(
+            self._channel,
+            _MetadataLoggingInterceptor("m1", self._record),
+            _MetadataLoggingInterceptor(
+                "m2", self._record, header=("secret", "42")
+            ),
+        )
+
+        self._record[:] = []
+
+        multi_callable = _unary_unary_multi_callable(channel)
+        response, call = multi_callable.with_call(
+            request,
+            metadata=(
+                ("test", "InterceptedUnaryRequestBlockingUnaryResponse"),
+            ),
+        )
+
+        self.assertEqual(request, response)
+        self.assertSequenceEqual(
+            self._record,
+            [
+                "m1:intercept_metadata",
+                "m2:intercept_metadata",
+                "s1:intercept_service",
+                "s3:intercept_service",
+                "s2:intercept_service[context-var-value]",
+                "handler:handle_unary_unary[context-var-value]",
+                "m2:observe_call:OK",
+                "m1:observe_call:OK",
+            ],
+        )
+
+    def testClientMetadataInterceptorObservesStreamCompletion(self):
+        requests = tuple(
+            b"\x07\x08" for _ in range(test_constants.STREAM_LENGTH)
+        )
+        request_iterator = iter(requests)
+
+        interceptor = _MetadataLoggingInterceptor("m1", self._record)
+        channel = grpc.intercept_channel(self._channel, interceptor)
+
+        self._record[:] = []
+
+        multi_callable = _stream_stream_multi_callable(channel)
+        response_iterator = multi_callable(
+            request_iterator,
+            metadata=(("test", "InterceptedStreamRequestStreamResponse"),),
+        )
+        tuple(response_iterator)
+
+        self.assertTrue(interceptor.observed.wait(test_constants.SHORT_TIMEOUT))
+        self.assertEqual("m1:intercept_metadata", self._record[0])
+        self.assertEqual("m1:observe_call:OK", self._record[-1])
+
+    def testClientMetadataInterceptorsWithGeneralInterceptors(self):
+        request = b"\x07\x08"
+
+        channel = grpc.intercept_channel(
+            self._channel,
+            _LoggingInterceptor("c1", self._record),
+            _MetadataLoggingInterceptor(
+                "m1", self._record, header=("secret", "42")
+            ),
+        )
+        channel = grpc.intercept_channel(
+            channel, _MetadataLoggingInterceptor("m0", self._record)
+        )
+
+        self._record[:] = []
+
+        multi_callable = _unary_unary_multi_callable(channel)
+        call_future = multi_callable.future(
+            request,
+            metadata=(("test", "InterceptedUnaryRequestFutureUnaryResponse"),),
+        )
+        self.assertEqual(request, call_future.result())
+
+        self.assertSequenceEqual(
+            self._record[:7],
+            [
+                "m0:intercept_metadata",
+                "c1:intercept_unary_unary",
+                "m1:intercept_metadata",
+                "s1:intercept_service",
+                "s3:intercept_service",
+                "s2:intercept_service[context-var-value]",
+                "handler:handle_unary_unary[context-var-value]",
+            ],
+        )
+
+    def testClientMetadataInterceptorObservesOutcomesThatAreNotFutures(self):
+        channel = grpc.intercept_channel(
+            self._channel,
+            _MetadataLoggingInterceptor("m1", self._record),
+            _ShortCircuitingInterceptor(),
+        )
+
+        self._record[:] = []
+
+        multi_callable = _unary_unary_multi_callable(channel)
+        outcome = multi_callable.future(b"\x07\x08")
+
+        self.assertIsInstance(outcome, _UnavailableError)
+        self.assertSequenceEqual(
+            self._record,
+            ["m1:intercept_metadata", "m1:observe_call:UNAVAILABLE"],
+        )
+
     def testInterceptedHeaderManipulationWithServerSideVerification(self):
         request = b"\x07\x08"
 
@@ -988,6 +1167,78 @@ class InterceptorTest(unittest.TestCase):
             ],
         )
 
+    def testPerMethodServerInterceptorRunsOncePerMethod(self):
+        record = []
+        server, port = _serve_with_interceptors(
+            self._server_pool,
+            _Handler(self._control, record),
+            (
+                grpc.experimental.per_method_server_interceptor(
+                    _LoggingInterceptor("s1", record)
+                ),
+            ),
+        )
+        try:
+            with grpc.insecure_channel("localhost:%d" % port) as channel:
+                unary_unary = _unary_unary_multi_callable(channel)
+                unary_stream = _unary_stream_multi_callable(channel)
+                for _ in range(3):
+                    unary_unary(b"\x07\x08")
+                    list(unary_stream(b"\x07\x08"))
+        finally:
+            server.stop(None)
+
+        self.assertEqual(2, record.count("s1:intercept_service"))
+        self.assertEqual(3, record.count("handler:handle_unary_unary"))
+        self.assertEqual(3, record.count("handler:handle_unary_stream"))
+
+    def testPerMethodServerInterceptorCachesByMetadataKey(self):
+        record = []
+        server, port = _serve_with_interceptors(
+            self._server_pool,
+            _Handler(self._control, record),
+            (
+                grpc.experimental.per_method_server_interceptor(
+                    _LoggingInterceptor("s1", record),
+                    metadata_keys=("tenant",),
+                ),
+            ),
+        )
+        try:
+            with grpc.insecure_channel("localhost:%d" % port) as channel:
+                multi_callable = _unary_unary_multi_callable(channel)
+                for tenant in ("a", "b", "a", "b"):
+                    multi_callable(b"\x07\x08", metadata=(("tenant", tenant),))
+                multi_callable(b"\x07\x08")
+        finally:
+            server.stop(None)
+
+        self.assertEqual(3, record.count("s1:intercept_service"))
+        self.assertEqual(5, record.count("handler:handle_unary_unary"))
+
+    def testServerInterceptorsWithoutPerMethodMarkerRunPerRpc(self):
+        record = []
+        server, port = _serve_with_interceptors(
+            self._server_pool,
+            _Handler(self._control, record),
+            (
+                grpc.experimental.per_method_server_interceptor(
+                    _LoggingInterceptor("s1", record)
+                ),
+                _LoggingInterceptor("s2", record),
+            ),
+        )
+        try:
+            with grpc.insecure_channel("localhost:%d" % port) as channel:
+                multi_callable = _unary_unary_multi_callable(channel)
+                for _ in range(3):
+                    multi_callable(b"\x07\x08")
+        finally:
+            server.stop(None)
+
+        self.assertEqual(3, record.count("s1:intercept_service"))
+        self.assertEqual(3, record.count("s2:intercept_service"))
+
 
 if __name__ == "__main__":
     logging.basicConfig()
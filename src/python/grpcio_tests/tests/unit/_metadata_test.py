@@ -100,6 +100,20 @@ def validate_client_metadata(test, servicer_context):
             _EXPECTED_INVOCATION_METADATA, invocation_metadata
         )
     )
+    test.assertEqual(
+        "invocation-md-value", invocation_metadata.get("invocation-md-key")
+    )
+    test.assertEqual(
+        [b"\x00\x01"], invocation_metadata.get_all("invocation-md-key-bin")
+    )
+    test.assertIsNone(invocation_metadata.get("missing-md-key"))
+    metadatum = ("invocation-md-key", "invocation-md-value")
+    test.assertEqual(1, invocation_metadata.count(metadatum))
+    test.assertEqual(
+        metadatum, invocation_metadata[invocation_metadata.index(metadatum)]
+    )
+    with test.assertRaises(ValueError):
+        invocation_metadata.index(("missing-md-key", "missing-md-value"))
     user_agent = _user_agent(invocation_metadata)
     test.assertTrue(
         user_agent.startswith("primary-agent " + _channel._USER_AGENT)
@@ -0,0 +1,105 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the hooks of observability plugins called by channels."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import _observability
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+
+_UNARY_UNARY_METHOD = grpc._common.fully_qualified_method(
+    _SERVICE_NAME, _UNARY_UNARY
+)
+_UNARY_STREAM_METHOD = grpc._common.fully_qualified_method(
+    _SERVICE_NAME, _UNARY_STREAM
+)
+
+_REQUEST = b"\x07\x08"
+
+
+def _handle_unary_unary(request, unused_servicer_context):
+    return request
+
+
+def _handle_unary_stream(request, unused_servicer_context):
+    yield request
+    yield request
+
+
+class _UntracingPlugin(_observability.ObservabilityPlugin):
+    def __init__(self):
+        self.traced_methods = []
+        self.latencies = []
+
+    def create_client_call_tracer(self, method_name, target):
+        self.traced_methods.append(method_name)
+        return None
+
+    def save_trace_context(self, trace_id, span_id, is_sampled):
+        pass
+
+    def create_server_call_tracer_factory(self, xds=False):
+        return None
+
+    def record_rpc_latency(self, method, target, rpc_latency, status_code):
+        self.latencies.append(method)
+
+
+class ObservabilityTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    _handle_unary_unary
+                ),
+                _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                    _handle_unary_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._plugin = _UntracingPlugin()
+        self._plugin.set_stats(True)
+        _observability.observability_init(self._plugin)
+
+    def tearDown(self):
+        _observability.observability_deinit()
+        self._channel.close()
+        self._server.stop(None)
+
+    def testCallsWithoutTracerRecordNoLatency(self):
+        unary_unary = self._channel.unary_unary(_UNARY_UNARY_METHOD)
+        unary_unary(_REQUEST)
+        unary_unary.future(_REQUEST).result()
+        unary_unary.batch((_REQUEST, _REQUEST))
+        list(self._channel.unary_stream(_UNARY_STREAM_METHOD)(_REQUEST))
+
+        self.assertEqual(5, len(self._plugin.traced_methods))
+        self.assertEqual([], self._plugin.latencies)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
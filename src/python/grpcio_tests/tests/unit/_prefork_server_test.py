@@ -0,0 +1,144 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests servers serving RPCs from pre-forked worker processes."""
+
+from concurrent import futures
+import logging
+import os
+import signal
+import time
+import unittest
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b"\x00\x00\x00"
+_SLOW_HANDLER_DELAY_S = 0.5
+
+_PROCESSES = 2
+
+_SERVICE_NAME = "test"
+_GET_PID = "GetPid"
+_SLOW_GET_PID = "SlowGetPid"
+
+
+def _get_pid(request, servicer_context):
+    return str(os.getpid()).encode()
+
+
+def _slow_get_pid(request, servicer_context):
+    time.sleep(_SLOW_HANDLER_DELAY_S)
+    return _get_pid(request, servicer_context)
+
+
+def _wait_for(predicate):
+    deadline = time.monotonic() + test_constants.TIME_ALLOWANCE
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.1)
+    return True
+
+
+@unittest.skipIf(os.name == "nt", "Pre-forked servers require fork().")
+class PreforkServerTest(unittest.TestCase):
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=2),
+            processes=_PROCESSES,
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _GET_PID: grpc.unary_unary_rpc_method_handler(_get_pid),
+                _SLOW_GET_PID: grpc.unary_unary_rpc_method_handler(
+                    _slow_get_pid
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        # Channels are only created once the workers have been forked.
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def _get_worker_pid(self, method=_GET_PID):
+        return int(
+            self._channel.unary_unary(
+                grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+                _registered_method=True,
+            )(_REQUEST, wait_for_ready=True)
+        )
+
+    def testServesFromWorkers(self):
+        self.assertEqual(_PROCESSES, self._server.serving_worker_count())
+        self.assertNotEqual(os.getpid(), self._get_worker_pid())
+
+    def testRestartsDeadWorker(self):
+        pid = self._get_worker_pid()
+        os.kill(pid, signal.SIGKILL)
+        self.assertTrue(
+            _wait_for(
+                lambda: self._server.serving_worker_count() == _PROCESSES
+                and self._get_worker_pid() != pid
+            )
+        )
+
+    def testStopWithGrace(self):
+        response_future = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _SLOW_GET_PID),
+            _registered_method=True,
+        ).future(_REQUEST, wait_for_ready=True)
+        time.sleep(_SLOW_HANDLER_DELAY_S / 2)
+        shutdown_event = self._server.stop(test_constants.SHORT_TIMEOUT)
+        self.assertNotEqual(os.getpid(), int(response_future.result()))
+        self.assertTrue(shutdown_event.wait(test_constants.TIME_ALLOWANCE))
+        self.assertFalse(self._server.wait_for_termination(timeout=0))
+        self.assertEqual(0, self._server.serving_worker_count())
+
+    def testServesOnRequestedHost(self):
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=1),
+            processes=1,
+        )
+        server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {_GET_PID: grpc.unary_unary_rpc_method_handler(_get_pid)},
+        )
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        try:
+            with grpc.insecure_channel("127.0.0.1:%d" % port) as channel:
+                pid = channel.unary_unary(
+                    grpc._common.fully_qualified_method(
+                        _SERVICE_NAME, _GET_PID
+                    ),
+                    _registered_method=True,
+                )(_REQUEST, wait_for_ready=True)
+            self.assertNotEqual(os.getpid(), int(pid))
+        finally:
+            server.stop(None).wait()
+
+    def testInvalidProcesses(self):
+        with self.assertRaises(ValueError):
+            grpc.server(futures.ThreadPoolExecutor(max_workers=1), processes=0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
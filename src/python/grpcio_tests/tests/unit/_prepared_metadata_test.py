@@ -0,0 +1,146 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests sending grpc.PreparedMetadata with RPCs."""
+
+import logging
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+
+_REQUEST = b"\x00\x00\x00"
+
+_SERVICE_NAME = "test"
+_ECHO_METADATA = "EchoMetadata"
+
+_METADATA = (
+    ("tenant", "tenant-value"),
+    (b"routing-key", "routing-value"),
+    ("token-bin", b"\x00\x01"),
+)
+_EXPECTED_METADATA = (
+    ("tenant", "tenant-value"),
+    ("routing-key", "routing-value"),
+    ("token-bin", b"\x00\x01"),
+)
+
+_RPC_COUNT = 3
+
+
+def _echo_metadata(request, servicer_context):
+    servicer_context.set_trailing_metadata(
+        tuple(
+            (key, value)
+            for key, value in servicer_context.invocation_metadata()
+            if key in ("tenant", "routing-key", "token-bin")
+        )
+    )
+    return request
+
+
+class _AddMetadataInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        client_call_details = client_call_details._replace(
+            metadata=tuple(client_call_details.metadata)
+            + (("intercepted", "true"),)
+        )
+        return continuation(client_call_details, request)
+
+
+class PreparedMetadataTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _ECHO_METADATA: grpc.unary_unary_rpc_method_handler(
+                    _echo_metadata
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._method = grpc._common.fully_qualified_method(
+            _SERVICE_NAME, _ECHO_METADATA
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _assert_metadata_sent(self, channel, metadata, compression=None):
+        multi_callable = channel.unary_unary(self._method)
+        for _ in range(_RPC_COUNT):
+            unused_response, call = multi_callable.with_call(
+                _REQUEST, metadata=metadata, compression=compression
+            )
+            self.assertEqual(_EXPECTED_METADATA, call.trailing_metadata())
+
+    def testBehavesLikeTuple(self):
+        prepared_metadata = grpc.PreparedMetadata(_METADATA)
+        self.assertEqual(len(_METADATA), len(prepared_metadata))
+        self.assertEqual(_METADATA, prepared_metadata)
+        self.assertEqual(_METADATA, tuple(prepared_metadata))
+        self.assertEqual(_METADATA[1], prepared_metadata[1])
+        self.assertEqual(1, prepared_metadata.index(_METADATA[1]))
+        self.assertEqual(1, prepared_metadata.count(_METADATA[1]))
+        self.assertEqual(0, prepared_metadata.count(("extra", "value")))
+        with self.assertRaises(ValueError):
+            prepared_metadata.index(_METADATA[0], 1)
+        self.assertEqual(
+            _METADATA + (("extra", "value"),),
+            prepared_metadata + (("extra", "value"),),
+        )
+        self.assertEqual(
+            (("extra", "value"),) + _METADATA,
+            (("extra", "value"),) + prepared_metadata,
+        )
+
+    def testInvalidMetadata(self):
+        with self.assertRaises(TypeError):
+            grpc.PreparedMetadata((("invalid-bin", "not bytes"),))
+
+    def testSendPreparedMetadata(self):
+        self._assert_metadata_sent(
+            self._channel, grpc.PreparedMetadata(_METADATA)
+        )
+
+    def testSendEmptyPreparedMetadata(self):
+        multi_callable = self._channel.unary_unary(self._method)
+        unused_response, call = multi_callable.with_call(
+            _REQUEST, metadata=grpc.PreparedMetadata(())
+        )
+        self.assertEqual((), call.trailing_metadata())
+
+    def testSendPreparedMetadataWithCompression(self):
+        self._assert_metadata_sent(
+            self._channel,
+            grpc.PreparedMetadata(_METADATA),
+            compression=grpc.Compression.Gzip,
+        )
+
+    def testSendPreparedMetadataThroughInterceptor(self):
+        intercepted_channel = grpc.intercept_channel(
+            self._channel, _AddMetadataInterceptor()
+        )
+        self._assert_metadata_sent(
+            intercepted_channel, grpc.PreparedMetadata(_METADATA)
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
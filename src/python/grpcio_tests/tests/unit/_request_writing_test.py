@@ -0,0 +1,130 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests writing requests of client-streaming RPCs without an iterator."""
+
+import logging
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_REQUESTS = (b"\x00", b"\x01\x01", b"\x02\x02\x02")
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b"".join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class RequestWritingTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    _handle_stream_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    _handle_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._stream_unary = self._channel.stream_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_UNARY)
+        )
+        self._stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM)
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def testStreamUnaryWrites(self):
+        response_future = self._stream_unary.future(None)
+        for request in _REQUESTS:
+            response_future.write(request)
+        response_future.done_writing()
+
+        self.assertEqual(b"".join(_REQUESTS), response_future.result())
+        self.assertIs(grpc.StatusCode.OK, response_future.code())
+
+    def testStreamStreamWrites(self):
+        call = self._stream_stream(None)
+        for request in _REQUESTS:
+            call.write(request)
+            self.assertEqual(request, next(call))
+        call.done_writing()
+
+        self.assertEqual([], list(call))
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testDoneWritingWithoutRequests(self):
+        call = self._stream_stream(None)
+        call.done_writing()
+        call.done_writing()
+
+        self.assertEqual([], list(call))
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testWriteAfterDoneWriting(self):
+        call = self._stream_stream(None)
+        call.write(_REQUESTS[0])
+        call.done_writing()
+
+        with self.assertRaises(ValueError):
+            call.write(_REQUESTS[1])
+        self.assertEqual([_REQUESTS[0]], list(call))
+
+    def testWriteAfterCancel(self):
+        call = self._stream_stream(None)
+        call.write(_REQUESTS[0])
+        call.cancel()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            call.write(_REQUESTS[1])
+        self.assertIs(
+            grpc.StatusCode.CANCELLED, exception_context.exception.code()
+        )
+
+    def testWriteUnserializableRequest(self):
+        stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            request_serializer=lambda request: request.encode("ascii"),
+        )
+        call = stream_stream(None)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            call.write(b"not a string")
+        self.assertIs(
+            grpc.StatusCode.INTERNAL, exception_context.exception.code()
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
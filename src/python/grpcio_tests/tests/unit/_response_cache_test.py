@@ -0,0 +1,241 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the client-side response cache."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+from grpc import _observability
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_LOOKUP = "Lookup"
+_UNCACHED = "Uncached"
+
+_LOOKUP_METHOD = grpc._common.fully_qualified_method(_SERVICE_NAME, _LOOKUP)
+_UNCACHED_METHOD = grpc._common.fully_qualified_method(_SERVICE_NAME, _UNCACHED)
+
+_REQUEST = b"\x07\x08"
+_MISSING_REQUEST = b"\x00"
+
+
+class _Servicer(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def handle(self, request, servicer_context):
+        with self._lock:
+            self.calls += 1
+        if request == _MISSING_REQUEST:
+            servicer_context.abort(grpc.StatusCode.NOT_FOUND, "missing")
+        return request * 2
+
+
+class _UnavailableError(grpc.RpcError, grpc.Call):
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return "Short-circuited"
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def add_callback(self, callback):
+        return False
+
+
+class _ShortCircuitingInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def intercept_unary_unary(
+        self, ignored_continuation, ignored_client_call_details, ignored_request
+    ):
+        return _UnavailableError()
+
+
+class _RecordingPlugin(_observability.ObservabilityPlugin):
+    def __init__(self):
+        self.lookups = []
+
+    def create_client_call_tracer(self, method_name, target):
+        return None
+
+    def save_trace_context(self, trace_id, span_id, is_sampled):
+        pass
+
+    def create_server_call_tracer_factory(self, xds=False):
+        return None
+
+    def record_rpc_latency(self, method, target, rpc_latency, status_code):
+        pass
+
+    def record_response_cache_lookup(self, method, hit):
+        self.lookups.append((method, hit))
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._servicer = _Servicer()
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _LOOKUP: grpc.unary_unary_rpc_method_handler(
+                    self._servicer.handle
+                ),
+                _UNCACHED: grpc.unary_unary_rpc_method_handler(
+                    self._servicer.handle
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def _intercepted_channel(self, cache):
+        return grpc.intercept_channel(self._channel, cache.interceptor())
+
+    def testHitsSkipTheNetwork(self):
+        cache = grpc.experimental.ResponseCache((_LOOKUP_METHOD,))
+        lookup = self._intercepted_channel(cache).unary_unary(_LOOKUP_METHOD)
+
+        first_response = lookup(_REQUEST)
+        second_response, call = lookup.with_call(_REQUEST)
+        future_response = lookup.future(_REQUEST).result()
+
+        self.assertEqual(_REQUEST * 2, first_response)
+        self.assertIs(first_response, second_response)
+        self.assertIs(first_response, future_response)
+        self.assertIs(grpc.StatusCode.OK, call.code())
+        self.assertEqual(1, self._servicer.calls)
+        self.assertEqual((2, 1, 0, 1), tuple(cache.stats())[:4])
+
+    def testUncachedMethodsAndRequestsReachTheServer(self):
+        cache = grpc.experimental.ResponseCache((_LOOKUP_METHOD,))
+        channel = self._intercepted_channel(cache)
+
+        channel.unary_unary(_UNCACHED_METHOD)(_REQUEST)
+        channel.unary_unary(_UNCACHED_METHOD)(_REQUEST)
+        channel.unary_unary(_LOOKUP_METHOD)(_REQUEST)
+        channel.unary_unary(_LOOKUP_METHOD)(_REQUEST + _REQUEST)
+
+        self.assertEqual(4, self._servicer.calls)
+        self.assertEqual((0, 2, 0, 2), tuple(cache.stats())[:4])
+
+    def testEntriesExpire(self):
+        cache = grpc.experimental.ResponseCache((_LOOKUP_METHOD,), ttl=0.1)
+        lookup = self._intercepted_channel(cache).unary_unary(_LOOKUP_METHOD)
+
+        lookup(_REQUEST)
+        time.sleep(0.2)
+        lookup(_REQUEST)
+
+        self.assertEqual(2, self._servicer.calls)
+
+    def testFailuresAreOnlyCachedWithNegativeTtl(self):
+        for negative_ttl, expected_calls in ((None, 2), (60.0, 1)):
+            self._servicer.calls = 0
+            cache = grpc.experimental.ResponseCache(
+                (_LOOKUP_METHOD,), negative_ttl=negative_ttl
+            )
+            lookup = self._intercepted_channel(cache).unary_unary(
+                _LOOKUP_METHOD
+            )
+
+            for _ in range(2):
+                with self.assertRaises(grpc.RpcError) as exception_context:
+                    lookup(_MISSING_REQUEST)
+                self.assertIs(
+                    grpc.StatusCode.NOT_FOUND,
+                    exception_context.exception.code(),
+                )
+                self.assertEqual(
+                    "missing", exception_context.exception.details()
+                )
+            self.assertEqual(expected_calls, self._servicer.calls)
+
+    def testLeastRecentlyUsedEntriesAreEvicted(self):
+        entry_size = len(_REQUEST) + len(_REQUEST * 2)
+        cache = grpc.experimental.ResponseCache(
+            (_LOOKUP_METHOD,), maximum_size=2 * entry_size
+        )
+        lookup = self._intercepted_channel(cache).unary_unary(_LOOKUP_METHOD)
+        other_request = b"\x01\x02"
+        third_request = b"\x03\x04"
+
+        lookup(_REQUEST)
+        lookup(other_request)
+        lookup(_REQUEST)
+        lookup(third_request)
+        lookup(_REQUEST)
+
+        self.assertEqual(3, self._servicer.calls)
+        self.assertEqual((2, 3, 1, 2, 2 * entry_size), tuple(cache.stats()))
+
+    def testOutcomesThatAreNotFuturesAreNotCached(self):
+        cache = grpc.experimental.ResponseCache(
+            (_LOOKUP_METHOD,),
+            negative_ttl=60.0,
+            negative_codes=(grpc.StatusCode.UNAVAILABLE,),
+        )
+        channel = grpc.intercept_channel(
+            self._channel, cache.interceptor(), _ShortCircuitingInterceptor()
+        )
+        lookup = channel.unary_unary(_LOOKUP_METHOD)
+
+        for _ in range(2):
+            self.assertIsInstance(lookup.future(_REQUEST), _UnavailableError)
+
+        self.assertEqual(0, self._servicer.calls)
+        self.assertEqual((0, 2, 0, 0), tuple(cache.stats())[:4])
+
+    def testLookupsAreRecordedByObservabilityPlugin(self):
+        cache = grpc.experimental.ResponseCache((_LOOKUP_METHOD,))
+        lookup = self._intercepted_channel(cache).unary_unary(_LOOKUP_METHOD)
+        lookup(_REQUEST)
+        plugin = _RecordingPlugin()
+        plugin.set_stats(True)
+        _observability.observability_init(plugin)
+        try:
+            # Hits never reach the channel, so no call tracer is created.
+            lookup(_REQUEST)
+        finally:
+            _observability.observability_deinit()
+
+        self.assertEqual([(_LOOKUP_METHOD, True)], plugin.lookups)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
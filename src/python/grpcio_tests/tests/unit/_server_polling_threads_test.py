@@ -0,0 +1,174 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests servers polling several completion queues."""
+
+from concurrent import futures
+import logging
+import threading
+import unittest
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b"\x00\x00\x00"
+_RESPONSE = b"\x00\x00\x01"
+
+_POLLING_THREADS = 4
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_UNARY_BLOCKING = "UnaryUnaryBlocking"
+_STREAM_STREAM = "StreamStream"
+
+
+class _Handler(object):
+    def __init__(self):
+        self.unblock = threading.Event()
+        self.entered = threading.Event()
+
+    def handle_unary_unary(self, request, servicer_context):
+        return _RESPONSE
+
+    def handle_unary_unary_blocking(self, request, servicer_context):
+        self.entered.set()
+        self.unblock.wait(test_constants.LONG_TIMEOUT)
+        return _RESPONSE
+
+    def handle_stream_stream(self, request_iterator, servicer_context):
+        for request in request_iterator:
+            yield request
+
+
+def _create_server(handler, maximum_concurrent_rpcs=None):
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=test_constants.THREAD_CONCURRENCY
+        ),
+        options=(("grpc.so_reuseport", 0),),
+        maximum_concurrent_rpcs=maximum_concurrent_rpcs,
+        polling_threads=_POLLING_THREADS,
+    )
+    server.add_registered_method_handlers(
+        _SERVICE_NAME,
+        {
+            _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                handler.handle_unary_unary
+            ),
+            _UNARY_UNARY_BLOCKING: grpc.unary_unary_rpc_method_handler(
+                handler.handle_unary_unary_blocking
+            ),
+            _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                handler.handle_stream_stream
+            ),
+        },
+    )
+    return server
+
+
+class ServerPollingThreadsTest(unittest.TestCase):
+    def setUp(self):
+        self._handler = _Handler()
+        self._server = None
+        self._channel = None
+
+    def tearDown(self):
+        self._handler.unblock.set()
+        if self._server is not None:
+            self._server.stop(None)
+        if self._channel is not None:
+            self._channel.close()
+
+    def _start(self, maximum_concurrent_rpcs=None):
+        self._server = _create_server(self._handler, maximum_concurrent_rpcs)
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def _multi_callable(self, method):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testInvalidPollingThreads(self):
+        for polling_threads in (0, -1):
+            with self.assertRaises(ValueError):
+                grpc.server(
+                    futures.ThreadPoolExecutor(max_workers=1),
+                    polling_threads=polling_threads,
+                )
+
+    def testConcurrentUnaryUnary(self):
+        self._start()
+        multi_callable = self._multi_callable(_UNARY_UNARY)
+        with futures.ThreadPoolExecutor(
+            max_workers=test_constants.THREAD_CONCURRENCY
+        ) as executor:
+            response_futures = [
+                executor.submit(multi_callable, _REQUEST)
+                for _ in range(test_constants.RPC_CONCURRENCY)
+            ]
+            for response_future in response_futures:
+                self.assertEqual(_RESPONSE, response_future.result())
+
+    def testStreamStream(self):
+        self._start()
+        requests = [_REQUEST] * test_constants.STREAM_LENGTH
+        response_iterator = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )(iter(requests))
+        self.assertSequenceEqual(requests, list(response_iterator))
+
+    def testMaximumConcurrentRpcsSpansPollingThreads(self):
+        self._start(maximum_concurrent_rpcs=1)
+        blocked_future = self._multi_callable(_UNARY_UNARY_BLOCKING).future(
+            _REQUEST
+        )
+        self.assertTrue(
+            self._handler.entered.wait(test_constants.SHORT_TIMEOUT)
+        )
+        multi_callable = self._multi_callable(_UNARY_UNARY)
+        for _ in range(_POLLING_THREADS * 2):
+            with self.assertRaises(grpc.RpcError) as exception_context:
+                multi_callable(_REQUEST)
+            self.assertIs(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                exception_context.exception.code(),
+            )
+        self._handler.unblock.set()
+        self.assertEqual(_RESPONSE, blocked_future.result())
+        self.assertEqual(_RESPONSE, multi_callable(_REQUEST))
+
+    def testStopWithGraceTerminates(self):
+        self._start()
+        blocked_future = self._multi_callable(_UNARY_UNARY_BLOCKING).future(
+            _REQUEST
+        )
+        self.assertTrue(
+            self._handler.entered.wait(test_constants.SHORT_TIMEOUT)
+        )
+        shutdown_event = self._server.stop(test_constants.LONG_TIMEOUT)
+        self._handler.unblock.set()
+        self.assertEqual(_RESPONSE, blocked_future.result())
+        self.assertTrue(shutdown_event.wait(test_constants.SHORT_TIMEOUT))
+        self.assertTrue(
+            self._server.wait_for_termination(test_constants.SHORT_TIMEOUT)
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,173 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests dispatching RPC events of many channels on a shared thread pool."""
+
+import logging
+import threading
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_CHANNEL_COUNT = 16
+_OPTIONS = ((grpc.experimental.ChannelOptions.SharedCallDispatch, True),)
+
+_REQUEST = b"\x07\x08"
+_STREAM_LENGTH = 3
+
+
+def _handle_unary_unary(request, servicer_context):
+    return request
+
+
+def _handle_unary_stream(request, servicer_context):
+    for _ in range(_STREAM_LENGTH):
+        yield request
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b"".join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class SharedCallDispatchTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    _handle_unary_unary
+                ),
+                _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                    _handle_unary_stream
+                ),
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    _handle_stream_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    _handle_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._target = "localhost:%d" % port
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _channels(self, count):
+        channels = tuple(
+            grpc.insecure_channel(self._target, options=_OPTIONS)
+            for _ in range(count)
+        )
+        for channel in channels:
+            self.addCleanup(channel.close)
+        return channels
+
+    def testRpcsOfAllArities(self):
+        (channel,) = self._channels(1)
+        unary_unary = channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY)
+        )
+        unary_stream = channel.unary_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_STREAM)
+        )
+        stream_unary = channel.stream_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_UNARY)
+        )
+        stream_stream = channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM)
+        )
+
+        self.assertEqual(_REQUEST, unary_unary(_REQUEST))
+        self.assertEqual(
+            [_REQUEST] * _STREAM_LENGTH, list(unary_stream(_REQUEST))
+        )
+        self.assertEqual(
+            _REQUEST * _STREAM_LENGTH,
+            stream_unary(iter([_REQUEST] * _STREAM_LENGTH)),
+        )
+        self.assertEqual(
+            [_REQUEST] * _STREAM_LENGTH,
+            list(stream_stream(iter([_REQUEST] * _STREAM_LENGTH))),
+        )
+
+    def testManyChannelsShareBoundedThreads(self):
+        channels = self._channels(_CHANNEL_COUNT)
+        # Start the pool before counting threads.
+        channels[0].unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY)
+        )(_REQUEST)
+        thread_count = threading.active_count()
+
+        response_iterators = [
+            channel.unary_stream(
+                grpc._common.fully_qualified_method(
+                    _SERVICE_NAME, _UNARY_STREAM
+                )
+            )(_REQUEST)
+            for channel in channels
+        ]
+
+        self.assertLess(threading.active_count() - thread_count, _CHANNEL_COUNT)
+        for response_iterator in response_iterators:
+            self.assertEqual(
+                [_REQUEST] * _STREAM_LENGTH, list(response_iterator)
+            )
+
+    def testCloseWithRpcInFlight(self):
+        channel, other_channel = self._channels(2)
+        stream_stream = channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM)
+        )
+        requests_done = threading.Event()
+        self.addCleanup(requests_done.set)
+
+        def request_iterator():
+            requests_done.wait()
+            yield _REQUEST
+
+        call = stream_stream(request_iterator())
+
+        channel.close()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            next(call)
+        self.assertIs(
+            grpc.StatusCode.CANCELLED, exception_context.exception.code()
+        )
+        self.assertEqual(
+            _REQUEST,
+            other_channel.unary_unary(
+                grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY)
+            )(_REQUEST),
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,174 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests zero-copy sending and receiving of messages."""
+
+import logging
+import mmap
+import time
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SMALL_MESSAGE = b"\x07" * 16
+# Large enough to be split across several slices by the transport.
+_LARGE_MESSAGE = bytes(range(256)) * 4096
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_STREAM_STREAM = "StreamStream"
+
+
+def _received_type_recorder(received_types):
+    def _deserialize(message):
+        received_types.append(type(message))
+        return bytes(message)
+
+    return grpc.experimental.zero_copy_deserializer(_deserialize)
+
+
+class _ZeroCopyServicer(object):
+    def __init__(self):
+        self.received_types = []
+
+    def method_handlers(self):
+        deserializer = _received_type_recorder(self.received_types)
+        return {
+            _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                lambda request, unused_context: request,
+                request_deserializer=deserializer,
+            ),
+            _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                lambda request_iterator, unused_context: iter(request_iterator),
+                request_deserializer=deserializer,
+            ),
+        }
+
+
+class ZeroCopyTest(unittest.TestCase):
+    def setUp(self):
+        self._servicer = _ZeroCopyServicer()
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, self._servicer.method_handlers()
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _unary_unary(self, response_deserializer):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            response_deserializer=response_deserializer,
+            _registered_method=True,
+        )
+
+    def testRawMemoryview(self):
+        multi_callable = self._unary_unary(
+            grpc.experimental.zero_copy_deserializer()
+        )
+        for message in (_SMALL_MESSAGE, _LARGE_MESSAGE):
+            response = multi_callable(message)
+            self.assertIsInstance(response, memoryview)
+            self.assertTrue(response.readonly)
+            self.assertEqual(message, response.tobytes())
+        self.assertTrue(
+            all(
+                received is memoryview
+                for received in self._servicer.received_types
+            )
+        )
+
+    def testEmptyMessage(self):
+        response = self._unary_unary(
+            grpc.experimental.zero_copy_deserializer()
+        )(b"")
+        self.assertEqual(b"", response.tobytes())
+
+    def testDeserializerReceivesMemoryview(self):
+        received_types = []
+        response = self._unary_unary(_received_type_recorder(received_types))(
+            _LARGE_MESSAGE
+        )
+        self.assertEqual(_LARGE_MESSAGE, response)
+        self.assertEqual([memoryview], received_types)
+
+    def testStreamStream(self):
+        received_types = []
+        requests = [_SMALL_MESSAGE, _LARGE_MESSAGE] * (
+            test_constants.STREAM_LENGTH // 64
+        )
+        response_iterator = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            response_deserializer=_received_type_recorder(received_types),
+            _registered_method=True,
+        )(iter(requests))
+        self.assertSequenceEqual(requests, list(response_iterator))
+        self.assertEqual([memoryview] * len(requests), received_types)
+
+    def testBufferRequests(self):
+        multi_callable = self._unary_unary(None)
+        for request in (
+            bytearray(_SMALL_MESSAGE),
+            bytearray(_LARGE_MESSAGE),
+            memoryview(_LARGE_MESSAGE)[1:-1],
+        ):
+            self.assertEqual(bytes(request), multi_callable(request))
+
+    def testSentBufferIsReleased(self):
+        request = bytearray(_LARGE_MESSAGE)
+        multi_callable = self._unary_unary(None)
+        multi_callable(request)
+        # The buffer is released by a later batch once Core drops the slice.
+        deadline = time.monotonic() + test_constants.SHORT_TIMEOUT
+        while True:
+            multi_callable(_SMALL_MESSAGE)
+            try:
+                request.append(0)
+                break
+            except BufferError:
+                self.assertLess(time.monotonic(), deadline)
+
+    def testMmapRequest(self):
+        with mmap.mmap(-1, len(_LARGE_MESSAGE)) as mapped:
+            mapped.write(_LARGE_MESSAGE)
+            self.assertEqual(_LARGE_MESSAGE, self._unary_unary(None)(mapped))
+
+    def testBufferSerializer(self):
+        response = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            request_serializer=bytearray,
+            _registered_method=True,
+        )(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    def testNonContiguousRequest(self):
+        with self.assertRaises(TypeError):
+            self._unary_unary(None)(memoryview(_LARGE_MESSAGE)[::2])
+
+    def testDefaultDeserializationIsUnchanged(self):
+        response = self._unary_unary(None)(_LARGE_MESSAGE)
+        self.assertIsInstance(response, bytes)
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -237,10 +237,10 @@ class HealthServicerTest(AioTestBase):
 
         # Wait for the serving coroutine to process client cancellation.
         timeout = time.monotonic() + test_constants.TIME_ALLOWANCE
-        while time.monotonic() < timeout and self._servicer._server_watchers:
+        while time.monotonic() < timeout and self._servicer._broadcasters:
             await asyncio.sleep(1)
         self.assertFalse(
-            self._servicer._server_watchers,
+            self._servicer._broadcasters,
             "There should not be any watcher left",
         )
         self.assertTrue(queue.empty())
@@ -308,6 +308,36 @@ class HealthServicerTest(AioTestBase):
 
         self.assertTrue(queue.empty())
 
+    async def test_rapid_status_changes_coalesced(self):
+        request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
+        call = self._stub.Watch(request)
+        queue = asyncio.Queue()
+        task = self.loop.create_task(_pipe_to_queue(call, queue))
+
+        self.assertEqual(
+            health_pb2.HealthCheckResponse.SERVICE_UNKNOWN,
+            (await queue.get()).status,
+        )
+
+        for status in (
+            health_pb2.HealthCheckResponse.SERVING,
+            health_pb2.HealthCheckResponse.NOT_SERVING,
+            health_pb2.HealthCheckResponse.SERVING,
+        ):
+            await self._servicer.set(_WATCH_SERVICE, status)
+        self.assertEqual(
+            health_pb2.HealthCheckResponse.SERVING, (await queue.get()).status
+        )
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get(), test_constants.SHORT_TIMEOUT)
+
+        call.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertTrue(queue.empty())
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the metadata abstraction that's used in the asynchronous driver."""
+
 import logging
 import unittest
 
@@ -194,6 +195,20 @@ class TestTypeMetadata(unittest.TestCase):
         with self.assertRaises(KeyError):
             del metadata["other key"]
 
+    def test_length_after_mutations(self):
+        metadata = Metadata(*self._MULTI_ENTRY_DATA)
+        metadata["new key"] = "new value"
+        metadata["key1"] = "replaced value"
+        self.assertEqual(len(metadata), len(self._MULTI_ENTRY_DATA) + 1)
+
+        metadata.set_all("key2", ["value 1", "value 2", "value 3"])
+        del metadata["key1"]
+        metadata.get_all("new key").append("ignored value")
+        self.assertEqual(len(metadata), len(tuple(metadata)))
+
+        metadata.delete_all("key2")
+        self.assertEqual(len(metadata), len(tuple(metadata)))
+
     def test_metadata_from_tuple(self):
         scenarios = (
             (Metadata(), Metadata()),
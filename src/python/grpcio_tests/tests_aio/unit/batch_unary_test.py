@@ -0,0 +1,149 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests issuing batches of unary-unary RPCs on AsyncIO channels."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_REQUEST_COUNT = 32
+_FAILING_REQUEST = b"fail"
+
+_SERVICE_NAME = "test"
+_ECHO = "/test/Echo"
+_BLOCK = "/test/Block"
+
+
+async def _echo(request, servicer_context):
+    if request == _FAILING_REQUEST:
+        await servicer_context.abort(grpc.StatusCode.INVALID_ARGUMENT, "failed")
+    return request
+
+
+class _BlockingServicer(object):
+    def __init__(self, expected_count):
+        self._expected_count = expected_count
+        self._started_count = 0
+        self._cancelled_count = 0
+        self.all_started = asyncio.Event()
+        self.all_cancelled = asyncio.Event()
+
+    async def block(self, request, servicer_context):
+        self._started_count += 1
+        if self._started_count == self._expected_count:
+            self.all_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self._cancelled_count += 1
+            if self._cancelled_count == self._expected_count:
+                self.all_cancelled.set()
+            raise
+
+
+class _PassThroughInterceptor(aio.UnaryUnaryClientInterceptor):
+    def __init__(self):
+        self.intercepted_count = 0
+
+    async def intercept_unary_unary(
+        self, continuation, client_call_details, request
+    ):
+        self.intercepted_count += 1
+        return await continuation(client_call_details, request)
+
+
+class _RaisingInterceptor(aio.UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(
+        self, continuation, client_call_details, request
+    ):
+        raise ValueError("Intercepted")
+
+
+class TestBatchUnary(AioTestBase):
+    async def setUp(self):
+        self._blocking_servicer = _BlockingServicer(2)
+        self._server = aio.server()
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME,
+                    {
+                        "Echo": grpc.unary_unary_rpc_method_handler(_echo),
+                        "Block": grpc.unary_unary_rpc_method_handler(
+                            self._blocking_servicer.block
+                        ),
+                    },
+                ),
+            )
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        self._address = "localhost:%d" % port
+
+    async def tearDown(self):
+        await self._server.stop(None)
+
+    async def test_responses_in_request_order(self):
+        requests = [b"%d" % index for index in range(_REQUEST_COUNT)]
+        async with aio.insecure_channel(self._address) as channel:
+            responses = await channel.unary_unary(_ECHO).batch(requests)
+        self.assertEqual(requests, responses)
+
+    async def test_failures_are_returned_in_place(self):
+        async with aio.insecure_channel(self._address) as channel:
+            responses = await channel.unary_unary(_ECHO).batch(
+                (b"first", _FAILING_REQUEST, b"last")
+            )
+        self.assertEqual(b"first", responses[0])
+        self.assertIsInstance(responses[1], aio.AioRpcError)
+        self.assertEqual(grpc.StatusCode.INVALID_ARGUMENT, responses[1].code())
+        self.assertEqual(b"last", responses[2])
+
+    async def test_intercepted_batch(self):
+        interceptor = _PassThroughInterceptor()
+        requests = [b"%d" % index for index in range(_REQUEST_COUNT)]
+        async with aio.insecure_channel(
+            self._address, interceptors=(interceptor,)
+        ) as channel:
+            responses = await channel.unary_unary(_ECHO).batch(requests)
+        self.assertEqual(requests, responses)
+        self.assertEqual(_REQUEST_COUNT, interceptor.intercepted_count)
+
+    async def test_other_exceptions_propagate(self):
+        async with aio.insecure_channel(
+            self._address, interceptors=(_RaisingInterceptor(),)
+        ) as channel:
+            with self.assertRaises(ValueError):
+                await channel.unary_unary(_ECHO).batch((b"first", b"last"))
+
+    async def test_cancellation_cancels_every_rpc(self):
+        async with aio.insecure_channel(self._address) as channel:
+            batch = asyncio.ensure_future(
+                channel.unary_unary(_BLOCK).batch((b"first", b"last"))
+            )
+            await self._blocking_servicer.all_started.wait()
+            batch.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await batch
+            await self._blocking_servicer.all_cancelled.wait()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the AsyncIO stack running on the callback completion queue."""
+
+import logging
+import os
+import subprocess
+import sys
+import unittest
+
+from tests_aio.unit._test_base import AioTestBase
+
+# The engine is picked when the AsyncIO stack initializes for the first time
+# in a process, so every scenario runs in a fresh interpreter.
+_SCENARIO_TEMPLATE = """
+import asyncio
+import grpc
+from grpc import aio
+
+_RPC_COUNT = 64
+
+
+async def _echo(request, unused_context):
+    return request
+
+
+async def _echo_stream(request_iterator, unused_context):
+    async for request in request_iterator:
+        yield request
+
+
+async def main():
+    server = aio.server()
+    server.add_generic_rpc_handlers((
+        grpc.method_handlers_generic_handler("test", {{
+            "Echo": grpc.unary_unary_rpc_method_handler(_echo),
+            "EchoStream": grpc.stream_stream_rpc_method_handler(
+                _echo_stream),
+        }}),
+    ))
+    port = server.add_insecure_port("[::]:0")
+    await server.start()
+    async with aio.insecure_channel("localhost:%d" % port) as channel:
+        echo = channel.unary_unary("/test/Echo")
+        requests = [b"%d" % index for index in range(_RPC_COUNT)]
+        responses = await asyncio.gather(*(echo(request) for request in requests))
+        assert responses == requests, responses
+        call = channel.stream_stream("/test/EchoStream")()
+        for request in requests:
+            await call.write(request)
+            assert await call.read() == request
+        await call.done_writing()
+    await server.stop(None)
+
+
+{runner}
+"""
+
+_RUN_ON_SELECTOR_LOOP = "asyncio.run(main())"
+
+# A loop without add_reader, as on Windows' ProactorEventLoop.
+_RUN_WITHOUT_FD_MONITORING = """
+class _Loop(asyncio.SelectorEventLoop):
+    def add_reader(self, *args, **kwargs):
+        raise NotImplementedError()
+
+
+loop = _Loop()
+try:
+    loop.run_until_complete(main())
+finally:
+    loop.close()
+"""
+
+
+def _run_scenario(runner):
+    env = dict(os.environ)
+    env["GRPC_ASYNCIO_ENGINE"] = "callback"
+    return subprocess.run(
+        (sys.executable, "-c", _SCENARIO_TEMPLATE.format(runner=runner)),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        timeout=60,
+        check=False,
+    )
+
+
+class TestCallbackEngine(AioTestBase):
+    async def test_rpcs_on_selector_loop(self):
+        process = _run_scenario(_RUN_ON_SELECTOR_LOOP)
+        self.assertEqual(0, process.returncode, process.stdout.decode())
+
+    async def test_rpcs_without_fd_monitoring(self):
+        process = _run_scenario(_RUN_WITHOUT_FD_MONITORING)
+        self.assertEqual(0, process.returncode, process.stdout.decode())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
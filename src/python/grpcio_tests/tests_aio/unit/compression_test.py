@@ -199,6 +199,52 @@ class TestCompression(AioTestBase):
 
         await server.stop(None)
 
+    async def test_server_compression_policy(self):
+        policy = grpc.experimental.CompressionPolicy(
+            minimum_size=len(_RESPONSE) + 1,
+            method_minimum_sizes={_TEST_SET_COMPRESSION: 0},
+        )
+        server = aio.server(
+            options=(
+                (grpc.experimental.ServerOptions.CompressionPolicy, policy),
+            ),
+            compression=grpc.Compression.Deflate,
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+
+        async with aio.insecure_channel(f"localhost:{port}") as channel:
+            self.assertEqual(
+                _RESPONSE,
+                await channel.unary_unary(_TEST_UNARY_UNARY)(_REQUEST),
+            )
+            call = channel.stream_stream(_TEST_SET_COMPRESSION)()
+            await call.write(_REQUEST)
+            await call.done_writing()
+            self.assertEqual(_RESPONSE, await call.read())
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+        self.assertEqual(
+            (1, len(_RESPONSE), 1, len(_RESPONSE)), tuple(policy.stats())
+        )
+        await server.stop(None)
+
+    async def test_channel_compression_policy(self):
+        policy = grpc.experimental.CompressionPolicy(minimum_size=len(_REQUEST))
+        async with aio.insecure_channel(
+            self._address,
+            options=(
+                (grpc.experimental.ChannelOptions.CompressionPolicy, policy),
+            ),
+            compression=grpc.Compression.Deflate,
+        ) as channel:
+            multicallable = channel.unary_unary(_TEST_UNARY_UNARY)
+            self.assertEqual(_RESPONSE, await multicallable(_REQUEST))
+            self.assertEqual(_RESPONSE, await multicallable(_REQUEST[:1]))
+
+        self.assertEqual((1, len(_REQUEST), 1, 1), tuple(policy.stats()))
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
@@ -263,6 +263,16 @@ class TestMetadata(AioTestBase):
         self.assertEqual(_RESPONSE, await call)
         self.assertEqual(grpc.StatusCode.OK, await call.code())
 
+    async def test_from_client_to_server_with_prepared_metadata(self):
+        multicallable = self._client.unary_unary(_TEST_CLIENT_TO_SERVER)
+        prepared_metadata = grpc.PreparedMetadata(
+            tuple(_INITIAL_METADATA_FROM_CLIENT_TO_SERVER)
+        )
+        for _ in range(3):
+            call = multicallable(_REQUEST, metadata=prepared_metadata)
+            self.assertEqual(_RESPONSE, await call)
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
     @unittest.skipIf(
         platform.system() == "Windows",
         "https://github.com/grpc/grpc/issues/21943",
@@ -0,0 +1,93 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests AsyncIO servers serving RPCs from pre-forked worker processes."""
+
+import asyncio
+import logging
+import os
+import unittest
+
+import grpc
+from grpc import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_REQUEST = b"\x00\x00\x00"
+_SLOW_HANDLER_DELAY_S = 0.5
+_STOP_GRACE_S = 5
+
+_PROCESSES = 2
+
+_SERVICE_NAME = "test"
+_GET_PID = "/test/GetPid"
+_SLOW_GET_PID = "/test/SlowGetPid"
+
+
+async def _get_pid(request, servicer_context):
+    return str(os.getpid()).encode()
+
+
+async def _slow_get_pid(request, servicer_context):
+    await asyncio.sleep(_SLOW_HANDLER_DELAY_S)
+    return await _get_pid(request, servicer_context)
+
+
+@unittest.skipIf(os.name == "nt", "Pre-forked servers require fork().")
+class TestPreforkServer(AioTestBase):
+    async def setUp(self):
+        self._server = aio.server(processes=_PROCESSES)
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME,
+                    {
+                        "GetPid": grpc.unary_unary_rpc_method_handler(_get_pid),
+                        "SlowGetPid": grpc.unary_unary_rpc_method_handler(
+                            _slow_get_pid
+                        ),
+                    },
+                ),
+            )
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        # Channels are only created once the workers have been forked.
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_serves_from_workers(self):
+        self.assertEqual(_PROCESSES, self._server.serving_worker_count())
+        response = await self._channel.unary_unary(_GET_PID)(
+            _REQUEST, wait_for_ready=True
+        )
+        self.assertNotEqual(os.getpid(), int(response))
+
+    async def test_stop_with_grace(self):
+        call = self._channel.unary_unary(_SLOW_GET_PID)(
+            _REQUEST, wait_for_ready=True
+        )
+        await asyncio.sleep(_SLOW_HANDLER_DELAY_S / 2)
+        stop_task = self.loop.create_task(self._server.stop(_STOP_GRACE_S))
+        self.assertNotEqual(os.getpid(), int(await call))
+        await stop_task
+        self.assertFalse(await self._server.wait_for_termination(timeout=0))
+        self.assertEqual(0, self._server.serving_worker_count())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the client-side response cache on AsyncIO channels."""
+
+import logging
+import unittest
+
+import grpc
+from grpc.experimental import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_TEST_LOOKUP = "/test/Lookup"
+_TEST_UNCACHED = "/test/Uncached"
+
+_REQUEST = b"\x07\x08"
+_MISSING_REQUEST = b"\x00"
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+    def __init__(self):
+        self.calls = 0
+
+    async def _handle(self, request, context):
+        self.calls += 1
+        if request == _MISSING_REQUEST:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "missing")
+        return request * 2
+
+    def service(self, handler_call_details):
+        if handler_call_details.method in (_TEST_LOOKUP, _TEST_UNCACHED):
+            return grpc.unary_unary_rpc_method_handler(self._handle)
+        return None
+
+
+class TestResponseCache(AioTestBase):
+    async def setUp(self):
+        self._handler = _GenericHandler()
+        self._server = aio.server()
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.add_generic_rpc_handlers((self._handler,))
+        await self._server.start()
+        self._address = f"localhost:{port}"
+
+    async def tearDown(self):
+        await self._server.stop(None)
+
+    async def test_hits_skip_the_network(self):
+        cache = grpc.experimental.ResponseCache((_TEST_LOOKUP,))
+        async with aio.insecure_channel(
+            self._address, interceptors=[cache.aio_interceptor()]
+        ) as channel:
+            lookup = channel.unary_unary(_TEST_LOOKUP)
+            first_response = await lookup(_REQUEST)
+            call = lookup(_REQUEST)
+            second_response = await call
+
+            self.assertEqual(_REQUEST * 2, first_response)
+            self.assertIs(first_response, second_response)
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+        self.assertEqual(1, self._handler.calls)
+        self.assertEqual((1, 1, 0, 1), tuple(cache.stats())[:4])
+
+    async def test_uncached_methods_reach_the_server(self):
+        cache = grpc.experimental.ResponseCache((_TEST_LOOKUP,))
+        async with aio.insecure_channel(
+            self._address, interceptors=[cache.aio_interceptor()]
+        ) as channel:
+            uncached = channel.unary_unary(_TEST_UNCACHED)
+            await uncached(_REQUEST)
+            await uncached(_REQUEST)
+
+        self.assertEqual(2, self._handler.calls)
+        self.assertEqual((0, 0, 0, 0), tuple(cache.stats())[:4])
+
+    async def test_failures_are_cached_with_negative_ttl(self):
+        cache = grpc.experimental.ResponseCache(
+            (_TEST_LOOKUP,), negative_ttl=60.0
+        )
+        async with aio.insecure_channel(
+            self._address, interceptors=[cache.aio_interceptor()]
+        ) as channel:
+            lookup = channel.unary_unary(_TEST_LOOKUP)
+            for _ in range(2):
+                with self.assertRaises(aio.AioRpcError) as exception_context:
+                    await lookup(_MISSING_REQUEST)
+                self.assertEqual(
+                    grpc.StatusCode.NOT_FOUND,
+                    exception_context.exception.code(),
+                )
+                self.assertEqual(
+                    "missing", exception_context.exception.details()
+                )
+
+        self.assertEqual(1, self._handler.calls)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,122 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests serializing responses into pooled buffers on AsyncIO servers."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_RESPONSE_COUNT = 64
+_SMALL_RESPONSE_SIZE = 100
+_LARGE_RESPONSE_SIZE = 64 * 1024
+
+_SERVICE_NAME = "test"
+_STREAM = "/test/Stream"
+_UNARY = "/test/Unary"
+
+
+def _serialize_into(message, buffer):
+    buffer[:] = message
+
+
+_SERIALIZER = grpc.experimental.buffer_serializer(len, _serialize_into)
+
+
+async def _stream(request, unused_context):
+    size = int(request)
+    for index in range(_RESPONSE_COUNT):
+        yield bytes((index % 256,)) * size
+
+
+async def _unary(request, unused_context):
+    return request
+
+
+def _method_handlers():
+    return {
+        "Stream": grpc.unary_stream_rpc_method_handler(
+            _stream, response_serializer=_SERIALIZER
+        ),
+        "Unary": grpc.unary_unary_rpc_method_handler(
+            _unary, response_serializer=_SERIALIZER
+        ),
+    }
+
+
+class TestSerializationBufferPool(AioTestBase):
+    async def setUp(self):
+        self._server = aio.server(
+            options=(
+                (grpc.experimental.ServerOptions.SerializationBufferPool, 1),
+            )
+        )
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME, _method_handlers()
+                ),
+            )
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def _check_stream(self, size):
+        call = self._channel.unary_stream(_STREAM)(b"%d" % size)
+        index = 0
+        async for response in call:
+            self.assertEqual(bytes((index % 256,)) * size, response)
+            index += 1
+        self.assertEqual(_RESPONSE_COUNT, index)
+
+    async def test_small_responses_reuse_buffers(self):
+        await self._check_stream(_SMALL_RESPONSE_SIZE)
+        stats = self._server.serialization_buffer_pool_stats()
+        self.assertEqual(_RESPONSE_COUNT, stats["hits"] + stats["misses"])
+        self.assertGreater(stats["hits"], 0)
+        self.assertGreater(stats["recycled"], 0)
+
+    async def test_large_responses_reuse_buffers(self):
+        await self._check_stream(_LARGE_RESPONSE_SIZE)
+        stats = self._server.serialization_buffer_pool_stats()
+        self.assertEqual(_RESPONSE_COUNT, stats["hits"] + stats["misses"])
+        self.assertGreater(stats["hits"], 0)
+
+    async def test_unary_response(self):
+        response = await self._channel.unary_unary(_UNARY)(b"request")
+        self.assertEqual(b"request", response)
+        self.assertEqual(
+            1, self._server.serialization_buffer_pool_stats()["misses"]
+        )
+
+    async def test_pool_disabled_by_default(self):
+        server = aio.server()
+        self.assertIsNone(server.serialization_buffer_pool_stats())
+        await server.stop(None)
+
+    async def test_serializer_without_pool(self):
+        self.assertEqual(b"message", bytes(_SERIALIZER(b"message")))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -23,6 +23,7 @@ import grpc
 from grpc.experimental import aio
 from grpc.experimental import wrap_server_method_handler
 
+from src.proto.grpc.testing import empty_pb2
 from src.proto.grpc.testing import messages_pb2
 from src.proto.grpc.testing import test_pb2_grpc
 from tests_aio.unit._test_base import AioTestBase
@@ -461,6 +462,40 @@ class TestServerInterceptor(AioTestBase):
             record,
         )
 
+    async def test_per_method_interceptor_runs_once_per_method(self):
+        record = []
+        server, stub = await _create_server_stub_pair(
+            record,
+            grpc.experimental.per_method_server_interceptor(
+                _LoggingInterceptor("log1", record)
+            ),
+        )
+
+        for _ in range(3):
+            response = await stub.UnaryCall(messages_pb2.SimpleRequest())
+            self.assertIsInstance(response, messages_pb2.SimpleResponse)
+        await stub.EmptyCall(empty_pb2.Empty())
+        await stub.EmptyCall(empty_pb2.Empty())
+
+        self.assertEqual(2, record.count("log1:intercept_service"))
+
+    async def test_per_method_interceptor_caches_by_metadata_key(self):
+        record = []
+        server, stub = await _create_server_stub_pair(
+            record,
+            grpc.experimental.per_method_server_interceptor(
+                _LoggingInterceptor("log1", record),
+                metadata_keys=("tenant",),
+            ),
+        )
+
+        for tenant in ("a", "b", "a", "b"):
+            await stub.UnaryCall(
+                messages_pb2.SimpleRequest(), metadata=(("tenant", tenant),)
+            )
+
+        self.assertEqual(2, record.count("log1:intercept_service"))
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
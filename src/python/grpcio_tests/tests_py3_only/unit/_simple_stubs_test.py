@@ -25,6 +25,7 @@ os.environ["GRPC_PYTHON_MANAGED_CHANNEL_EVICTION_SECONDS"] = "2"
 os.environ["GRPC_PYTHON_MANAGED_CHANNEL_MAXIMUM"] = str(_MAXIMUM_CHANNELS)
 os.environ["GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS"] = str(_DEFAULT_TIMEOUT)
 
+from concurrent import futures
 import contextlib
 import datetime
 import inspect
@@ -361,6 +362,27 @@ class SimpleStubsTest(unittest.TestCase):
                     _registered_method=0,
                 )
 
+    def test_concurrent_hits_share_channel(self):
+        with _server(grpc.local_server_credentials()) as port:
+            target = f"localhost:{port}"
+            cache = grpc._simple_stubs.ChannelCache.get()
+
+            def _get_channel(unused_index):
+                return cache.get_channel(
+                    target=target,
+                    options=(("test_concurrent_hits_share_channel", ""),),
+                    channel_credentials=grpc.local_channel_credentials(),
+                    insecure=False,
+                    compression=None,
+                    method=_UNARY_UNARY,
+                    _registered_method=True,
+                )
+
+            with futures.ThreadPoolExecutor(max_workers=8) as executor:
+                results = tuple(executor.map(_get_channel, range(64)))
+            self.assertEqual(1, len(set(id(channel) for channel, _ in results)))
+            self.assertEqual(1, len(set(handle for _, handle in results)))
+
     def test_default_wait_for_ready(self):
         addr, port, sock = get_socket()
         sock.close()